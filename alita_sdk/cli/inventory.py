@@ -132,7 +132,7 @@ def init_config(output: str):
 @click.option('--dir', '-d', 'directory', type=click.Path(exists=True, file_okay=False, dir_okay=True),
               help='Local directory to ingest (alternative to --toolkit for local files)')
 @click.option('--graph', '-g', required=True, type=click.Path(),
-              help='Path to output graph JSON file')
+              help='Path to output graph JSON file or SQLite store (.db)')
 @click.option('--config', '-c', type=click.Path(exists=True),
               help='Path to YAML/JSON config file for LLM, embeddings, guardrails')
 @click.option('--preset', '-p', default=None,
@@ -382,7 +382,7 @@ def ingest(ctx, toolkit: Optional[str], directory: Optional[str], graph: str,
 @click.option('--dir', '-d', 'directory', type=click.Path(exists=True, file_okay=False, dir_okay=True),
               help='Local directory to ingest (alternative to --toolkit for local files)')
 @click.option('--graph', '-g', required=True, type=click.Path(exists=True),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 @click.option('--config', '-c', type=click.Path(exists=True),
               help='Path to YAML/JSON config file for LLM, embeddings, guardrails')
 @click.option('--no-relations', is_flag=True,
@@ -578,7 +578,7 @@ def retry(ctx, toolkit: Optional[str], directory: Optional[str], graph: str,
 
 @inventory.command('status')
 @click.option('--graph', '-g', required=True, type=click.Path(),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 @click.option('--name', '-n', required=True,
               help='Source name to check status for')
 def status(graph: str, name: str):
@@ -670,7 +670,7 @@ def status(graph: str, name: str):
 
 @inventory.command('stats')
 @click.option('--graph', '-g', required=True, type=click.Path(exists=True),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 def stats(graph: str):
     """
     Show knowledge graph statistics.
@@ -682,7 +682,7 @@ def stats(graph: str):
         from alita_sdk.community.inventory import KnowledgeGraph
         
         kg = KnowledgeGraph()
-        kg.load_from_json(graph)
+        kg.load(graph)
         stats = kg.get_stats()
         
         click.echo(f"\n📊 Knowledge Graph Statistics")
@@ -717,7 +717,7 @@ def stats(graph: str):
 @inventory.command('search')
 @click.argument('query')
 @click.option('--graph', '-g', required=True, type=click.Path(exists=True),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 @click.option('--type', '-t', 'entity_type', default=None,
               help='Filter by entity type')
 @click.option('--limit', '-n', default=10, type=int,
@@ -734,7 +734,7 @@ def search(query: str, graph: str, entity_type: Optional[str], limit: int):
         from alita_sdk.community.inventory import KnowledgeGraph
         
         kg = KnowledgeGraph()
-        kg.load_from_json(graph)
+        kg.load(graph)
         
         results = kg.search(query, top_k=limit, entity_type=entity_type)
         
@@ -777,7 +777,7 @@ def search(query: str, graph: str, entity_type: Optional[str], limit: int):
 @inventory.command('entity')
 @click.argument('name')
 @click.option('--graph', '-g', required=True, type=click.Path(exists=True),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 @click.option('--relations/--no-relations', default=True,
               help='Include relations (default: yes)')
 def entity(name: str, graph: str, relations: bool):
@@ -804,7 +804,7 @@ def entity(name: str, graph: str, relations: bool):
 @inventory.command('impact')
 @click.argument('name')
 @click.option('--graph', '-g', required=True, type=click.Path(exists=True),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 @click.option('--direction', '-d', type=click.Choice(['upstream', 'downstream']),
               default='downstream', help='Analysis direction (default: downstream)')
 @click.option('--depth', default=3, type=int,
@@ -833,7 +833,7 @@ def impact(name: str, graph: str, direction: str, depth: int):
 
 @inventory.command('visualize')
 @click.option('--graph', '-g', required=True, type=click.Path(exists=True),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 @click.option('--output', '-o', default=None, type=click.Path(),
               help='Output HTML file path (default: graph_visualization.html in same dir)')
 @click.option('--open/--no-open', 'open_browser', default=True,
@@ -884,7 +884,7 @@ def visualize(graph: str, output: Optional[str], open_browser: bool, title: Opti
         
         # Show graph stats
         kg = KnowledgeGraph()
-        kg.load_from_json(graph)
+        kg.load(graph)
         stats = kg.get_stats()
         click.echo(f"\n   📊 Graph contains:")
         click.echo(f"      - {stats['node_count']} entities")
@@ -909,7 +909,7 @@ def visualize(graph: str, output: Optional[str], open_browser: bool, title: Opti
 
 @inventory.command('enrich')
 @click.option('--graph', '-g', required=True, type=click.Path(exists=True),
-              help='Path to graph JSON file')
+              help='Path to graph JSON file or SQLite store (.db)')
 @click.option('--output', '-o', default=None, type=click.Path(),
               help='Output graph file (default: overwrite input)')
 @click.option('--deduplicate/--no-deduplicate', default=False,
@@ -136,7 +136,7 @@ class IngestionConfig(BaseModel):
     guardrails: GuardrailsConfig = Field(default_factory=GuardrailsConfig)
     
     # Graph configuration
-    graph_path: str = Field(default="./knowledge_graph.json", description="Path to persist graph")
+    graph_path: str = Field(default="./knowledge_graph.json", description="Path to persist graph (.db/.sqlite for a SQLite store, migrated from the JSON graph with the same name)")
     auto_save: bool = Field(default=True, description="Auto-save after mutations")
     
     # Extraction settings
@@ -15,15 +15,18 @@ Usage:
     enricher.save()
 """
 
-import json
+import bisect
 import logging
+import math
 import re
 import hashlib
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional, Any
 from difflib import SequenceMatcher
 
+from .knowledge_graph import load_graph_data, save_graph_data
+
 logger = logging.getLogger(__name__)
 
 
@@ -835,6 +838,135 @@ NEVER_DEDUPLICATE_TYPES = {
     "event_handler",         # Same handler name in different services
 }
 
+# Words ignored when tokenizing entity names
+NAME_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'for', 'on', 'with', 'by', 'is', 'it'})
+
+
+class SimilarNameIndex:
+    """
+    Candidate generation for name similarity above a threshold.
+    
+    Finds all pairs of names with SequenceMatcher ratio >= t without comparing every pair.
+    Matching blocks of two names are separated by unmatched characters, so a ratio of at
+    least t implies:
+    - length filter: 2 * min(len1, len2) / (len1 + len2) >= t
+    - q-gram count filter: the names share at least
+      ((2q - 1)t / 2 - (q - 1))(len1 + len2) - (q - 1) q-grams
+    
+    The count filter is applied with prefix filtering: q-grams of every name are ordered
+    from rarest to most frequent, and only names sharing a q-gram within their prefixes
+    are compared. Names whose bound requires no shared q-grams (low thresholds, short
+    names) are compared with all names of a similar length. Results are exact.
+    """
+    
+    def __init__(self, names: List[str], threshold: float, q: Optional[int] = None):
+        self.names = names
+        self.threshold = threshold
+        self.q = q or self._gram_size(threshold)
+        self._lengths = [len(name) for name in names]
+        self._char_counts: List[Counter] = [Counter(name) for name in names]
+        self._prefixes: List[List[Tuple[str, int]]] = []
+        self._prefix_index: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        # Names compared by length only, and all names, sorted by length
+        self._unfiltered: List[int] = []
+        self._unfiltered_lengths: List[int] = []
+        self._by_length = sorted(range(len(names)), key=lambda i: self._lengths[i])
+        self._sorted_lengths = [self._lengths[i] for i in self._by_length]
+        self._build()
+    
+    @staticmethod
+    def _gram_size(threshold: float) -> int:
+        """Longer grams are more selective, but need higher thresholds to keep the bound useful."""
+        if threshold >= 0.93:
+            return 4
+        if threshold >= 0.85:
+            return 3
+        return 2
+    
+    def _grams(self, name: str) -> List[Tuple[str, int]]:
+        """q-grams tagged with their occurrence number, so set overlap counts repeats."""
+        q = self.q
+        seen: Dict[str, int] = defaultdict(int)
+        grams = []
+        for i in range(len(name) - q + 1):
+            gram = name[i:i + q]
+            grams.append((gram, seen[gram]))
+            seen[gram] += 1
+        return grams
+    
+    def _min_shared_grams(self, length: int) -> int:
+        """Lower bound of q-grams shared with any name similar enough to one of this length."""
+        t = self.threshold
+        q = self.q
+        min_other_length = length * t / (2 - t)
+        bound = ((2 * q - 1) * t / 2 - (q - 1)) * (length + min_other_length) - (q - 1)
+        return max(0, math.ceil(bound - 1e-9))
+    
+    def _build(self):
+        all_grams = [self._grams(name) for name in self.names]
+        frequency: Dict[Tuple[str, int], int] = defaultdict(int)
+        for grams in all_grams:
+            for gram in grams:
+                frequency[gram] += 1
+        
+        unfiltered = []
+        for i, grams in enumerate(all_grams):
+            min_shared = self._min_shared_grams(self._lengths[i])
+            if min_shared < 1 or min_shared > len(grams):
+                unfiltered.append(i)
+                self._prefixes.append([])
+                continue
+            grams.sort(key=lambda gram: (frequency[gram], gram))
+            prefix = grams[:len(grams) - min_shared + 1]
+            self._prefixes.append(prefix)
+            for gram in prefix:
+                self._prefix_index[gram].append(i)
+        
+        unfiltered.sort(key=lambda i: self._lengths[i])
+        self._unfiltered = unfiltered
+        self._unfiltered_lengths = [self._lengths[i] for i in unfiltered]
+    
+    def _length_window(self, indices: List[int], lengths: List[int], length: int) -> List[int]:
+        """Indices (sorted by lengths) of names passing the length filter with a name of this length."""
+        t = self.threshold
+        low = bisect.bisect_left(lengths, length * t / (2 - t) - 1e-9)
+        high = bisect.bisect_right(lengths, length * (2 - t) / t + 1e-9) if t > 0 else len(lengths)
+        return indices[low:high]
+    
+    def candidates(self, i: int) -> Set[int]:
+        """Indices of names which may be similar enough to name i (excluding i)."""
+        length = self._lengths[i]
+        if self._prefixes[i]:
+            found = set()
+            for gram in self._prefixes[i]:
+                found.update(self._prefix_index[gram])
+            found.update(self._length_window(self._unfiltered, self._unfiltered_lengths, length))
+        else:
+            found = set(self._length_window(self._by_length, self._sorted_lengths, length))
+        found.discard(i)
+        return found
+    
+    def similar(self, i: int, min_index: int = 0) -> Dict[int, float]:
+        """Indices (from min_index on) of names with ratio >= threshold to name i, with the ratio."""
+        name = self.names[i]
+        length = self._lengths[i]
+        char_counts = self._char_counts[i]
+        t = self.threshold
+        result = {}
+        for j in self.candidates(i):
+            if j < min_index:
+                continue
+            other_length = self._lengths[j]
+            if 2 * min(length, other_length) < t * (length + other_length):
+                continue
+            # Same bound as SequenceMatcher.quick_ratio, with character counts computed once
+            if 2 * sum((char_counts & self._char_counts[j]).values()) < t * (length + other_length):
+                continue
+            ratio = SequenceMatcher(None, name, self.names[j]).ratio()
+            if ratio >= t:
+                result[j] = ratio
+        return result
+
 
 class GraphEnricher:
     """
@@ -856,6 +988,9 @@ class GraphEnricher:
         self.new_links: List[Dict] = []
         self.id_mapping: Dict[str, str] = {}  # old_id -> new_id for merged nodes
         self.merged_nodes: List[Dict] = []  # Track merged node info
+        # Names are normalized and tokenized many times across enrichment steps
+        self._normalized_names: Dict[str, str] = {}
+        self._name_tokens: Dict[str, FrozenSet[str]] = {}
         self.stats = {
             "cross_source_links": 0,
             "orphan_links": 0,
@@ -867,9 +1002,8 @@ class GraphEnricher:
         self._load_graph()
     
     def _load_graph(self):
-        """Load graph from JSON file."""
-        with open(self.graph_path) as f:
-            self.graph_data = json.load(f)
+        """Load graph from JSON file (or SQLite store)."""
+        self.graph_data = load_graph_data(str(self.graph_path))
         
         # Build indices
         for node in self.graph_data.get("nodes", []):
@@ -926,19 +1060,23 @@ class GraphEnricher:
     
     def _normalize_name(self, name: str) -> str:
         """Normalize entity name for matching."""
-        # Convert to lowercase, replace separators with spaces
-        name = name.lower().strip()
-        name = re.sub(r'[_\-\.]+', ' ', name)
-        name = re.sub(r'\s+', ' ', name)
-        return name
+        normalized = self._normalized_names.get(name)
+        if normalized is None:
+            # Convert to lowercase, replace separators with spaces
+            normalized = name.lower().strip()
+            normalized = re.sub(r'[_\-\.]+', ' ', normalized)
+            normalized = re.sub(r'\s+', ' ', normalized)
+            self._normalized_names[name] = normalized
+        return normalized
     
-    def _tokenize_name(self, name: str) -> Set[str]:
+    def _tokenize_name(self, name: str) -> FrozenSet[str]:
         """Tokenize name into significant words."""
-        normalized = self._normalize_name(name)
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'of', 'to', 'in', 'for', 'on', 'with', 'by', 'is', 'it'}
-        words = set(normalized.split())
-        return words - stop_words
+        tokens = self._name_tokens.get(name)
+        if tokens is None:
+            # Remove common stop words
+            tokens = frozenset(self._normalize_name(name).split()) - NAME_STOP_WORDS
+            self._name_tokens[name] = tokens
+        return tokens
     
     def _get_source(self, node: Dict) -> str:
         """Determine source category for a node."""
@@ -1102,34 +1240,32 @@ class GraphEnricher:
         
         # Optional: Phase 2 - Very high similarity fuzzy matches (disabled by default)
         if not require_exact_match:
-            remaining_nodes = [n for n in nodes if n["id"] not in processed_ids]
+            remaining_nodes = [
+                n for n in nodes
+                if n["id"] not in processed_ids and len(self._normalize_name(n.get("name", ""))) >= 3
+            ]
+            # Only merge on VERY high similarity (almost identical names)
+            similar_names = SimilarNameIndex(
+                [self._normalize_name(n.get("name", "")) for n in remaining_nodes],
+                name_similarity_threshold,
+            )
             
             for i, node1 in enumerate(remaining_nodes):
                 if node1["id"] in processed_ids:
                     continue
                 
-                name1 = self._normalize_name(node1.get("name", ""))
-                if len(name1) < 3:
-                    continue
-                
                 candidates = [node1]
                 
-                for node2 in remaining_nodes[i+1:]:
+                for j in sorted(similar_names.similar(i, min_index=i + 1)):
+                    node2 = remaining_nodes[j]
                     if node2["id"] in processed_ids:
                         continue
                     
-                    name2 = self._normalize_name(node2.get("name", ""))
-                    if len(name2) < 3:
-                        continue
-                    
                     # Check if types are mergeable
                     if not self._are_types_mergeable(node1.get("type", ""), node2.get("type", "")):
                         continue
                     
-                    # Only merge on VERY high similarity (almost identical names)
-                    str_sim = self._similarity(name1, name2)
-                    if str_sim >= name_similarity_threshold:
-                        candidates.append(node2)
+                    candidates.append(node2)
                 
                 if len(candidates) >= 2:
                     merge_groups.append(candidates)
@@ -1599,18 +1735,29 @@ class GraphEnricher:
         
         logger.info(f"Found {len(orphans)} orphan nodes")
         
+        # Connected nodes by name word - candidates must share a word with the orphan
+        nodes = self.graph_data.get("nodes", [])
+        word_to_positions: Dict[str, List[int]] = defaultdict(list)
+        for position, node in enumerate(nodes):
+            if node["id"] not in connected:
+                continue  # Don't link orphans to orphans
+            for word in set(self._normalize_name(node.get("name", "")).split()):
+                word_to_positions[word].append(position)
+        
         # For each orphan, find potential parents
         for orphan in orphans:
             orphan_name = self._normalize_name(orphan.get("name", ""))
             orphan_words = set(orphan_name.split())
             
             candidates = []
+            positions: Set[int] = set()
+            for word in orphan_words:
+                positions.update(word_to_positions.get(word, ()))
             
-            for node in self.graph_data.get("nodes", []):
+            for position in sorted(positions):
+                node = nodes[position]
                 if node["id"] == orphan["id"]:
                     continue
-                if node["id"] not in connected:
-                    continue  # Don't link orphans to orphans
                 
                 node_name = self._normalize_name(node.get("name", ""))
                 node_words = set(node_name.split())
@@ -1648,35 +1795,25 @@ class GraphEnricher:
         """
         logger.info(f"Creating similarity links (threshold={min_similarity})...")
         
-        nodes = self.graph_data.get("nodes", [])
-        processed = set()
+        nodes = [
+            node for node in self.graph_data.get("nodes", [])
+            if len(self._normalize_name(node.get("name", ""))) >= 3
+        ]
+        similar_names = SimilarNameIndex(
+            [self._normalize_name(node.get("name", "")) for node in nodes],
+            min_similarity,
+        )
         
         for i, node1 in enumerate(nodes):
-            name1 = self._normalize_name(node1.get("name", ""))
-            if len(name1) < 3:
-                continue
-            
-            for j, node2 in enumerate(nodes[i+1:], i+1):
-                pair = (node1["id"], node2["id"])
-                if pair in processed:
-                    continue
-                processed.add(pair)
-                
-                name2 = self._normalize_name(node2.get("name", ""))
-                if len(name2) < 3:
-                    continue
-                
-                # Calculate similarity
-                sim = self._similarity(name1, name2)
-                
-                if sim >= min_similarity:
-                    if self._add_link(
-                        node1["id"],
-                        node2["id"],
-                        "similar_to",
-                        f"similarity:{sim:.2f}"
-                    ):
-                        self.stats["similarity_links"] += 1
+            similar = similar_names.similar(i, min_index=i + 1)
+            for j in sorted(similar):
+                if self._add_link(
+                    node1["id"],
+                    nodes[j]["id"],
+                    "similar_to",
+                    f"similarity:{similar[j]:.2f}"
+                ):
+                    self.stats["similarity_links"] += 1
         
         logger.info(f"Created {self.stats['similarity_links']} similarity links")
 
@@ -2071,8 +2208,7 @@ Respond with ONLY a JSON object:
             self.graph_data["metadata"] = {}
         self.graph_data["metadata"]["enrichment_stats"] = self.stats
         
-        with open(output, "w") as f:
-            json.dump(self.graph_data, f, indent=2)
+        save_graph_data(self.graph_data, str(output))
         
         logger.info(f"Saved enriched graph to {output}")
         return str(output)
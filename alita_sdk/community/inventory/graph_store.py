@@ -0,0 +1,344 @@
+"""
+SQLite storage backend for KnowledgeGraph.
+
+An alternative to the indented JSON file written by KnowledgeGraph.dump_to_json, selected by the file
+extension of the graph path (.db, .sqlite, .sqlite3) or by the SQLite header of an existing file:
+
+- nodes: name/type/layer/file_path columns (stored as text) and the remaining attributes as compact JSON with the list of their keys, decoded lazily on first
+  access to one of them (LazyNodeAttributes)
+- edges: source, target and attributes as compact JSON
+- citations: file path and source document of every citation, to restore file and source indices
+- tokens: the search token index, read grouped by token
+- meta: graph metadata, schema and format version
+
+Reads use memory-mapped I/O. Saves are incremental: only entities and relations changed since the
+graph was loaded from (or last saved to) the same file are written, in a single transaction.
+When a store does not exist yet, a JSON graph with the same name is migrated into it on load.
+
+JSON graph paths keep being read and written as JSON. To migrate an existing graph, point graph_path
+(or the --graph option of the CLI) to the store path with the same name, e.g. ./knowledge_graph.db for
+./knowledge_graph.json: the JSON graph is migrated on first load and the store is used from then on.
+
+Usage:
+    graph = KnowledgeGraph()
+    graph.load("./knowledge_graph.db")  # migrates ./knowledge_graph.json if the store is missing
+    graph.save("./knowledge_graph.db")
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+SQLITE_HEADER = b'SQLite format 3\x00'
+# Node attributes stored in columns and available without decoding the attributes JSON
+COLUMN_ATTRIBUTES = ('name', 'type', 'layer', 'file_path')
+# Separator of attribute keys and of node ids grouped by token
+LIST_SEPARATOR = '\x1f'
+# Size of the memory map used for reads
+MMAP_SIZE = 1 << 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    type TEXT,
+    layer TEXT,
+    file_path TEXT,
+    attribute_keys TEXT NOT NULL,
+    attributes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS edges (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    attributes TEXT NOT NULL,
+    PRIMARY KEY (source, target)
+);
+CREATE INDEX IF NOT EXISTS edges_target ON edges (target);
+CREATE TABLE IF NOT EXISTS citations (
+    node_id TEXT NOT NULL,
+    file_path TEXT,
+    doc_id TEXT
+);
+CREATE INDEX IF NOT EXISTS citations_node ON citations (node_id);
+CREATE TABLE IF NOT EXISTS tokens (
+    token TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    PRIMARY KEY (token, node_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tokens_node ON tokens (node_id);
+"""
+
+
+def is_sqlite_store(path: str) -> bool:
+    """Whether the graph at the path is (or, for a new file, should be) stored in SQLite."""
+    if os.path.isfile(path):
+        with open(path, 'rb') as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    return os.path.splitext(path)[1].lower() in SQLITE_EXTENSIONS
+
+
+def legacy_json_path(path: str) -> str:
+    """JSON graph migrated into a new store at the path."""
+    return os.path.splitext(path)[0] + '.json'
+
+
+def _encode(value: Dict[str, Any]) -> str:
+    return json.dumps(value, default=str, separators=(',', ':'))
+
+
+class LazyNodeAttributes(MutableMapping):
+    """
+    Node attributes loaded from the store.
+
+    Column attributes are available right away; the rest is decoded from JSON on first access
+    to one of the `keys`, so entities never touched after loading are never decoded.
+
+    Created empty, it is the node attribute mapping of graphs loaded from the store (the
+    networkx node_attr_dict_factory), which takes over stored attributes on `update`.
+    """
+    __slots__ = ('_data', '_encoded', '_keys')
+
+    def __init__(self, columns: Optional[Dict[str, Any]] = None, encoded: Optional[str] = None,
+                 keys: frozenset = frozenset()):
+        self._data = {} if columns is None else columns
+        self._encoded = encoded
+        self._keys = keys
+
+    def _decoded(self) -> Dict[str, Any]:
+        if self._encoded is not None:
+            self._data.update(json.loads(self._encoded))
+            self._encoded = None
+        return self._data
+
+    def encoded_attributes(self) -> Optional[str]:
+        """Attributes JSON as stored, None once decoded (attributes may have been changed)."""
+        return self._encoded
+
+    def attribute_keys(self) -> frozenset:
+        """Keys of the attributes JSON."""
+        return self._keys
+
+    def __getitem__(self, key):
+        try:
+            return self._data[key]
+        except KeyError:
+            if self._encoded is None or key not in self._keys:
+                raise
+        return self._decoded()[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._data or (self._encoded is not None and key in self._keys)
+
+    def __setitem__(self, key, value):
+        self._decoded()[key] = value
+
+    def __delitem__(self, key):
+        del self._decoded()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._decoded())
+
+    def __len__(self) -> int:
+        return len(self._decoded())
+
+    def update(self, other=(), /, **kwargs):
+        if isinstance(other, LazyNodeAttributes) and not kwargs and not self._data and self._encoded is None:
+            # Attributes read from the store are taken over still encoded
+            self._data, self._encoded, self._keys = dict(other._data), other._encoded, other._keys
+            return
+        super().update(other, **kwargs)
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self._decoded())
+
+    def __repr__(self) -> str:
+        return repr(self._decoded())
+
+
+class SQLiteGraphStore:
+    """
+    Tables of a KnowledgeGraph in a SQLite database.
+
+    Args:
+        path: Database file, created on first write.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _connect(self, readonly: bool = False) -> sqlite3.Connection:
+        if readonly:
+            if not os.path.isfile(self.path):
+                raise FileNotFoundError(self.path)
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        else:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+        connection.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return connection
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Read-only connection using memory-mapped I/O."""
+        connection = self._connect(readonly=True)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Connection writing in a single transaction, committed on success."""
+        connection = self._connect()
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    # ========== Writes ==========
+
+    @staticmethod
+    def clear(connection: sqlite3.Connection) -> None:
+        for table in ('nodes', 'edges', 'citations', 'tokens', 'meta'):
+            connection.execute(f"DELETE FROM {table}")
+
+    @staticmethod
+    def delete_nodes(connection: sqlite3.Connection, node_ids: List[str]) -> None:
+        """Delete entities with their citations, tokens and relations."""
+        rows = [(node_id,) for node_id in node_ids]
+        connection.executemany("DELETE FROM nodes WHERE id = ?", rows)
+        connection.executemany("DELETE FROM citations WHERE node_id = ?", rows)
+        connection.executemany("DELETE FROM tokens WHERE node_id = ?", rows)
+        connection.executemany("DELETE FROM edges WHERE source = ?", rows)
+        connection.executemany("DELETE FROM edges WHERE target = ?", rows)
+
+    @staticmethod
+    def write_nodes(
+        connection: sqlite3.Connection,
+        nodes: Iterable[Tuple[str, Dict[str, Any], str, Iterable[str], Iterable[str], List[Tuple[str, str]]]],
+    ) -> None:
+        """
+        Insert or replace entities.
+
+        Args:
+            nodes: (node_id, column attributes, attributes JSON, its keys, tokens,
+                [(file_path, doc_id)] of citations)
+        """
+        node_rows = []
+        citation_rows = []
+        token_rows = []
+        for node_id, columns, encoded, keys, tokens, citations in nodes:
+            node_rows.append((
+                node_id, columns.get('name'), columns.get('type'), columns.get('layer'), columns.get('file_path'),
+                LIST_SEPARATOR.join(keys), encoded,
+            ))
+            citation_rows.extend((node_id, file_path, doc_id) for file_path, doc_id in citations)
+            token_rows.extend((token, node_id) for token in tokens)
+        ids = [(row[0],) for row in node_rows]
+        connection.executemany("DELETE FROM citations WHERE node_id = ?", ids)
+        connection.executemany("DELETE FROM tokens WHERE node_id = ?", ids)
+        connection.executemany("INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?)", node_rows)
+        connection.executemany("INSERT INTO citations VALUES (?, ?, ?)", citation_rows)
+        connection.executemany("INSERT OR IGNORE INTO tokens VALUES (?, ?)", token_rows)
+
+    @staticmethod
+    def delete_edges(connection: sqlite3.Connection, edges: List[Tuple[str, str]]) -> None:
+        connection.executemany("DELETE FROM edges WHERE source = ? AND target = ?", edges)
+
+    @staticmethod
+    def write_edges(connection: sqlite3.Connection, edges: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        connection.executemany(
+            "INSERT OR REPLACE INTO edges VALUES (?, ?, ?)",
+            ((source, target, _encode(data)) for source, target, data in edges),
+        )
+
+    @staticmethod
+    def write_meta(connection: sqlite3.Connection, meta: Dict[str, Any]) -> None:
+        connection.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [(key, json.dumps(value, default=str)) for key, value in meta.items()],
+        )
+
+    # ========== Reads ==========
+
+    @staticmethod
+    def read_meta(connection: sqlite3.Connection) -> Dict[str, Any]:
+        return {key: json.loads(value) for key, value in connection.execute("SELECT key, value FROM meta")}
+
+    @staticmethod
+    def read_nodes(connection: sqlite3.Connection) -> Iterator[Tuple[str, LazyNodeAttributes]]:
+        """Yields (node_id, lazily decoded attributes)."""
+        key_sets: Dict[str, frozenset] = {}  # shared between nodes with the same attribute keys
+        query = "SELECT id, name, type, layer, file_path, attribute_keys, attributes FROM nodes"
+        for node_id, name, entity_type, layer, file_path, keys, encoded in connection.execute(query):
+            columns = {}
+            if name is not None:
+                columns['name'] = name
+            if entity_type is not None:
+                columns['type'] = entity_type
+            if layer is not None:
+                columns['layer'] = layer
+            if file_path is not None:
+                columns['file_path'] = file_path
+            if keys not in key_sets:
+                key_sets[keys] = frozenset(keys.split(LIST_SEPARATOR)) if keys else frozenset()
+            yield node_id, LazyNodeAttributes(columns, encoded, key_sets[keys])
+
+    @staticmethod
+    def read_edges(connection: sqlite3.Connection) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        for source, target, encoded in connection.execute("SELECT source, target, attributes FROM edges"):
+            yield source, target, json.loads(encoded)
+
+    @staticmethod
+    def read_citations(connection: sqlite3.Connection) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Yields (node_id, file_path, doc_id) of all citations."""
+        return connection.execute("SELECT node_id, file_path, doc_id FROM citations")
+
+    @staticmethod
+    def read_token_index(connection: sqlite3.Connection) -> Iterator[Tuple[str, List[str]]]:
+        """Yields (token, node_ids) of the search token index, grouped by SQLite."""
+        query = f"SELECT token, group_concat(node_id, '{LIST_SEPARATOR}') FROM tokens GROUP BY token"
+        for token, node_ids in connection.execute(query):
+            yield token, node_ids.split(LIST_SEPARATOR)
+
+
+def split_node_attributes(data: MutableMapping) -> Tuple[Dict[str, Any], str, Iterable[str]]:
+    """Column attributes, attributes JSON and its keys, reusing the stored JSON of undecoded nodes."""
+    encoded = data.encoded_attributes() if isinstance(data, LazyNodeAttributes) else None
+    if encoded is not None:
+        return {key: data[key] for key in COLUMN_ATTRIBUTES if key in data}, encoded, data.attribute_keys()
+    columns = {}
+    attributes = {}
+    for key, value in data.items():
+        if key not in COLUMN_ATTRIBUTES:
+            attributes[key] = value
+        elif value is not None:
+            columns[key] = value if isinstance(value, str) else str(value)
+    return columns, _encode(attributes), attributes.keys()
+
+
+def node_citations(data: MutableMapping) -> List[Tuple[str, str]]:
+    """(file_path, doc_id) of node citations, including the legacy single citation."""
+    citations = data.get('citations') or []
+    if not citations and isinstance(data.get('citation'), dict):
+        citations = [data['citation']]
+    return [
+        (citation.get('file_path'), citation.get('doc_id'))
+        for citation in citations
+        if isinstance(citation, dict) and (citation.get('file_path') or citation.get('doc_id'))
+    ]
@@ -591,7 +591,7 @@ class IngestionPipeline(BaseModel):
     alita: Any = None
     
     # Graph persistence path
-    graph_path: str = Field(description="Path to persist the knowledge graph JSON")
+    graph_path: str = Field(description="Path to persist the knowledge graph JSON, or SQLite store (.db) migrated from the JSON graph with the same name")
     
     # Source toolkits (injected by runtime)
     # Maps toolkit name -> toolkit instance (e.g., {'github': GitHubApiWrapper})
@@ -665,11 +665,11 @@ class IngestionPipeline(BaseModel):
         graph_path = getattr(self, 'graph_path', None)
         if graph_path:
             try:
-                path = Path(graph_path)
-                if path.exists():
-                    self._knowledge_graph.load_from_json(graph_path)
-                    stats = self._knowledge_graph.get_stats()
-                    logger.info(f"Loaded existing graph: {stats['node_count']} entities, {stats['edge_count']} relations")
+                self._knowledge_graph.load(graph_path)
+                stats = self._knowledge_graph.get_stats()
+                logger.info(f"Loaded existing graph: {stats['node_count']} entities, {stats['edge_count']} relations")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.warning(f"Could not load existing graph: {e}")
         
@@ -777,10 +777,10 @@ class IngestionPipeline(BaseModel):
                 logger.debug(f"Progress callback failed: {e}")
     
     def _auto_save(self) -> None:
-        """Auto-save graph after mutations."""
+        """Auto-save graph after mutations (incrementally for SQLite stores)."""
         if self.graph_path:
             try:
-                self._knowledge_graph.dump_to_json(self.graph_path)
+                self._knowledge_graph.save(self.graph_path)
                 logger.debug(f"Auto-saved graph to {self.graph_path}")
             except Exception as e:
                 logger.warning(f"Failed to auto-save: {e}")
@@ -2033,8 +2033,7 @@ class IngestionPipeline(BaseModel):
         Returns:
             List of cross-file relations
         """
-        from .patterns import get_patterns_for_file, PatternCategory
-        import re
+        from .patterns import get_patterns_for_file, PatternCategory, MentionMatcher
         
         cross_relations = []
         
@@ -2083,6 +2082,12 @@ class IngestionPipeline(BaseModel):
         
         # Sort significant entities by length for greedy matching
         significant_entities.sort(key=lambda x: len(x[0]), reverse=True)
+        # Single-pass matcher of all significant entity names
+        mention_matcher = MentionMatcher(name_lower for name_lower, _ in significant_entities)
+        # Significant entities with their position in the sorted list, by name
+        entities_by_name: Dict[str, List[Tuple[int, Dict]]] = {}
+        for idx, (name_lower, ent) in enumerate(significant_entities):
+            entities_by_name.setdefault(name_lower, []).append((idx, ent))
         
         # ========================================================================
         # PHASE 1: Pattern-based extraction from file content
@@ -2187,34 +2192,36 @@ class IngestionPipeline(BaseModel):
                             })
             
             # --- Entity mention detection ---
-            content_lower = file_content.lower()
-            for name_lower, target_ent in significant_entities:
+            mentioned = mention_matcher.find(file_content.lower())
+            # Entities of mentioned names only, in the order of significant_entities
+            mentioned_entities = sorted(
+                (hit for name_lower in mentioned for hit in entities_by_name.get(name_lower, ())),
+                key=lambda hit: hit[0],
+            )
+            for _, target_ent in mentioned_entities:
                 if target_ent.get('id') == source_id:
                     continue
                 
-                if name_lower in content_lower:
-                    # Verify word boundary
-                    if re.search(r'\b' + re.escape(name_lower) + r'\b', content_lower):
-                        target_citation = target_ent.get('citation')
-                        target_file = ''
-                        if target_citation:
-                            target_file = (target_citation.get('file_path', '') 
-                                         if isinstance(target_citation, dict) 
-                                         else getattr(target_citation, 'file_path', ''))
-                        
-                        if target_file and target_file != file_path:
-                            cross_relations.append({
-                                'source_id': source_id,
-                                'target_id': target_ent.get('id'),
-                                'type': 'MENTIONS',
-                                'properties': {
-                                    'source_file': file_path,
-                                    'target_file': target_file,
-                                    'discovered_by': 'content_mention',
-                                    'mentioned_name': target_ent.get('name', '')
-                                },
-                                'confidence': 0.7
-                            })
+                target_citation = target_ent.get('citation')
+                target_file = ''
+                if target_citation:
+                    target_file = (target_citation.get('file_path', '') 
+                                 if isinstance(target_citation, dict) 
+                                 else getattr(target_citation, 'file_path', ''))
+                
+                if target_file and target_file != file_path:
+                    cross_relations.append({
+                        'source_id': source_id,
+                        'target_id': target_ent.get('id'),
+                        'type': 'MENTIONS',
+                        'properties': {
+                            'source_file': file_path,
+                            'target_file': target_file,
+                            'discovered_by': 'content_mention',
+                            'mentioned_name': target_ent.get('name', '')
+                        },
+                        'confidence': 0.7
+                    })
         
         # ========================================================================
         # PHASE 1.5: AST-based analysis (when available)
@@ -3097,9 +3104,9 @@ class IngestionPipeline(BaseModel):
         return self._knowledge_graph.get_stats()
     
     def export(self, path: Optional[str] = None) -> str:
-        """Export graph to JSON."""
+        """Export graph to JSON (or a SQLite store, see KnowledgeGraph.save)."""
         export_path = path or self.graph_path
-        self._knowledge_graph.dump_to_json(export_path)
+        self._knowledge_graph.save(export_path)
         return export_path
     
     def register_toolkit(self, name: str, toolkit: Any) -> None:
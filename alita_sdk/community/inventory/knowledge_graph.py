@@ -8,8 +8,10 @@ Raw data should be retrieved on-demand using filesystem tools.
 
 import json
 import logging
+import os
+import re
 from datetime import datetime
-from typing import Any, Optional, List, Dict, Set
+from typing import Any, Optional, List, Dict, Iterable, NamedTuple, Set
 from collections import defaultdict
 
 try:
@@ -18,8 +20,37 @@ try:
 except ImportError:
     nx = None
 
+from .graph_store import (
+    FORMAT_VERSION,
+    LazyNodeAttributes,
+    SQLiteGraphStore,
+    is_sqlite_store,
+    legacy_json_path,
+    node_citations,
+    split_node_attributes,
+)
+
 logger = logging.getLogger(__name__)
 
+if nx is not None:
+    class _StoreDiGraph(DiGraph):
+        """DiGraph of a graph loaded from a SQLite store, keeping node attributes lazily decoded."""
+        node_attr_dict_factory = LazyNodeAttributes
+
+_WORD_SPLIT_RE = re.compile(r'[^a-zA-Z0-9]+')
+_WORD_PARTS_RE = re.compile(r'[a-z]+|[A-Z][a-z]*|[0-9]+')
+
+
+class _SearchFields(NamedTuple):
+    """Lowercase and tokenized entity fields used by search, computed once per entity."""
+    name_lower: str
+    name_tokens: Set[str]
+    description_lower: str
+    description_tokens: Set[str]
+    primary_file: str  # file of the first citation (or file_path attribute)
+    file_path: str  # file_path attribute
+    tokens: frozenset  # all tokens of the entity in the token index
+
 
 class Citation:
     """
@@ -88,7 +119,8 @@ class KnowledgeGraph:
     
     Features:
     - In-memory property graph using NetworkX
-    - JSON persistence via node_link_data format
+    - JSON persistence via node_link_data format, or SQLite store with lazily decoded
+      attributes and incremental saves (see graph_store)
     - Delta update support with source document tracking
     - Entity deduplication with merge strategies
     - Impact analysis via graph traversal
@@ -165,8 +197,16 @@ class KnowledgeGraph:
         self._type_index: Dict[str, Set[str]] = defaultdict(set)  # type (lowercase) -> node_ids
         self._file_index: Dict[str, Set[str]] = defaultdict(set)  # file_path -> node_ids
         self._source_doc_index: Dict[str, Set[str]] = defaultdict(set)  # source_doc_id -> node_ids
+        self._token_index: Dict[str, Set[str]] = defaultdict(set)  # name/description/file token -> node_ids
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)  # trigram -> tokens of the token index
+        self._search_fields_cache: Dict[str, _SearchFields] = {}  # node_id -> precomputed search fields
         self._metadata: Dict[str, Any] = {}  # Graph metadata (sources, timestamps)
         self._schema: Optional[Dict[str, Any]] = None  # Discovered entity schema
+        # Changes since the graph was loaded from or saved to the SQLite store at _store_path
+        self._store_path: Optional[str] = None
+        self._dirty_nodes: Set[str] = set()
+        self._removed_nodes: Set[str] = set()
+        self._dirty_edges: Set[tuple] = set()
     
     # ========== Entity Operations ==========
     
@@ -201,6 +241,9 @@ class KnowledgeGraph:
         if existing:
             # Entity exists - merge the new citation
             if citation:
+                # Unindex tokens of the entity as indexed: the primary file may change
+                # when the legacy citation is migrated
+                self._unindex_search_tokens(entity_id)
                 new_citation_dict = citation.to_dict()
                 existing_citations = existing.get('citations', [])
                 
@@ -221,6 +264,9 @@ class KnowledgeGraph:
                 # Track source document
                 if citation.doc_id:
                     self._source_doc_index[citation.doc_id].add(entity_id)
+                
+                self._index_search_tokens(entity_id)
+                self._dirty_nodes.add(entity_id)
             
             logger.debug(f"Merged citation into existing entity: {entity_type} '{name}' ({entity_id})")
             return entity_id
@@ -264,6 +310,8 @@ class KnowledgeGraph:
         # Update indices - store ALL entities with this name (not just one)
         self._entity_index[name.lower()].add(entity_id)
         self._type_index[entity_type.lower()].add(entity_id)
+        self._index_search_tokens(entity_id)
+        self._dirty_nodes.add(entity_id)
         
         logger.debug(f"Added entity: {entity_type} '{name}' ({entity_id})")
         return entity_id
@@ -404,10 +452,25 @@ class KnowledgeGraph:
         }
         
         current = dict(self._graph.nodes[entity_id])
+        old_name = current.get('name', '').lower()
+        old_type = current.get('type', '').lower()
         current.update(filtered_updates)
         
+        self._unindex_search_tokens(entity_id)
         for key, value in current.items():
             self._graph.nodes[entity_id][key] = value
+        self._index_search_tokens(entity_id)
+        self._dirty_nodes.add(entity_id)
+        
+        # Keep name and type indices in sync
+        new_name = current.get('name', '').lower()
+        if new_name != old_name:
+            self._discard_from_index(self._entity_index, old_name, entity_id)
+            self._entity_index[new_name].add(entity_id)
+        new_type = current.get('type', '').lower()
+        if new_type != old_type:
+            self._discard_from_index(self._type_index, old_type, entity_id)
+            self._type_index[new_type].add(entity_id)
         
         return True
     
@@ -447,7 +510,10 @@ class KnowledgeGraph:
                     if doc_id and entity_id in self._source_doc_index.get(doc_id, set()):
                         self._source_doc_index[doc_id].discard(entity_id)
         
+        self._unindex_search_tokens(entity_id)
         self._graph.remove_node(entity_id)
+        self._dirty_nodes.discard(entity_id)
+        self._removed_nodes.add(entity_id)
         return True
     
     # ========== Relation Operations ==========
@@ -483,6 +549,7 @@ class KnowledgeGraph:
             edge_data.update(properties)
         
         self._graph.add_edge(source_id, target_id, **edge_data)
+        self._dirty_edges.add((source_id, target_id))
         logger.debug(f"Added relation: {source_id} --[{relation_type}]--> {target_id}")
         return True
     
@@ -523,6 +590,7 @@ class KnowledgeGraph:
         """Remove a relation between entities."""
         if self._graph.has_edge(source_id, target_id):
             self._graph.remove_edge(source_id, target_id)
+            self._dirty_edges.add((source_id, target_id))
             return True
         return False
     
@@ -768,12 +836,11 @@ class KnowledgeGraph:
     
     def _tokenize(self, text: str) -> Set[str]:
         """Tokenize text into searchable tokens (handles camelCase, snake_case, etc.)."""
-        import re
         if not text:
             return set()
         
         # Split on non-alphanumeric
-        words = re.split(r'[^a-zA-Z0-9]+', text.lower())
+        words = _WORD_SPLIT_RE.split(text.lower())
         
         # Also split camelCase
         tokens = set()
@@ -781,11 +848,125 @@ class KnowledgeGraph:
             if word:
                 tokens.add(word)
                 # Split camelCase: "ChatMessageHandler" -> ["chat", "message", "handler"]
-                camel_parts = re.findall(r'[a-z]+|[A-Z][a-z]*|[0-9]+', word)
-                tokens.update(p.lower() for p in camel_parts if p)
+                if not (word.isalpha() or word.isdigit()):
+                    camel_parts = _WORD_PARTS_RE.findall(word)
+                    tokens.update(p.lower() for p in camel_parts if p)
         
         return tokens
     
+    @staticmethod
+    def _discard_from_index(index: Dict[str, Set[str]], key: str, node_id: str) -> None:
+        node_ids = index.get(key)
+        if node_ids is not None:
+            node_ids.discard(node_id)
+            if not node_ids:
+                del index[key]
+    
+    def _make_search_fields(self, data: Dict[str, Any]) -> _SearchFields:
+        """Precompute lowercase and tokenized fields of an entity for search."""
+        name = data.get('name') or ''
+        description = data.get('description') or ''
+        if isinstance(data.get('properties'), dict):
+            description = description or data['properties'].get('description') or ''
+        
+        citations = data.get('citations', [])
+        if not citations and 'citation' in data:
+            citations = [data['citation']]
+        file_paths = [c.get('file_path', '') for c in citations if isinstance(c, dict)]
+        file_path = data.get('file_path') or ''
+        primary_file = (file_paths[0] if file_paths else file_path) or ''
+        
+        name_tokens = self._tokenize(name)
+        description_tokens = self._tokenize(description)
+        tokens = name_tokens | description_tokens | self._tokenize(primary_file)
+        if file_path and file_path != primary_file:
+            tokens |= self._tokenize(file_path)
+        return _SearchFields(
+            name.lower(), name_tokens, description.lower(), description_tokens,
+            primary_file, file_path, frozenset(tokens),
+        )
+    
+    def _search_fields(self, node_id: str) -> _SearchFields:
+        """Search fields of an entity, computed on first use for entities of loaded graphs."""
+        fields = self._search_fields_cache.get(node_id)
+        if fields is None:
+            fields = self._make_search_fields(self._graph.nodes[node_id])
+            self._search_fields_cache[node_id] = fields
+        return fields
+    
+    def _index_search_tokens(self, node_id: str) -> None:
+        """Add entity tokens to the token index (and new tokens to the trigram index)."""
+        fields = self._make_search_fields(self._graph.nodes[node_id])
+        self._search_fields_cache[node_id] = fields
+        for token in fields.tokens:
+            if token not in self._token_index:
+                for i in range(len(token) - 2):
+                    self._trigram_index[token[i:i + 3]].add(token)
+            self._token_index[token].add(node_id)
+    
+    def _unindex_search_tokens(self, node_id: str) -> None:
+        """Remove entity tokens from the token index (and tokens left without entities from the trigram index)."""
+        fields = self._search_fields_cache.pop(node_id, None)
+        if fields is None:
+            fields = self._make_search_fields(self._graph.nodes[node_id])
+        for token in fields.tokens:
+            self._discard_from_index(self._token_index, token, node_id)
+            if token not in self._token_index:
+                for i in range(len(token) - 2):
+                    self._discard_from_index(self._trigram_index, token[i:i + 3], token)
+    
+    def _rebuild_trigram_index(self) -> None:
+        self._trigram_index = defaultdict(set)
+        for token in self._token_index:
+            for i in range(len(token) - 2):
+                self._trigram_index[token[i:i + 3]].add(token)
+    
+    def _rebuild_search_index(self) -> None:
+        """Rebuild token and trigram indices from graph data."""
+        self._token_index = defaultdict(set)
+        self._trigram_index = defaultdict(set)
+        self._search_fields_cache = {}
+        for node_id in self._graph.nodes:
+            self._index_search_tokens(node_id)
+    
+    def _tokens_containing(self, text: str) -> Iterable[str]:
+        """Tokens of the token index containing the text, looked up by its trigrams."""
+        if len(text) < 3:
+            return [token for token in self._token_index if text in token]
+        trigram_tokens = []
+        for i in range(len(text) - 2):
+            tokens = self._trigram_index.get(text[i:i + 3])
+            if not tokens:
+                return []
+            trigram_tokens.append(tokens)
+        trigram_tokens.sort(key=len)
+        return [token for token in trigram_tokens[0].intersection(*trigram_tokens[1:]) if text in token]
+    
+    def _search_candidates(self, query_tokens: Set[str], query_lower: str) -> Optional[Set[str]]:
+        """
+        Node IDs which may get a non-zero match score for the query.
+        
+        Entities matching query tokens are found in the token index. A field containing the
+        query as a substring contains each alphanumeric word of the query inside one of its
+        tokens, so entities having a token that contains the longest query word are added too,
+        as well as entities of types containing the query.
+        
+        Returns None if the query has no alphanumeric characters (all entities are candidates).
+        """
+        words = [word for word in _WORD_SPLIT_RE.split(query_lower) if word]
+        if not words:
+            return None
+        
+        candidates = set()
+        for token in query_tokens:
+            candidates.update(self._token_index.get(token, ()))
+        for token in self._tokens_containing(max(words, key=len)):
+            candidates.update(self._token_index[token])
+        for type_name, node_ids in self._type_index.items():
+            if query_lower in type_name:
+                candidates.update(node_ids)
+        return candidates
+    
     def _calculate_match_score(
         self,
         query_tokens: Set[str],
@@ -801,9 +982,23 @@ class KnowledgeGraph:
         Returns (score, match_field) tuple.
         Higher scores mean better matches.
         """
-        name_lower = name.lower()
-        name_tokens = self._tokenize(name)
-        
+        return self._score_match(
+            query_tokens, query_lower, name.lower(), self._tokenize(name),
+            entity_type, description.lower() if description else '', self._tokenize(description), file_path,
+        )
+    
+    @staticmethod
+    def _score_match(
+        query_tokens: Set[str],
+        query_lower: str,
+        name_lower: str,
+        name_tokens: Set[str],
+        entity_type: str,
+        description_lower: str,
+        description_tokens: Set[str],
+        file_path: str,
+    ) -> tuple:
+        """_calculate_match_score over precomputed lowercase fields and tokens."""
         # Exact name match (highest priority)
         if query_lower == name_lower:
             return (1.0, 'name_exact')
@@ -829,14 +1024,12 @@ class KnowledgeGraph:
             return (0.55, 'file_path')
         
         # Check description
-        if description:
-            desc_lower = description.lower()
-            if query_lower in desc_lower:
+        if description_lower:
+            if query_lower in description_lower:
                 return (0.5, 'description')
             # Token match in description
-            desc_tokens = self._tokenize(description)
-            if query_tokens and desc_tokens:
-                overlap = len(query_tokens & desc_tokens)
+            if query_tokens and description_tokens:
+                overlap = len(query_tokens & description_tokens)
                 if overlap > 0:
                     score = 0.35 * (overlap / len(query_tokens))
                     return (score, 'description_tokens')
@@ -847,6 +1040,18 @@ class KnowledgeGraph:
         
         return (0.0, None)
     
+    def _top_results(self, scored: List[tuple], top_k: int) -> List[Dict[str, Any]]:
+        """Sort (score, name_lower, node_id, match_field) tuples and copy entities of the top ones."""
+        scored.sort(key=lambda x: (-x[0], x[1], x[2]))
+        return [
+            {
+                'entity': dict(self._graph.nodes[node_id]),
+                'score': score,
+                'match_field': match_field,
+            }
+            for score, _, node_id, match_field in scored[:top_k]
+        ]
+    
     def search(
         self,
         query: str,
@@ -865,6 +1070,8 @@ class KnowledgeGraph:
         - File path pattern matching
         - Type and layer filtering
         
+        Only candidate entities found via token and trigram indices are scored.
+        
         Args:
             query: Search query string
             top_k: Maximum results to return
@@ -875,9 +1082,7 @@ class KnowledgeGraph:
         Returns:
             List of matching entities with scores
         """
-        import re
-        
-        results = []
+        scored = []
         query_lower = query.lower().strip()
         query_tokens = self._tokenize(query)
         
@@ -896,7 +1101,10 @@ class KnowledgeGraph:
             except re.error:
                 pass
         
-        for node_id, data in self._graph.nodes(data=True):
+        candidates = self._search_candidates(query_tokens, query_lower)
+        nodes = self._graph.nodes
+        for node_id in (nodes if candidates is None else candidates):
+            data = nodes[node_id]
             # Type filter (case-insensitive)
             data_type = data.get('type', '').lower()
             if entity_type and data_type != entity_type.lower():
@@ -909,37 +1117,24 @@ class KnowledgeGraph:
                     continue
             
             # File pattern filter
-            citations = data.get('citations', [])
-            if not citations and 'citation' in data:
-                citations = [data['citation']]
-            
-            file_paths = [c.get('file_path', '') for c in citations if isinstance(c, dict)]
-            primary_file = file_paths[0] if file_paths else data.get('file_path', '')
+            fields = self._search_fields(node_id)
+            primary_file = fields.primary_file
             
             if file_regex and primary_file:
                 if not file_regex.search(primary_file):
                     continue
             
             # Calculate match score
-            name = data.get('name', '')
-            description = data.get('description', '')
-            if isinstance(data.get('properties'), dict):
-                description = description or data['properties'].get('description', '')
-            
-            score, match_field = self._calculate_match_score(
-                query_tokens, query_lower, name, data_type, description, primary_file
+            score, match_field = self._score_match(
+                query_tokens, query_lower, fields.name_lower, fields.name_tokens,
+                data_type, fields.description_lower, fields.description_tokens, primary_file,
             )
             
             if score > 0:
-                results.append({
-                    'entity': dict(data),
-                    'score': score,
-                    'match_field': match_field,
-                })
+                scored.append((score, fields.name_lower, node_id, match_field))
         
         # Sort by score (descending), then by name
-        results.sort(key=lambda x: (-x['score'], x['entity'].get('name', '').lower()))
-        return results[:top_k]
+        return self._top_results(scored, top_k)
     
     def search_by_file(self, file_path_pattern: str, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -1007,8 +1202,6 @@ class KnowledgeGraph:
         Returns:
             List of matching entities
         """
-        import re
-        
         # Build type filter set
         type_filter = set()
         if entity_types:
@@ -1037,9 +1230,12 @@ class KnowledgeGraph:
         query_tokens = self._tokenize(query) if query else set()
         query_lower = query.lower().strip() if query else ''
         
-        results = []
+        scored = []
         
-        for node_id, data in self._graph.nodes(data=True):
+        candidates = self._search_candidates(query_tokens, query_lower) if query else None
+        nodes = self._graph.nodes
+        for node_id in (nodes if candidates is None else candidates):
+            data = nodes[node_id]
             data_type = data.get('type', '').lower()
             data_layer = data.get('layer', '').lower() or self.TYPE_TO_LAYER.get(data_type, '')
             
@@ -1077,28 +1273,20 @@ class KnowledgeGraph:
             # Text search
             score = 1.0
             match_field = 'filter'
+            fields = self._search_fields(node_id)
             
             if query:
-                name = data.get('name', '')
-                description = data.get('description', '')
-                if isinstance(data.get('properties'), dict):
-                    description = description or data['properties'].get('description', '')
-                
-                score, match_field = self._calculate_match_score(
-                    query_tokens, query_lower, name, data_type, description, file_path
+                score, match_field = self._score_match(
+                    query_tokens, query_lower, fields.name_lower, fields.name_tokens,
+                    data_type, fields.description_lower, fields.description_tokens, file_path,
                 )
                 
                 if score == 0:
                     continue
             
-            results.append({
-                'entity': dict(data),
-                'score': score,
-                'match_field': match_field,
-            })
+            scored.append((score, fields.name_lower, node_id, match_field))
         
-        results.sort(key=lambda x: (-x['score'], x['entity'].get('name', '').lower()))
-        return results[:top_k]
+        return self._top_results(scored, top_k)
     
     def get_entities_by_source(self, doc_id: str) -> List[Dict[str, Any]]:
         """Get all entities from a specific source document."""
@@ -1230,7 +1418,8 @@ class KnowledgeGraph:
             'entity_index': {k: list(v) for k, v in self._entity_index.items()},
             'type_index': {k: list(v) for k, v in self._type_index.items()},
             'file_index': {k: list(v) for k, v in self._file_index.items()},
-            'source_doc_index': {k: list(v) for k, v in self._source_doc_index.items()}
+            'source_doc_index': {k: list(v) for k, v in self._source_doc_index.items()},
+            'token_index': {k: list(v) for k, v in self._token_index.items()},
         }
         
         # Add schema if discovered
@@ -1239,7 +1428,7 @@ class KnowledgeGraph:
         
         # Add metadata
         self._metadata['last_saved'] = datetime.now().isoformat()
-        self._metadata['version'] = '2.1'  # Enhanced indices version
+        self._metadata['version'] = '2.2'  # Token index version
         data['_metadata'] = self._metadata
         
         with open(path, 'w', encoding='utf-8') as f:
@@ -1260,6 +1449,12 @@ class KnowledgeGraph:
         with open(path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
+        self._load_node_link_data(data)
+        
+        logger.info(f"Loaded graph from {path} ({self._graph.number_of_nodes()} entities, {self._graph.number_of_edges()} relations)")
+    
+    def _load_node_link_data(self, data: Dict[str, Any]) -> None:
+        """Restore graph, indices, schema and metadata from node_link data (consumed)."""
         # Restore indices
         indices = data.pop('_indices', {})
         
@@ -1286,6 +1481,13 @@ class KnowledgeGraph:
         for k, v in indices.get('source_doc_index', {}).items():
             self._source_doc_index[k] = set(v) if isinstance(v, list) else set()
         
+        # Token index (trigrams are derived from its tokens, search fields are computed lazily)
+        self._token_index = defaultdict(set)
+        for k, v in indices.get('token_index', {}).items():
+            self._token_index[k] = set(v) if isinstance(v, list) else set()
+        self._rebuild_trigram_index()
+        self._search_fields_cache = {}
+        
         # Restore schema
         self._schema = data.pop('_schema', None)
         
@@ -1299,10 +1501,173 @@ class KnowledgeGraph:
             data['links'] = data.pop('edges')
         
         self._graph = nx.node_link_graph(data, edges="links")
+        self._store_path = None
+        self._dirty_nodes.clear()
+        self._removed_nodes.clear()
+        self._dirty_edges.clear()
         
         # Rebuild missing indices if needed (for legacy graphs)
         if not self._type_index or not self._file_index:
             self._rebuild_indices()
+        elif 'token_index' not in indices:
+            self._rebuild_search_index()
+    
+    def save(self, path: str) -> None:
+        """
+        Save graph to a SQLite store or a JSON file, depending on the path (see graph_store).
+        
+        Args:
+            path: Store (.db, .sqlite, .sqlite3) or JSON file path
+        """
+        if is_sqlite_store(path):
+            self.dump_to_store(path)
+        else:
+            self.dump_to_json(path)
+    
+    def load(self, path: str) -> None:
+        """
+        Load graph from a SQLite store or a JSON file, depending on the path.
+        
+        A store which does not exist yet is created from the JSON graph with the same
+        name (e.g. graph.json for graph.db), if there is one. JSON paths are loaded as
+        JSON, so an existing JSON graph is migrated by loading the store path once.
+        
+        Args:
+            path: Store (.db, .sqlite, .sqlite3) or JSON file path
+            
+        Raises:
+            FileNotFoundError: If neither the file nor the JSON graph to migrate exists
+        """
+        if not is_sqlite_store(path):
+            self.load_from_json(path)
+            logger.info(f"Graph is stored in JSON, load it from {os.path.splitext(path)[0]}.db "
+                        f"to migrate it to a SQLite store")
+            return
+        
+        if not os.path.exists(path):
+            json_path = legacy_json_path(path)
+            if not os.path.isfile(json_path):
+                raise FileNotFoundError(path)
+            logger.info(f"Migrating graph from {json_path} to {path}")
+            self.load_from_json(json_path)
+            self.dump_to_store(path)
+            return
+        
+        self.load_from_store(path)
+    
+    def dump_to_store(self, path: str) -> None:
+        """
+        Save graph to a SQLite store.
+        
+        Only entities and relations changed since the graph was loaded from or last saved
+        to the same store are written; any other store is rewritten completely.
+        
+        Args:
+            path: Store file path
+        """
+        store = SQLiteGraphStore(path)
+        full = self._store_path != os.path.abspath(path) or not os.path.isfile(path)
+        if full:
+            removed_nodes = []
+            node_ids = list(self._graph.nodes)
+            edges = list(self._graph.edges)
+            tokens_by_node = defaultdict(list)
+            for token, node_ids_with_token in self._token_index.items():
+                for node_id in node_ids_with_token:
+                    tokens_by_node[node_id].append(token)
+        else:
+            removed_nodes = list(self._removed_nodes)
+            node_ids = [node_id for node_id in self._dirty_nodes if self._graph.has_node(node_id)]
+            edges = list(self._dirty_edges)
+            tokens_by_node = {node_id: self._search_fields(node_id).tokens for node_id in node_ids}
+        
+        def node_rows():
+            for node_id in node_ids:
+                data = self._graph.nodes[node_id]
+                columns, encoded, keys = split_node_attributes(data)
+                yield node_id, columns, encoded, keys, tokens_by_node.get(node_id, ()), node_citations(data)
+        
+        self._metadata['last_saved'] = datetime.now().isoformat()
+        self._metadata['version'] = '2.2'
+        
+        with store.writer() as connection:
+            if full:
+                store.clear(connection)
+            store.delete_nodes(connection, removed_nodes)
+            store.write_nodes(connection, node_rows())
+            store.delete_edges(connection, [edge for edge in edges if not self._graph.has_edge(*edge)])
+            store.write_edges(connection, (
+                (source, target, self._graph.edges[source, target])
+                for source, target in edges if self._graph.has_edge(source, target)
+            ))
+            store.write_meta(connection, {
+                'format_version': FORMAT_VERSION,
+                'metadata': self._metadata,
+                'schema': self._schema,
+            })
+        
+        self._store_path = os.path.abspath(path)
+        self._dirty_nodes.clear()
+        self._removed_nodes.clear()
+        self._dirty_edges.clear()
+        
+        logger.info(
+            f"Saved graph to {path} ({'all' if full else len(node_ids)} entities and "
+            f"{len(edges)} relations written, {len(removed_nodes)} entities removed)"
+        )
+    
+    def load_from_store(self, path: str) -> None:
+        """
+        Load graph from a SQLite store.
+        
+        Indices are restored from node columns and citations; other entity attributes
+        are decoded on first access.
+        
+        Args:
+            path: Store file path
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        store = SQLiteGraphStore(path)
+        graph = _StoreDiGraph()
+        self._entity_index = defaultdict(set)
+        self._type_index = defaultdict(set)
+        self._file_index = defaultdict(set)
+        self._source_doc_index = defaultdict(set)
+        self._token_index = defaultdict(set)
+        self._search_fields_cache = {}
+        
+        with store.reader() as connection:
+            meta = store.read_meta(connection)
+            nodes = list(store.read_nodes(connection))
+            graph.add_nodes_from(node_id for node_id, _ in nodes)
+            for node_id, data in nodes:
+                # attributes passed to add_nodes_from would be decoded by copying them
+                graph.nodes[node_id].update(data)
+                if data.get('name'):
+                    self._entity_index[data['name'].lower()].add(node_id)
+                if data.get('type'):
+                    self._type_index[data['type'].lower()].add(node_id)
+                if data.get('file_path'):
+                    self._file_index[data['file_path']].add(node_id)
+            for token, node_ids in store.read_token_index(connection):
+                self._token_index[token] = set(node_ids)
+            for node_id, file_path, doc_id in store.read_citations(connection):
+                if file_path:
+                    self._file_index[file_path].add(node_id)
+                if doc_id:
+                    self._source_doc_index[doc_id].add(node_id)
+            graph.add_edges_from(store.read_edges(connection))
+        
+        self._graph = graph
+        self._rebuild_trigram_index()
+        self._schema = meta.get('schema')
+        self._metadata = meta.get('metadata') or {}
+        self._store_path = os.path.abspath(path)
+        self._dirty_nodes.clear()
+        self._removed_nodes.clear()
+        self._dirty_edges.clear()
         
         logger.info(f"Loaded graph from {path} ({self._graph.number_of_nodes()} entities, {self._graph.number_of_edges()} relations)")
     
@@ -1339,7 +1704,9 @@ class KnowledgeGraph:
                     if doc_id:
                         self._source_doc_index[doc_id].add(node_id)
         
-        logger.info(f"Rebuilt indices: {len(self._entity_index)} names, {len(self._type_index)} types, {len(self._file_index)} files")
+        self._rebuild_search_index()
+        
+        logger.info(f"Rebuilt indices: {len(self._entity_index)} names, {len(self._type_index)} types, {len(self._file_index)} files, {len(self._token_index)} tokens")
     
     def clear(self) -> None:
         """Clear all data from the graph."""
@@ -1348,8 +1715,12 @@ class KnowledgeGraph:
         self._type_index.clear()
         self._file_index.clear()
         self._source_doc_index.clear()
+        self._token_index.clear()
+        self._trigram_index.clear()
+        self._search_fields_cache.clear()
         self._schema = None
         self._metadata = {}
+        self._store_path = None
     
     # ========== Subgraph Operations ==========
     
@@ -1367,16 +1738,7 @@ class KnowledgeGraph:
         subgraph._graph = self._graph.subgraph(node_ids).copy()
         
         # Rebuild indices for subgraph
-        for node_id, data in subgraph._graph.nodes(data=True):
-            name = data.get('name', '').lower()
-            if name:
-                subgraph._entity_index[name] = node_id
-            
-            citation = data.get('citation', {})
-            if isinstance(citation, dict):
-                doc_id = citation.get('doc_id')
-                if doc_id:
-                    subgraph._source_doc_index[doc_id].add(node_id)
+        subgraph._rebuild_indices()
         
         return subgraph
     
@@ -1455,3 +1817,37 @@ class KnowledgeGraph:
             by_file[file_path].sort(key=lambda x: x.get('line_start') or 0)
         
         return dict(by_file)
+
+
+def load_graph_data(path: str) -> Dict[str, Any]:
+    """
+    Read graph in node_link format ('nodes', 'links', '_metadata', ...) from a JSON file
+    or a SQLite store.
+    """
+    if not is_sqlite_store(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    graph = KnowledgeGraph()
+    graph.load_from_store(path)
+    data = nx.node_link_data(graph._graph, edges="links")
+    if graph._schema:
+        data['_schema'] = graph._schema
+    data['_metadata'] = graph._metadata
+    return data
+
+
+def save_graph_data(data: Dict[str, Any], path: str) -> None:
+    """
+    Write graph in node_link format to a JSON file or a SQLite store.
+    
+    Indices of the data are not trusted when writing a store - they are rebuilt.
+    """
+    if not is_sqlite_store(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return
+    
+    graph = KnowledgeGraph()
+    graph._load_node_link_data({key: value for key, value in data.items() if key != '_indices'})
+    graph.dump_to_store(path)
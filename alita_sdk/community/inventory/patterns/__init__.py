@@ -24,6 +24,7 @@ from .loader import (
     get_patterns_for_content_type,
     extract_references_from_content,
 )
+from .mentions import MentionMatcher
 
 # AST adapter - provides integration with deepwiki parsers
 from .ast_adapter import (
@@ -48,6 +49,7 @@ __all__ = [
     'get_patterns_for_file',
     'get_patterns_for_content_type',
     'extract_references_from_content',
+    'MentionMatcher',
     # AST adapter
     'is_ast_available',
     'get_supported_ast_languages',
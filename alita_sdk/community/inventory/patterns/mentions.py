@@ -0,0 +1,110 @@
+"""
+Entity name mention matching for cross-file reference detection.
+
+Finds which of many entity names are mentioned in a text with an Aho-Corasick
+automaton, built once for all names and scanning each text in a single pass.
+A mention counts only at word boundaries, the same as re.search(r'\\bname\\b', text).
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether the character matches \\w of the re module."""
+    return char.isalnum() or char == '_'
+
+
+class MentionMatcher:
+    """
+    Multi-pattern matcher of entity names.
+
+    Names are matched case-sensitively; callers lowercase both names and text
+    for case-insensitive matching.
+
+    Example:
+        matcher = MentionMatcher(['user service', 'user'])
+        matcher.find('the user service calls users')  # {'user service', 'user'}
+    """
+
+    def __init__(self, names: Iterable[str]):
+        # Trie of the names: goto transitions, failure links and names ending at each state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        self._names = {name for name in names if name}
+        for name in self._names:
+            self._add(name)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _add(self, name: str) -> None:
+        state = 0
+        for char in name:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(name)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                # Names ending at the failure state end here as well
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Names mentioned in the text at word boundaries.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of the matched names
+        """
+        found: Set[str] = set()
+        if not self._names:
+            return found
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        length = len(text)
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+            for name in output[state]:
+                if name in found:
+                    continue
+                start = end - len(name)
+                # \b before the name: word-ness of the characters around the start differs
+                if start > 0 and _is_word_char(text[start - 1]) == _is_word_char(name[0]):
+                    continue
+                if start == 0 and not _is_word_char(name[0]):
+                    continue
+                # \b after the name
+                if end < length and _is_word_char(text[end]) == _is_word_char(name[-1]):
+                    continue
+                if end == length and not _is_word_char(name[-1]):
+                    continue
+                found.add(name)
+        return found
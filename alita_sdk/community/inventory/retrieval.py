@@ -151,7 +151,7 @@ class InventoryRetrievalApiWrapper(BaseToolApiWrapper):
     """
     
     # Graph persistence path (required)
-    graph_path: str = Field(description="Path to the knowledge graph JSON file")
+    graph_path: str = Field(description="Path to the knowledge graph JSON file or SQLite store (.db)")
     
     # Base directory for local content retrieval (optional)
     # If set, get_entity_content will read from local files
@@ -175,7 +175,7 @@ class InventoryRetrievalApiWrapper(BaseToolApiWrapper):
         graph_path = getattr(self, 'graph_path', None)
         if graph_path:
             try:
-                self._knowledge_graph.load_from_json(graph_path)
+                self._knowledge_graph.load(graph_path)
                 stats = self._knowledge_graph.get_stats()
                 logger.info(
                     f"Loaded graph: {stats['node_count']} entities, "
@@ -18,6 +18,8 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from .knowledge_graph import load_graph_data
+
 logger = logging.getLogger(__name__)
 
 # Color palette for entity types based on ENTITY_TAXONOMY layers
@@ -1312,8 +1314,7 @@ def generate_visualization(
     if not graph_path.exists():
         raise FileNotFoundError(f"Graph not found: {graph_path}")
     
-    with open(graph_path, 'r') as f:
-        graph_data = json.load(f)
+    graph_data = load_graph_data(str(graph_path))
     
     # Handle NetworkX 3.5+ compatibility: may have "edges" instead of "links"
     if 'edges' in graph_data and 'links' not in graph_data:
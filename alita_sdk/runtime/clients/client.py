@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 from copy import deepcopy
 
@@ -17,6 +19,9 @@ from langchain_anthropic import ChatAnthropic
 
 from ..langchain.assistant import Assistant as LangChainAssistant
 from .artifact import Artifact
+from .http_session import AsyncHttpSessions, create_http_session, session_stats
+from .metadata_cache import NOT_MODIFIED, MetadataResponse, create_metadata_cache
+from ..llms.embedding_cache import CachedEmbeddings, create_embedding_cache
 from ..middleware import TransformErrorStrategy, LoggingStrategy, SensitiveToolGuardMiddleware
 from ..utils.mcp_oauth import McpAuthorizationRequired
 from ...tools import get_available_toolkit_models, instantiate_toolkit
@@ -115,12 +120,77 @@ class AlitaClient:
         self.configurations: list = configurations or []
         self.model_timeout = kwargs.get('model_timeout', 120)
         self.model_image_generation = kwargs.get('model_image_generation')
+        # Pooled keep-alive connections shared by all platform requests, see clients/http_session.py
+        self.http_session = create_http_session(kwargs.get('http_pool'))
+        self.async_http = AsyncHttpSessions(kwargs.get('http_pool'))
+        # Cache of models, configurations, app versions and integrations, see clients/metadata_cache.py
+        self.metadata_cache = create_metadata_cache(kwargs.get('metadata_cache'))
+        # Embeddings cache shared by all embedding models of the client, see llms/embedding_cache.py
+        try:
+            self.embedding_cache = create_embedding_cache(kwargs.get('embedding_cache'))
+        except Exception as e:
+            logger.error(f"Failed to initialize embedding cache, embeddings are not cached: {e}")
+            self.embedding_cache = None
+
+    def connection_stats(self) -> dict:
+        """Requests and opened/reused connections of the sync and async transports."""
+        return {
+            "sync": session_stats(self.http_session),
+            "async": self.async_http.stats.as_dict(),
+        }
+
+    def metadata_cache_stats(self) -> dict:
+        """Hits, misses, revalidations and coalesced lookups of the metadata cache."""
+        return self.metadata_cache.stats() if self.metadata_cache is not None else {}
+
+    def invalidate_metadata_cache(self, kind: Optional[str] = None, *args) -> int:
+        """Drop cached metadata lookups.
+
+        Args:
+            kind: lookup to drop ('models', 'configurations', 'ai_section', 'app_details',
+                'app_version_details' or 'integration_details'), all lookups when None.
+            args: leading lookup arguments, e.g. application id for 'app_details'.
+
+        Returns:
+            Number of dropped entries.
+        """
+        if self.metadata_cache is None:
+            return 0
+        return self.metadata_cache.invalidate(kind, *args)
+
+    def _cached_request(self, key: tuple, method: str, url: str, parse, revalidate: bool = True, **kwargs):
+        """Metadata request through the metadata cache.
+
+        `parse(response)` returns the value of the lookup; values of failed responses are not cached.
+        Expired entries are revalidated with If-None-Match when the server returned an ETag.
+        """
+        def fetch(etag: Optional[str] = None):
+            headers = self.headers
+            if etag and revalidate:
+                headers = {**headers, 'If-None-Match': etag}
+            resp = self.http_session.request(method, url, headers=headers, verify=False, **kwargs)
+            if resp.status_code == 304 and 'If-None-Match' in headers:
+                return NOT_MODIFIED
+            return MetadataResponse(parse(resp), etag=resp.headers.get('ETag'), cacheable=resp.ok)
+
+        if self.metadata_cache is None:
+            return fetch().value
+        return self.metadata_cache.get(key, fetch)
+
+    def close(self):
+        """Close pooled connections of the sync transport."""
+        self.http_session.close()
+
+    async def aclose(self):
+        """Close pooled connections of the async transport in the running event loop."""
+        await self.async_http.close()
 
     def get_mcp_toolkits(self):
-        data = requests.get(self.mcp_tools_list, headers=self.headers, verify=False).json()
+        data = self.http_session.get(self.mcp_tools_list, headers=self.headers, verify=False).json()
         return data
 
-    def mcp_tool_call(self, params: dict[str, Any]):
+    @staticmethod
+    def _serialize_mcp_arguments(params: dict[str, Any]):
         #
         # This loop iterates over each key-value pair in the arguments dictionary,
         # and if a value is a Pydantic object, it replaces it with its dictionary representation using .dict().
@@ -132,17 +202,29 @@ class AlitaClient:
                 ]
             elif hasattr(arg_value, "dict") and callable(arg_value.dict):
                 params['params']['arguments'][arg_name] = arg_value.dict()
-        #
-        response = requests.post(self.mcp_tools_call, headers=self.headers, json=params, verify=False)
+
+    def mcp_tool_call(self, params: dict[str, Any]):
+        self._serialize_mcp_arguments(params)
+        response = self.http_session.post(self.mcp_tools_call, headers=self.headers, json=params, verify=False)
         try:
             return response.json()
         except (ValueError, TypeError):
             return response.text
 
+    async def amcp_tool_call(self, params: dict[str, Any]):
+        """Async twin of mcp_tool_call using the pooled aiohttp session."""
+        self._serialize_mcp_arguments(params)
+        async with self.async_http.session().post(self.mcp_tools_call, headers=self.headers, json=params) as response:
+            text = await response.text()
+        try:
+            return json.loads(text)
+        except (ValueError, TypeError):
+            return text
+
     def get_app_details(self, application_id: int, version_name: Optional[str] = None):
         url = f"{self.app}/{application_id}" if version_name is None else f"{self.app}/{application_id}/{version_name}"
-        data = requests.get(url, headers=self.headers, verify=False).json()
-        return data
+        return self._cached_request(('app_details', application_id, version_name), 'GET', url,
+                                    lambda resp: resp.json())
 
 
     def get_public_app_details(self, application_id: int, version_name: str = None) -> dict:
@@ -167,7 +249,7 @@ class AlitaClient:
         if version_name:
             url = f"{url}/{version_name}"
 
-        resp = requests.get(url, headers=self.headers, verify=False)
+        resp = self.http_session.get(url, headers=self.headers, verify=False)
         if resp.ok:
             data = resp.json()
             logger.info(f"[PUBLIC_APP] Successfully fetched public app {application_id}: {data.get('name')}")
@@ -182,7 +264,7 @@ class AlitaClient:
 
     def toolkit(self, toolkit_id: int):
         url = f"{self.base_url}{self.api_path}/tool/prompt_lib/{self.project_id}/{toolkit_id}"
-        response = requests.get(url, headers=self.headers, verify=False)
+        response = self.http_session.get(url, headers=self.headers, verify=False)
         if not response.ok:
             raise ValueError(f"Failed to fetch toolkit {toolkit_id}: {response.text}")
         
@@ -201,7 +283,7 @@ class AlitaClient:
 
         while total_count is None or offset < total_count:
             params = {'offset': offset, 'limit': limit}
-            resp = requests.get(self.list_apps_url, headers=self.headers, params=params, verify=False)
+            resp = self.http_session.get(self.list_apps_url, headers=self.headers, params=params, verify=False)
 
             if resp.ok:
                 data = resp.json()
@@ -214,16 +296,12 @@ class AlitaClient:
         return apps
 
     def fetch_available_configurations(self) -> list:
-        resp = requests.get(self.configurations_url, headers=self.headers, verify=False)
-        if resp.ok:
-            return resp.json()
-        return []
+        return self._cached_request(('configurations',), 'GET', self.configurations_url,
+                                    lambda resp: resp.json() if resp.ok else [])
 
     def all_models_and_integrations(self):
-        resp = requests.get(self.ai_section_url, headers=self.headers, verify=False)
-        if resp.ok:
-            return resp.json()
-        return []
+        return self._cached_request(('ai_section',), 'GET', self.ai_section_url,
+                                    lambda resp: resp.json() if resp.ok else [])
 
     def get_available_models(self):
         """Get list of available models from the configurations API.
@@ -232,12 +310,9 @@ class AlitaClient:
             List of model dictionaries with 'name' and other properties,
             or empty list if request fails.
         """
-        resp = requests.get(self.models_url, headers=self.headers, verify=False)
-        if resp.ok:
-            data = resp.json()
-            # API returns {"items": [...], ...}
-            return data.get('items', [])
-        return []
+        # API returns {"items": [...], ...}
+        return self._cached_request(('models',), 'GET', self.models_url,
+                                    lambda resp: resp.json().get('items', []) if resp.ok else [])
 
     def get_filtered_models(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -385,16 +460,22 @@ class AlitaClient:
         """
         Get an instance of OpenAIEmbeddings configured with the project ID and auth token.
 
+        When embedding cache is configured (`embedding_cache` client argument or ALITA_EMBEDDING_CACHE
+        environment variable), the instance is wrapped with CachedEmbeddings.
+
         Returns:
             An instance of OpenAIEmbeddings configured for the project.
         """
-        return OpenAIEmbeddings(
+        embeddings = OpenAIEmbeddings(
             base_url=f"{self.base_url}{self.llm_path}",
             model=embedding_model,
             api_key=self.auth_token,
             openai_organization=str(self.project_id),
             request_timeout=self.model_timeout
         )
+        if self.embedding_cache is not None:
+            return CachedEmbeddings(embeddings, self.embedding_cache, model=embedding_model)
+        return embeddings
 
     def get_llm(self, model_name: str, model_config: dict):
         """
@@ -608,7 +689,7 @@ class AlitaClient:
         logger.info(f"Generating image with model: {self.model_image_generation}, prompt: {prompt[:50]}...")
 
         try:
-            response = requests.post(
+            response = self.http_session.post(
                 self.image_generation_url,
                 headers=image_headers,
                 json=image_generation_data,
@@ -633,21 +714,28 @@ class AlitaClient:
         else:
             configs = self.fetch_available_configurations()
 
-        resp = requests.patch(url, headers=self.headers, verify=False, json={'configurations': configs})
-        if resp.ok:
-            return resp.json()
-        logger.error(f"Failed to fetch application version details: {resp.status_code} - {resp.text}."
-                     f" Application ID: {application_id}, Version ID: {application_version_id}, Project ID: {self.project_id}")
-        raise ApiDetailsRequestError(f"Failed to fetch application version details for {application_id}/{application_version_id}: {resp.status_code} - {resp.text}")
+
+        def parse(resp):
+            if resp.ok:
+                return resp.json()
+            logger.error(f"Failed to fetch application version details: {resp.status_code} - {resp.text}."
+                         f" Application ID: {application_id}, Version ID: {application_version_id}, Project ID: {self.project_id}")
+            raise ApiDetailsRequestError(f"Failed to fetch application version details for {application_id}/{application_version_id}: {resp.status_code} - {resp.text}")
+
+        # Version details are resolved with the given configurations, so they are part of the key
+        configs_hash = hashlib.sha256(json.dumps(configs, sort_keys=True, default=str).encode()).hexdigest()
+        # PATCH responses are not revalidated with If-None-Match
+        return self._cached_request(('app_version_details', application_id, application_version_id, configs_hash),
+                                    'PATCH', url, parse, revalidate=False, json={'configurations': configs})
 
     def get_integration_details(self, integration_id: str, format_for_model: bool = False):
         url = f"{self.integration_details}/{integration_id}"
-        data = requests.get(url, headers=self.headers, verify=False).json()
-        return data
+        return self._cached_request(('integration_details', integration_id), 'GET', url,
+                                    lambda resp: resp.json())
 
     def unsecret(self, secret_name: str):
         url = f"{self.secrets_url}/{secret_name}"
-        data = requests.get(url, headers=self.headers, verify=False).json()
+        data = self.http_session.get(url, headers=self.headers, verify=False).json()
         logger.info(f"Unsecret response: {data}")
         return data.get('value', None)
 
@@ -847,7 +935,7 @@ class AlitaClient:
     def bucket_exists(self, bucket_name):
         try:
             resp = self._process_requst(
-                requests.get(f'{self.bucket_url}', headers=self.headers, verify=False)
+                self.http_session.get(f'{self.bucket_url}', headers=self.headers, verify=False)
             )
             for each in resp.get('rows', []):
                 if each['name'] == bucket_name:
@@ -862,13 +950,13 @@ class AlitaClient:
             "expiration_measure": expiration_measure,
             "expiration_value": expiration_value
         }
-        resp = requests.post(f'{self.bucket_url}', headers=self.headers, json=post_data, verify=False)
+        resp = self.http_session.post(f'{self.bucket_url}', headers=self.headers, json=post_data, verify=False)
         return self._process_requst(resp)
 
     def list_artifacts(self, bucket_name: str):
         # Ensure bucket name is lowercase as required by the API
         url = f'{self.artifacts_url}/{bucket_name.lower()}'
-        data = requests.get(url, headers=self.headers, verify=False)
+        data = self.http_session.get(url, headers=self.headers, verify=False)
         return self._process_requst(data)
 
     def create_artifact(self, bucket_name, artifact_name, artifact_data, source: str = 'generated', prompt: str = None):
@@ -881,7 +969,7 @@ class AlitaClient:
         form_data = {'source': source}
         if prompt:
             form_data['prompt'] = prompt
-        data = requests.post(url, headers=self.headers, files={
+        data = self.http_session.post(url, headers=self.headers, files={
             'file': (sanitized_name, artifact_data)
         }, data=form_data, verify=False)
         return self._process_requst(data)
@@ -951,7 +1039,7 @@ class AlitaClient:
 
     def download_artifact(self, bucket_name, artifact_name):
         url = f'{self.artifact_url}/{bucket_name.lower()}/{artifact_name}'
-        data = requests.get(url, headers=self.headers, verify=False)
+        data = self.http_session.get(url, headers=self.headers, verify=False)
         if data.status_code == 403:
             return {"error": "You are not authorized to access this resource"}
         elif data.status_code == 404:
@@ -965,7 +1053,7 @@ class AlitaClient:
 
     def delete_artifact(self, bucket_name, artifact_name):
         url = f'{self.artifact_url}/{bucket_name}'
-        data = requests.delete(url, headers=self.headers, verify=False, params={'filename': quote(artifact_name)})
+        data = self.http_session.delete(url, headers=self.headers, verify=False, params={'filename': quote(artifact_name)})
         return self._process_requst(data)
 
     # =========================================================================
@@ -1024,7 +1112,7 @@ class AlitaClient:
         if delimiter:
             params["delimiter"] = delimiter
         
-        response = requests.get(url, headers=self.headers, params=params, verify=False)
+        response = self.http_session.get(url, headers=self.headers, params=params, verify=False)
         
         if response.status_code >= 400:
             return self._handle_s3_error(response, bucket=bucket_name)
@@ -1061,7 +1149,7 @@ class AlitaClient:
         url = f"{self.s3_url}/{bucket_name.lower()}/{quote(sanitized_key, safe='/')}"
         headers = {**self.headers, 'Content-Type': content_type}
         
-        response = requests.put(url, headers=headers, data=data,
+        response = self.http_session.put(url, headers=headers, data=data,
                                params=self._s3_params(), verify=False)
         
         if response.status_code >= 400:
@@ -1089,7 +1177,7 @@ class AlitaClient:
         """
         url = f"{self.s3_url}/{bucket_name.lower()}/{quote(key, safe='/')}"
         
-        response = requests.get(url, headers=self.headers,
+        response = self.http_session.get(url, headers=self.headers,
                                params=self._s3_params(), verify=False)
         
         if response.status_code >= 400:
@@ -1109,7 +1197,7 @@ class AlitaClient:
         """
         url = f"{self.s3_url}/{bucket_name.lower()}/{quote(key, safe='/')}"
         
-        response = requests.delete(url, headers=self.headers,
+        response = self.http_session.delete(url, headers=self.headers,
                                   params=self._s3_params(), verify=False)
         
         if response.status_code >= 400:
@@ -1130,7 +1218,7 @@ class AlitaClient:
         """
         url = f"{self.s3_url}/{bucket_name.lower()}/{quote(key, safe='/')}"
         
-        response = requests.head(url, headers=self.headers,
+        response = self.http_session.head(url, headers=self.headers,
                                 params=self._s3_params(), verify=False)
         
         if response.status_code == 404:
@@ -1185,7 +1273,7 @@ class AlitaClient:
     def async_predict(self, messages: list[BaseMessage], model_settings: dict, variables: list[dict] = None):
         # TODO: Modify to make it appropriate stream response
         prompt_data = self._prepare_payload(messages, model_settings, variables)
-        response = requests.post(self.predict_url, headers=self.headers, json=prompt_data, verify=False)
+        response = self.http_session.post(self.predict_url, headers=self.headers, json=prompt_data, verify=False)
         logger.info(response.content)
         response_data = response.json()
         for message in response_data['messages']:
@@ -1196,7 +1284,7 @@ class AlitaClient:
 
     def predict(self, messages: list[BaseMessage], model_settings: dict, variables: list[dict] = None):
         prompt_data = self._prepare_payload(messages, model_settings, variables)
-        response = requests.post(self.predict_url, headers=self.headers, json=prompt_data, verify=False)
+        response = self.http_session.post(self.predict_url, headers=self.headers, json=prompt_data, verify=False)
 
         if response.status_code != 200:
             logger.error(f"Error in response of predict: {response.content}")
@@ -1214,6 +1302,23 @@ class AlitaClient:
             logger.error(f"TypeError in response of predict: {response.content}")
             raise
 
+    async def apredict(self, messages: list[BaseMessage], model_settings: dict, variables: list[dict] = None):
+        """Async twin of predict using the pooled aiohttp session."""
+        prompt_data = self._prepare_payload(messages, model_settings, variables)
+        async with self.async_http.session().post(self.predict_url, headers=self.headers, json=prompt_data) as response:
+            content = await response.read()
+            status = response.status
+        if status != 200:
+            logger.error(f"Error in response of predict: {content}")
+            raise requests.exceptions.HTTPError(content)
+        response_messages = []
+        for message in json.loads(content)['messages']:
+            if message.get('role') == 'user':
+                response_messages.append(HumanMessage(content=message['content']))
+            else:
+                response_messages.append(AIMessage(content=message['content']))
+        return response_messages
+
     def predict_agent(self, llm: ChatOpenAI, instructions: str = "You are a helpful assistant.",
                       tools: Optional[list] = None, chat_history: Optional[List[Any]] = None,
                       memory=None, runtime='langchain', variables: Optional[list] = None,
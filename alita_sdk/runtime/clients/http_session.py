@@ -0,0 +1,236 @@
+""" Pooled HTTP transport of AlitaClient
+
+All platform requests of a client share one `requests.Session`, so TCP and TLS connections are
+kept alive and reused instead of being opened for every call. Idempotent requests are retried with
+backoff on connection errors and gateway errors. Async calls share one `aiohttp.ClientSession`
+per event loop.
+
+Both transports count requests and opened connections (see `ConnectionStats`).
+
+Configuration (`http_pool` argument of AlitaClient), all keys optional:
+    pool_connections: number of hosts with pooled connections (default 10);
+    pool_maxsize: connections kept per host, also the async connection limit (default 32);
+    max_retries: retries of idempotent requests (default 3), 0 to disable;
+    backoff_factor: retry backoff in seconds, doubled for every retry (default 0.5);
+    status_forcelist: response codes retried for idempotent requests (default 502, 503, 504);
+    keepalive_timeout: seconds idle async connections are kept (default 30);
+    request_timeout: total seconds of an async request (default None - not limited, like sync requests,
+        so long predictions and MCP tool calls limited by their tool_timeout_sec are not cut off).
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_POOL_CONFIG = {
+    "pool_connections": 10,
+    "pool_maxsize": 32,
+    "max_retries": 3,
+    "backoff_factor": 0.5,
+    "status_forcelist": (502, 503, 504),
+    "keepalive_timeout": 30,
+    "request_timeout": None,
+}
+
+
+def _pool_config(config: Optional[dict]) -> dict:
+    return {**DEFAULT_HTTP_POOL_CONFIG, **(config or {})}
+
+
+class ConnectionStats:
+    """ Thread-safe counters of requests and opened connections """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+
+    def add_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            requests_count, connections = self.requests, self.connections
+        reused = max(requests_count - connections, 0)
+        return {
+            "requests": requests_count,
+            "connections_opened": connections,
+            "connections_reused": reused,
+            "reuse_ratio": reused / requests_count if requests_count else 0.0,
+        }
+
+    def __getstate__(self):
+        return {"requests": self.requests, "connections": self.connections}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.requests = state["requests"]
+        self.connections = state["connections"]
+
+
+def _counting_pool_class(pool_class, stats: ConnectionStats):
+    """ Subclass of a urllib3 connection pool counting new connections into stats """
+
+    def _new_conn(self):
+        stats.add_connection()
+        return pool_class._new_conn(self)
+
+    return type(f"Counting{pool_class.__name__}", (pool_class,), {"_new_conn": _new_conn})
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """ HTTPAdapter counting requests and connections opened by its pools """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["stats"]
+
+    def __init__(self, *args, stats: Optional[ConnectionStats] = None, **kwargs):
+        self.stats = stats or ConnectionStats()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        # PoolManager looks pool classes up per instance, so they can be replaced for this adapter only
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool_class(pool_class, self.stats)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def send(self, request, *args, **kwargs):
+        self.stats.add_request()
+        return super().send(request, *args, **kwargs)
+
+
+def create_http_session(config: Optional[dict] = None) -> requests.Session:
+    """ Create session with pooled keep-alive connections and retries of idempotent requests
+
+    Args:
+        config: pool settings, see module docstring.
+
+    Returns:
+        Session; its adapter stats are available with `session_stats`.
+    """
+    config = _pool_config(config)
+    retries = Retry(
+        total=config["max_retries"],
+        backoff_factor=config["backoff_factor"],
+        status_forcelist=tuple(config["status_forcelist"]),
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        # Return the last response instead of raising, callers check status codes themselves
+        raise_on_status=False,
+    )
+    adapter = PooledHTTPAdapter(
+        pool_connections=config["pool_connections"],
+        pool_maxsize=config["pool_maxsize"],
+        max_retries=retries,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def session_stats(session: requests.Session) -> Dict[str, Any]:
+    """ Request and connection counters of a session created by `create_http_session` """
+    adapter = session.get_adapter("https://")
+    if isinstance(adapter, PooledHTTPAdapter):
+        return adapter.stats.as_dict()
+    return ConnectionStats().as_dict()
+
+
+class AsyncHttpSessions:
+    """ aiohttp sessions sharing connections per event loop
+
+    aiohttp sessions are bound to the loop they were created in, so every running loop gets its own
+    session, created on first use. The session is closed when its loop shuts down its async generators
+    (asyncio.run does it before closing the loop); sessions of loops closed without that are dropped
+    on the next call from any loop.
+    """
+
+    def __init__(self, config: Optional[dict] = None):
+        self.config = _pool_config(config)
+        self.stats = ConnectionStats()
+        self._lock = threading.Lock()
+        # Loop -> session and async generator closing it, sessions reference their loop, so weak keys would not help
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncGenerator]] = {}
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        stats = self.stats
+
+        async def on_request_start(session, context, params):
+            stats.add_request()
+
+        async def on_connection_create_end(session, context, params):
+            stats.add_connection()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        return trace_config
+
+    @staticmethod
+    async def _close_on_shutdown(session: aiohttp.ClientSession) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            await session.close()
+
+    def _drop_closed_loops(self):
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            session, _ = self._sessions.pop(loop)
+            if not session.closed:
+                logger.debug("Dropping async HTTP session of a closed event loop")
+
+    def session(self) -> aiohttp.ClientSession:
+        """ Session of the running event loop """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._drop_closed_loops()
+            session, _ = self._sessions.get(loop, (None, None))
+            if session is not None and not session.closed:
+                return session
+            connector = aiohttp.TCPConnector(
+                limit=self.config["pool_maxsize"],
+                keepalive_timeout=self.config["keepalive_timeout"],
+                ssl=False,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                # aiohttp limits requests to 300 seconds by default
+                timeout=aiohttp.ClientTimeout(total=self.config["request_timeout"]),
+                trace_configs=[self._trace_config()],
+            )
+            # The loop finalizes started async generators on shutdown, which closes the session
+            closer = self._close_on_shutdown(session)
+            asyncio.ensure_future(closer.__anext__())
+            self._sessions[loop] = (session, closer)
+        return session
+
+    async def close(self):
+        """ Close the session of the running event loop """
+        with self._lock:
+            session, closer = self._sessions.pop(asyncio.get_running_loop(), (None, None))
+        if session is not None:
+            await session.close()
+            await closer.aclose()
+
+    def __getstate__(self):
+        return {"config": self.config, "stats": self.stats}
+
+    def __setstate__(self, state):
+        self.config = state["config"]
+        self.stats = state["stats"]
+        self._lock = threading.Lock()
+        self._sessions = {}
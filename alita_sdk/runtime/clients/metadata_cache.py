@@ -0,0 +1,206 @@
+""" In-memory cache of platform metadata lookups of AlitaClient
+
+Models, configurations, application versions and integrations rarely change while agents and
+pipelines are built, but they are looked up for every nested agent and toolkit. Lookups are cached
+per client for `ttl` seconds:
+
+    - concurrent lookups of the same key share one request (single flight);
+    - expired entries with an ETag are revalidated with If-None-Match, a 304 response renews them;
+    - failed lookups are not cached;
+    - cached values are deep-copied on return, so callers may modify them.
+
+Configuration (`metadata_cache` argument of AlitaClient), all keys optional, False disables caching:
+    ttl: seconds entries are fresh (default 60);
+    max_entries: least recently used entries above this number are evicted (default 1024);
+    revalidate: send If-None-Match for expired entries with an ETag (default True).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+DEFAULT_METADATA_CACHE_CONFIG = {
+    "ttl": 60,
+    "max_entries": 1024,
+    "revalidate": True,
+}
+
+# Returned by fetch functions when the server answered 304 Not Modified
+NOT_MODIFIED = object()
+
+
+class MetadataResponse:
+    """ Result of a fetch function: value, its ETag and whether the value may be cached """
+
+    __slots__ = ("value", "etag", "cacheable")
+
+    def __init__(self, value: Any, etag: Optional[str] = None, cacheable: bool = True):
+        self.value = value
+        self.etag = etag
+        self.cacheable = cacheable
+
+
+class _Entry:
+    __slots__ = ("value", "etag", "expires_at")
+
+    def __init__(self, value: Any, etag: Optional[str], expires_at: float):
+        self.value = value
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class _Flight:
+    """ Lookup in progress, awaited by concurrent lookups of the same key """
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+FetchFunction = Callable[[Optional[str]], Union[MetadataResponse, object]]
+
+
+class MetadataCache:
+    """ Thread-safe TTL cache with single-flight lookups and ETag revalidation """
+
+    def __init__(self, ttl: float = DEFAULT_METADATA_CACHE_CONFIG["ttl"],
+                 max_entries: int = DEFAULT_METADATA_CACHE_CONFIG["max_entries"],
+                 revalidate: bool = DEFAULT_METADATA_CACHE_CONFIG["revalidate"]):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.revalidate = revalidate
+        self._init_state()
+
+    def _init_state(self):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, fetch: FetchFunction) -> Any:
+        """ Cached value of the key, fetched when missing or expired
+
+        Args:
+            key: cache key, tuples of the lookup kind and its arguments are used by AlitaClient.
+            fetch: called with the ETag of the expired entry (None if there is nothing to revalidate),
+                returns MetadataResponse or NOT_MODIFIED.
+
+        Returns:
+            Deep copy of the value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return deepcopy(entry.value)
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return deepcopy(flight.value)
+
+        try:
+            flight.value = self._fetch(key, entry, fetch)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return deepcopy(flight.value)
+
+    def _fetch(self, key: Hashable, entry: Optional[_Entry], fetch: FetchFunction) -> Any:
+        etag = entry.etag if entry is not None and self.revalidate else None
+        response = fetch(etag)
+        with self._lock:
+            if response is NOT_MODIFIED:
+                if entry is None:
+                    raise ValueError(f"Not modified response for {key!r} without cached value")
+                self.revalidated += 1
+                self._store(key, _Entry(entry.value, entry.etag, time.monotonic() + self.ttl))
+                return entry.value
+            if response.cacheable:
+                self._store(key, _Entry(response.value, response.etag, time.monotonic() + self.ttl))
+            else:
+                self._entries.pop(key, None)
+            return response.value
+
+    def _store(self, key: Hashable, entry: _Entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, kind: Optional[str] = None, *args) -> int:
+        """ Drop cached entries
+
+        Args:
+            kind: first item of the keys to drop, all entries are dropped when None.
+            args: further leading key items, e.g. application id of "app_details" keys.
+
+        Returns:
+            Number of dropped entries.
+        """
+        prefix = (kind, *args) if kind is not None else ()
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if isinstance(key, tuple) and key[:len(prefix)] == prefix
+            ] if prefix else list(self._entries)
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
+
+    def __getstate__(self):
+        return {"ttl": self.ttl, "max_entries": self.max_entries, "revalidate": self.revalidate}
+
+    def __setstate__(self, state):
+        self.ttl = state["ttl"]
+        self.max_entries = state["max_entries"]
+        self.revalidate = state["revalidate"]
+        self._init_state()
+
+
+def create_metadata_cache(config: Optional[Union[dict, bool]] = None) -> Optional[MetadataCache]:
+    """ Metadata cache from the client configuration, None when caching is disabled """
+    if config is False:
+        return None
+    config = {**DEFAULT_METADATA_CACHE_CONFIG, **(config if isinstance(config, dict) else {})}
+    if not config["ttl"] or config["ttl"] <= 0:
+        return None
+    return MetadataCache(ttl=config["ttl"], max_entries=config["max_entries"], revalidate=config["revalidate"])
+
@@ -8,6 +8,7 @@ from langgraph.store.base import BaseStore
 from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage
 from langchain_core.tools import BaseTool, ToolException
 
+from .checkpointer import BoundedMemorySaver, create_checkpointer
 from .langraph_agent import create_graph
 from .constants import (
     USER_ADDON, QA_ASSISTANT, NERDY_ASSISTANT, QUIRKY_ASSISTANT, CYNICAL_ASSISTANT,
@@ -359,15 +360,10 @@ class Assistant:
         checkpointer = None
         if self.memory is not None:
             checkpointer = self.memory
-        elif self.store is not None:
-            # Convert store to checkpointer if needed
-            from langgraph.checkpoint.memory import MemorySaver
-            checkpointer = MemorySaver()
         else:
             # Ensure we have a checkpointer for conversation persistence
-            from langgraph.checkpoint.memory import MemorySaver
-            checkpointer = MemorySaver()
-            logger.info("Using default MemorySaver for conversation persistence")
+            checkpointer = create_checkpointer()
+            logger.info(f"Using default {type(checkpointer).__name__} for conversation persistence")
 
         # Resolve Jinja2 variables in prompt instructions
         # Variables from data['variables'] (via get_app_version_details API) and system variables are processed here
@@ -501,8 +497,7 @@ class Assistant:
         memory = self.memory
         #
         if memory is None:
-            from langgraph.checkpoint.memory import MemorySaver  # pylint: disable=E0401,C0415
-            memory = MemorySaver()
+            memory = create_checkpointer()
         #
         agent = create_graph(
             client=self.client, tools=self.tools,
@@ -569,15 +564,14 @@ class Assistant:
         from langchain_core.runnables import RunnableConfig
         from langgraph.graph import StateGraph, END, START, MessagesState
         from langgraph.prebuilt import ToolNode
-        from langgraph.checkpoint.memory import MemorySaver
         from langgraph.types import Command
         from langgraph_swarm import create_swarm, create_handoff_tool
 
-        # For swarm mode, always use a fresh MemorySaver to avoid corrupted state
+        # For swarm mode, always use a fresh in-memory checkpointer to avoid corrupted state
         # from previous failed runs. The message history is passed via invoke(),
         # so we don't need to persist across invocations.
-        checkpointer = MemorySaver()
-        logger.info("[SWARM] Using fresh MemorySaver for swarm mode")
+        checkpointer = BoundedMemorySaver()
+        logger.info("[SWARM] Using fresh BoundedMemorySaver for swarm mode")
 
         # Separate regular tools from agent tools
         regular_tools = [t for t in all_tools if t not in agent_tools]
@@ -1193,10 +1187,6 @@ class Assistant:
         """Get or create a checkpointer for conversation persistence."""
         if self.memory is not None:
             return self.memory
-        elif self.store is not None:
-            from langgraph.checkpoint.memory import MemorySaver
-            return MemorySaver()
-        else:
-            from langgraph.checkpoint.memory import MemorySaver
-            logger.info("Using default MemorySaver for conversation persistence")
-            return MemorySaver()
+        checkpointer = create_checkpointer()
+        logger.info(f"Using default {type(checkpointer).__name__} for conversation persistence")
+        return checkpointer
@@ -0,0 +1,253 @@
+""" Checkpointers of agent and pipeline runs
+
+Agents fall back to an in-memory checkpointer, which kept every checkpoint of every thread for the
+life of the process. Checkpointers created here are bounded:
+
+    - only the last `max_checkpoints_per_thread` checkpoints of every thread (and subgraph namespace)
+      are kept, with their writes and channel values;
+    - with `compact_writes` pending writes of a checkpoint are dropped once the next checkpoint
+      is saved, they are already applied to it;
+    - the in-memory checkpointer keeps at most `max_threads` threads, least recently used threads
+      are dropped.
+
+Configuration (`create_checkpointer` argument or ALITA_CHECKPOINTER environment variable):
+    path of SQLite file or dict with keys:
+        backend: 'memory' (default), 'sqlite' or 'postgres';
+        path: SQLite file path;
+        connection_string: PostgreSQL connection;
+        max_threads, max_checkpoints_per_thread, compact_writes: see above, None for unlimited.
+
+SQLite and PostgreSQL checkpointers keep threads across restarts and support sync graph execution
+(invoke/stream), like SqliteSaver and PostgresSaver they are based on.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Optional, Set, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINTER_ENV = "ALITA_CHECKPOINTER"
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_MAX_CHECKPOINTS_PER_THREAD = 20
+
+# Durable checkpointers are shared by agents with the same configuration, they hold connections
+_durable_savers: Dict[str, BaseCheckpointSaver] = {}
+_durable_savers_lock = threading.Lock()
+
+
+def _checkpoint_location(config: RunnableConfig) -> Tuple[str, str, Optional[str]]:
+    configurable = config["configurable"]
+    return str(configurable["thread_id"]), configurable.get("checkpoint_ns", ""), configurable.get("checkpoint_id")
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """ InMemorySaver keeping recent checkpoints of recently used threads """
+
+    def __init__(self, max_threads: Optional[int] = DEFAULT_MAX_THREADS,
+                 max_checkpoints_per_thread: Optional[int] = DEFAULT_MAX_CHECKPOINTS_PER_THREAD,
+                 compact_writes: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self.max_checkpoints_per_thread = max_checkpoints_per_thread
+        self.compact_writes = compact_writes
+        self._lock = threading.RLock()
+        self._threads: "OrderedDict[str, None]" = OrderedDict()
+        # Channel versions of every stored checkpoint and blob keys of every namespace,
+        # so pruning doesn't need to deserialize checkpoints or scan all blobs
+        self._channel_versions: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._blob_keys: Dict[Tuple[str, str], Set[Tuple[str, Any]]] = defaultdict(set)
+
+    def _touch(self, thread_id: str):
+        self._threads[thread_id] = None
+        self._threads.move_to_end(thread_id)
+        if self.max_threads:
+            while len(self._threads) > self.max_threads:
+                evicted, _ = self._threads.popitem(last=False)
+                logger.debug(f"Dropping checkpoints of least recently used thread {evicted}")
+                self._delete_thread(evicted)
+
+    def get_tuple(self, config: RunnableConfig):
+        thread_id = str(config["configurable"]["thread_id"])
+        with self._lock:
+            if thread_id in self._threads:
+                self._threads.move_to_end(thread_id)
+            return super().get_tuple(config)
+
+    def put(self, config: RunnableConfig, checkpoint, metadata, new_versions) -> RunnableConfig:
+        thread_id, checkpoint_ns, parent_id = _checkpoint_location(config)
+        with self._lock:
+            saved = super().put(config, checkpoint, metadata, new_versions)
+            self._channel_versions[(thread_id, checkpoint_ns, checkpoint["id"])] = dict(
+                checkpoint["channel_versions"])
+            self._blob_keys[(thread_id, checkpoint_ns)].update(new_versions.items())
+            if self.compact_writes and parent_id:
+                self.writes.pop((thread_id, checkpoint_ns, parent_id), None)
+            self._prune(thread_id, checkpoint_ns)
+            self._touch(thread_id)
+            return saved
+
+    def put_writes(self, config: RunnableConfig, writes, task_id: str, task_path: str = "") -> None:
+        with self._lock:
+            super().put_writes(config, writes, task_id, task_path)
+            self._touch(str(config["configurable"]["thread_id"]))
+
+    def _prune(self, thread_id: str, checkpoint_ns: str):
+        if not self.max_checkpoints_per_thread:
+            return
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if len(checkpoints) <= self.max_checkpoints_per_thread:
+            return
+        # Checkpoint ids are time ordered
+        for checkpoint_id in sorted(checkpoints)[:-self.max_checkpoints_per_thread]:
+            del checkpoints[checkpoint_id]
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            self._channel_versions.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+        referenced = set()
+        for checkpoint_id in checkpoints:
+            referenced.update(self._channel_versions.get((thread_id, checkpoint_ns, checkpoint_id), {}).items())
+        blob_keys = self._blob_keys[(thread_id, checkpoint_ns)]
+        for channel, version in blob_keys - referenced:
+            self.blobs.pop((thread_id, checkpoint_ns, channel, version), None)
+        blob_keys &= referenced
+
+    def _delete_thread(self, thread_id: str):
+        super().delete_thread(thread_id)
+        for key in [key for key in self._channel_versions if key[0] == thread_id]:
+            del self._channel_versions[key]
+        for key in [key for key in self._blob_keys if key[0] == thread_id]:
+            del self._blob_keys[key]
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._threads.pop(str(thread_id), None)
+            self._delete_thread(str(thread_id))
+
+
+def _prune_sql_checkpoints(cursor, placeholder: str, thread_id: str, checkpoint_ns: str,
+                           parent_id: Optional[str], max_checkpoints: Optional[int], compact_writes: bool,
+                           writes_table: str):
+    """ Delete checkpoints above the limit and superseded writes, statements are the same in SQLite and PostgreSQL """
+    p = placeholder
+    if compact_writes and parent_id:
+        cursor.execute(
+            f"DELETE FROM {writes_table} WHERE thread_id = {p} AND checkpoint_ns = {p} AND checkpoint_id = {p}",
+            (thread_id, checkpoint_ns, parent_id))
+    if not max_checkpoints:
+        return
+    keep = (f"SELECT checkpoint_id FROM checkpoints WHERE thread_id = {p} AND checkpoint_ns = {p} "
+            f"ORDER BY checkpoint_id DESC LIMIT {p}")
+    for table in ("checkpoints", writes_table):
+        cursor.execute(
+            f"DELETE FROM {table} WHERE thread_id = {p} AND checkpoint_ns = {p} AND checkpoint_id NOT IN ({keep})",
+            (thread_id, checkpoint_ns, thread_id, checkpoint_ns, int(max_checkpoints)))
+
+
+def _create_sqlite_saver(path: str, max_checkpoints_per_thread: Optional[int], compact_writes: bool):
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    class BoundedSqliteSaver(SqliteSaver):
+        """ SqliteSaver keeping recent checkpoints of every thread """
+
+        def put(self, config: RunnableConfig, checkpoint, metadata, new_versions) -> RunnableConfig:
+            saved = super().put(config, checkpoint, metadata, new_versions)
+            thread_id, checkpoint_ns, parent_id = _checkpoint_location(config)
+            with self.cursor() as cursor:
+                _prune_sql_checkpoints(cursor, "?", thread_id, checkpoint_ns, parent_id,
+                                       max_checkpoints_per_thread, compact_writes, "writes")
+            return saved
+
+    path = os.path.expanduser(path)
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    saver = BoundedSqliteSaver(sqlite3.connect(path, check_same_thread=False))
+    saver.setup()
+    return saver
+
+
+def _create_postgres_saver(connection_string: str, max_checkpoints_per_thread: Optional[int], compact_writes: bool):
+    from langgraph.checkpoint.postgres import PostgresSaver
+    from psycopg.rows import dict_row
+    from psycopg_pool import ConnectionPool
+
+    class BoundedPostgresSaver(PostgresSaver):
+        """ PostgresSaver keeping recent checkpoints of every thread and their channel values """
+
+        def put(self, config: RunnableConfig, checkpoint, metadata, new_versions) -> RunnableConfig:
+            saved = super().put(config, checkpoint, metadata, new_versions)
+            thread_id, checkpoint_ns, parent_id = _checkpoint_location(config)
+            with self._cursor() as cursor:
+                _prune_sql_checkpoints(cursor, "%s", thread_id, checkpoint_ns, parent_id,
+                                       max_checkpoints_per_thread, compact_writes, "checkpoint_writes")
+                if max_checkpoints_per_thread:
+                    # Channel values are stored once per version, drop versions no kept checkpoint refers to
+                    cursor.execute(
+                        "DELETE FROM checkpoint_blobs b WHERE b.thread_id = %s AND b.checkpoint_ns = %s "
+                        "AND NOT EXISTS (SELECT 1 FROM checkpoints c WHERE c.thread_id = b.thread_id "
+                        "AND c.checkpoint_ns = b.checkpoint_ns "
+                        "AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version)",
+                        (thread_id, checkpoint_ns))
+            return saved
+
+    # SQLAlchemy style connection strings of pgvector configurations are accepted as well
+    conninfo = connection_string.replace("postgresql+psycopg://", "postgresql://", 1)
+    pool = ConnectionPool(conninfo, open=True, check=ConnectionPool.check_connection,
+                          kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row})
+    saver = BoundedPostgresSaver(pool)
+    saver.setup()
+    return saver
+
+
+def create_checkpointer(config: Union[str, dict, None] = None) -> BaseCheckpointSaver:
+    """ Create checkpointer from configuration
+
+    Args:
+        config: path of SQLite file or dict, see module docstring.
+            Defaults to ALITA_CHECKPOINTER environment variable, in-memory checkpointer if it is not set.
+
+    Returns:
+        Checkpointer. Durable checkpointers are shared by calls with the same configuration,
+        the ones failing to initialize fall back to the in-memory checkpointer.
+    """
+    if config is None:
+        config = os.environ.get(CHECKPOINTER_ENV)
+        if config and config.lstrip().startswith("{"):
+            config = json.loads(config)
+    if isinstance(config, str):
+        config = {"backend": "sqlite", "path": config} if config not in ("memory", "") else {}
+    config = config or {}
+    backend = config.get("backend", "memory")
+    max_checkpoints = config.get("max_checkpoints_per_thread", DEFAULT_MAX_CHECKPOINTS_PER_THREAD)
+    compact_writes = config.get("compact_writes", True)
+    if backend not in ("memory", "sqlite", "postgres", "pgvector"):
+        raise ValueError(f"Unknown checkpointer backend: {backend}")
+    if backend != "memory":
+        key = json.dumps(config, sort_keys=True, default=str)
+        with _durable_savers_lock:
+            saver = _durable_savers.get(key)
+            if saver is not None:
+                return saver
+            try:
+                if backend == "sqlite":
+                    saver = _create_sqlite_saver(config.get("path", "~/.alita/checkpoints.sqlite"),
+                                                 max_checkpoints, compact_writes)
+                else:
+                    saver = _create_postgres_saver(config["connection_string"], max_checkpoints, compact_writes)
+            except Exception as e:
+                logger.error(f"Failed to initialize {backend} checkpointer, using in-memory checkpointer: {e}")
+            else:
+                _durable_savers[key] = saver
+                return saver
+    return BoundedMemorySaver(
+        max_threads=config.get("max_threads", DEFAULT_MAX_THREADS),
+        max_checkpoints_per_thread=max_checkpoints,
+        compact_writes=compact_writes,
+    )
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 from typing import List, Optional, Iterator
 from charset_normalizer import from_path, from_bytes
 from csv import DictReader
@@ -29,7 +30,7 @@ class AlitaCSVLoader(AlitaTableLoader):
                  columns: Optional[List[str]] = None,
                  cleanse: bool = True,
                  **kwargs):
-        super().__init__(file_path=file_path, file_content=file_content, json_documents=json_documents, columns=columns, raw_content=raw_content, cleanse=cleanse)
+        super().__init__(file_path=file_path, file_content=file_content, json_documents=json_documents, columns=columns, raw_content=raw_content, cleanse=cleanse, **kwargs)
         self.encoding = encoding
         self.autodetect_encoding = autodetect_encoding
         if self.file_path:
@@ -38,8 +39,14 @@ class AlitaCSVLoader(AlitaTableLoader):
         else:
             self.encoding = from_bytes(self.file_content).best().encoding
 
+    def _open(self):
+        """Text stream over the file, or over the content when loaded from memory."""
+        if self.file_path:
+            return open(self.file_path, 'r', encoding=self.encoding)
+        return io.TextIOWrapper(io.BytesIO(self.file_content), encoding=self.encoding)
+
     def read_lazy(self) -> Iterator[dict]:
-        with open(self.file_path, 'r', encoding=self.encoding) as fd:
+        with self._open() as fd:
             if self.raw_content:
                 yield fd.read()
                 return
@@ -47,11 +54,7 @@ class AlitaCSVLoader(AlitaTableLoader):
                 yield row
 
     def read(self) -> Any:
-        if self.file_path:
-            with open(self.file_path, 'r', encoding=self.encoding) as fd:
-                if self.raw_content:
-                    return [fd.read()]
-                return list(DictReader(fd))
-        else:
-            super.row_content = True
-            return self.file_content
+        with self._open() as fd:
+            if self.raw_content:
+                return [fd.read()]
+            return list(DictReader(fd))
@@ -15,9 +15,10 @@ from bs4 import BeautifulSoup
 
 from alita_sdk.tools.chunkers.sematic.markdown_chunker import markdown_by_headers_chunker
 from .utils import perform_llm_prediction_for_image_bytes
+from .bytes_loader import BytesLoaderMixin
 
 
-class AlitaDocxMammothLoader(BaseLoader):
+class AlitaDocxMammothLoader(BytesLoaderMixin, BaseLoader):
     """
     Loader for Docx files using Mammoth to convert to HTML, with image handling,
     and then Markdownify to convert HTML to markdown.
@@ -400,7 +401,7 @@ class AlitaDocxMammothLoader(BaseLoader):
                           and metadata including the source file path.
         """
         result_content = self.get_content()
-        return list(markdown_by_headers_chunker(iter([Document(page_content=result_content, metadata={'source': str(self.path)})]), config={'max_tokens':self.max_tokens}))
+        return list(markdown_by_headers_chunker(iter([Document(page_content=result_content, metadata={'source': str(self.path or self.file_name)})]), config={'max_tokens':self.max_tokens}))
 
     def get_content(self):
         """
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import importlib.util
 import io
 import logging
 import os
@@ -22,11 +23,14 @@ from openpyxl import load_workbook
 from xlrd import open_workbook
 from langchain_core.documents import Document
 from .AlitaTableLoader import AlitaTableLoader
+from .bytes_loader import memory_temp_file
 from alita_sdk.runtime.langchain.constants import LOADER_MAX_TOKENS_DEFAULT
 
 logger = logging.getLogger(__name__)
 
 cell_delimiter = " | "
+# formulas library (optional) evaluates workbooks from a path only
+FORMULAS_AVAILABLE = importlib.util.find_spec("formulas") is not None
 
 class AlitaExcelLoader(AlitaTableLoader):
     sheet_name: str = None
@@ -105,6 +109,9 @@ class AlitaExcelLoader(AlitaTableLoader):
         computed_values = {}
         if isinstance(self.file_path, str):
             computed_values = self._compute_formula_values(self.file_path)
+        elif self.file_content and FORMULAS_AVAILABLE:
+            with memory_temp_file(self.file_content, suffix='.xlsx') as file_path:
+                computed_values = self._compute_formula_values(file_path)
 
         sheets = workbook.sheetnames
         if self.sheet_name:
@@ -260,7 +267,7 @@ class AlitaExcelLoader(AlitaTableLoader):
         content_per_sheet = self.get_content()
         for sheet_name, content_chunks in content_per_sheet.items():
             metadata = {
-                "source": f'{self.file_path}:{sheet_name}',
+                "source": f'{self.source}:{sheet_name}',
                 "sheet_name": sheet_name,
                 "file_type": "excel",
             }
@@ -10,13 +10,14 @@ from reportlab.graphics import renderPM
 from svglib.svglib import svg2rlg
 
 from .utils import perform_llm_prediction_for_image_bytes
+from .bytes_loader import BytesLoaderMixin
 from ..constants import DEFAULT_MULTIMODAL_PROMPT
 from ..tools.utils import image_to_byte_array, bytes_to_base64
 
 Image.MAX_IMAGE_PIXELS = 300_000_000
 
 
-class AlitaImageLoader(BaseLoader):
+class AlitaImageLoader(BytesLoaderMixin, BaseLoader):
     """Loads image files using pytesseract for OCR or optionally LLM for advanced analysis, including SVG support."""
 
     def __init__(self, file_path=None, **kwargs):
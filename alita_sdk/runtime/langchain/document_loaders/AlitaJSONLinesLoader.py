@@ -30,7 +30,7 @@ class AlitaJSONLinesLoader(AlitaJSONLoader):
                 for line in f:
                     yield line
         # Fallback to file_content if available
-        elif hasattr(self, "file_content") and self.file_content:
+        elif hasattr(self, "file_content") and self.file_content is not None:
             # file_content may be bytes or a file-like object
             if isinstance(self.file_content, (bytes, bytearray)):
                 text = self.file_content.decode(self.encoding)
@@ -8,14 +8,16 @@ from langchain_community.document_loaders.helpers import detect_file_encodings
 from langchain_core.tools import ToolException
 from langchain_text_splitters import RecursiveJsonSplitter
 
+from .bytes_loader import BytesLoaderMixin
 
-class AlitaJSONLoader(BaseLoader):
+
+class AlitaJSONLoader(BytesLoaderMixin, BaseLoader):
 
     def __init__(self, **kwargs):
         """Initialize with file path."""
         if kwargs.get('file_path'):
             self.file_path = kwargs['file_path']
-        elif kwargs.get('file_content'):
+        elif kwargs.get('file_content') is not None:
             self.file_content = kwargs['file_content']
             self.file_name = kwargs['file_name']
         else:
@@ -29,7 +31,7 @@ class AlitaJSONLoader(BaseLoader):
             if hasattr(self, 'file_path') and self.file_path:
                 with open(self.file_path, encoding=self.encoding) as f:
                     return json.load(f)
-            elif hasattr(self, 'file_content') and self.file_content:
+            elif hasattr(self, 'file_content') and self.file_content is not None:
                 if isinstance(self.file_content, bytes):
                     return json.loads(self.file_content.decode(self.encoding))
                 elif isinstance(self.file_content, str):
@@ -49,7 +51,7 @@ class AlitaJSONLoader(BaseLoader):
                                 return f.read()
                         except UnicodeDecodeError:
                             continue
-                elif hasattr(self, 'file_content') and self.file_content:
+                elif hasattr(self, 'file_content') and self.file_content is not None:
                     detected_encodings = detect_file_encodings(self.file_content)
                     for encoding in detected_encodings:
                         try:
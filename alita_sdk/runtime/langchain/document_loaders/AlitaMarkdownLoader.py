@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, List, Union, Generator, Iterator
+from typing import Any, List, Optional, Union, Generator, Iterator
 from langchain_core.documents import Document
 
 from langchain_community.document_loaders.unstructured import (
@@ -7,13 +7,18 @@ from langchain_community.document_loaders.unstructured import (
     validate_unstructured_version,
 )
 
-class AlitaMarkdownLoader(UnstructuredFileLoader):
+from .bytes_loader import BytesLoaderMixin
+
+
+class AlitaMarkdownLoader(BytesLoaderMixin, UnstructuredFileLoader):
 
     def __init__(
         self,
-        file_path: Union[str, Path],
+        file_path: Union[str, Path] = None,
         mode: str = "elements",
         chunker_config: dict = None,
+        file_content: Optional[bytes] = None,
+        file_name: Optional[str] = None,
         **unstructured_kwargs: Any,
     ):
         """
@@ -22,9 +27,12 @@ class AlitaMarkdownLoader(UnstructuredFileLoader):
             mode: The mode to use when loading the file. Can be one of "single",
                 "multi", or "all". Default is "single".
             chunker_config: Configuration dictionary for the markdown chunker.
+            file_content: Content of the Markdown file, used instead of file_path.
+            file_name: Name of the file the content comes from.
             **unstructured_kwargs: Any kwargs to pass to the unstructured.
         """
-        file_path = str(file_path)
+        self.file_content = file_content
+        file_path = str(file_path if file_path is not None else file_name)
         validate_unstructured_version("0.4.16")
         self.chunker_config = chunker_config or {
             "strip_header": False,
@@ -40,8 +48,11 @@ class AlitaMarkdownLoader(UnstructuredFileLoader):
         Creates a generator that yields a single Document object
         representing the entire content of the Markdown file.
         """
-        with open(self.file_path, "r", encoding="utf-8") as file:
-            content = file.read()
+        if self.file_content is not None:
+            content = self.file_content.decode("utf-8")
+        else:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                content = file.read()
         yield Document(page_content=content, metadata={"source": self.file_path})
 
     def _get_elements(self) -> List[Document]:
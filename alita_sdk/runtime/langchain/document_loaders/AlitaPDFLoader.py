@@ -1,18 +1,22 @@
 import pymupdf
 import fitz
 from langchain_community.document_loaders import PyPDFium2Loader
+from langchain_community.document_loaders.parsers import PyPDFium2Parser
+from langchain_core.document_loaders import Blob
 
 from .ImageParser import ImageParser
+from .bytes_loader import BytesLoaderMixin
 from .utils import perform_llm_prediction_for_image_bytes, create_temp_file
 from langchain_core.tools import ToolException
 
-class AlitaPDFLoader:
+class AlitaPDFLoader(BytesLoaderMixin):
 
     def __init__(self, **kwargs):
         if kwargs.get('file_path'):
             self.file_path = kwargs.get('file_path')
         elif kwargs.get('file_content'):
             self.file_content = kwargs.get('file_content')
+            self.file_name = kwargs.get('file_name')
         else:
             raise ToolException("'file_path' or 'file_content' parameter should be provided.")
         self.password = kwargs.get('password', None)
@@ -109,13 +113,13 @@ class AlitaPDFLoader:
 
     def load(self):
         if not hasattr(self, 'file_path'):
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(mode='w+b', delete=True, suffix=".pdf") as temp_file:
-                temp_file.write(self.file_content)
-                temp_file.flush()
-                self.file_path = temp_file.name
-                return self._load_docs()
+            # parse from memory with the same parser PyPDFium2Loader uses for files
+            parser = PyPDFium2Parser(
+                password=self.password,
+                extract_images=self.extract_images,
+                images_parser=ImageParser(llm=self.llm, prompt=self.prompt),
+            )
+            return self._set_chunk_ids(list(parser.lazy_parse(Blob.from_data(self.file_content, path=self.file_name))))
         else:
             return self._load_docs()
 
@@ -127,6 +131,10 @@ class AlitaPDFLoader:
                 extract_images = self.extract_images,
                 images_parser = ImageParser(llm=self.llm, prompt=self.prompt),
             ).load()
+        return self._set_chunk_ids(docs)
+
+    @staticmethod
+    def _set_chunk_ids(docs):
         for doc in docs:
             doc.metadata['chunk_id'] = doc.metadata['page']
-        return docs
\ No newline at end of file
+        return docs
@@ -3,11 +3,12 @@ import io
 from langchain_core.tools import ToolException
 from pptx import Presentation
 from .utils import perform_llm_prediction_for_image_bytes, create_temp_file
+from .bytes_loader import BytesLoaderMixin
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from langchain_core.documents import Document
 
 
-class AlitaPowerPointLoader:
+class AlitaPowerPointLoader(BytesLoaderMixin):
 
     def __init__(self, file_path=None, file_content=None, mode=None, **unstructured_kwargs):
         if file_path:
@@ -17,8 +17,11 @@ from langchain_core.documents import Document
 from typing import List, Optional, Iterator
 from json import dumps
 from .utils import cleanse_data
+from .bytes_loader import BytesLoaderMixin
+
+class AlitaTableLoader(BytesLoaderMixin, BaseLoader):
+    file_name: Optional[str] = None
 
-class AlitaTableLoader(BaseLoader):
     def __init__(self,
                  file_path: str = None,
                  file_content: bytes = None,
@@ -33,6 +36,13 @@ class AlitaTableLoader(BaseLoader):
         self.json_documents = json_documents
         self.columns = columns
         self.cleanse = cleanse
+        if kwargs.get('file_name'):
+            self.file_name = kwargs['file_name']
+
+    @property
+    def source(self):
+        """File path, or file name when the content is loaded from memory."""
+        return self.file_path if isinstance(self.file_path, str) else self.file_name
 
     def read(self, lazy: bool = False):
         raise NotImplementedError("Excel loader is not implemented yet")
@@ -60,8 +70,8 @@ class AlitaTableLoader(BaseLoader):
         docs = []
         for idx, row in enumerate(self.read()):
             metadata = {
-                "source": f'{self.file_path}:{idx+1}',
-                "table_source": self.file_path,
+                "source": f'{self.source}:{idx+1}',
+                "table_source": self.source,
             }
             if len(docs) == 0 and not self.raw_content:
                 header_metadata = metadata.copy()
@@ -84,8 +94,8 @@ class AlitaTableLoader(BaseLoader):
         data = self.read_lazy()
         for idx, row in enumerate(data):
             metadata = {
-                "source": f'{self.file_path}:{idx+1}',
-                "table_source": self.file_path,
+                "source": f'{self.source}:{idx+1}',
+                "table_source": self.source,
             }
             if self.raw_content:
                 yield Document(page_content=row, metadata=metadata)
@@ -7,15 +7,16 @@ from langchain_community.document_loaders.helpers import detect_file_encodings
 from langchain_core.tools import ToolException
 
 from alita_sdk.tools.chunkers import markdown_chunker
+from .bytes_loader import BytesLoaderMixin
 
 
-class AlitaTextLoader(BaseLoader):
+class AlitaTextLoader(BytesLoaderMixin, BaseLoader):
 
     def __init__(self, **kwargs):
         """Initialize with file path."""
         if kwargs.get('file_path'):
             self.file_path = kwargs['file_path']
-        elif  kwargs.get('file_content'):
+        elif kwargs.get('file_content') is not None:
             self.file_content = kwargs['file_content']
             self.file_name = kwargs['file_name']
         else:
@@ -31,7 +32,7 @@ class AlitaTextLoader(BaseLoader):
             if hasattr(self, 'file_path') and self.file_path:
                 with open(self.file_path, encoding=self.encoding) as f:
                     text = f.read()
-            elif hasattr(self, 'file_content') and self.file_content:
+            elif hasattr(self, 'file_content') and self.file_content is not None:
                 text = self.file_content.decode(self.encoding)
             else:
                 raise ValueError("Neither file_path nor file_content is provided.")
@@ -0,0 +1,46 @@
+"""
+In-memory loading contract for document loaders.
+
+Loaders mixing in `BytesLoaderMixin` parse the content straight from memory via `from_bytes`. Loaders which
+truly need a path on disk (unstructured-based ones) get a temporary file created on tmpfs when available,
+so no disk I/O is involved.
+"""
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from typing import Generator, Optional
+
+# tmpfs mount points checked (in order) for temporary files of path-only loaders
+MEMORY_TEMP_DIRS = ("/dev/shm",)
+
+
+class BytesLoaderMixin:
+    """Loader able to parse the file content from memory, without a file on disk."""
+
+    @classmethod
+    def from_bytes(cls, content: bytes, file_name: str, **kwargs):
+        """Creates a loader for the content; file_name is used for format detection and as `source`."""
+        return cls(file_content=content, file_name=file_name, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def memory_temp_dir() -> Optional[str]:
+    """Writable tmpfs directory for temporary files, None (system default) if there is none."""
+    for directory in MEMORY_TEMP_DIRS:
+        if os.path.isdir(directory) and os.access(directory, os.W_OK | os.X_OK):
+            return directory
+    return None
+
+
+@contextmanager
+def memory_temp_file(content: bytes, suffix: str = "") -> Generator[str, None, None]:
+    """Writes the content to a temporary file (on tmpfs when available), yields its path and removes it."""
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=memory_temp_dir())
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        yield path
+    finally:
+        with suppress(FileNotFoundError):
+            os.remove(path)
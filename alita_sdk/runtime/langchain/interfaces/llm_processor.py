@@ -159,7 +159,32 @@ def get_vectorstore(vectorstore_type, vectorstore_params, embedding_func=None):
                 vectorstore_params["embeddings"] = embedding_func
             #
             from langchain_postgres import PGVector  # pylint: disable=E0401,C0415
-            return PGVector(**vectorstore_params)
+            vectorstore = PGVector(**vectorstore_params)
+            #
+            if "target_schema" in sdk_options and sdk_options.get("metadata_indexes", True):
+                from ...tools.pgvector_schema import (  # pylint: disable=C0415
+                    METADATA_COLUMNS_ATTR, ensure_metadata_indexes,
+                )
+                #
+                setattr(vectorstore, METADATA_COLUMNS_ATTR, ensure_metadata_indexes(
+                    engine, sdk_options["target_schema"],
+                    generated_columns=sdk_options.get("metadata_generated_columns", False),
+                ))
+            #
+            full_text_index = sdk_options.get("full_text_index")
+            if full_text_index and full_text_index.get("fields"):
+                # Schema changes run here only, searches use the index when it exists
+                from ...tools.pgvector_search import PGVectorSearch  # pylint: disable=C0415
+                #
+                pg_helper = PGVectorSearch.from_vectorstore(
+                    vectorstore, language=full_text_index.get("language", "english"),
+                )
+                if pg_helper is not None:
+                    pg_helper.ensure_full_text_index(
+                        full_text_index["fields"], stored=full_text_index.get("stored", False),
+                    )
+            #
+            return vectorstore
     #
     if vectorstore_type in vectorstores:
         vectorstore_params = vectorstore_params.copy()
@@ -171,10 +196,8 @@ def get_vectorstore(vectorstore_type, vectorstore_params, embedding_func=None):
     #
     raise RuntimeError(f"Unknown VectorStore type: {vectorstore_type}")
 
-def add_documents(vectorstore, documents, ids = None) -> list[str]:
-    """ Add documents to vectorstore """
-    if vectorstore is None:
-        return None
+def prepare_documents(documents) -> tuple[list[str], list[dict]]:
+    """ Get texts and flattened metadata of documents with non-empty content """
     texts = []
     metadata = []
     for document in documents:
@@ -187,6 +210,29 @@ def add_documents(vectorstore, documents, ids = None) -> list[str]:
             if isinstance(document.metadata[key], dict):
                 document.metadata[key] = dumps(document.metadata[key])
         metadata.append(document.metadata)
+    return texts, metadata
+
+
+def supports_precomputed_embeddings(vectorstore) -> bool:
+    """ Check if vectorstore can store documents with embeddings calculated beforehand """
+    # Chroma has no public API for it, it embeds documents on write
+    return hasattr(vectorstore, "add_embeddings")
+
+
+def add_documents(vectorstore, documents, ids = None, embeddings = None) -> list[str]:
+    """ Add documents to vectorstore
+
+    If embeddings are provided (one vector per document with non-empty content) and vectorstore supports it,
+    documents are inserted as is, without embedding them again.
+    """
+    if vectorstore is None:
+        return None
+    texts, metadata = prepare_documents(documents)
+    if embeddings is not None and texts and supports_precomputed_embeddings(vectorstore):
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(texts)} documents")
+        # PGVector
+        return vectorstore.add_embeddings(texts, embeddings, metadatas=metadata, ids=ids)
     return vectorstore.add_texts(texts, metadatas=metadata, ids=ids)
 
 
@@ -990,7 +990,9 @@ def create_graph(
                                 name=node_id, return_type='dict',
                                 output_variables=node.get('output', []),
                                 input_variables=node.get('input', ['messages']),
-                                task=node.get('task', '')
+                                task=node.get('task', ''),
+                                parallelism=node.get('parallelism', 1),
+                                item_timeout=node.get('item_timeout')
                             ))
                         elif node_type == 'loop_from_tool':
                             loop_toolkit_name = node.get('loop_toolkit_name')
@@ -1009,7 +1011,9 @@ def create_graph(
                                             output_variables=node.get('output', []),
                                             input_variables=node.get('input', ['messages']),
                                             structured_output=node.get('structured_output', False),
-                                            task=node.get('task')
+                                            task=node.get('task'),
+                                            parallelism=node.get('parallelism', 1),
+                                            item_timeout=node.get('item_timeout')
                                         ))
                                         break
                         elif node_type == 'indexer':
@@ -1104,6 +1108,8 @@ def create_graph(
                     input_variables=node.get('input', ['messages']),
                     structured_output=node.get('structured_output', False),
                     tool_execution_timeout=node.get('tool_execution_timeout', 900),
+                    parallel_tool_calls=node.get('parallel_tool_calls', False),
+                    max_parallel_tool_calls=node.get('max_parallel_tool_calls', 5),
                     available_tools=available_tools,
                     tool_names=tool_names,
                     steps_limit=kwargs.get('steps_limit', 25),
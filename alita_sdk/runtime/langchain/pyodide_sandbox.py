@@ -6,11 +6,13 @@ based on langchain-sandbox but without the version constraints.
 
 import asyncio
 import dataclasses
+import functools
 import json
 import logging
 import os
 import shutil
 import subprocess
+import tempfile
 import time
 from typing import Annotated, Any, Literal
 
@@ -23,8 +25,17 @@ from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool, InjectedToolCallId
 from pydantic import BaseModel, Field
 
+from .pyodide_worker_pool import (
+    DEFAULT_MAX_EXECUTIONS,
+    PyodideWorkerError,
+    PyodideWorkerPool,
+    PyodideWorkerStartError,
+    get_worker_pool,
+)
+
 logger = logging.getLogger(__name__)
 
+SESSION_FILE_FLAG = "--session-file"
 
 Status = Literal["success", "error"]
 
@@ -51,6 +62,46 @@ def get_default_pkg_name() -> str | None:
     return os.environ.get("PYODIDE_SANDBOX_PKG")
 
 
+def get_default_worker_pool_size() -> int:
+    """Get the number of warm sandbox workers from environment.
+
+    Set PYODIDE_SANDBOX_WORKERS environment variable to enable workers. By default (0)
+    every execution starts a new Deno process with a fresh interpreter. Workers are
+    shared by all sandboxes with the same permissions and restore interpreter state
+    between executions only partially, see worker_isolation in the entrypoint.
+    """
+    return int(os.environ.get("PYODIDE_SANDBOX_WORKERS", "0"))
+
+
+def get_default_worker_max_executions() -> int:
+    """Get the number of executions after which a sandbox worker is replaced.
+
+    Set PYODIDE_SANDBOX_WORKER_MAX_EXECUTIONS environment variable to change it.
+    """
+    return int(os.environ.get("PYODIDE_SANDBOX_WORKER_MAX_EXECUTIONS", str(DEFAULT_MAX_EXECUTIONS)))
+
+
+@functools.lru_cache(maxsize=None)
+def entrypoint_reads_session_file(pkg_name: str) -> bool:
+    """Whether the entrypoint accepts --session-file (infra/data/sandbox/main.ts).
+
+    Upstream entrypoints ignore unknown flags, so sessions are passed to them on
+    the command line, which is limited by ARG_MAX.
+    """
+    try:
+        with open(pkg_name, encoding="utf-8") as f:
+            return SESSION_FILE_FLAG in f.read()
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def grant_path(value: bool | list[str], path: str | None) -> bool | list[str]:
+    """Permission setting extended with access to the path."""
+    if path is None or value is True:
+        return value
+    return [*(value or []), path]
+
+
 def build_permission_flag(
     flag: str,
     *,
@@ -84,6 +135,8 @@ class BasePyodideSandbox:
         node_modules_dir: str = "auto",
         skip_deno_check: bool = False,
         pkg_name: str | None = None,
+        worker_pool_size: int | None = None,
+        worker_max_executions: int | None = None,
     ) -> None:
         """Initialize the sandbox with specific Deno permissions.
 
@@ -99,6 +152,15 @@ class BasePyodideSandbox:
             skip_deno_check: Skip Deno installation check.
             pkg_name: Path to the Deno entrypoint script. If not provided,
                 reads from PYODIDE_SANDBOX_PKG environment variable.
+            worker_pool_size: Number of warm workers executing code, 0 starts
+                a new Deno process for every execution. If not provided, reads
+                from PYODIDE_SANDBOX_WORKERS environment variable (default 0).
+                Workers are shared by sandboxes with the same permissions, enable
+                them only where executions of different users may share modules
+                first imported by an earlier execution and installed packages.
+            worker_max_executions: Executions after which a worker is replaced.
+                If not provided, reads from PYODIDE_SANDBOX_WORKER_MAX_EXECUTIONS
+                environment variable.
         """
         self.stateful = stateful
         self.allow_env = allow_env
@@ -109,6 +171,10 @@ class BasePyodideSandbox:
         self.allow_ffi = allow_ffi
         self.node_modules_dir = node_modules_dir
         self.pkg_name = pkg_name or get_default_pkg_name()
+        self.worker_pool_size = (
+            get_default_worker_pool_size() if worker_pool_size is None else worker_pool_size
+        )
+        self.worker_max_executions = worker_max_executions or get_default_worker_max_executions()
 
         if not self.pkg_name:
             raise RuntimeError(
@@ -122,15 +188,8 @@ class BasePyodideSandbox:
                 "Install from: https://docs.deno.com/runtime/getting_started/installation/"
             )
 
-    def _build_command(
-        self,
-        code: str,
-        *,
-        session_bytes: bytes | None = None,
-        session_metadata: dict | None = None,
-        memory_limit_mb: int | None = None,
-    ) -> list[str]:
-        """Build the Deno command with appropriate flags."""
+    def _deno_command(self, memory_limit_mb: int | None = None, session_file: str | None = None) -> list[str]:
+        """Build the Deno command with permission and memory flags, the session file is readable and writable."""
         cmd = [
             "deno",
             "run",
@@ -141,8 +200,8 @@ class BasePyodideSandbox:
         # Add permission flags
         permission_configs = [
             ("--allow-env", self.allow_env),
-            ("--allow-read", self.allow_read),
-            ("--allow-write", self.allow_write),
+            ("--allow-read", grant_path(self.allow_read, session_file)),
+            ("--allow-write", grant_path(self.allow_write, session_file)),
             ("--allow-net", self.allow_net),
             ("--allow-run", self.allow_run),
             ("--allow-ffi", self.allow_ffi),
@@ -156,6 +215,20 @@ class BasePyodideSandbox:
         if memory_limit_mb:
             cmd.append(f"--v8-flags=--max-old-space-size={memory_limit_mb}")
 
+        return cmd
+
+    def _build_command(
+        self,
+        code: str,
+        *,
+        session_bytes: bytes | None = None,
+        session_metadata: dict | None = None,
+        memory_limit_mb: int | None = None,
+        session_file: str | None = None,
+    ) -> list[str]:
+        """Build the Deno command running a single execution, session bytes are passed in the session file if any."""
+        cmd = self._deno_command(memory_limit_mb, session_file)
+
         # Add the package and code
         cmd.extend([self.pkg_name, "-c", code])
 
@@ -164,7 +237,9 @@ class BasePyodideSandbox:
             cmd.append("-s")
 
         # Add session state if provided
-        if session_bytes:
+        if session_file:
+            cmd.extend([SESSION_FILE_FLAG, session_file])
+        elif session_bytes:
             bytes_array = list(session_bytes)
             cmd.extend(["-b", json.dumps(bytes_array)])
 
@@ -173,6 +248,78 @@ class BasePyodideSandbox:
 
         return cmd
 
+    def _create_session_file(self, session_bytes: bytes | None) -> str | None:
+        """Temporary file passing the session to a new process, None if the entrypoint takes it from argv only."""
+        if not (self.stateful or session_bytes) or not entrypoint_reads_session_file(self.pkg_name):
+            return None
+        fd, path = tempfile.mkstemp(prefix="pyodide_session_", suffix=".bin")
+        with os.fdopen(fd, "wb") as f:
+            f.write(session_bytes or b"")
+        return path
+
+    @staticmethod
+    def _remove_session_file(session_file: str | None) -> None:
+        if session_file:
+            try:
+                os.remove(session_file)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _result_session_bytes(full_result: dict, session_file: str | None) -> bytes | None:
+        """Session bytes of the execution output, written to the session file or listed in the output."""
+        if session_file and full_result.get("sessionFile"):
+            with open(session_file, "rb") as f:
+                return f.read() or None
+        session_bytes_array = full_result.get("sessionBytes", None)
+        return bytes(session_bytes_array) if session_bytes_array else None
+
+    def _get_worker_pool(self, memory_limit_mb: int | None = None) -> PyodideWorkerPool | None:
+        """Get the pool of warm workers, None when executions run in new processes."""
+        if self.worker_pool_size <= 0:
+            return None
+        pool = get_worker_pool(
+            [*self._deno_command(memory_limit_mb), self.pkg_name, "--worker"],
+            size=self.worker_pool_size,
+            max_executions=self.worker_max_executions,
+        )
+        if pool.start_error is not None:
+            # E.g. entrypoint without worker mode, it was logged when workers failed to start
+            return None
+        return pool
+
+    def _worker_request(
+        self,
+        code: str,
+        session_bytes: bytes | None,
+        session_metadata: dict | None,
+    ) -> tuple[dict, bytes]:
+        """Build the worker request, session bytes are sent as the binary payload."""
+        header = {"code": code, "stateful": self.stateful, "sessionMetadata": session_metadata}
+        return header, session_bytes or b""
+
+    @staticmethod
+    def _worker_error(error: Exception, start_time: float) -> CodeExecutionResult:
+        """Convert worker timeout or crash to CodeExecutionResult."""
+        return CodeExecutionResult(
+            status="error",
+            execution_time=time.time() - start_time,
+            stderr=str(error),
+        )
+
+    @staticmethod
+    def _worker_result(full_result: dict, session_bytes: bytes, start_time: float) -> CodeExecutionResult:
+        """Convert the worker result to CodeExecutionResult."""
+        return CodeExecutionResult(
+            status="success" if full_result.get("success", False) else "error",
+            execution_time=time.time() - start_time,
+            stdout=full_result.get("stdout") or None,
+            stderr=full_result.get("stderr") or None,
+            result=full_result.get("result"),
+            session_metadata=full_result.get("sessionMetadata"),
+            session_bytes=session_bytes or None,
+        )
+
 
 class PyodideSandbox(BasePyodideSandbox):
     """Asynchronous implementation of PyodideSandbox."""
@@ -193,20 +340,34 @@ class PyodideSandbox(BasePyodideSandbox):
         result = None
         status: Literal["success", "error"] = "success"
 
+        pool = self._get_worker_pool(memory_limit_mb)
+        if pool is not None:
+            header, payload = self._worker_request(code, session_bytes, session_metadata)
+            try:
+                full_result, result_bytes = await asyncio.wrap_future(
+                    pool.submit(header, payload, timeout_seconds)
+                )
+                return self._worker_result(full_result, result_bytes, start_time)
+            except PyodideWorkerStartError as e:
+                logger.warning(f"Sandbox workers are not available, starting a process per execution: {e}")
+            except (TimeoutError, PyodideWorkerError) as e:
+                return self._worker_error(e, start_time)
+
+        session_file = self._create_session_file(session_bytes)
         cmd = self._build_command(
             code,
             session_bytes=session_bytes,
             session_metadata=session_metadata,
             memory_limit_mb=memory_limit_mb,
-        )
-
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            session_file=session_file,
         )
 
         try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
             stdout_bytes, stderr_bytes = await asyncio.wait_for(
                 process.communicate(),
                 timeout=timeout_seconds,
@@ -220,10 +381,7 @@ class PyodideSandbox(BasePyodideSandbox):
                 result = full_result.get("result", None)
                 status = "success" if full_result.get("success", False) else "error"
                 session_metadata = full_result.get("sessionMetadata", None)
-                session_bytes_array = full_result.get("sessionBytes", None)
-                session_bytes = (
-                    bytes(session_bytes_array) if session_bytes_array else None
-                )
+                session_bytes = self._result_session_bytes(full_result, session_file)
             else:
                 stderr = stderr_bytes.decode("utf-8", errors="replace")
                 status = "error"
@@ -234,6 +392,8 @@ class PyodideSandbox(BasePyodideSandbox):
             stderr = f"Execution timed out after {timeout_seconds} seconds"
         except asyncio.CancelledError:
             pass
+        finally:
+            self._remove_session_file(session_file)
 
         end_time = time.time()
 
@@ -267,11 +427,24 @@ class SyncPyodideSandbox(BasePyodideSandbox):
         stderr: str
         status: Literal["success", "error"]
 
+        pool = self._get_worker_pool(memory_limit_mb)
+        if pool is not None:
+            header, payload = self._worker_request(code, session_bytes, session_metadata)
+            try:
+                full_result, result_bytes = pool.submit(header, payload, timeout_seconds).result()
+                return self._worker_result(full_result, result_bytes, start_time)
+            except PyodideWorkerStartError as e:
+                logger.warning(f"Sandbox workers are not available, starting a process per execution: {e}")
+            except (TimeoutError, PyodideWorkerError) as e:
+                return self._worker_error(e, start_time)
+
+        session_file = self._create_session_file(session_bytes)
         cmd = self._build_command(
             code,
             session_bytes=session_bytes,
             session_metadata=session_metadata,
             memory_limit_mb=memory_limit_mb,
+            session_file=session_file,
         )
 
         try:
@@ -294,10 +467,7 @@ class SyncPyodideSandbox(BasePyodideSandbox):
                 result = full_result.get("result", None)
                 status = "success" if full_result.get("success", False) else "error"
                 session_metadata = full_result.get("sessionMetadata", None)
-                session_bytes_array = full_result.get("sessionBytes", None)
-                session_bytes = (
-                    bytes(session_bytes_array) if session_bytes_array else None
-                )
+                session_bytes = self._result_session_bytes(full_result, session_file)
             else:
                 stderr = stderr_bytes.decode("utf-8", errors="replace")
                 status = "error"
@@ -305,6 +475,8 @@ class SyncPyodideSandbox(BasePyodideSandbox):
         except subprocess.TimeoutExpired:
             status = "error"
             stderr = f"Execution timed out after {timeout_seconds} seconds"
+        finally:
+            self._remove_session_file(session_file)
 
         end_time = time.time()
 
@@ -0,0 +1,321 @@
+"""Pool of warm Deno/Pyodide workers used by PyodideSandbox.
+
+Starting `deno run` boots Pyodide and loads micropip for every execution, which
+takes seconds. Workers started with the `--worker` flag of the sandbox
+entrypoint (infra/data/sandbox/main.ts) boot once and then execute requests
+read from stdin, writing results to stdout.
+
+Requests and results are frames: two unsigned 32-bit big-endian lengths, a JSON
+header of the first length and a binary payload of the second one. The payload
+carries the dill session snapshot of stateful executions, so sessions are not
+passed on the command line.
+
+Isolation is weaker than with a process per execution: the worker restores
+`__main__`, builtins, modules loaded at startup, `os.environ`, the working
+directory and files of its work directories before every execution, but modules
+first imported by an execution stay loaded and micropip-installed packages stay
+installed until the worker is recycled. Pools are therefore opt-in
+(PYODIDE_SANDBOX_WORKERS).
+
+Workers are recycled after `max_executions` executions or when they time out or
+crash, a warm replacement is started in the background. Worker processes are
+driven by an event loop running in a daemon thread, so pools can be used from
+sync code and from any event loop.
+"""
+
+import asyncio
+import atexit
+import collections
+import concurrent.futures
+import json
+import logging
+import struct
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct(">II")
+
+DEFAULT_MAX_EXECUTIONS = 100
+DEFAULT_STARTUP_TIMEOUT = 120.0
+
+
+class PyodideWorkerError(RuntimeError):
+    """Worker process exited or broke the protocol."""
+
+
+class PyodideWorkerStartError(PyodideWorkerError):
+    """Worker process did not become ready, e.g. the entrypoint has no worker mode."""
+
+
+def encode_frame(header: dict, payload: bytes = b"") -> bytes:
+    """Encode a request or result frame."""
+    header_bytes = json.dumps(header).encode("utf-8")
+    return FRAME_HEADER.pack(len(header_bytes), len(payload)) + header_bytes + payload
+
+
+async def read_frame(stream: asyncio.StreamReader) -> tuple[dict, bytes]:
+    """Read a frame, raises asyncio.IncompleteReadError at end of stream."""
+    header_length, payload_length = FRAME_HEADER.unpack(
+        await stream.readexactly(FRAME_HEADER.size)
+    )
+    header = json.loads(await stream.readexactly(header_length))
+    payload = await stream.readexactly(payload_length) if payload_length else b""
+    return header, payload
+
+
+class PyodideWorker:
+    """Worker process executing one request at a time."""
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.executions = 0
+        self._stderr_tail: collections.deque = collections.deque(maxlen=20)
+        self._stderr_task = asyncio.ensure_future(self._drain_stderr())
+
+    @classmethod
+    async def start(cls, command: list[str], startup_timeout: float) -> "PyodideWorker":
+        """Start a worker and wait until Pyodide is loaded."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            raise PyodideWorkerStartError(f"Failed to start sandbox worker: {e}") from None
+        worker = cls(process)
+        try:
+            header, _ = await asyncio.wait_for(worker._read_frame(), startup_timeout)
+        except asyncio.TimeoutError:
+            worker.kill()
+            raise PyodideWorkerStartError(
+                f"Sandbox worker was not ready after {startup_timeout} seconds"
+            ) from None
+        except PyodideWorkerError as e:
+            worker.kill()
+            raise PyodideWorkerStartError(str(e)) from None
+        if not header.get("ready"):
+            worker.kill()
+            raise PyodideWorkerStartError(f"Unexpected sandbox worker handshake: {header}")
+        return worker
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def _drain_stderr(self) -> None:
+        # Unread stderr would fill the pipe and block the worker
+        async for line in self.process.stderr:
+            line = line.decode("utf-8", errors="replace").rstrip()
+            self._stderr_tail.append(line)
+            logger.debug(f"Sandbox worker {self.process.pid}: {line}")
+
+    async def _read_frame(self) -> tuple[dict, bytes]:
+        try:
+            return await read_frame(self.process.stdout)
+        except asyncio.IncompleteReadError:
+            returncode = await self.process.wait()
+            # Let the stderr reader catch up with the output of the exited process
+            await asyncio.wait({self._stderr_task}, timeout=1)
+            details = "\n".join(self._stderr_tail)
+            raise PyodideWorkerError(
+                f"Sandbox worker exited with code {returncode}" + (f": {details}" if details else "")
+            ) from None
+
+    async def execute(self, header: dict, payload: bytes) -> tuple[dict, bytes]:
+        """Send a request frame and read the result frame."""
+        self.executions += 1
+        try:
+            self.process.stdin.write(encode_frame(header, payload))
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the reason is reported by _read_frame
+        return await self._read_frame()
+
+    def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        # Reap the process
+        asyncio.ensure_future(self.process.wait())
+
+
+class PyodideWorkerPool:
+    """Warm workers started with the same command (permissions, memory limit).
+
+    Args:
+        command: worker command line.
+        size: maximal number of workers, all of them are warmed up on first use.
+        max_executions: executions after which a worker is replaced.
+        startup_timeout: seconds to wait for a worker to load Pyodide.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        *,
+        size: int = 2,
+        max_executions: int = DEFAULT_MAX_EXECUTIONS,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+    ) -> None:
+        self.command = list(command)
+        self.size = max(size, 1)
+        self.max_executions = max_executions
+        self.startup_timeout = startup_timeout
+        self.start_error: PyodideWorkerStartError | None = None
+        self._idle: collections.deque[PyodideWorker] = collections.deque()
+        self._busy: set[PyodideWorker] = set()
+        self._warming: set[asyncio.Task] = set()
+        self._slots: asyncio.Semaphore | None = None
+        self._stats = {"executions": 0, "workers_started": 0, "workers_recycled": 0, "startup_time": 0.0}
+
+    def submit(self, header: dict, payload: bytes = b"", timeout: float | None = None) -> concurrent.futures.Future:
+        """Execute a request on a warm worker, thread-safe.
+
+        Returns:
+            Future of the result header and payload. It fails with PyodideWorkerStartError
+            when workers can't be started, TimeoutError when the execution timed out and
+            PyodideWorkerError when the worker crashed.
+        """
+        return asyncio.run_coroutine_threadsafe(self._execute(header, payload, timeout), _pool_loop())
+
+    def warm(self) -> None:
+        """Start workers in the background until the pool is full, thread-safe."""
+        _pool_loop().call_soon_threadsafe(self._warm)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "idle": len(self._idle),
+            "busy": len(self._busy),
+            "starting": len(self._warming),
+        }
+
+    def _warm(self) -> None:
+        if self.start_error is not None:
+            return
+        while len(self._idle) + len(self._busy) + len(self._warming) < self.size:
+            task = asyncio.ensure_future(self._warm_worker())
+            self._warming.add(task)
+            task.add_done_callback(self._warming.discard)
+
+    async def _warm_worker(self) -> None:
+        try:
+            self._idle.append(await self._start_worker())
+        except PyodideWorkerError as e:
+            logger.warning(f"Failed to warm up sandbox worker: {e}")
+
+    async def _start_worker(self) -> PyodideWorker:
+        started = time.perf_counter()
+        try:
+            worker = await PyodideWorker.start(self.command, self.startup_timeout)
+        except PyodideWorkerStartError as e:
+            self.start_error = e
+            raise
+        self._stats["workers_started"] += 1
+        self._stats["startup_time"] += time.perf_counter() - started
+        return worker
+
+    async def _acquire(self) -> PyodideWorker:
+        while True:
+            while self._idle:
+                worker = self._idle.popleft()
+                if worker.alive:
+                    return worker
+            if self.start_error is not None:
+                raise self.start_error
+            if not self._warming:
+                return await self._start_worker()
+            await asyncio.wait(set(self._warming), return_when=asyncio.FIRST_COMPLETED)
+
+    async def _execute(self, header: dict, payload: bytes, timeout: float | None) -> tuple[dict, bytes]:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        async with self._slots:
+            worker = await self._acquire()
+            self._busy.add(worker)
+            self._warm()
+            reusable = False
+            try:
+                result = await asyncio.wait_for(worker.execute(header, payload), timeout)
+                reusable = True
+                return result
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Execution timed out after {timeout} seconds") from None
+            finally:
+                self._stats["executions"] += 1
+                self._busy.discard(worker)
+                self._release(worker, reusable)
+
+    def _release(self, worker: PyodideWorker, reusable: bool) -> None:
+        if reusable and worker.alive and worker.executions < self.max_executions:
+            self._idle.append(worker)
+            return
+        # Timed out, cancelled or crashed workers are in unknown state, they are replaced as well
+        worker.kill()
+        self._stats["workers_recycled"] += 1
+        self._warm()
+
+    async def aclose(self) -> None:
+        for task in list(self._warming):
+            task.cancel()
+        for worker in [*self._idle, *self._busy]:
+            worker.kill()
+        self._idle.clear()
+        self._busy.clear()
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_pools: dict[tuple, PyodideWorkerPool] = {}
+_lock = threading.Lock()
+
+
+def _pool_loop() -> asyncio.AbstractEventLoop:
+    """Event loop of worker processes, running in a daemon thread."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="pyodide-worker-pool", daemon=True).start()
+        return _loop
+
+
+def get_worker_pool(
+    command: list[str],
+    *,
+    size: int = 2,
+    max_executions: int = DEFAULT_MAX_EXECUTIONS,
+) -> PyodideWorkerPool:
+    """Process-wide pool of workers started with the command, warmed up when created."""
+    key = (tuple(command), size, max_executions)
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = PyodideWorkerPool(command, size=size, max_executions=max_executions)
+            created = True
+        else:
+            created = False
+    if created:
+        pool.warm()
+    return pool
+
+
+def shutdown_worker_pools() -> None:
+    """Stop all workers."""
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+        loop = _loop
+    if loop is None:
+        return
+    for pool in pools:
+        try:
+            asyncio.run_coroutine_threadsafe(pool.aclose(), loop).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Failed to stop sandbox workers: {e}")
+
+
+atexit.register(shutdown_worker_pools)
@@ -1,11 +1,57 @@
+import asyncio
 import threading
 import atexit
 import logging
+import weakref
+from typing import Any, Dict
 from urllib.parse import urlparse, unquote
 
 logger = logging.getLogger(__name__)
 
+# Settings of the connection pools backing the stores, see StoreManager.configure
+DEFAULT_POOL_CONFIG = {
+    "min_size": 1,
+    "max_size": 10,
+    # seconds to wait for a free connection before the store call fails
+    "timeout": 30.0,
+    # seconds idle connections above min_size are kept
+    "max_idle": 300.0,
+    # seconds after which connections are replaced
+    "max_lifetime": 3600.0,
+    # seconds to retry connecting after the database became unavailable
+    "reconnect_timeout": 300.0,
+    # check connections with a query before handing them out
+    "check": True,
+}
+
+
+def _pool_stats(pool) -> dict:
+    """ Usage of a psycopg pool: waiting requests, connections in use and average checkout latency """
+    stats = pool.get_stats()
+    requests_num = stats.get("requests_num", 0)
+    return {
+        "min_size": stats.get("pool_min", 0),
+        "max_size": stats.get("pool_max", 0),
+        "size": stats.get("pool_size", 0),
+        "available": stats.get("pool_available", 0),
+        "in_use": stats.get("pool_size", 0) - stats.get("pool_available", 0),
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests_num,
+        "checkout_latency_ms": stats.get("requests_wait_ms", 0) / requests_num if requests_num else 0.0,
+        "checkout_errors": stats.get("requests_errors", 0),
+        "connections_opened": stats.get("connections_num", 0),
+        "connections_failed": stats.get("connections_errors", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
+
+
 class StoreManager:
+    """ Process-wide PostgresStore instances, one per connection string
+
+    Every store is backed by a connection pool, so threads using the store don't share one connection,
+    connections are checked before use and broken ones are replaced. Async stores (`aget_store`)
+    have a pool per event loop.
+    """
     _instance = None
     _lock = threading.Lock()
 
@@ -15,8 +61,20 @@ class StoreManager:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
                     cls._instance._stores = {}
+                    cls._instance._pools = {}
+                    cls._instance._async_stores = weakref.WeakKeyDictionary()
+                    cls._instance._pool_config = dict(DEFAULT_POOL_CONFIG)
         return cls._instance
 
+    def configure(self, **pool_config) -> None:
+        """
+        Update settings of connection pools created afterwards, see DEFAULT_POOL_CONFIG.
+        """
+        unknown = set(pool_config) - set(DEFAULT_POOL_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown store pool settings: {', '.join(sorted(unknown))}")
+        self._pool_config.update(pool_config)
+
     def _parse_connection_string(self, conn_str: str) -> dict:
         """
         Parse the connection string from SQLAlchemy style to args dict.
@@ -34,34 +92,121 @@ class StoreManager:
             "dbname": parsed.path.lstrip("/") if parsed.path else None
         }
 
+    def _pool_name(self, conn_params: dict) -> str:
+        # Connection strings contain passwords, pools are named and logged without them
+        return f"{conn_params.get('user')}@{conn_params.get('host')}:{conn_params.get('port')}/{conn_params.get('dbname')}"
+
+    def _pool_kwargs(self, conn_str: str, check) -> dict:
+        conn_params = self._parse_connection_string(conn_str)
+        name = self._pool_name(conn_params)
+        conn_params.update({'autocommit': True, 'prepare_threshold': 0})
+        config = dict(self._pool_config)
+
+        def reconnect_failed(pool):
+            logger.error(f"Store connection pool {name} failed to reconnect for "
+                         f"{config['reconnect_timeout']} seconds")
+
+        return {
+            "kwargs": conn_params,
+            "name": name,
+            "min_size": config["min_size"],
+            "max_size": config["max_size"],
+            "timeout": config["timeout"],
+            "max_idle": config["max_idle"],
+            "max_lifetime": config["max_lifetime"],
+            "reconnect_timeout": config["reconnect_timeout"],
+            "reconnect_failed": reconnect_failed,
+            "check": check if config["check"] else None,
+        }
+
     def get_store(self, conn_str: str):
-        from psycopg import Connection
+        from psycopg_pool import ConnectionPool
         from langgraph.store.postgres import PostgresStore
-        
+
         store = self._stores.get(conn_str)
         if store is None:
-            logger.info(f"Creating new PostgresStore for connection: {conn_str}")
-            conn_params = self._parse_connection_string(conn_str)
-            conn_params.update({'autocommit': True, 'prepare_threshold': 0})
-            conn = Connection.connect(**conn_params)
-            store = PostgresStore(conn)
-            store.setup()
-            self._stores[conn_str] = store
+            with self._lock:
+                store = self._stores.get(conn_str)
+                if store is None:
+                    pool_kwargs = self._pool_kwargs(conn_str, ConnectionPool.check_connection)
+                    logger.info(f"Creating new PostgresStore for connection: {pool_kwargs['name']}")
+                    pool = ConnectionPool(open=True, **pool_kwargs)
+                    try:
+                        store = PostgresStore(pool)
+                        store.setup()
+                    except Exception:
+                        pool.close()
+                        raise
+                    self._pools[conn_str] = pool
+                    self._stores[conn_str] = store
         return store
 
+    async def aget_store(self, conn_str: str):
+        """
+        AsyncPostgresStore of the running event loop for the connection string.
+        """
+        from psycopg_pool import AsyncConnectionPool
+        from langgraph.store.postgres.aio import AsyncPostgresStore
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._async_stores.setdefault(loop, {"lock": asyncio.Lock(), "stores": {}, "pools": {}})
+        async with entry["lock"]:
+            store = entry["stores"].get(conn_str)
+            if store is None:
+                pool_kwargs = self._pool_kwargs(conn_str, AsyncConnectionPool.check_connection)
+                logger.info(f"Creating new AsyncPostgresStore for connection: {pool_kwargs['name']}")
+                pool = AsyncConnectionPool(open=False, **pool_kwargs)
+                await pool.open()
+                try:
+                    store = AsyncPostgresStore(pool)
+                    await store.setup()
+                except Exception:
+                    await pool.close()
+                    raise
+                entry["pools"][conn_str] = pool
+                entry["stores"][conn_str] = store
+        return store
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Usage of the store connection pools by pool name (connection without password).
+        """
+        stats = {name: _pool_stats(pool) for name, pool in self._named_pools(self._pools)}
+        for entry in list(self._async_stores.values()):
+            for name, pool in self._named_pools(entry["pools"]):
+                stats[f"{name} (async)"] = _pool_stats(pool)
+        return stats
+
+    def _named_pools(self, pools: dict):
+        return [(getattr(pool, 'name', None) or conn_str, pool) for conn_str, pool in list(pools.items())]
+
+    async def aclose(self) -> None:
+        """
+        Close async stores of the running event loop.
+        """
+        entry = self._async_stores.pop(asyncio.get_running_loop(), None)
+        if entry:
+            for pool in entry["pools"].values():
+                try:
+                    await pool.close()
+                except Exception:
+                    pass
+
     def shutdown(self) -> None:
         logger.info("Shutting down StoreManager and closing all stores")
-        for store in list(self._stores.values()):
+        for pool in list(self._pools.values()):
             try:
-                conn = getattr(store, 'conn', None)
-                if conn:
-                    conn.close()
+                pool.close()
             except Exception:
                 pass
+        self._pools.clear()
         self._stores.clear()
+        # Async pools can only be closed in their event loops, see aclose
+        self._async_stores.clear()
 
 _store_manager = StoreManager()
 atexit.register(_store_manager.shutdown)
 
 def get_manager() -> StoreManager:
-    return _store_manager
\ No newline at end of file
+    return _store_manager
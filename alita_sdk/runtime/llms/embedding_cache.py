@@ -0,0 +1,376 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+# Copyright (c) 2024 Artem Rozumenko
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Persistent embedding cache
+
+Embeddings are stored by (model, sha256(text)), so re-indexing re-embeds only new text.
+`CachedEmbeddings` wraps any langchain `Embeddings` and is transparent for vector stores
+(`add_documents`) and chunkers (`embed_documents`).
+
+Backends:
+    - SQLiteEmbeddingCache: local file, no extra dependencies;
+    - PGEmbeddingCache: table in a PostgreSQL schema (e.g. the schema of the vector store).
+
+Both evict entries older than `ttl` seconds and the least recently used entries above `max_entries`.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from langchain_core.embeddings import Embeddings  # pylint: disable=E0401
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_ENV = "ALITA_EMBEDDING_CACHE"
+EMBEDDING_CACHE_TABLE = "alita_embedding_cache"
+DEFAULT_MAX_ENTRIES = 1_000_000
+# Eviction by size is checked after this number of new entries
+EVICTION_INTERVAL = 1000
+# Number of keys per lookup query
+LOOKUP_BATCH_SIZE = 500
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def _pack(vector: Iterable[float]) -> bytes:
+    return array("d", vector).tobytes()
+
+
+def _unpack(data: bytes) -> List[float]:
+    vector = array("d")
+    vector.frombytes(bytes(data))
+    return vector.tolist()
+
+
+class EmbeddingCacheStore(ABC):
+    """ Storage of embeddings by (model, text hash) """
+
+    def __init__(self, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._added = 0
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def get_many(self, model: str, hashes: List[str]) -> Dict[str, List[float]]:
+        """ Cached embeddings for the hashes; expired entries are not returned """
+
+    @abstractmethod
+    def _put_many(self, model: str, items: Dict[str, List[float]]):
+        pass
+
+    @abstractmethod
+    def evict(self) -> int:
+        """ Remove expired and least recently used entries, returns number of removed entries """
+
+    @abstractmethod
+    def clear(self, model: Optional[str] = None):
+        pass
+
+    def put_many(self, model: str, items: Dict[str, List[float]]):
+        if not items:
+            return
+        self._put_many(model, items)
+        with self._lock:
+            self._added += len(items)
+            if self._added < EVICTION_INTERVAL:
+                return
+            self._added = 0
+        removed = self.evict()
+        if removed:
+            logger.info(f"Evicted {removed} entries from embedding cache")
+
+    def _expired_before(self) -> Optional[float]:
+        return time.time() - self.ttl if self.ttl else None
+
+
+class SQLiteEmbeddingCache(EmbeddingCacheStore):
+    """ Embedding cache in a local SQLite file """
+
+    def __init__(self, path: str, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = None):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self.path = os.path.expanduser(path)
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db_lock = threading.Lock()
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {EMBEDDING_CACHE_TABLE} ("
+                "model TEXT NOT NULL, hash TEXT NOT NULL, vector BLOB NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (model, hash)) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{EMBEDDING_CACHE_TABLE}_accessed_at "
+                f"ON {EMBEDDING_CACHE_TABLE} (accessed_at)"
+            )
+
+    def get_many(self, model: str, hashes: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        expired_before = self._expired_before()
+        now = time.time()
+        with self._db_lock:
+            for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+                batch = hashes[start:start + LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                query = (f"SELECT hash, vector FROM {EMBEDDING_CACHE_TABLE} "
+                         f"WHERE model = ? AND hash IN ({placeholders})")
+                params = [model, *batch]
+                if expired_before:
+                    query += " AND created_at >= ?"
+                    params.append(expired_before)
+                rows = self._conn.execute(query, params).fetchall()
+                found.update((row_hash, _unpack(vector)) for row_hash, vector in rows)
+            if found:
+                self._conn.executemany(
+                    f"UPDATE {EMBEDDING_CACHE_TABLE} SET accessed_at = ? WHERE model = ? AND hash = ?",
+                    [(now, model, row_hash) for row_hash in found],
+                )
+        return found
+
+    def _put_many(self, model: str, items: Dict[str, List[float]]):
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO {EMBEDDING_CACHE_TABLE} "
+                    "(model, hash, vector, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    [(model, row_hash, _pack(vector), now, now) for row_hash, vector in items.items()],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def evict(self) -> int:
+        removed = 0
+        expired_before = self._expired_before()
+        with self._db_lock:
+            if expired_before:
+                removed += self._conn.execute(
+                    f"DELETE FROM {EMBEDDING_CACHE_TABLE} WHERE created_at < ?", (expired_before,)
+                ).rowcount
+            if self.max_entries:
+                total = self._conn.execute(f"SELECT COUNT(*) FROM {EMBEDDING_CACHE_TABLE}").fetchone()[0]
+                if total > self.max_entries:
+                    removed += self._conn.execute(
+                        f"DELETE FROM {EMBEDDING_CACHE_TABLE} WHERE (model, hash) IN ("
+                        f"SELECT model, hash FROM {EMBEDDING_CACHE_TABLE} ORDER BY accessed_at LIMIT ?)",
+                        (total - self.max_entries,),
+                    ).rowcount
+        return removed
+
+    def clear(self, model: Optional[str] = None):
+        with self._db_lock:
+            if model is None:
+                self._conn.execute(f"DELETE FROM {EMBEDDING_CACHE_TABLE}")
+            else:
+                self._conn.execute(f"DELETE FROM {EMBEDDING_CACHE_TABLE} WHERE model = ?", (model,))
+
+
+class PGEmbeddingCache(EmbeddingCacheStore):
+    """ Embedding cache in a PostgreSQL table, shared by all workers using the database """
+
+    def __init__(self, connection_string: str, schema: str = "public",
+                 max_entries: Optional[int] = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = None):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        from sqlalchemy import create_engine, text  # pylint: disable=C0415,E0401
+
+        self._engine = create_engine(connection_string, pool_pre_ping=True)
+        quote = self._engine.dialect.identifier_preparer.quote
+        self.table = f"{quote(schema)}.{EMBEDDING_CACHE_TABLE}"
+        with self._engine.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {quote(schema)}"))
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "model text NOT NULL, hash text NOT NULL, vector bytea NOT NULL, "
+                "created_at double precision NOT NULL, accessed_at double precision NOT NULL, "
+                "PRIMARY KEY (model, hash))"
+            ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{EMBEDDING_CACHE_TABLE}_accessed_at ON {self.table} (accessed_at)"
+            ))
+
+    def get_many(self, model: str, hashes: List[str]) -> Dict[str, List[float]]:
+        from sqlalchemy import text  # pylint: disable=C0415,E0401
+
+        found = {}
+        expired_before = self._expired_before() or 0
+        with self._engine.begin() as conn:
+            for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+                rows = conn.execute(text(
+                    f"UPDATE {self.table} SET accessed_at = :now "
+                    "WHERE model = :model AND hash = ANY(:hashes) AND created_at >= :expired_before "
+                    "RETURNING hash, vector"
+                ), {"now": time.time(), "model": model, "hashes": hashes[start:start + LOOKUP_BATCH_SIZE],
+                    "expired_before": expired_before}).all()
+                found.update((row_hash, _unpack(vector)) for row_hash, vector in rows)
+        return found
+
+    def _put_many(self, model: str, items: Dict[str, List[float]]):
+        from sqlalchemy import text  # pylint: disable=C0415,E0401
+
+        now = time.time()
+        with self._engine.begin() as conn:
+            conn.execute(text(
+                f"INSERT INTO {self.table} (model, hash, vector, created_at, accessed_at) "
+                "VALUES (:model, :hash, :vector, :now, :now) "
+                "ON CONFLICT (model, hash) DO UPDATE SET vector = EXCLUDED.vector, "
+                "created_at = EXCLUDED.created_at, accessed_at = EXCLUDED.accessed_at"
+            ), [{"model": model, "hash": row_hash, "vector": _pack(vector), "now": now}
+                for row_hash, vector in items.items()])
+
+    def evict(self) -> int:
+        from sqlalchemy import text  # pylint: disable=C0415,E0401
+
+        removed = 0
+        expired_before = self._expired_before()
+        with self._engine.begin() as conn:
+            if expired_before:
+                removed += conn.execute(text(f"DELETE FROM {self.table} WHERE created_at < :expired_before"),
+                                        {"expired_before": expired_before}).rowcount
+            if self.max_entries:
+                total = conn.execute(text(f"SELECT COUNT(*) FROM {self.table}")).scalar()
+                if total > self.max_entries:
+                    removed += conn.execute(text(
+                        f"DELETE FROM {self.table} WHERE (model, hash) IN ("
+                        f"SELECT model, hash FROM {self.table} ORDER BY accessed_at LIMIT :excess)"
+                    ), {"excess": total - self.max_entries}).rowcount
+        return removed
+
+    def clear(self, model: Optional[str] = None):
+        from sqlalchemy import text  # pylint: disable=C0415,E0401
+
+        with self._engine.begin() as conn:
+            if model is None:
+                conn.execute(text(f"DELETE FROM {self.table}"))
+            else:
+                conn.execute(text(f"DELETE FROM {self.table} WHERE model = :model"), {"model": model})
+
+
+class CachedEmbeddings(Embeddings):
+    """ Embeddings wrapper looking up every text in the cache before calling the wrapped model """
+
+    def __init__(self, embeddings: Embeddings, store: EmbeddingCacheStore, model: Optional[str] = None):
+        self.embeddings = embeddings
+        self.store = store
+        self.model = model or _model_name(embeddings)
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def stats(self) -> dict:
+        return {"model": self.model, "hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        hashes = [text_hash(text) for text in texts]
+        try:
+            cached = self.store.get_many(self.model, list(dict.fromkeys(hashes)))
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all texts: {e}")
+            cached = {}
+        # texts repeated in the batch are embedded once
+        missing = {}
+        for row_hash, text in zip(hashes, texts):
+            if row_hash not in cached:
+                missing.setdefault(row_hash, text)
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            try:
+                self.store.put_many(self.model, computed)
+            except Exception as e:
+                logger.warning(f"Failed to store embeddings in cache: {e}")
+            cached.update(computed)
+        self._count(len(texts) - len(missing), len(missing))
+        logger.debug(f"Embedding cache: {len(texts) - len(missing)} of {len(texts)} texts found, "
+                     f"hit rate {self.hit_rate:.2%}")
+        return [cached[row_hash] for row_hash in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    def _count(self, hits: int, misses: int):
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += misses
+
+    def __getattr__(self, name: str) -> Any:
+        # attributes of the wrapped model (e.g. `model_name`, `dimensions`) stay available
+        embeddings = self.__dict__.get("embeddings")
+        if embeddings is None:
+            raise AttributeError(name)
+        return getattr(embeddings, name)
+
+
+def _model_name(embeddings: Embeddings) -> str:
+    for attr in ("model", "model_name", "deployment"):
+        value = getattr(embeddings, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(embeddings).__name__
+
+
+def create_embedding_cache(config: Union[str, dict, None] = None) -> Optional[EmbeddingCacheStore]:
+    """ Create cache store from configuration
+
+    Args:
+        config: path of SQLite file or dict with keys:
+            backend: 'sqlite' (default) or 'postgres';
+            path: SQLite file path;
+            connection_string, schema: PostgreSQL location of cache table;
+            max_entries: number of entries kept (LRU), None for unlimited;
+            ttl: entry lifetime in seconds, None for unlimited.
+            Defaults to path from ALITA_EMBEDDING_CACHE environment variable.
+
+    Returns:
+        Cache store or None if cache is not configured.
+    """
+    if config is None:
+        config = os.environ.get(EMBEDDING_CACHE_ENV)
+    if not config:
+        return None
+    if isinstance(config, str):
+        config = {"path": config}
+    backend = config.get("backend", "sqlite")
+    options = {"max_entries": config.get("max_entries", DEFAULT_MAX_ENTRIES), "ttl": config.get("ttl")}
+    if backend == "sqlite":
+        return SQLiteEmbeddingCache(config.get("path", "~/.alita/embedding_cache.sqlite"), **options)
+    if backend in ("postgres", "pgvector"):
+        return PGEmbeddingCache(config["connection_string"], schema=config.get("schema", "public"), **options)
+    raise ValueError(f"Unknown embedding cache backend: {backend}")
@@ -321,11 +321,12 @@ class SensitiveToolGuardMiddleware(Middleware):
             'value': str(resume_value.get('value', '') or ''),
         }
 
-    def _could_be_sensitive(self, tool: BaseTool) -> bool:
+    @classmethod
+    def _could_be_sensitive(cls, tool: BaseTool) -> bool:
         """Quick check whether a tool could match any sensitive tools config entry."""
-        tool_name = normalize_tool_name(self._get_tool_metadata_value(tool, 'tool_name') or tool.name)
-        toolkit_name = self._get_tool_metadata_value(tool, 'toolkit_name')
-        toolkit_type = self._get_tool_metadata_value(tool, 'toolkit_type', 'type')
+        tool_name = normalize_tool_name(cls._get_tool_metadata_value(tool, 'tool_name') or tool.name)
+        toolkit_name = cls._get_tool_metadata_value(tool, 'toolkit_name')
+        toolkit_type = cls._get_tool_metadata_value(tool, 'toolkit_type', 'type')
         identifiers = [i for i in [toolkit_type, toolkit_name] if i]
         if find_sensitive_tool_match(tool_name, identifiers) is not None:
             return True
@@ -502,3 +503,8 @@ class SensitiveToolGuardMiddleware(Middleware):
 
         self._wrapped_tools_cache[cache_key] = copied
         return copied
+
+
+def tool_may_require_approval(tool: BaseTool) -> bool:
+    """Whether the guard may interrupt calls of the tool to ask the user for approval."""
+    return has_sensitive_tools_config() and SensitiveToolGuardMiddleware._could_be_sensitive(tool)
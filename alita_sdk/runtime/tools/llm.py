@@ -2,6 +2,8 @@ import asyncio
 import contextvars
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from traceback import format_exc
 from typing import Any, Optional, List, Union, Literal, Dict, TYPE_CHECKING
 
@@ -67,6 +69,17 @@ _PENDING_TOOL_MESSAGES: contextvars.ContextVar[list] = contextvars.ContextVar(
     
 #     return supports_reasoning
 
+
+class _ToolCallError:
+    """Exception raised by a tool call, kept until results are processed in call order."""
+
+    __slots__ = ('error', 'details')
+
+    def __init__(self, error: BaseException, details: str = ''):
+        self.error = error
+        self.details = details
+
+
 JSON_INSTRUCTION_TEMPLATE = (
         "\n\n**IMPORTANT: You MUST respond with ONLY a valid JSON object.**\n\n"
         "Required JSON fields:\n{field_descriptions}\n\n"
@@ -100,6 +113,12 @@ class LLMNode(BaseTool):
     tool_names: Optional[List[str]] = Field(default=None, description='Specific tool names to filter')
     steps_limit: Optional[int] = Field(default=25, description='Maximum steps for tool execution')
     tool_execution_timeout: Optional[int] = Field(default=900, description='Timeout (seconds) for tool execution. Default is 15 minutes.')
+    parallel_tool_calls: Optional[bool] = Field(
+        default=False,
+        description='Execute independent tool calls of one completion concurrently. Calls of tools that may '
+                    'require user approval (sensitive tools) and of nested applications run one by one.'
+    )
+    max_parallel_tool_calls: Optional[int] = Field(default=5, description='Maximum concurrent tool calls of the node')
 
     # Lazy tools mode - reduces token usage by not binding all tools upfront
     lazy_tools_mode: Optional[bool] = Field(
@@ -1517,6 +1536,125 @@ class LLMNode(BaseTool):
         # Legacy async support
         return self.invoke(kwargs, **kwargs)
 
+    def _resolve_tool(self, tool_name: str, tool_lookup: Dict[str, BaseTool],
+                      forced_followup_lookup: Dict[str, BaseTool]) -> Optional[BaseTool]:
+        """Find the tool of a tool call in filtered tools and fallbacks."""
+        tool_to_execute = tool_lookup.get(tool_name)
+
+        # Fallback: check forced follow-up lookup (lazy mode).
+        # After a blocked-tool forced follow-up the LLM calls a real
+        # tool directly, but get_filtered_tools only returns meta-tools.
+        if tool_to_execute is None and tool_name in forced_followup_lookup:
+            tool_to_execute = forced_followup_lookup[tool_name]
+            logger.info("Resolved tool '%s' via forced-followup lookup", tool_name)
+
+        # Fallback: in lazy mode (and HITL resume) the tool may not appear
+        # in get_filtered_tools because that returns only meta-tools.
+        # Search available_tools and tool_registry for a direct match.
+        if tool_to_execute is None:
+            for tool in (self.available_tools or []):
+                if tool.name == tool_name:
+                    tool_to_execute = tool
+                    logger.info("Resolved tool '%s' via available_tools fallback", tool_name)
+                    break
+        if tool_to_execute is None and self.tool_registry is not None:
+            registry_tool = self.tool_registry.get_tool_by_name(tool_name)
+            if registry_tool is not None:
+                tool_to_execute = registry_tool
+                logger.info("Resolved tool '%s' via tool_registry fallback", tool_name)
+        return tool_to_execute
+
+    @staticmethod
+    def _must_run_alone(tool: Optional[BaseTool]) -> bool:
+        """Whether a tool call may interrupt the graph and so must not run concurrently.
+
+        interrupt() resume values are matched to interrupts by their order, so sensitive tools
+        (the guard asks the user for approval) and nested applications (may ask for input) run
+        one by one in call order.
+        """
+        # Lazy import to avoid circular dependency (sensitive_tool_guard -> tools.application)
+        from ..middleware.sensitive_tool_guard import tool_may_require_approval
+        from .application import Application
+
+        return tool is not None and (isinstance(tool, Application) or tool_may_require_approval(tool))
+
+    def _batch_tool_calls(self, resolved_calls: list) -> List[list]:
+        """Split resolved tool calls into batches executed one after another, keeping call order.
+
+        Without parallel_tool_calls every call is a batch of its own. Otherwise consecutive calls
+        form a batch, except calls that must run alone.
+        """
+        if not self.parallel_tool_calls or (self.max_parallel_tool_calls or 1) <= 1:
+            return [[call] for call in resolved_calls]
+        batches: List[list] = []
+        open_batch: Optional[list] = None
+        for call in resolved_calls:
+            if self._must_run_alone(call[3]):
+                batches.append([call])
+                open_batch = None
+            elif open_batch is None:
+                open_batch = [call]
+                batches.append(open_batch)
+            else:
+                open_batch.append(call)
+        return batches
+
+    async def _invoke_tool(self, tool_to_execute: BaseTool, tool_name: str, tool_args: Any, config: Any,
+                           executor: Optional[ThreadPoolExecutor] = None) -> Any:
+        """Execute a tool call; exceptions are returned as _ToolCallError."""
+        try:
+            logger.info(f"Executing tool '{tool_name}' with args: {tool_args}")
+            if executor is not None and not self._has_async_implementation(tool_to_execute):
+                # Sync tool of a parallel batch: run in the bounded pool of the batch, in a copy of the
+                # current context as BaseTool.ainvoke does for its default executor
+                loop = asyncio.get_running_loop()
+                context = contextvars.copy_context()
+                return await loop.run_in_executor(
+                    executor, partial(context.run, tool_to_execute.invoke, tool_args, config=config),
+                )
+            # Try async invoke first (for MCP tools), fallback to sync
+            if hasattr(tool_to_execute, 'ainvoke'):
+                try:
+                    return await tool_to_execute.ainvoke(tool_args, config=config)
+                except (NotImplementedError, AttributeError):
+                    logger.debug(f"Tool '{tool_name}' ainvoke failed, falling back to sync invoke")
+                    return tool_to_execute.invoke(tool_args, config=config)
+            # Sync-only tool
+            return tool_to_execute.invoke(tool_args, config=config)
+        except Exception as e:
+            return _ToolCallError(e, format_exc())
+
+    @staticmethod
+    def _has_async_implementation(tool: BaseTool) -> bool:
+        if getattr(tool, 'coroutine', None) is not None:
+            return True
+        return '_arun' in tool.__dict__ or type(tool)._arun is not BaseTool._arun
+
+    async def _execute_tool_calls(self, batch: list, config: Any) -> list:
+        """Execute a batch of resolved tool calls, concurrently when there are several.
+
+        Returns results in the order of the batch; None for calls of missing tools.
+        """
+        if len(batch) == 1:
+            tool_name, tool_args, _, tool_to_execute = batch[0]
+            if tool_to_execute is None:
+                return [None]
+            return [await self._invoke_tool(tool_to_execute, tool_name, tool_args, config)]
+
+        limit = min(self.max_parallel_tool_calls, len(batch))
+        semaphore = asyncio.Semaphore(limit)
+        logger.info(f"Executing {len(batch)} tool calls concurrently (limit {limit})")
+
+        with ThreadPoolExecutor(max_workers=limit, thread_name_prefix=f"{self.name}-tools") as executor:
+            async def run(call):
+                tool_name, tool_args, _, tool_to_execute = call
+                if tool_to_execute is None:
+                    return None
+                async with semaphore:
+                    return await self._invoke_tool(tool_to_execute, tool_name, tool_args, config, executor)
+
+            return list(await asyncio.gather(*(run(call) for call in batch)))
+
     async def __perform_tool_calling(self, completion, messages, llm_client, config, hitl_decisions=None):
         # Handle iterative tool-calling and execution
         logger.info(f"__perform_tool_calling called with {len(completion.tool_calls) if hasattr(completion, 'tool_calls') else 0} tool calls")
@@ -1584,6 +1722,12 @@ class LLMNode(BaseTool):
             blocked_tool_names: set[str] = set()
             blocked_payloads_this_iter: List[Dict[str, Any]] = []
 
+            # Resolve the tools once per iteration.
+            # Pass config to ensure dynamically selected tools are available
+            tool_lookup: Dict[str, BaseTool] = {}
+            for tool in self.get_filtered_tools(config=config):
+                tool_lookup.setdefault(tool.name, tool)
+            resolved_calls = []
             for tool_call in tool_calls:
                 tool_name = tool_call.get('name', '') if isinstance(tool_call, dict) else getattr(tool_call,
                                                                                                   'name',
@@ -1593,119 +1737,31 @@ class LLMNode(BaseTool):
                                                                                                   {})
                 tool_call_id = tool_call.get('id', '') if isinstance(tool_call, dict) else getattr(
                     tool_call, 'id', '')
+                tool_to_execute = self._resolve_tool(tool_name, tool_lookup, _forced_followup_lookup)
+                resolved_calls.append((tool_name, tool_args, tool_call_id, tool_to_execute))
+
+            for batch in self._batch_tool_calls(resolved_calls):
+                # Expose accumulated intermediate messages BEFORE invoking
+                # the tools.  If a tool triggers a sensitive-tool interrupt,
+                # the guard reads this contextvar so the messages survive the
+                # checkpoint and can be restored on resume.
+                _PENDING_TOOL_MESSAGES.set(list(new_messages[_input_msg_count:]))
+                outcomes = await self._execute_tool_calls(batch, config)
+
+                for (tool_name, tool_args, tool_call_id, tool_to_execute), tool_result in zip(batch, outcomes):
+                    from langchain_core.messages import ToolMessage
 
-                # Find the tool in filtered tools
-                # Pass config to ensure dynamically selected tools are available
-                filtered_tools = self.get_filtered_tools(config=config)
-                tool_to_execute = None
-                for tool in filtered_tools:
-                    if tool.name == tool_name:
-                        tool_to_execute = tool
-                        break
-
-                # Fallback: check forced follow-up lookup (lazy mode).
-                # After a blocked-tool forced follow-up the LLM calls a real
-                # tool directly, but get_filtered_tools only returns meta-tools.
-                if tool_to_execute is None and tool_name in _forced_followup_lookup:
-                    tool_to_execute = _forced_followup_lookup[tool_name]
-                    logger.info("Resolved tool '%s' via forced-followup lookup", tool_name)
-
-                # Fallback: in lazy mode (and HITL resume) the tool may not appear
-                # in get_filtered_tools because that returns only meta-tools.
-                # Search available_tools and tool_registry for a direct match.
-                if tool_to_execute is None:
-                    for tool in (self.available_tools or []):
-                        if tool.name == tool_name:
-                            tool_to_execute = tool
-                            logger.info("Resolved tool '%s' via available_tools fallback", tool_name)
-                            break
-                if tool_to_execute is None and self.tool_registry is not None:
-                    registry_tool = self.tool_registry.get_tool_by_name(tool_name)
-                    if registry_tool is not None:
-                        tool_to_execute = registry_tool
-                        logger.info("Resolved tool '%s' via tool_registry fallback", tool_name)
-
-                if tool_to_execute:
-                    try:
-                        logger.info(f"Executing tool '{tool_name}' with args: {tool_args}")
-
-                        # Expose accumulated intermediate messages BEFORE invoking
-                        # the tool.  If the tool triggers a sensitive-tool interrupt,
-                        # the guard reads this contextvar so the messages survive the
-                        # checkpoint and can be restored on resume.
-                        _PENDING_TOOL_MESSAGES.set(list(new_messages[_input_msg_count:]))
-
-                        # Try async invoke first (for MCP tools), fallback to sync
-                        tool_result = None
-                        if hasattr(tool_to_execute, 'ainvoke'):
-                            try:
-                                tool_result = await tool_to_execute.ainvoke(tool_args, config=config)
-                            except (NotImplementedError, AttributeError):
-                                logger.debug(f"Tool '{tool_name}' ainvoke failed, falling back to sync invoke")
-                                tool_result = tool_to_execute.invoke(tool_args, config=config)
-                        else:
-                            # Sync-only tool
-                            tool_result = tool_to_execute.invoke(tool_args, config=config)
-
-                        # Create tool message with result - preserve structured content
-                        from langchain_core.messages import ToolMessage
-
-                        blocked_payload = self._parse_sensitive_tool_blocked_result(tool_result)
-                        if blocked_payload is not None:
-                            blocked_tool_name = normalize_tool_name(
-                                blocked_payload.get('blocked_tool_name')
-                                or blocked_payload.get('tool_name')
-                                or tool_name
-                                or ''
-                            )
-                            if blocked_tool_name:
-                                blocked_tool_names.add(blocked_tool_name)
-                            enriched_payload = self._enrich_blocked_tool_payload(
-                                blocked_payload=blocked_payload,
-                            )
-                            blocked_payloads_this_iter.append(enriched_payload)
-                            tool_message = ToolMessage(
-                                content=json.dumps(
-                                    self._build_visible_blocked_tool_payload(blocked_payload),
-                                    ensure_ascii=True,
-                                    separators=(',', ':'),
-                                ),
-                                tool_call_id=tool_call_id,
-                            )
-                            new_messages.append(tool_message)
-                            continue
-
-                        # Check if tool_result is structured content (list of dicts)
-                        # Only use the structured fast-path when every item has an
-                        # LLM-standard content block type AND no bytes values are
-                        # present (bytes are not JSON-serializable and would cause
-                        # a 400 from the LLM API).
-                        _STANDARD_CONTENT_TYPES = {"text", "image", "image_url", "document", "search_result"}
-
-                        def _is_llm_safe_content_block(item: dict) -> bool:
-                            if not isinstance(item, dict):
-                                return False
-                            if item.get('type') not in _STANDARD_CONTENT_TYPES:
-                                return False
-                            return not any(isinstance(v, bytes) for v in item.values())
-
-                        if isinstance(tool_result, list) and tool_result and all(
-                                _is_llm_safe_content_block(item) for item in tool_result
-                        ):
-                            # Use structured content directly for multimodal support
-                            tool_message = ToolMessage(
-                                content=tool_result,
-                                tool_call_id=tool_call_id
-                            )
-                        else:
-                            # Fallback to string conversion for other tool results
-                            tool_message = ToolMessage(
-                                content=str(tool_result),
-                                tool_call_id=tool_call_id
-                            )
+                    if tool_to_execute is None:
+                        logger.warning(f"Tool '{tool_name}' not found in available tools")
+                        # Create error tool message for missing tool
+                        tool_message = ToolMessage(
+                            content=f"Tool '{tool_name}' not available",
+                            tool_call_id=tool_call_id
+                        )
                         new_messages.append(tool_message)
+                        continue
 
-                    except GraphBubbleUp:
+                    if isinstance(tool_result, _ToolCallError) and isinstance(tool_result.error, GraphBubbleUp):
                         # GraphInterrupt (from interrupt()) and other graph-level
                         # signals must propagate to the graph executor.
                         # Reset auto-approve context before propagating.
@@ -1714,27 +1770,73 @@ class LLMNode(BaseTool):
                         if _approved_token is not None:
                             reset_hitl_approved_tools(_approved_token)
                         _PENDING_TOOL_MESSAGES.set([])
-                        raise
-                    except Exception as e:
-                        import traceback
-                        error_details = traceback.format_exc()
+                        raise tool_result.error
+
+                    if isinstance(tool_result, _ToolCallError):
                         # Use debug level to avoid duplicate output when CLI callbacks are active
-                        logger.debug(f"Error executing tool '{tool_name}': {e}\n{error_details}")
+                        logger.debug(f"Error executing tool '{tool_name}': {tool_result.error}\n"
+                                     f"{tool_result.details}")
                         # Create error tool message
-                        from langchain_core.messages import ToolMessage
                         tool_message = ToolMessage(
-                            content=f"Error executing {tool_name}: {str(e)}",
+                            content=f"Error executing {tool_name}: {str(tool_result.error)}",
                             tool_call_id=tool_call_id
                         )
                         new_messages.append(tool_message)
-                else:
-                    logger.warning(f"Tool '{tool_name}' not found in available tools")
-                    # Create error tool message for missing tool
-                    from langchain_core.messages import ToolMessage
-                    tool_message = ToolMessage(
-                        content=f"Tool '{tool_name}' not available",
-                        tool_call_id=tool_call_id
-                    )
+                        continue
+
+                    blocked_payload = self._parse_sensitive_tool_blocked_result(tool_result)
+                    if blocked_payload is not None:
+                        blocked_tool_name = normalize_tool_name(
+                            blocked_payload.get('blocked_tool_name')
+                            or blocked_payload.get('tool_name')
+                            or tool_name
+                            or ''
+                        )
+                        if blocked_tool_name:
+                            blocked_tool_names.add(blocked_tool_name)
+                        enriched_payload = self._enrich_blocked_tool_payload(
+                            blocked_payload=blocked_payload,
+                        )
+                        blocked_payloads_this_iter.append(enriched_payload)
+                        tool_message = ToolMessage(
+                            content=json.dumps(
+                                self._build_visible_blocked_tool_payload(blocked_payload),
+                                ensure_ascii=True,
+                                separators=(',', ':'),
+                            ),
+                            tool_call_id=tool_call_id,
+                        )
+                        new_messages.append(tool_message)
+                        continue
+
+                    # Check if tool_result is structured content (list of dicts)
+                    # Only use the structured fast-path when every item has an
+                    # LLM-standard content block type AND no bytes values are
+                    # present (bytes are not JSON-serializable and would cause
+                    # a 400 from the LLM API).
+                    _STANDARD_CONTENT_TYPES = {"text", "image", "image_url", "document", "search_result"}
+
+                    def _is_llm_safe_content_block(item: dict) -> bool:
+                        if not isinstance(item, dict):
+                            return False
+                        if item.get('type') not in _STANDARD_CONTENT_TYPES:
+                            return False
+                        return not any(isinstance(v, bytes) for v in item.values())
+
+                    if isinstance(tool_result, list) and tool_result and all(
+                            _is_llm_safe_content_block(item) for item in tool_result
+                    ):
+                        # Use structured content directly for multimodal support
+                        tool_message = ToolMessage(
+                            content=tool_result,
+                            tool_call_id=tool_call_id
+                        )
+                    else:
+                        # Fallback to string conversion for other tool results
+                        tool_message = ToolMessage(
+                            content=str(tool_result),
+                            tool_call_id=tool_call_id
+                        )
                     new_messages.append(tool_message)
 
             # After the first iteration's tool calls are processed, activate
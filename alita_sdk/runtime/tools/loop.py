@@ -1,6 +1,8 @@
+import contextvars
 import logging
+import threading
 from json import dumps
-from typing import Any, Optional, Union
+from typing import Any, List, Optional, Union
 
 from langchain_core.callbacks import dispatch_custom_event
 from langchain_core.messages import HumanMessage, ToolCall
@@ -32,6 +34,89 @@ def process_response(response, return_type, accumulated_response):
     return accumulated_response
 
 
+class LoopItemOutcome:
+    """Result of one loop iteration: tool result or the raised error with its traceback"""
+
+    __slots__ = ('result', 'error', 'details')
+
+    def __init__(self, result: Any = None, error: Optional[BaseException] = None, details: str = ''):
+        self.result = result
+        self.error = error
+        self.details = details
+
+
+def invoke_loop_items(tool: BaseTool, items: list, config: Optional[RunnableConfig] = None,
+                      parallelism: int = 1, item_timeout: Optional[float] = None,
+                      **invoke_kwargs: Any) -> List[LoopItemOutcome]:
+    """Invoke the tool for every item of a loop node, outcomes are in the order of items.
+
+    By default items are invoked one by one in the calling thread. With parallelism above 1 up to
+    `parallelism` items run at once, each in its own thread. With item_timeout an iteration running
+    longer gets TimeoutError as its error; its thread cannot be interrupted and finishes in background,
+    but it no longer counts against parallelism.
+    """
+    if (parallelism or 1) <= 1 and not item_timeout:
+        outcomes = []
+        for item in items:
+            logger.debug(f"Loop step input: {item}")
+            try:
+                outcomes.append(LoopItemOutcome(result=tool.invoke(item, config=config, **invoke_kwargs)))
+            except Exception as e:
+                outcomes.append(LoopItemOutcome(error=e, details=format_exc()))
+        return outcomes
+
+    outcomes: List[Optional[LoopItemOutcome]] = [None] * len(items)
+    finished = [threading.Event() for _ in items]
+    slots = threading.Semaphore(max(parallelism or 1, 1))
+    lock = threading.Lock()
+
+    def complete(index: int, outcome: LoopItemOutcome):
+        # First of the tool result and the timeout wins, the slot is released once
+        with lock:
+            if outcomes[index] is not None:
+                return
+            outcomes[index] = outcome
+        slots.release()
+        finished[index].set()
+
+    def run(index: int, item: Any, timer: Optional[threading.Timer]):
+        logger.debug(f"Loop step input: {item}")
+        try:
+            outcome = LoopItemOutcome(result=tool.invoke(item, config=config, **invoke_kwargs))
+        except Exception as e:
+            outcome = LoopItemOutcome(error=e, details=format_exc())
+        if timer is not None:
+            timer.cancel()
+        complete(index, outcome)
+
+    for index, item in enumerate(items):
+        slots.acquire()
+        timer = None
+        if item_timeout:
+            timer = threading.Timer(item_timeout, complete, args=(index, LoopItemOutcome(
+                error=TimeoutError(f"Iteration timed out after {item_timeout} seconds"))))
+            timer.daemon = True
+        # Every iteration runs in a copy of the caller context, as langchain does for its executors
+        context = contextvars.copy_context()
+        worker = threading.Thread(target=context.run, args=(run, index, item, timer),
+                                  name=f"{tool.name}-loop-{index}", daemon=True)
+        worker.start()
+        if timer is not None:
+            timer.start()
+    for event in finished:
+        event.wait()
+    return outcomes
+
+
+def loop_failure_summary(items: list, outcomes: List[LoopItemOutcome]) -> str:
+    """Summary of failed iterations, empty when all of them succeeded"""
+    failed = [index for index, outcome in enumerate(outcomes) if outcome.error is not None]
+    if not failed:
+        return ''
+    logger.warning(f"{len(failed)} of {len(items)} loop iterations failed: {failed}")
+    return f"{len(failed)} of {len(items)} iterations failed (items {', '.join(str(i + 1) for i in failed)})"
+
+
 class LoopNode(BaseTool):
     name: str = 'LoopNode'
     description: str = 'This is tool node for tools'
@@ -41,6 +126,9 @@ class LoopNode(BaseTool):
     output_variables: Optional[list] = None
     input_variables: Optional[list] = None
     return_type: str = "str"
+    # Number of items invoked at once and timeout (seconds) of every invocation, see invoke_loop_items
+    parallelism: int = 1
+    item_timeout: Optional[float] = None
     prompt: str = """# ROLE: AI assistant generating tool arguments based on user intent.
 
 Input Data:
@@ -114,29 +202,33 @@ Input Data:
             output_varibles = {self.output_variables[0]: ""}
         if isinstance(loop_data, dict):
             loop_data = [loop_data]
+        failures = ''
         if isinstance(loop_data, list):
-            for each in loop_data:
-                logger.debug(f"LoopNode step input: {each}")
-                try:
-                    tool_run = self.tool.invoke(each, config=config)
+            outcomes = invoke_loop_items(self.tool, loop_data, config, self.parallelism, self.item_timeout)
+            for outcome in outcomes:
+                if outcome.error is None:
+                    tool_run = outcome.result
                     if len(self.output_variables) > 0:
                         output_varibles[self.output_variables[0]] += f'{tool_run}\n\n'
                     accumulated_response = process_response(tool_run, self.return_type, accumulated_response)
-                except ValidationError:
+                elif isinstance(outcome.error, ValidationError):
                     resp = f"""Tool input to the {self.tool.name} with value {loop_data} raised ValidationError.
                         \n\nTool schema is {dumps(params)} \n\nand the input to LLM was {predict_input[-1].content}\n\n"""
                     if len(self.output_variables) > 0:
                         output_varibles[self.output_variables[0]] += resp
                     accumulated_response = process_response(resp, self.return_type, accumulated_response)
-                    logger.error(f"ValidationError: {format_exc()}")
-                except Exception as e:
-                    resp = f"""Tool input to the {self.tool.name} with value {loop_data} raised an exception: {e}.                                             
+                    logger.error(f"ValidationError: {outcome.details}")
+                else:
+                    resp = f"""Tool input to the {self.tool.name} with value {loop_data} raised an exception: {outcome.error}.                                             
                         \n\nTool schema is {dumps(params)} \n\nand the input to LLM was {predict_input[-1].content}\n\n"""
                     if len(self.output_variables) > 0:
                         output_varibles[self.output_variables[0]] += resp
                     accumulated_response = process_response(resp, self.return_type, accumulated_response)
-                    logger.error(f"Exception: {format_exc()}")
+                    logger.error(f"Exception: {outcome.details}")
                 logger.info(f"LoopNode response: {accumulated_response}")
+            failures = loop_failure_summary(loop_data, outcomes)
+            if failures and (self.parallelism > 1 or self.item_timeout):
+                accumulated_response = process_response(failures, self.return_type, accumulated_response)
         else:
             resp = f"""Tool input to the {self.tool.name} with value {loop_data} is not a valid JSON. 
                 \n\nTool schema is {dumps(params)} \n\nand the input to LLM was  {predict_input[-1].content}\n\n"""
@@ -152,6 +244,7 @@ Input Data:
             "on_loop_node", {
                 "input_variables": self.input_variables,
                 "accumulated_response": accumulated_response,
+                "failures": failures,
                 "state": state,
             }, config=config
         )
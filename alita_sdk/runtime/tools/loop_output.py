@@ -10,7 +10,7 @@ from langchain_core.tools import BaseTool
 from langchain_core.utils.function_calling import convert_to_openai_tool
 from pydantic import ValidationError
 
-from .loop import process_response
+from .loop import invoke_loop_items, loop_failure_summary, process_response
 from ..langchain.utils import _extract_json, create_pydantic_model, propagate_the_input_mapping
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,9 @@ class LoopToolNode(BaseTool):
     output_variables: Optional[list[str]] = None
     structured_output: Optional[bool] = False
     task: Optional[str] = None
+    # Number of items invoked at once and timeout (seconds) of every invocation, see invoke_loop_items
+    parallelism: int = 1
+    item_timeout: Optional[float] = None
     prompt: str = """You are tasked to formulate arguments for the tool according to user task and conversation history.
 Tool name: {tool_name}
 Tool description: {tool_description}
@@ -129,28 +132,35 @@ Answer must be JSON only extractable by JSON.LOADS."""
             output_variables = dict()
             if len(self.output_variables) > 0:
                 output_variables = {self.output_variables[0]: ""}
-            for tool_input in tool_inputs:
-                logger.info(f"LoopToolNode step input: {tool_input}")
-                try:
-                    tool_run = self.loop_tool.invoke(tool_input, config=config, kwargs=kwargs)
+            outcomes = invoke_loop_items(self.loop_tool, tool_inputs, config, self.parallelism, self.item_timeout,
+                                         kwargs=kwargs)
+            for tool_input, outcome in zip(tool_inputs, outcomes):
+                if outcome.error is None:
+                    tool_run = outcome.result
                     if len(self.output_variables) > 0:
                         output_variables[self.output_variables[0]] += f'{tool_run}\n\n'
                     accumulated_response = process_response(tool_run, self.return_type, accumulated_response)
-                except ValidationError:
+                elif isinstance(outcome.error, ValidationError):
                     resp = f"""Tool input to the {self.tool.name} with value {tool_input} raised ValidationError.
                                 \n\nTool schema is {dumps(params)}"""
                     if len(self.output_variables) > 0:
                         output_variables[self.output_variables[0]] += resp
                     accumulated_response = process_response(resp, self.return_type, accumulated_response)
-                    logger.error(f"ValidationError: {format_exc()}")
-                except Exception as e:
-                    resp = f"""Tool input to the {self.tool.name} with value {tool_input} raised an exception: {e}.                                             
+                    logger.error(f"ValidationError: {outcome.details}")
+                else:
+                    resp = f"""Tool input to the {self.tool.name} with value {tool_input} raised an exception: {outcome.error}.                                             
                                 \n\nTool schema is {dumps(params)}"""
                     if len(self.output_variables) > 0:
                         output_variables[self.output_variables[0]] += resp
                     accumulated_response = process_response(resp, self.return_type, accumulated_response)
-                    logger.error(f"Exception: {format_exc()}")
+                    logger.error(f"Exception: {outcome.details}")
                 logger.info(f"LoopNode response: {accumulated_response}")
+            failures = loop_failure_summary(tool_inputs, outcomes)
+            if failures and (self.parallelism > 1 or self.item_timeout):
+                accumulated_response = process_response(failures, self.return_type, accumulated_response)
+            if len(self.output_variables) > 0:
+                accumulated_response[self.output_variables[0]] = output_variables[self.output_variables[0]]
+            return accumulated_response
 
         except ValidationError:
             logger.error(f"ValidationError: {format_exc()}")
@@ -11,6 +11,8 @@ import uuid
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
+from langchain_core.tools import BaseTool
+
 from .mcp_server_tool import McpServerTool
 from pydantic import Field
 from ..utils.mcp_oauth import (
@@ -95,6 +97,10 @@ class McpRemoteTool(McpServerTool):
             logger.error(f"Error executing remote MCP tool '{self.name}': {e}")
             return f"Error executing tool: {e}"
 
+    async def _arun(self, *args, **kwargs):
+        # Remote tools call the server directly, not through client.amcp_tool_call
+        return await BaseTool._arun(self, *args, **kwargs)
+
     def _run_in_new_loop(self, kwargs: Dict[str, Any]) -> str:
         """Run the async tool invocation in a new event loop."""
         return asyncio.run(self._execute_remote_tool(kwargs))
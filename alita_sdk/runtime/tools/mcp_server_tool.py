@@ -1,3 +1,4 @@
+import inspect
 import uuid
 from logging import getLogger
 from typing import Any, Type, Literal, Optional, Union, List, Annotated
@@ -91,11 +92,11 @@ class McpServerTool(BaseTool):
             fields[name] = (typ, Field(default, **field_args))
         return create_model(model_name, **fields)
 
-    def _run(self, *args, **kwargs):
+    def _call_data(self, kwargs: dict) -> dict:
         # Strip None values — MCP servers reject null for typed optional params
         clean_kwargs = {k: v for k, v in kwargs.items() if v is not None}
         # Use the tool name directly (no prefix extraction needed)
-        call_data = {
+        return {
             "server": self.server,
             "tool_timeout_sec": self.tool_timeout_sec,
             "tool_call_id": str(uuid.uuid4()),
@@ -104,5 +105,12 @@ class McpServerTool(BaseTool):
                 "arguments": clean_kwargs
             }
         }
-        
-        return self.client.mcp_tool_call(call_data)
+
+    def _run(self, *args, **kwargs):
+        return self.client.mcp_tool_call(self._call_data(kwargs))
+
+    async def _arun(self, *args, **kwargs):
+        # Clients without the async transport are called in a thread
+        if not inspect.iscoroutinefunction(getattr(self.client, "amcp_tool_call", None)):
+            return await super()._arun(*args, **kwargs)
+        return await self.client.amcp_tool_call(self._call_data(kwargs))
@@ -0,0 +1,117 @@
+"""
+Bootstrap of PGVector embeddings table for metadata filtering.
+
+Indexing and search queries filter rows by a few metadata keys (collection, type, id, ...).
+Without matching indexes each of them is a full scan of the embeddings table.
+`ensure_metadata_indexes` creates btree expression indexes on `cmetadata ->> '<key>'` for such keys and,
+optionally, promotes the keys to stored generated columns with plain btree indexes.
+Queries should build metadata conditions with `metadata_field`, so they match the created indexes.
+"""
+import threading
+from logging import getLogger
+from typing import FrozenSet, Iterable, Optional
+
+logger = getLogger(__name__)
+
+EMBEDDING_TABLE = "langchain_pg_embedding"
+# Metadata keys used in filters of indexing and search queries
+METADATA_INDEXED_KEYS = ("collection", "type", "id", "filename", "chunk_type", "source")
+METADATA_COLUMN_PREFIX = "meta_"
+# Attribute of PGVector store with metadata keys available as generated columns
+METADATA_COLUMNS_ATTR = "alita_metadata_columns"
+
+_bootstrapped = {}
+_bootstrap_lock = threading.Lock()
+
+
+def metadata_column_name(key: str) -> str:
+    return f"{METADATA_COLUMN_PREFIX}{key}"
+
+
+def metadata_field(store, key: str):
+    """SQLAlchemy expression of metadata value as text.
+
+    Uses generated column if the key is promoted for the store, otherwise `cmetadata ->> key`
+    (the same expression as used by langchain_postgres for `$in`/`$like` filters).
+    """
+    if key in getattr(store, METADATA_COLUMNS_ATTR, ()):
+        from sqlalchemy import Text, column  # pylint: disable=C0415,E0401
+        return column(metadata_column_name(key), Text, _selectable=store.EmbeddingStore.__table__)
+    return store.EmbeddingStore.cmetadata[key].astext
+
+
+def ensure_metadata_indexes(engine,
+                            schema: Optional[str] = None,
+                            generated_columns: bool = False,
+                            keys: Iterable[str] = METADATA_INDEXED_KEYS) -> FrozenSet[str]:
+    """Create missing metadata indexes for embeddings table in the schema.
+
+    Indexes are built concurrently, so existing tables stay writable during bootstrap.
+    With generated_columns=True the keys are also added as `meta_<key>` stored generated columns
+    with own indexes, used by `metadata_field` (adding a column rewrites the table, so it is an opt-in).
+    Bootstrap is idempotent and performed once per process for the same database, schema and options.
+
+    Returns:
+        Metadata keys available as generated columns.
+    """
+    from sqlalchemy import text  # pylint: disable=C0415,E0401
+
+    keys = tuple(keys)
+    schema = schema or "public"
+    cache_key = (engine.url.render_as_string(hide_password=True), schema, generated_columns, keys)
+    with _bootstrap_lock:
+        if cache_key in _bootstrapped:
+            return _bootstrapped[cache_key]
+
+    quote = engine.dialect.identifier_preparer.quote
+    table = f"{quote(schema)}.{EMBEDDING_TABLE}"
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        columns = {row[0] for row in conn.execute(
+            text("SELECT column_name FROM information_schema.columns "
+                 "WHERE table_schema = :schema AND table_name = :table"),
+            {"schema": schema, "table": EMBEDDING_TABLE},
+        )}
+        if not columns:
+            logger.warning(f"Table {table} does not exist, metadata indexes are not created")
+            return frozenset()
+        indexes = dict(conn.execute(
+            text("SELECT c.relname, i.indisvalid FROM pg_index i "
+                 "JOIN pg_class c ON c.oid = i.indexrelid "
+                 "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                 "WHERE n.nspname = :schema"),
+            {"schema": schema},
+        ).all())
+        for key in keys:
+            column = metadata_column_name(key)
+            try:
+                if generated_columns and column not in columns:
+                    logger.info(f"Adding generated column {column} to {table}")
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} text "
+                        f"GENERATED ALWAYS AS (cmetadata ->> '{key}') STORED"
+                    ))
+                    columns.add(column)
+                if column in columns:
+                    _create_index(conn, indexes, quote(schema), f"ix_{EMBEDDING_TABLE}_{column}", table, column)
+                # expression index is kept for filters built by langchain_postgres itself (e.g. `$in`)
+                _create_index(conn, indexes, quote(schema), f"ix_{EMBEDDING_TABLE}_{column}_expr", table,
+                              f"(cmetadata ->> '{key}')")
+            except Exception as e:
+                logger.error(f"Failed to create metadata index for '{key}' in {table}: {str(e)}")
+    promoted = frozenset(key for key in keys if metadata_column_name(key) in columns)
+    with _bootstrap_lock:
+        _bootstrapped[cache_key] = promoted
+    return promoted
+
+
+def _create_index(conn, indexes: dict, schema: str, name: str, table: str, target: str):
+    from sqlalchemy import text  # pylint: disable=C0415,E0401
+
+    if indexes.get(name):
+        return
+    if name in indexes:
+        # interrupted concurrent build leaves invalid index behind
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {schema}.{name}"))
+    logger.info(f"Creating index {name} on {table} ({target})")
+    conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({target})"))
+    indexes[name] = True
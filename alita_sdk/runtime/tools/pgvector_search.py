@@ -1,15 +1,28 @@
 import psycopg2
 import psycopg2.extras
+import hashlib
 import json
+import re
+from collections import OrderedDict
 from logging import getLogger
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable
+
+from langchain_core.documents import Document
+
+from .pgvector_schema import EMBEDDING_TABLE
 
 logger = getLogger(__name__)
 
+_IDENTIFIER = re.compile(r"^[\w.\-]+$")
+FUSION_WEIGHTED = "weighted"
+FUSION_RRF = "rrf"
+
+
 class PGVectorSearch:
     """Helper class for PostgreSQL vector search operations"""
     
-    def __init__(self, connection_string: str, collection_name: str, language: str = 'english'):
+    def __init__(self, connection_string: str, collection_name: str, language: str = 'english',
+                 schema: Optional[str] = None):
         """
         Initialize PGVector search helper
         
@@ -17,16 +30,36 @@ class PGVectorSearch:
             connection_string: PostgreSQL connection string
             collection_name: Name of the collection/table to search
             language: Language for full-text search (default: 'english')
+            schema: Schema with langchain_postgres embeddings table. If set, this table is searched
+                instead of the table named after the collection
         """
         self.connection_string = connection_string
         self.collection_name = collection_name
         self.language = language
+        self.schema = schema
+        self.table = f'"{schema}".{EMBEDDING_TABLE}' if schema else collection_name
         self._conn = None
+        self._fts_columns: Dict[Tuple[str, ...], Optional[str]] = {}
+        self._fts_indexed = set()
+
+    @classmethod
+    def from_vectorstore(cls, vectorstore, language: str = 'english') -> Optional["PGVectorSearch"]:
+        """Create helper for PGVector store: legacy one with connection string or langchain_postgres one."""
+        if hasattr(vectorstore, 'connection_string') and hasattr(vectorstore, 'collection_name'):
+            return cls(vectorstore.connection_string, vectorstore.collection_name, language=language)
+        engine = getattr(vectorstore, '_engine', None)
+        if engine is None or not hasattr(vectorstore, 'collection_name'):
+            return None
+        schema = engine.get_execution_options().get('schema_translate_map', {}).get(None)
+        connection_string = engine.url.set(drivername='postgresql').render_as_string(hide_password=False)
+        return cls(connection_string, vectorstore.collection_name, language=language, schema=schema or 'public')
     
     def _get_connection(self):
         """Get a PostgreSQL connection"""
         if not self._conn or self._conn.closed:
             self._conn = psycopg2.connect(self.connection_string)
+            # read-only queries: do not keep idle transactions, they block concurrent index builds
+            self._conn.autocommit = True
         return self._conn
     
     def _close_connection(self):
@@ -51,48 +84,48 @@ class PGVectorSearch:
             # Operator
             if key == "$eq":
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f"= %({param_name})s", params
+                params[param_name] = json.dumps(value)
+                return f"= %({param_name})s::jsonb", params
             elif key == "$ne":
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f"!= %({param_name})s", params
+                params[param_name] = json.dumps(value)
+                return f"!= %({param_name})s::jsonb", params
             elif key == "$lt":
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f"< %({param_name})s", params
+                params[param_name] = json.dumps(value)
+                return f"< %({param_name})s::jsonb", params
             elif key == "$lte":
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f"<= %({param_name})s", params
+                params[param_name] = json.dumps(value)
+                return f"<= %({param_name})s::jsonb", params
             elif key == "$gt":
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f"> %({param_name})s", params
+                params[param_name] = json.dumps(value)
+                return f"> %({param_name})s::jsonb", params
             elif key == "$gte":
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f">= %({param_name})s", params
+                params[param_name] = json.dumps(value)
+                return f">= %({param_name})s::jsonb", params
             elif key == "$in":
                 if not isinstance(value, (list, tuple)):
                     value = [value]
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f"= ANY(%({param_name})s)", params
+                params[param_name] = [json.dumps(item) for item in value]
+                return f"= ANY(%({param_name})s::jsonb[])", params
             elif key == "$nin":
                 if not isinstance(value, (list, tuple)):
                     value = [value]
                 param_name = f"p{len(params) + 1}"
-                params[param_name] = value
-                return f"!= ALL(%({param_name})s)", params
+                params[param_name] = [json.dumps(item) for item in value]
+                return f"!= ALL(%({param_name})s::jsonb[])", params
             elif key == "$between":
                 if not isinstance(value, (list, tuple)) or len(value) != 2:
                     raise ValueError("$between requires a list or tuple with exactly 2 elements")
                 param_name1 = f"p{len(params) + 1}"
                 param_name2 = f"p{len(params) + 2}"
-                params[param_name1] = value[0]
-                params[param_name2] = value[1]
-                return f"BETWEEN %({param_name1})s AND %({param_name2})s", params
+                params[param_name1] = json.dumps(value[0])
+                params[param_name2] = json.dumps(value[1])
+                return f"BETWEEN %({param_name1})s::jsonb AND %({param_name2})s::jsonb", params
             elif key == "$exists":
                 if value:
                     return "IS NOT NULL", params
@@ -131,8 +164,15 @@ class PGVectorSearch:
                 conditions = []
                 for op, op_value in value.items():
                     op_sql, params = self._process_filter_condition(op, op_value, params)
-                    conditions.append(f"(cmetadata->'{key}' {op_sql})")
+                    # values are compared as jsonb to keep their types, patterns are matched against text
+                    accessor = "->>" if op in ("$like", "$ilike") else "->"
+                    conditions.append(f"(cmetadata{accessor}'{key}' {op_sql})")
                 return " AND ".join(conditions), params
+            elif isinstance(value, (str, int, float, bool)):
+                # Direct equality of scalar as containment, so it is served by GIN index on cmetadata
+                param_name = f"p{len(params) + 1}"
+                params[param_name] = json.dumps({key: value})
+                return f"cmetadata @> %({param_name})s::jsonb", params
             else:
                 # Direct equality
                 param_name = f"p{len(params) + 1}"
@@ -190,7 +230,7 @@ class PGVectorSearch:
                     id, 
                     (ts_rank(to_tsvector(%s, cmetadata->>%s), plainto_tsquery(%s, %s))) as text_score
                 FROM 
-                    {self.collection_name}
+                    {self.table}
                 WHERE 
                     cmetadata ? %s
                     AND to_tsvector(%s, cmetadata->>%s) @@ plainto_tsquery(%s, %s)
@@ -218,6 +258,182 @@ class PGVectorSearch:
         finally:
             cursor.close()
     
+    def _fts_document_sql(self, fields: List[str]) -> str:
+        """tsvector expression of all fields, the same expression is used by queries and indexes."""
+        for name in list(fields) + [self.language]:
+            if not _IDENTIFIER.match(name):
+                raise ValueError(f"Invalid full-text search field or language: {name}")
+        text_sql = " || ' ' || ".join(f"coalesce(cmetadata->>'{field}', '')" for field in fields)
+        return f"to_tsvector('{self.language}'::regconfig, {text_sql})"
+
+    def _fts_column_name(self, fields: List[str]) -> str:
+        digest = hashlib.sha1("|".join([self.language, *fields]).encode("utf-8")).hexdigest()[:10]
+        return f"fts_{digest}"
+
+    def _fts_column(self, fields: List[str]) -> Optional[str]:
+        """Name of stored tsvector column for the fields if it exists."""
+        key = (self.language, *fields)
+        if key not in self._fts_columns:
+            column = self._fts_column_name(fields)
+            conn = self._get_connection()
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_schema = %s AND table_name = %s AND column_name = %s",
+                    (self.schema or 'public', EMBEDDING_TABLE if self.schema else self.collection_name, column)
+                )
+                self._fts_columns[key] = column if cursor.fetchone() else None
+        return self._fts_columns[key]
+
+    def ensure_full_text_index(self, fields: List[str], stored: bool = False):
+        """
+        Create GIN index for full-text search over the fields
+        
+        Args:
+            fields: Metadata fields searched together
+            stored: If True, tsvector is kept in a stored generated column (adds a column to the table),
+                otherwise an expression index is created
+        """
+        if (self.language, *fields, stored) in self._fts_indexed:
+            return
+        document_sql = self._fts_document_sql(fields)
+        column = self._fts_column_name(fields)
+        conn = psycopg2.connect(self.connection_string)
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cursor:
+                if stored:
+                    cursor.execute(f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS {column} tsvector "
+                                   f"GENERATED ALWAYS AS ({document_sql}) STORED")
+                    cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{EMBEDDING_TABLE}_{column} "
+                                   f"ON {self.table} USING gin ({column})")
+                else:
+                    cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{EMBEDDING_TABLE}_{column}_expr "
+                                   f"ON {self.table} USING gin (({document_sql}))")
+        except Exception as e:
+            logger.error(f"Failed to create full-text search index for fields {fields}: {str(e)}")
+        finally:
+            conn.close()
+        self._fts_indexed.add((self.language, *fields, stored))
+        self._fts_columns.pop((self.language, *fields), None)
+
+    def full_text_search_fields(self, fields: List[str], query: str, limit: int = 30,
+                                filter_dict: Dict = None) -> List[Dict[str, Any]]:
+        """
+        Perform a full-text search over several fields at once
+        
+        Args:
+            fields: Field names to search in
+            query: Search query
+            limit: Maximum number of results
+            filter_dict: Optional metadata filter
+            
+        Returns:
+            List of dictionaries with id, cmetadata and text_score ordered by text_score
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        
+        try:
+            document_sql = self._fts_column(fields) or self._fts_document_sql(fields)
+            params = {"language": self.language, "query": query, "limit": limit}
+            where_clause = "TRUE"
+            if filter_dict:
+                where_clause, filter_params = self._process_filter(filter_dict)
+                params.update(filter_params)
+            sql = f"""
+                SELECT 
+                    id, cmetadata, ts_rank({document_sql}, q.query) as text_score
+                FROM 
+                    {self.table}, plainto_tsquery(%(language)s::regconfig, %(query)s) AS q(query)
+                WHERE 
+                    {document_sql} @@ q.query
+                    AND {where_clause}
+                ORDER BY 
+                    text_score DESC
+                LIMIT %(limit)s
+            """
+            cursor.execute(sql, params)
+            return [dict(row) for row in cursor.fetchall()]
+        
+        except Exception as e:
+            logger.error(f"Full-text search error: {str(e)}")
+            conn.rollback()
+            return []
+        finally:
+            cursor.close()
+
+    def hybrid_search(self,
+                      query: str,
+                      fields: List[str],
+                      vector_items: "OrderedDict[Any, Tuple[Document, float]]",
+                      key_fn: Callable[[Dict[str, Any], str], Any],
+                      text_weight: float = 0.3,
+                      vector_weight: float = 1.0,
+                      fusion: str = FUSION_WEIGHTED,
+                      rrf_k: int = 60,
+                      limit: int = 30,
+                      filter_dict: Dict = None) -> "OrderedDict[Any, Tuple[Document, float]]":
+        """
+        Combine vector search results with a full-text search over all fields
+        
+        Text ranks are computed with one query over all fields, documents found by text only are fetched
+        with one more query.
+        
+        Args:
+            query: Search query
+            fields: Metadata fields for full-text search
+            vector_items: Vector search results, key -> (document, similarity) in descending similarity order
+            key_fn: Builds the key of vector_items from metadata and id of a row found by text
+            text_weight: Weight of text search scores
+            vector_weight: Weight of vector search scores
+            fusion: 'weighted' - weighted sum of scores, 'rrf' - reciprocal rank fusion normalized to [0, 1]
+            rrf_k: Rank constant of reciprocal rank fusion
+            limit: Maximum number of text search results
+            filter_dict: Optional metadata filter for text search
+            
+        Returns:
+            Ordered dictionary key -> (document, fused score) in descending score order
+        """
+        text_results = self.full_text_search_fields(fields, query, limit=limit, filter_dict=filter_dict)
+        text_ranks = OrderedDict()
+        for result in text_results:
+            key = key_fn(result.get('cmetadata') or {}, result['id'])
+            text_ranks.setdefault(key, (result['id'], result['text_score']))
+
+        missing = [row_id for key, (row_id, _) in text_ranks.items() if key not in vector_items]
+        fetched = self.get_documents_by_ids(missing) if missing else {}
+
+        fused = {}
+        if fusion == FUSION_RRF:
+            max_score = (vector_weight + text_weight) / (rrf_k + 1)
+            vector_rank = {key: rank for rank, key in enumerate(vector_items, start=1)}
+            text_rank = {key: rank for rank, key in enumerate(text_ranks, start=1)}
+            for key in list(vector_items) + [key for key in text_ranks if key not in vector_items]:
+                score = 0.0
+                if key in vector_rank:
+                    score += vector_weight / (rrf_k + vector_rank[key])
+                if key in text_rank:
+                    score += text_weight / (rrf_k + text_rank[key])
+                fused[key] = score / max_score if max_score else 0.0
+        else:
+            for key, (_, vector_score) in vector_items.items():
+                fused[key] = vector_score * vector_weight
+            for key, (_, text_score) in text_ranks.items():
+                fused[key] = fused.get(key, 0.0) + text_score * text_weight
+
+        result = OrderedDict()
+        for key in sorted(fused, key=fused.get, reverse=True):
+            if key in vector_items:
+                doc = vector_items[key][0]
+            else:
+                doc_data = fetched.get(text_ranks[key][0])
+                if not doc_data:
+                    continue
+                doc = Document(page_content=doc_data.get('document', ''), metadata=doc_data.get('cmetadata', {}))
+            result[key] = (doc, fused[key])
+        return result
+
     def get_documents_by_ids(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         Retrieve documents by IDs
@@ -240,7 +456,7 @@ class PGVectorSearch:
                 SELECT 
                     id, document, cmetadata
                 FROM 
-                    {self.collection_name}
+                    {self.table}
                 WHERE 
                     id IN ({placeholders})
             """
@@ -290,7 +506,7 @@ class PGVectorSearch:
                 SELECT 
                     id, document, cmetadata
                 FROM 
-                    {self.collection_name}
+                    {self.table}
                 WHERE 
                     {where_clause}
                 LIMIT 
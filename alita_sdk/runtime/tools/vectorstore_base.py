@@ -35,8 +35,11 @@ class SearchDocumentsModel(BaseModel):
             "enabled": true,
             "weight": 0.3,
             "fields": ["content", "title"],
-            "language": "english"
-        }""",
+            "language": "english",
+            "fusion": "weighted",
+            "vector_weight": 1.0
+        }
+        fusion: "weighted" (sum of weighted scores) or "rrf" (reciprocal rank fusion, "rrf_k" sets rank constant).""",
         default=None
     )
     reranking_config: Optional[Dict[str, Dict[str, Any]]] = Field(
@@ -71,8 +74,11 @@ class StepBackSearchDocumentsModel(BaseModel):
             "enabled": true,
             "weight": 0.3,
             "fields": ["content", "title"],
-            "language": "english"
-        }""",
+            "language": "english",
+            "fusion": "weighted",
+            "vector_weight": 1.0
+        }
+        fusion: "weighted" (sum of weighted scores) or "rrf" (reciprocal rank fusion, "rrf_k" sets rank constant).""",
         default=None
     )
     reranking_config: Optional[Dict[str, Dict[str, Any]]] = Field(
@@ -134,6 +140,14 @@ Make sure to provide unique source for each citation.
 How did you come up with the answer?
 """
 
+
+def search_result_key(metadata: dict, default: Any):
+    """Key of a search result: document id with chunk id (if any), default is used when id is missing."""
+    if 'chunk_id' in metadata:
+        return f"{metadata.get('id', default)}_{metadata['chunk_id']}"
+    return metadata.get('id', default)
+
+
 class VectorStoreWrapperBase(BaseToolApiWrapper):
     llm: Any
     embedding_model: Optional[str] = None
@@ -196,14 +210,13 @@ class VectorStoreWrapperBase(BaseToolApiWrapper):
     def _init_pg_helper(self, language='english'):
         """Initialize PGVector helper if needed and not already initialized"""
         self._ensure_vectorstore_initialized()
-        if self.pg_helper is None and hasattr(self.vectorstore, 'connection_string') and hasattr(self.vectorstore, 'collection_name'):
+        if self.pg_helper is not None:
+            self.pg_helper.language = language
+            return
+        if hasattr(self.vectorstore, 'collection_name'):
             try:
                 from .pgvector_search import PGVectorSearch
-                self.pg_helper = PGVectorSearch(
-                    self.vectorstore.connection_string,
-                    self.vectorstore.collection_name,
-                    language=language
-                )
+                self.pg_helper = PGVectorSearch.from_vectorstore(self.vectorstore, language=language)
             except ImportError:
                 logger.warning("PGVectorSearch not available - full-text search will be limited")
             except Exception as e:
@@ -241,6 +254,13 @@ class VectorStoreWrapperBase(BaseToolApiWrapper):
             logger.error(f"Error during similarity search: {str(e)}")
             raise ToolException(f"Search failed: {str(e)}")
 
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed search query once to reuse it for several searches."""
+        embeddings = self.embeddings or getattr(self.vectorstore, 'embeddings', None)
+        if embeddings is None:
+            raise ToolException("Embeddings are not configured for the vectorstore.")
+        return embeddings.embed_query(query)
+
     def list_collections(self) -> List[str]:
         """List all collections in the vectorstore."""
         self._ensure_vectorstore_initialized()
@@ -259,16 +279,18 @@ class VectorStoreWrapperBase(BaseToolApiWrapper):
     def get_indexed_count(self, index_name: str) -> int:
         self._ensure_vectorstore_initialized()
         from sqlalchemy.orm import Session
-        from sqlalchemy import func, or_
+        from sqlalchemy import or_
+        from .pgvector_schema import metadata_field
 
-        with Session(self.vectorstore.session_maker.bind) as session:
+        store = self.vectorstore
+        with Session(store.session_maker.bind) as session:
             return session.query(
-                self.vectorstore.EmbeddingStore.id,
+                store.EmbeddingStore.id,
             ).filter(
-                func.jsonb_extract_path_text(self.vectorstore.EmbeddingStore.cmetadata, 'collection') == index_name,
+                metadata_field(store, 'collection') == index_name,
                 or_(
-                    func.jsonb_extract_path_text(self.vectorstore.EmbeddingStore.cmetadata, 'type').is_(None),
-                    func.jsonb_extract_path_text(self.vectorstore.EmbeddingStore.cmetadata, 'type') != IndexerKeywords.INDEX_META_TYPE.value
+                    metadata_field(store, 'type').is_(None),
+                    metadata_field(store, 'type') != IndexerKeywords.INDEX_META_TYPE.value
                 )
             ).count()
 
@@ -380,96 +402,16 @@ class VectorStoreWrapperBase(BaseToolApiWrapper):
 
         # Extended search implementation
         if extended_search:
-            # Track unique documents by source and chunk_id
-            unique_docs = {}
-            chunk_type_scores = {}  # Store scores by document identifier
-            # Create initial set of results from documents
-            if filter is None:
-                document_filter = {"chunk_type": {"$eq": "document"}}
-            else:
-                document_filter = {
-                    "$and": [
-                        filter,
-                        {"chunk_type": {"$eq": "document"}}
-                    ]
-                }
-                
-            try:
-                document_items = self._similarity_search_with_score(
-                    query, filter=document_filter, k=search_top
-                )                
-                # Add document results to unique docs
-                vector_items = document_items
-                for doc, score in document_items:
-                    source = doc.metadata.get('source')
-                    chunk_id = doc.metadata.get('chunk_id')
-                    doc_id = f"{source}_{chunk_id}" if source and chunk_id else str(doc.metadata.get('id', id(doc)))
-                    
-                    if doc_id not in unique_docs or score > chunk_type_scores.get(doc_id, 0):
-                        unique_docs[doc_id] = doc
-                        chunk_type_scores[doc_id] = score
-            except Exception as e:
-                logger.warning(f"Error searching for document chunks: {str(e)}")
-            
-            # First search for specified chunk types (title, summary, propositions, keywords)
+            self._ensure_vectorstore_initialized()
+            # Query is embedded once and reused by all searches of documents and specified chunk types
             valid_chunk_types = ["title", "summary", "propositions", "keywords"]
-            chunk_types_to_search = [ct for ct in extended_search if ct in valid_chunk_types]
-            
-            # Search for each chunk type separately
-            for chunk_type in chunk_types_to_search:
-                if filter is None:
-                    chunk_filter = {"chunk_type": {"$eq": chunk_type}}
-                else:
-                    chunk_filter = {
-                        "$and": [
-                            filter,
-                            {"chunk_type": {"$eq": chunk_type}}
-                        ]
-                    }
-                
-                try:
-                    chunk_items = self._similarity_search_with_score(
-                        query, filter=chunk_filter, k=search_top
-                    )
-
-                    for doc, score in chunk_items:
-                        # Create unique identifier for document
-                        source = doc.metadata.get('source')
-                        chunk_id = doc.metadata.get('chunk_id')
-                        doc_id = f"{source}_{chunk_id}" if source and chunk_id else str(doc.metadata.get('id', id(doc)))
-
-                        # Store document and its score
-                        if doc_id not in unique_docs:
-                            unique_docs[doc_id] = doc
-                            chunk_type_scores[doc_id] = score
-                            # Create a filter with proper operators 
-                            doc_filter_parts = [
-                                {"source": {"$eq": source}},
-                                {"chunk_id": {"$eq": chunk_id}},
-                                {"chunk_type": {"$eq": "document"}}
-                            ]
-                            
-                            if filter is not None:
-                                doc_filter = {
-                                    "$and": [filter] + doc_filter_parts
-                                }
-                            else:
-                                doc_filter = {
-                                    "$and": doc_filter_parts
-                                }
-
-                            try:
-                                fetch_items = self._similarity_search_with_score(
-                                    query, filter=doc_filter, k=1
-                                )
-                                if fetch_items:
-                                    vector_items.append(fetch_items[0])
-
-                            except Exception as e:
-                                logger.warning(f"Error retrieving document chunk for {source}_{chunk_id}: {str(e)}")
-                except Exception as e:
-                    logger.warning(f"Error searching for chunk type {chunk_type}: {str(e)}")
-            
+            vector_items = self.vector_adapter.extended_search(
+                self,
+                self._embed_query(query),
+                [ct for ct in extended_search if ct in valid_chunk_types],
+                filter=filter,
+                k=search_top,
+            )
         else:
             # Default search behavior (unchanged)
             max_search_results = 30 if search_top * 3 > 30 else search_top * 3
@@ -479,11 +421,7 @@ class VectorStoreWrapperBase(BaseToolApiWrapper):
             
         # Initialize document map for tracking by ID
         doc_map = {
-            (
-                f"{doc.metadata.get('id', f'idx_{i}')}_{doc.metadata['chunk_id']}"
-                if 'chunk_id' in doc.metadata
-                else doc.metadata.get('id', f"idx_{i}")
-            ): (doc, 1 - score)
+            search_result_key(doc.metadata, f"idx_{i}"): (doc, 1 - score)
             for i, (doc, score) in enumerate(vector_items)
         }
 
@@ -497,38 +435,23 @@ class VectorStoreWrapperBase(BaseToolApiWrapper):
             language = full_text_search.get('language', 'english')
             self._init_pg_helper(language)
             if self.pg_helper:
-                vector_weight = 1.0  # Default vector weight
-                text_weight = full_text_search.get('weight', 0.3)
-                
-                # Query each specified field
-                for field_name in full_text_search.get('fields', []):
-                    try:
-                        text_results = self.pg_helper.full_text_search(field_name, query)
-
-                        # Combine text search results with vector results
-                        for result in text_results:
-                            doc_id = result['id']
-                            text_score = result['text_score']
-
-                            if doc_id in doc_map:
-                                # Document exists in vector results, combine scores
-                                doc, vector_score = doc_map[doc_id]
-                                combined_score = (vector_score * vector_weight) + (text_score * text_weight)
-                                doc_map[doc_id] = (doc, combined_score)
-                            else:
-                                # Document is new from text search, fetch and add if possible
-                                doc_data = self.pg_helper.get_documents_by_ids([doc_id]).get(doc_id)
-                                if doc_data:
-                                    from langchain_core.documents import Document
-                                    doc = Document(
-                                        page_content=doc_data.get('document', ''),
-                                        metadata=doc_data.get('cmetadata', {})
-                                    )
-                                    # Use weighted text score for new documents
-                                    doc_map[doc_id] = (doc, text_score * text_weight)
-                    except Exception as e:
-                        logger.error(f"Full-text search error on field {field_name}: {str(e)}")
-            
+                fields = full_text_search['fields']
+                try:
+                    # Ranks over all fields are computed at once and fused with vector scores
+                    doc_map = self.pg_helper.hybrid_search(
+                        query,
+                        fields,
+                        doc_map,
+                        key_fn=search_result_key,
+                        text_weight=full_text_search.get('weight', 0.3),
+                        vector_weight=full_text_search.get('vector_weight', 1.0),
+                        fusion=full_text_search.get('fusion', 'weighted'),
+                        rrf_k=full_text_search.get('rrf_k', 60),
+                        filter_dict=filter,
+                    )
+                except Exception as e:
+                    logger.error(f"Full-text search error on fields {fields}: {str(e)}")
+
         # Convert the document map back to a list
         combined_items = list(doc_map.values())
         
@@ -426,8 +426,28 @@ class ReposApiWrapper(CodeIndexerToolkit):
         Returns:
             List[str]: List of file paths
         """
+        blobs = self._get_files_blob_shas(path, branch, recursion_level)
+        if isinstance(blobs, ToolException):
+            return blobs
+        return list(blobs) # Changed to return list directly instead of str
+
+    def _get_files_blob_shas(
+            self,
+            path: str = "",
+            branch: str = None,
+            recursion_level: str = "Full",
+    ):
+        """Get blob SHAs (git object ids) of files from a repository path and branch.
+
+        Args:
+            path (str): Path within the repository to list files from
+            branch (str): Branch to get files from. Defaults to base_branch if None.
+            recursion_level (str): OneLevel - includes immediate children, Full - includes all items, None - no recursion
+
+        Returns:
+            Dict[str, str]: Blob SHAs by file paths
+        """
         branch = branch if branch else self.base_branch
-        files: List[str] = []
         try:
             version_descriptor = GitVersionDescriptor(
                 version=branch, version_type="branch"
@@ -444,12 +464,7 @@ class ReposApiWrapper(CodeIndexerToolkit):
             msg = f"Failed to fetch files from directory due to an error: {str(e)}"
             logger.error(msg)
             return ToolException(msg)
-        files = []
-        while items:
-            item = items.pop(0)
-            if item.git_object_type == "blob":
-                files.append(item.path)
-        return files # Changed to return list directly instead of str
+        return {item.path: item.object_id for item in items if item.git_object_type == "blob"}
 
     def set_active_branch(self, branch_name: str) -> str:
         """
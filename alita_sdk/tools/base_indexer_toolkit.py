@@ -1,15 +1,17 @@
 import copy
 import json
 import logging
+import math
 import time
 from enum import Enum
-from typing import Any, Optional, List, Dict, Generator
+from typing import Any, ClassVar, Optional, List, Dict, Generator, Iterable
 
 from langchain_core.callbacks import dispatch_custom_event
 from langchain_core.documents import Document
 from pydantic import create_model, Field, SecretStr
 
-from .utils.content_parser import file_extension_by_chunker, process_document_by_type
+from .utils.content_parser import document_chunks, file_extension_by_chunker, loader_uses_llm, process_document_by_type
+from .utils.parsing_pool import ParsingPool, future_results, get_parsing_pool
 from .vector_adapters.VectorStoreAdapter import VectorStoreAdapterFactory
 from ..runtime.langchain.document_loaders.constants import loaders_allowed_to_override
 from ..runtime.tools.vectorstore_base import VectorStoreWrapperBase
@@ -20,6 +22,28 @@ logger = logging.getLogger(__name__)
 DEFAULT_CUT_OFF = 0.1
 INDEX_META_UPDATE_INTERVAL = 600.0
 
+# index_data parameters overriding indexing settings (fields) of the toolkit for a single run
+INDEXING_SETTINGS_PARAMS = {
+    "indexing_loader_workers": (Optional[int], Field(
+        default=None, ge=1,
+        description="Optional number of threads loading and chunking documents concurrently with embedding, "
+                    "used by toolkits with thread-safe loaders. Defaults to the toolkit setting (1)")),
+    "embedding_workers": (Optional[int], Field(
+        default=None, ge=1,
+        description="Optional number of concurrent embedding requests. Defaults to the toolkit setting (1)")),
+    "embedding_rpm_limit": (Optional[int], Field(
+        default=None, ge=1,
+        description="Optional limit of embedding requests per minute. Defaults to the toolkit setting (no limit)")),
+    "parsing_processes": (Optional[int], Field(
+        default=None, ge=0,
+        description="Optional number of worker processes parsing and chunking document content, "
+                    "0 - in the indexing thread. Defaults to the toolkit setting (0)")),
+    "dedupe_batch_size": (Optional[int], Field(
+        default=None, ge=0,
+        description="Optional number of documents verified against the index at once, requesting indexed data "
+                    "of their keys only, 0 - load data of the whole index once. Defaults to the toolkit setting (0)")),
+}
+
 class IndexTools(str, Enum):
     """Enum for index-related tool names."""
     INDEX_DATA = "index_data"
@@ -104,6 +128,19 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
     connection_string: Optional[SecretStr] = None
     collection_name: Optional[str] = None
     alita: Any = None # Elitea client, if available
+    # Indexing pipeline: when any of workers > 1, loading/chunking, embedding and writing run concurrently.
+    # Settings below are toolkit defaults, index_data accepts them as parameters (see INDEXING_SETTINGS_PARAMS)
+    indexing_loader_workers: int = 1
+    embedding_workers: int = 1
+    # Loaders (_base_loader, _extend_data, _process_document) may run in several threads,
+    # NOTE: set it in subclasses which API clients are thread-safe, other toolkits use a single loader thread
+    thread_safe_loaders: ClassVar[bool] = False
+    embedding_rpm_limit: Optional[int] = None
+    # Parsing and chunking of document content in N worker processes (0 - in the indexing thread)
+    parsing_processes: int = 0
+    # Duplicates reduction: 0 loads compact data of the whole index once,
+    # N > 0 verifies incoming documents in batches of N requesting only the matching indexed data
+    dedupe_batch_size: int = 0
 
     def __init__(self, **kwargs):
         conn = kwargs.get('connection_string', None)
@@ -150,6 +187,18 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
         and returns a list of Document objects with base metadata: id and created_on."""
         yield from ()
 
+    def _base_loader_total(self, **kwargs) -> Optional[int]:
+        """ Returns an estimated number of base documents `_base_loader` is going to yield for the same kwargs.
+        Used only for progress reporting, so it may be approximate. Return None if the total is unknown
+        or expensive to calculate: base documents are streamed to indexing in any case.
+        NOTE: override this method in subclasses which can cheaply estimate the total (e.g. from API paging info)."""
+        return None
+
+    def _indexing_setting(self, name: str):
+        """ Value of indexing setting provided to the current index_data run, the toolkit one if not provided. """
+        value = getattr(self, "_index_settings", {}).get(name)
+        return getattr(self, name) if value is None else value
+
     def _process_document(self, base_document: Document) -> Generator[Document, None, None]:
         """ Process an existing base document to extract relevant metadata for full document preparation.
         Used for late processing of documents after we ensure that the document has to be indexed to avoid
@@ -176,6 +225,7 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
             "meta_update_interval",
             INDEX_META_UPDATE_INTERVAL,
         )
+        self._index_settings = {name: kwargs.get(name) for name in INDEXING_SETTINGS_PARAMS}
 
         result = {"count": 0, "failed_count": 0}
         #
@@ -188,16 +238,21 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
             #
             self._log_tool_event(f"Indexing data into collection with suffix '{index_name}'. It can take some time...")
             self._log_tool_event(f"Loading the documents to index...{kwargs}")
+            # base documents are streamed from the loader through duplicates reduction into the vectorstore,
+            # so memory usage is bounded by max_docs_per_add rather than by the size of the source
+            documents_total = self._base_loader_total(**kwargs)
             documents = self._base_loader(**kwargs)
-            documents = list(documents) # consume/exhaust generator to count items
-            documents_count = len(documents)
-            documents = (doc for doc in documents)
-            self._log_tool_event(f"Base documents were pre-loaded. "
-                                 f"Search for possible document duplicates and remove them from the indexing list...")
-            documents = self._reduce_duplicates(documents, index_name)
-            self._log_tool_event(f"Duplicates were removed. "
-                                 f"Processing documents to collect dependencies and prepare them for indexing...")
-            self._save_index_generator(documents, documents_count, chunking_tool, chunking_config, index_name=index_name, result=result)
+            self._log_tool_event(f"Base documents are streamed from the source. "
+                                 f"Possible duplicates are skipped and dependencies are collected on the fly...")
+            outdated_ids = set()
+            documents = self._reduce_duplicates(documents, index_name, outdated_ids=outdated_ids)
+            try:
+                self._save_index_generator(documents, documents_total, chunking_tool, chunking_config,
+                                           index_name=index_name, result=result,
+                                           progress_step=kwargs.get("progress_step"))
+            finally:
+                # chunks of changed documents are replaced only once all new versions are written
+                self._remove_outdated_documents(outdated_ids)
             #
             results_count = result["count"]
             failed_count = result.get("failed_count", 0)
@@ -241,13 +296,27 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
             self._emit_index_event(index_name, error=msg)
             raise e
 
-    def _save_index_generator(self, base_documents: Generator[Document, None, None], base_total: int, chunking_tool, chunking_config, result, index_name: Optional[str] = None):
+    def _save_index_generator(self, base_documents: Generator[Document, None, None], base_total: Optional[int], chunking_tool, chunking_config, result, index_name: Optional[str] = None, progress_step: Optional[int] = None):
+        """ Consumes base documents one by one and indexes them with all dependent documents.
+
+        Args:
+            base_documents: Generator of base documents (not materialized in memory).
+            base_total: Estimated number of base documents or None if unknown.
+            progress_step: Step (in percents) for progress reporting when base_total is known.
+        """
         self._ensure_vectorstore_initialized()
-        self._log_tool_event(f"Base documents are ready for indexing. {base_total} base documents in total to index.")
+        if base_total:
+            self._log_tool_event(f"Base documents are ready for indexing. ~{base_total} base documents in total to index.")
+        else:
+            self._log_tool_event("Base documents are ready for indexing. Total number of base documents is unknown.")
+        if self._indexing_setting("indexing_loader_workers") > 1 or self._indexing_setting("embedding_workers") > 1:
+            return self._save_index_pipeline(base_documents, base_total, chunking_tool, chunking_config, result,
+                                             index_name=index_name, progress_step=progress_step)
         from ..runtime.langchain.interfaces.llm_processor import add_documents
         #
         base_doc_counter = 0
         pg_vector_add_docs_chunk = []
+        report_progress = self._progress_reporter(base_total, progress_step)
 
         def _flush_chunk(chunk: list):
             """Flush a chunk of documents to the vectorstore, tracking failures in result."""
@@ -257,99 +326,205 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
                 add_documents(vectorstore=self.vectorstore, documents=chunk)
                 self._log_tool_event(f"{len(chunk)} documents have been indexed. Continuing...")
             except Exception as exc:
-                from traceback import format_exc
-                err = format_exc()
-                logger.error(f"Failed to add {len(chunk)} documents to vectorstore: {err}")
-                result["failed_count"] = result.get("failed_count", 0) + len(chunk)
-                error_msg = str(exc)
-                if error_msg not in result.setdefault("errors", []):
-                    result["errors"].append(error_msg)
+                self._track_failed_chunk(chunk, exc, result)
 
         for base_doc in base_documents:
             base_doc_counter += 1
             self._log_tool_event(f"Processing dependent documents for base documents #{base_doc_counter}.")
-
-            # (base_doc for _ in range(1)) - wrap single base_doc to Generator in order to reuse existing code
-            documents = self._extend_data((base_doc for _ in range(1)))  # update content of not-reduced base document if needed (for sharepoint and similar)
-            documents = self._collect_dependencies(documents)  # collect dependencies for base documents
-            self._log_tool_event(f"Dependent documents were processed. "
-                                 f"Applying chunking tool '{chunking_tool if chunking_tool else "default"}' if specified and preparing documents for indexing...")
-            documents = self._apply_loaders_chunkers(documents, chunking_tool, chunking_config)
-            documents = self._clean_metadata(documents)
-
-            logger.debug(f"Indexing base document #{base_doc_counter}: {base_doc} and all dependent documents: {documents}")
-
             dependent_docs_counter = 0
             #
-            for doc in documents:
-                if not doc.page_content:
-                    # To avoid case when all documents have empty content
-                    # See llm_processor.add_documents which exclude metadata of docs with empty content
-                    continue
-                #
-                if 'id' not in doc.metadata or 'updated_on' not in doc.metadata:
-                    logger.warning(f"Document is missing required metadata field 'id' or 'updated_on': {doc.metadata}")
-                #
-                # if index_name is provided, add it to metadata of each document
-                if index_name:
-                    if not doc.metadata.get('collection'):
-                        doc.metadata['collection'] = index_name
-                    else:
-                        doc.metadata['collection'] += f";{index_name}"
-                #
+            for doc in self._prepare_base_document(base_doc, chunking_tool, chunking_config, index_name):
                 pg_vector_add_docs_chunk.append(doc)
                 dependent_docs_counter += 1
                 if len(pg_vector_add_docs_chunk) >= self.max_docs_per_add:
                     _flush_chunk(pg_vector_add_docs_chunk)
                     pg_vector_add_docs_chunk = []
 
-            msg = f"Indexed base document #{base_doc_counter} out of {base_total} (with {dependent_docs_counter} dependencies)."
-            logger.debug(msg)
-            self._log_tool_event(msg)
+            report_progress(base_doc_counter, dependent_docs_counter)
             result["count"] += dependent_docs_counter
-            # After each base document, try a non-forced meta update; throttling handled inside index_meta_update
-            try:
-                self.index_meta_update(index_name, IndexerKeywords.INDEX_META_IN_PROGRESS.value, result["count"], update_force=False)
-            except Exception as exc:  # best-effort, do not break indexing
-                logger.warning(f"Failed to update index meta during indexing process for index '{index_name}': {exc}")
+            self._index_meta_progress(index_name, result)
         if pg_vector_add_docs_chunk:
             _flush_chunk(pg_vector_add_docs_chunk)
+        self._log_tool_event(f"All {base_doc_counter} base documents have been processed.")
 
-    def _apply_loaders_chunkers(self, documents: Generator[Document, None, None], chunking_tool: str=None, chunking_config=None) -> Generator[Document, None, None]:
-        from ..tools.chunkers import __all__ as chunkers
+    def _save_index_pipeline(self, base_documents: Generator[Document, None, None], base_total: Optional[int], chunking_tool, chunking_config, result, index_name: Optional[str] = None, progress_step: Optional[int] = None):
+        """ Pipelined version of `_save_index_generator`.
 
+        Base documents are loaded and chunked in `indexing_loader_workers` threads (one thread unless
+        `thread_safe_loaders`), batches of `max_docs_per_add`
+        documents are embedded by `embedding_workers` concurrent requests (limited by `embedding_rpm_limit`)
+        and written into the vectorstore by the current thread. Stages are connected with bounded queues.
+        """
+        from ..runtime.langchain.interfaces.llm_processor import add_documents, supports_precomputed_embeddings
+        from .utils.indexing_pipeline import IndexingPipeline
+        #
+        loader_workers = self._indexing_setting("indexing_loader_workers")
+        if loader_workers > 1 and not self.thread_safe_loaders:
+            self._log_tool_event(f"Loaders of the toolkit are not thread-safe, documents are loaded by a single "
+                                 f"thread instead of {loader_workers}.")
+            loader_workers = 1
+        embedding_workers = self._indexing_setting("embedding_workers")
+        embedding_rpm_limit = self._indexing_setting("embedding_rpm_limit")
+        report_progress = self._progress_reporter(base_total, progress_step)
+        # embed separately only if vectorstore is able to store pre-computed embeddings, otherwise it embeds on write
+        embed_fn = self.embeddings.embed_documents \
+            if self.embeddings is not None and supports_precomputed_embeddings(self.vectorstore) else None
+        self._log_tool_event(f"Indexing pipeline started: {loader_workers} loader worker(s), "
+                             f"{embedding_workers} embedding worker(s), "
+                             f"embedding RPM limit: {embedding_rpm_limit or 'none'}.")
+
+        def _write(documents: List[Document], embeddings: Optional[List[List[float]]]):
+            add_documents(vectorstore=self.vectorstore, documents=documents, embeddings=embeddings)
+
+        def _on_written(batch):
+            if batch.documents:
+                self._log_tool_event(f"{len(batch.documents)} documents have been indexed. Continuing...")
+            _on_completed(batch)
+
+        def _on_failed(batch, exc: Exception):
+            self._track_failed_chunk(batch.documents, exc, result)
+            _on_completed(batch)
+
+        def _on_completed(batch):
+            for base_doc_number, dependent_docs_counter in batch.completed_base_docs:
+                report_progress(base_doc_number, dependent_docs_counter)
+                result["count"] += dependent_docs_counter
+            if batch.completed_base_docs:
+                self._index_meta_progress(index_name, result)
+
+        pipeline = IndexingPipeline(
+            prepare_fn=lambda base_doc: list(self._prepare_base_document(base_doc, chunking_tool, chunking_config, index_name)),
+            embed_fn=embed_fn,
+            write_fn=_write,
+            batch_size=self.max_docs_per_add,
+            loader_workers=loader_workers,
+            embedding_workers=embedding_workers,
+            embedding_rpm=embedding_rpm_limit,
+        )
+        try:
+            pipeline.run(base_documents, on_written=_on_written, on_failed=_on_failed)
+        finally:
+            self._log_tool_event(f"Indexing pipeline stage timings: {pipeline.timings.summary() or 'no data'}.")
+
+    def _prepare_base_document(self, base_doc: Document, chunking_tool, chunking_config, index_name: Optional[str] = None) -> Generator[Document, None, None]:
+        """ Turns a single base document into the documents ready to be indexed: extends it, collects its dependencies,
+        applies loaders and chunkers and marks the result with index_name. Documents with empty content are skipped."""
+        # (base_doc for _ in range(1)) - wrap single base_doc to Generator in order to reuse existing code
+        documents = self._extend_data((base_doc for _ in range(1)))  # update content of not-reduced base document if needed (for sharepoint and similar)
+        documents = self._collect_dependencies(documents)  # collect dependencies for base documents
+        self._log_tool_event(f"Dependent documents were processed. "
+                             f"Applying chunking tool '{chunking_tool if chunking_tool else "default"}' if specified and preparing documents for indexing...")
+        documents = self._apply_loaders_chunkers(documents, chunking_tool, chunking_config)
+        documents = self._clean_metadata(documents)
+
+        logger.debug(f"Indexing base document: {base_doc} and all dependent documents: {documents}")
+        #
+        for doc in documents:
+            if not doc.page_content:
+                # To avoid case when all documents have empty content
+                # See llm_processor.add_documents which exclude metadata of docs with empty content
+                continue
+            #
+            if 'id' not in doc.metadata or 'updated_on' not in doc.metadata:
+                logger.warning(f"Document is missing required metadata field 'id' or 'updated_on': {doc.metadata}")
+            #
+            # if index_name is provided, add it to metadata of each document
+            if index_name:
+                if not doc.metadata.get('collection'):
+                    doc.metadata['collection'] = index_name
+                else:
+                    doc.metadata['collection'] += f";{index_name}"
+            yield doc
+
+    def _progress_reporter(self, base_total: Optional[int], progress_step: Optional[int] = None):
+        """ Returns a callable reporting that base document #N was indexed with its dependent documents. """
+        # set default progress step to 10 if out of 1...100 or None
+        progress_step = 10 if progress_step not in range(1, 101) else progress_step
+        next_progress_point = progress_step
+
+        def _report(base_doc_counter: int, dependent_docs_counter: int):
+            nonlocal next_progress_point
+            total_msg = f" out of ~{max(base_total, base_doc_counter)}" if base_total else ""
+            msg = f"Indexed base document #{base_doc_counter}{total_msg} (with {dependent_docs_counter} dependencies)."
+            logger.debug(msg)
+            self._log_tool_event(msg)
+            if base_total:
+                percent = min(math.floor((base_doc_counter / base_total) * 100), 100)
+                if percent >= next_progress_point:
+                    self._log_tool_event(f"Indexing progress: {percent}%. Processed {base_doc_counter} base documents.")
+                    next_progress_point = (percent // progress_step + 1) * progress_step
+
+        return _report
+
+    def _track_failed_chunk(self, chunk: List[Document], exc: Exception, result: dict):
+        """ Tracks failure of adding a chunk of documents to the vectorstore in result. """
+        from traceback import format_exception
+        err = "".join(format_exception(exc))
+        logger.error(f"Failed to add {len(chunk)} documents to vectorstore: {err}")
+        result["failed_count"] = result.get("failed_count", 0) + len(chunk)
+        error_msg = str(exc)
+        if error_msg not in result.setdefault("errors", []):
+            result["errors"].append(error_msg)
+
+    def _index_meta_progress(self, index_name: str, result: dict):
+        # After each base document, try a non-forced meta update; throttling handled inside index_meta_update
+        try:
+            self.index_meta_update(index_name, IndexerKeywords.INDEX_META_IN_PROGRESS.value, result["count"], update_force=False)
+        except Exception as exc:  # best-effort, do not break indexing
+            logger.warning(f"Failed to update index meta during indexing process for index '{index_name}': {exc}")
+
+    def _apply_loaders_chunkers(self, documents: Generator[Document, None, None], chunking_tool: str=None, chunking_config=None) -> Generator[Document, None, None]:
         if chunking_config is None:
             chunking_config = {}
         chunking_config['embedding'] = self.embeddings
         chunking_config['llm'] = self.llm
 
-        for document in documents:
-            if content_type := document.metadata.get(IndexerKeywords.CONTENT_FILE_NAME.value, None):
-                # apply parsing based on content type and chunk if chunker was applied to parent doc
-                content = document.metadata.pop(IndexerKeywords.CONTENT_IN_BYTES.value, None)
-                yield from process_document_by_type(
-                    document=document,
-                    content=content,
-                    extension_source=content_type, llm=self.llm, chunking_config=chunking_config)
-            elif chunking_tool and (content_in_bytes := document.metadata.pop(IndexerKeywords.CONTENT_IN_BYTES.value, None)) is not None:
-                if not content_in_bytes:
-                    # content is empty, yield as is
-                    yield document
-                    continue
-                # apply parsing based on content type resolved from chunking_tool
-                content_type = file_extension_by_chunker(chunking_tool)
-                yield from process_document_by_type(
-                    document=document,
-                    content=content_in_bytes,
-                    extension_source=content_type, llm=self.llm, chunking_config=chunking_config)
-            elif chunking_tool:
-                # apply default chunker from toolkit config. No parsing.
-                chunker = chunkers.get(chunking_tool)
-                yield from chunker(file_content_generator=iter([document]), config=chunking_config)
-            else:
-                # return as is if neither chunker nor content type are specified
-                yield document
-    
+        pool = self._parsing_pool()
+        items = (self._load_and_chunk(document, chunking_tool, chunking_config, pool) for document in documents)
+        if pool is None:
+            for item in items:
+                yield from item
+        else:
+            # jobs are submitted ahead while the earlier documents are being consumed
+            yield from pool.ordered(items)
+
+    def _load_and_chunk(self, document: Document, chunking_tool: str, chunking_config: dict,
+                        pool: Optional[ParsingPool] = None) -> Iterable[Document]:
+        """ Returns documents produced from the document by loaders/chunkers. Parsing of the content is submitted
+        to the pool right away unless the loader requires LLM, which is available in the current process only. """
+        from ..tools.chunkers import __all__ as chunkers
+
+        if content_type := document.metadata.get(IndexerKeywords.CONTENT_FILE_NAME.value, None):
+            # apply parsing based on content type and chunk if chunker was applied to parent doc
+            content = document.metadata.pop(IndexerKeywords.CONTENT_IN_BYTES.value, None)
+            return self._process_document_by_type(document, content, content_type, chunking_config, pool)
+        elif chunking_tool and (content_in_bytes := document.metadata.pop(IndexerKeywords.CONTENT_IN_BYTES.value, None)) is not None:
+            if not content_in_bytes:
+                # content is empty, yield as is
+                return [document]
+            # apply parsing based on content type resolved from chunking_tool
+            content_type = file_extension_by_chunker(chunking_tool)
+            return self._process_document_by_type(document, content_in_bytes, content_type, chunking_config, pool)
+        elif chunking_tool:
+            # apply default chunker from toolkit config. No parsing.
+            chunker = chunkers.get(chunking_tool)
+            return chunker(file_content_generator=iter([document]), config=chunking_config)
+        else:
+            # return as is if neither chunker nor content type are specified
+            return [document]
+
+    def _process_document_by_type(self, document: Document, content, content_type: str, chunking_config: dict,
+                                  pool: Optional[ParsingPool] = None) -> Iterable[Document]:
+        if pool is None or content is None or loader_uses_llm(content_type, chunking_config):
+            return process_document_by_type(document=document, content=content, extension_source=content_type,
+                                            llm=self.llm, chunking_config=chunking_config)
+        return document_chunks(future_results(pool.parse_content(content, content_type, chunking_config)),
+                               content_type, document)
+
+    def _parsing_pool(self) -> Optional[ParsingPool]:
+        """ Shared pool of `parsing_processes` worker processes, None if parsing runs in-process. """
+        return get_parsing_pool(self._indexing_setting("parsing_processes"))
+
     def _extend_data(self, documents: Generator[Document, None, None]):
         yield from documents
 
@@ -375,24 +550,59 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
             self,
             documents: Generator[Any, None, None],
             index_name: str,
-            log_msg: str = "Verification of documents to index started"
+            log_msg: str = "Verification of documents to index started",
+            outdated_ids: Optional[set] = None,
     ) -> Generator[Document, None, None]:
-        """Generic duplicate reduction logic for documents."""
+        """Generic duplicate reduction logic for documents.
+
+        By default, compact data of the whole index is loaded once. If `dedupe_batch_size` is set, incoming documents
+        are verified in batches of that size and only indexed data matching their keys is requested from vectorstore.
+        Ids of indexed chunks of changed documents are collected to outdated_ids, if it is provided, for the caller
+        to remove them once new versions are written. Otherwise, they are removed when all documents are consumed.
+        """
         self._ensure_vectorstore_initialized()
         self._log_tool_event(log_msg, tool_name="index_documents")
-        indexed_data = self._get_indexed_data(index_name)
-        indexed_keys = set(indexed_data.keys())
-        if not indexed_keys:
-            self._log_tool_event("Vectorstore is empty, indexing all incoming documents", tool_name="index_documents")
-            yield from documents
-            return
+        docs_to_remove = outdated_ids if outdated_ids is not None else set()
+        batch_size = self._indexing_setting("dedupe_batch_size")
+
+        if batch_size > 0:
+            batch = []
+            for document in documents:
+                batch.append(document)
+                if len(batch) >= batch_size:
+                    yield from self._skip_indexed(batch, index_name, docs_to_remove)
+                    batch = []
+            if batch:
+                yield from self._skip_indexed(batch, index_name, docs_to_remove)
+        else:
+            indexed_data = self._get_indexed_data(index_name)
+            if not indexed_data:
+                self._log_tool_event("Vectorstore is empty, indexing all incoming documents", tool_name="index_documents")
+                yield from documents
+                return
+            yield from self._skip_indexed(documents, index_name, docs_to_remove, indexed_data)
 
-        docs_to_remove = set()
+        if outdated_ids is None:
+            self._remove_outdated_documents(docs_to_remove)
 
+    def _remove_outdated_documents(self, ids: set):
+        if ids:
+            self._log_tool_event(
+                f"Removing {len(ids)} documents from vectorstore that are already indexed with different updated_on.",
+                tool_name="index_documents"
+            )
+            self.vectorstore.delete(ids=list(ids))
+
+    def _skip_indexed(self, documents, index_name: str, docs_to_remove: set, indexed_data=None) -> Generator[Document, None, None]:
+        """Yields documents which are not indexed yet or changed, collecting ids of outdated chunks to docs_to_remove.
+        If indexed_data is not provided, it is requested for keys of given documents only."""
+        if indexed_data is None:
+            keys = [str(self.key_fn(document)) for document in documents]
+            indexed_data = self._get_indexed_data(index_name, keys=keys)
         for document in documents:
             key = self.key_fn(document)
             key = key if isinstance(key, str) else str(key)
-            if key in indexed_keys and index_name == indexed_data[key]['metadata'].get('collection'):
+            if key in indexed_data and index_name == indexed_data[key]['metadata'].get('collection'):
                 if self.compare_fn(document, indexed_data[key]):
                     continue
                 yield document
@@ -400,14 +610,8 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
             else:
                 yield document
 
-        if docs_to_remove:
-            self._log_tool_event(
-                f"Removing {len(docs_to_remove)} documents from vectorstore that are already indexed with different updated_on.",
-                tool_name="index_documents"
-            )
-            self.vectorstore.delete(ids=list(docs_to_remove))
-    
-    def _get_indexed_data(self, index_name: str):
+    def _get_indexed_data(self, index_name: str, keys: Optional[List[str]] = None):
+        """Returns indexed data per key of documents. If keys are provided, it is enough to return data for them only."""
         raise NotImplementedError("Subclasses must implement this method")
 
     def key_fn(self, document: Document):
@@ -432,8 +636,9 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
 
         filter = filter if isinstance(filter, dict) else json.loads(filter)
         if index_name:
+            # $in is translated by PGVector into `cmetadata ->> 'collection'` condition matching metadata index
             filter.update({"collection": {
-                "$eq": index_name.strip()
+                "$in": [index_name.strip()]
             }})
 
         if filter:
@@ -757,6 +962,7 @@ class BaseIndexerToolkit(VectorStoreWrapperBase):
                 Optional[int],
                 Field(default=10, ge=0, le=100, description="Optional step size for progress reporting during indexing")
             ),
+            **INDEXING_SETTINGS_PARAMS,
         }
         chunking_config = (
             Optional[dict],
@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 
-from typing import Generator
+from typing import Generator, Optional
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter, TokenTextSplitter
 
@@ -12,6 +13,25 @@ from logging import getLogger
 
 logger = getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _code_splitter(langchain_language) -> Optional[RecursiveCharacterTextSplitter]:
+    """Splitter of method source code, built once per language (splitting is stateless and thread-safe)."""
+    if not langchain_language:
+        return None
+    return RecursiveCharacterTextSplitter.from_language(
+        language=langchain_language,
+        chunk_size=1024,
+        chunk_overlap=128,
+    )
+
+
+@lru_cache(maxsize=1)
+def _text_splitter() -> TokenTextSplitter:
+    """Splitter of files in languages without a parser."""
+    return TokenTextSplitter(encoding_name="gpt2", chunk_size=256, chunk_overlap=30)
+
+
 def parse_code_files_for_db(file_content_generator: Generator[str, None, None], *args, **kwargs) -> Generator[Document, None, None]:
     """
     Parses code files from a generator and returns a generator of Document objects for database storage.
@@ -22,11 +42,9 @@ def parse_code_files_for_db(file_content_generator: Generator[str, None, None],
     Returns:
         Generator[Document, None, None]: Generator of Document objects containing parsed code information.
     """
-    code_splitter = None
     for data in file_content_generator:
         file_name: str = data.get("file_name")
         file_content: str = data.get("file_content")
-        file_bytes = file_content.encode()
 
         file_extension = get_file_extension(file_name)
         programming_language = get_programming_language(file_extension)
@@ -37,7 +55,7 @@ def parse_code_files_for_db(file_content_generator: Generator[str, None, None],
             logger.debug(f"Skipping image file: {file_name} as it is image")
             continue
         if programming_language == Language.UNKNOWN:
-            documents = TokenTextSplitter(encoding_name="gpt2", chunk_size=256, chunk_overlap=30).split_text(file_content)
+            documents = _text_splitter().split_text(file_content)
             for document in documents:
                 metadata = {
                     "filename": file_name,
@@ -54,17 +72,10 @@ def parse_code_files_for_db(file_content_generator: Generator[str, None, None],
                 yield document
         else:
             try:
-                langchain_language = get_langchain_language(programming_language)
-
-                if langchain_language:
-                    code_splitter = RecursiveCharacterTextSplitter.from_language(
-                        language=langchain_language,
-                        chunk_size=1024,
-                        chunk_overlap=128,
-                    )
-                treesitter_parser = Treesitter.create_treesitter(programming_language)
+                code_splitter = _code_splitter(get_langchain_language(programming_language))
+                treesitter_parser = Treesitter.get_treesitter(programming_language)
                 treesitterNodes: list[TreesitterMethodNode] = treesitter_parser.parse(
-                    file_bytes
+                    file_content.encode()
                 )
                 for node in treesitterNodes:
                     method_source_code = node.method_source_code
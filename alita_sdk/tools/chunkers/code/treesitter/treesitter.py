@@ -1,4 +1,6 @@
+import threading
 from abc import ABC
+from typing import Iterator
 
 import tree_sitter
 from tree_sitter_languages import get_language, get_parser
@@ -8,17 +10,36 @@ from .treesitter_registry import TreesitterRegistry
 
 
 class TreesitterMethodNode:
+    """Method found in the parsed file.
+
+    The source code is kept as byte offsets into the file bytes and decoded on first access."""
+
+    __slots__ = ("name", "doc_comment", "node", "start_byte", "end_byte", "_source", "_method_source_code")
+
     def __init__(
         self,
         name: "str | bytes | None",
         doc_comment: "str | None",
         method_source_code: "str | None",
         node: tree_sitter.Node,
+        source: "bytes | None" = None,
     ):
         self.name = name
         self.doc_comment = doc_comment
-        self.method_source_code = method_source_code or node.text.decode()
         self.node = node
+        self.start_byte = node.start_byte
+        self.end_byte = node.end_byte
+        self._source = source
+        self._method_source_code = method_source_code
+
+    @property
+    def method_source_code(self) -> str:
+        if self._method_source_code is None:
+            if self._source is not None:
+                self._method_source_code = self._source[self.start_byte:self.end_byte].decode()
+            else:
+                self._method_source_code = self.node.text.decode()
+        return self._method_source_code
 
 
 class Treesitter(ABC):
@@ -35,10 +56,23 @@ class Treesitter(ABC):
         self.method_name_identifier = name_identifier
         self.doc_comment_identifier = doc_comment_identifier
 
+    _local = threading.local()
+
     @staticmethod
     def create_treesitter(language: Language) -> "Treesitter":
         return TreesitterRegistry.create_treesitter(language)
 
+    @staticmethod
+    def get_treesitter(language: Language) -> "Treesitter":
+        """Returns the parser of the language reused by the current thread.
+
+        Grammar loading and parser creation are done once per thread and language;
+        parsers keep the state of the parsed file, so they are not shared between threads."""
+        parsers = Treesitter._local.__dict__.setdefault("parsers", {})
+        if language not in parsers:
+            parsers[language] = Treesitter.create_treesitter(language)
+        return parsers[language]
+
     def parse(self, file_bytes: bytes) -> list[TreesitterMethodNode]:
         """Parses the given file bytes and extracts method nodes.
 
@@ -65,7 +99,7 @@ class Treesitter(ABC):
                 doc_comment = method["doc_comment"]
                 result.append(
                     TreesitterMethodNode(
-                        method_name, doc_comment, None, method["method"]
+                        method_name, doc_comment, None, method["method"], file_bytes
                     )
                 )
             return result
@@ -89,7 +123,7 @@ class Treesitter(ABC):
         node: tree_sitter.Node,
     ):
         """
-        Recursively queries all method nodes in the given syntax tree node.
+        Queries all method nodes in the given syntax tree node.
 
         Args:
             node (tree_sitter.Node): The root node to start the query from.
@@ -98,19 +132,41 @@ class Treesitter(ABC):
             list: A list of dictionaries, each containing a method node and its
             associated doc comment (if any).
         """
-        methods = []
-        if node.type == self.method_declaration_identifier:
-            doc_comment_node = None
-            if (
-                node.prev_named_sibling
-                and node.prev_named_sibling.type == self.doc_comment_identifier
-            ):
-                doc_comment_node = node.prev_named_sibling.text.decode()
-            methods.append({"method": node, "doc_comment": doc_comment_node})
-        else:
-            for child in node.children:
-                methods.extend(self._query_all_methods(child))
-        return methods
+        return [
+            {"method": method, "doc_comment": self._query_doc_comment(method)}
+            for method in self._walk_methods(node)
+        ]
+
+    def _walk_methods(self, node: tree_sitter.Node) -> Iterator[tree_sitter.Node]:
+        """Yields method nodes in document order walking the tree with a cursor.
+
+        Nested methods are not yielded: children of a method node are not visited."""
+        cursor = node.walk()
+        while True:
+            if cursor.node.type == self.method_declaration_identifier:
+                yield cursor.node
+            elif cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
+
+    def _query_doc_comment(self, node: tree_sitter.Node):
+        """Returns the text of the doc comment node preceding the method node, if any."""
+        previous = node.prev_named_sibling
+        if previous and previous.type == self.doc_comment_identifier:
+            return previous.text.decode()
+        return None
+
+    def _preceding_comments(self, node: tree_sitter.Node) -> list:
+        """Returns texts of consecutive doc comment nodes preceding the method node in document order."""
+        comments = []
+        previous = node.prev_named_sibling
+        while previous and previous.type == self.doc_comment_identifier:
+            comments.append(previous.text.decode())
+            previous = previous.prev_named_sibling
+        comments.reverse()
+        return comments
 
     def _query_method_name(self, node: tree_sitter.Node):
         """Queries the method name from the given syntax tree node.
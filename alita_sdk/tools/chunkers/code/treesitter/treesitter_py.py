@@ -6,10 +6,16 @@ from .treesitter_registry import TreesitterRegistry
 
 
 class TreesitterPython(Treesitter):
+    DOC_STR_QUERY = """
+        (function_definition
+            body: (block . (expression_statement (string)) @function_doc_str))
+    """
+
     def __init__(self):
         super().__init__(
             Language.PYTHON, "function_definition", "identifier", "expression_statement"
         )
+        self.doc_str_query = self.language.query(self.DOC_STR_QUERY)
 
     def parse(self, file_bytes: bytes) -> list[TreesitterMethodNode]:
         """
@@ -27,7 +33,7 @@ class TreesitterPython(Treesitter):
         for method in methods:
             method_name = self._query_method_name(method)
             doc_comment = self._query_doc_comment(method)
-            result.append(TreesitterMethodNode(method_name, doc_comment, None, method))
+            result.append(TreesitterMethodNode(method_name, doc_comment, None, method, file_bytes))
         return result
 
     def _query_method_name(self, node: tree_sitter.Node):
@@ -77,12 +83,7 @@ class TreesitterPython(Treesitter):
         Returns:
             str or None: The documentation comment string if found, otherwise None.
         """
-        query_code = """
-            (function_definition
-                body: (block . (expression_statement (string)) @function_doc_str))
-        """
-        doc_str_query = self.language.query(query_code)
-        doc_strs = doc_str_query.captures(node)
+        doc_strs = self.doc_str_query.captures(node)
 
         if doc_strs:
             return doc_strs[0][0].text.decode()
@@ -35,41 +35,78 @@ def _encode_documents(embeddings: 'BaseModel', docs: List[str]) -> np.ndarray: #
     logger.info(f"Encoded {len(_embeddings)} embeddings.")
     return np.array(_embeddings)
 
+# Rows processed at once by the sliding window, bounds memory used for prefix sums of large documents
+SIMILARITY_BLOCK_SIZE = 64
+
+
+def _row_norms(matrix: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+
+
 def _calculate_similarity_scores(encoded_docs: np.ndarray, window_size: int) -> List[float]:
-        raw_similarities = []
-        for idx in range(1, len(encoded_docs)):
-            window_start = max(0, idx - window_size)
-            cumulative_context = np.mean(encoded_docs[window_start:idx], axis=0)
-            curr_sim_score = np.dot(cumulative_context, encoded_docs[idx]) / (
-                np.linalg.norm(cumulative_context) * np.linalg.norm(encoded_docs[idx])
-                + 1e-10
-            )
-            raw_similarities.append(curr_sim_score)
-        return raw_similarities
-
-def _find_split_indices(
-        similarities: List[float], calculated_threshold: float
-    ) -> List[int]:
-        split_indices = []
-        for idx, score in enumerate(similarities):
-            logger.debug(f"Similarity score at index {idx}: {score}")
-            if score < calculated_threshold:
-                logger.debug(
-                    f"Adding to split_indices due to score < threshold: "
-                    f"{score} < {calculated_threshold}"
-                )
-                # Chunk after the document at idx
-                split_indices.append(idx + 1)
-        return split_indices
-    
+    """
+    Cosine similarity of every document (starting from the second one) with the mean
+    of up to window_size preceding documents.
+
+    Window sums are differences of prefix sums of embeddings, so the whole computation is vectorized;
+    documents are processed in blocks of SIMILARITY_BLOCK_SIZE rows to keep prefix sums in cache.
+    """
+    encoded = np.asarray(encoded_docs, dtype=np.float64)
+    total = len(encoded)
+    if total < 2:
+        return []
+    window_size = max(int(window_size), 1)
+    norms = _row_norms(encoded)
+    scores = np.empty(total - 1, dtype=np.float64)
+    for block_start in range(1, total, SIMILARITY_BLOCK_SIZE):
+        block_end = min(block_start + SIMILARITY_BLOCK_SIZE, total)
+        offset = block_start - window_size
+        # prefix[k] is the sum of encoded[offset:offset + k], so prefix[window_size + i] - prefix[i] is the
+        # window of window_size rows preceding row block_start + i; rows before the document start are
+        # zeros, so windows of the first documents are shorter without index clamping
+        prefix = np.zeros((block_end - offset + 1, encoded.shape[1]), dtype=np.float64)
+        valid_from = max(0, -offset)
+        np.cumsum(encoded[offset + valid_from:block_end], axis=0, out=prefix[valid_from + 1:])
+        size = block_end - block_start
+        window_sums = prefix[window_size:window_size + size] - prefix[:size]
+        # mean of the window is applied to the scalars: dot and norm both scale with 1 / window length
+        lengths = np.minimum(np.arange(block_start, block_end), window_size)
+        dots = np.einsum("ij,ij->i", window_sums, encoded[block_start:block_end]) / lengths
+        scores[block_start - 1:block_end - 1] = dots / (
+            _row_norms(window_sums) / lengths * norms[block_start:block_end] + 1e-10
+        )
+    return scores.tolist()
+
+
+def _find_split_indices(similarities: List[float], calculated_threshold: float) -> List[int]:
+    """Indices to chunk after: every document with similarity below the threshold starts a new split."""
+    similarities = np.asarray(similarities, dtype=np.float64)
+    # Chunk after the document at idx
+    split_indices = np.flatnonzero(similarities < calculated_threshold) + 1
+    logger.debug(f"{len(split_indices)} split indices found for threshold {calculated_threshold}")
+    return split_indices.tolist()
+
+
+def _token_counts(docs: List[str], token_counts: Optional[List[int]] = None) -> np.ndarray:
+    if token_counts is None:
+        token_counts = [tiktoken_length(doc) for doc in docs]
+    return np.asarray(token_counts, dtype=np.int64)
+
+
 def _find_optimal_threshold(docs: List[str], similarity_scores: List[float], 
                             min_split_tokens:int = 100, 
                             max_split_tokens:int = 300,
                             split_tokens_tolerance: int = 10,
-                            threshold_adjustment: float = 0.01
+                            threshold_adjustment: float = 0.01,
+                            token_counts: Optional[List[int]] = None
                             ) -> float:
-    token_counts = [tiktoken_length(doc) for doc in docs]
-    cumulative_token_counts = np.cumsum([0] + token_counts)
+    token_counts = _token_counts(docs, token_counts)
+    cumulative_token_counts = np.concatenate(([0], np.cumsum(token_counts)))
+    similarity_scores = np.asarray(similarity_scores, dtype=np.float64)
+    # Sorted scores give the number of splits for a threshold with a binary search,
+    # positions of these splits are the documents with the lowest scores
+    order = np.argsort(similarity_scores, kind="stable")
+    sorted_scores = similarity_scores[order]
 
     # Analyze the distribution of similarity scores to set initial bounds
     median_score = np.median(similarity_scores)
@@ -84,17 +121,14 @@ def _find_optimal_threshold(docs: List[str], similarity_scores: List[float],
     calculated_threshold = 0.0
     while low <= high:
         calculated_threshold = (low + high) / 2
-        split_indices = _find_split_indices(similarity_scores, calculated_threshold)
+        splits_count = np.searchsorted(sorted_scores, calculated_threshold, side="left")
+        split_indices = np.sort(order[:splits_count]) + 1
         logger.debug(f"Iteration {iteration}: Trying threshold: {calculated_threshold}")
 
         # Calculate the token counts for each split using the cumulative sums
-        split_token_counts = [
-            cumulative_token_counts[end] - cumulative_token_counts[start]
-            for start, end in zip(
-                [0] + split_indices, split_indices + [len(token_counts)]
-            )
-        ]
-        
+        boundaries = np.concatenate(([0], split_indices, [len(token_counts)]))
+        split_token_counts = cumulative_token_counts[boundaries[1:]] - cumulative_token_counts[boundaries[:-1]]
+
         # Calculate the median token count for the chunks
         median_tokens = np.median(split_token_counts)
         logger.debug(
@@ -123,22 +157,10 @@ def _find_optimal_threshold(docs: List[str], similarity_scores: List[float],
 
     return calculated_threshold
 
-def _find_split_indices(similarities: List[float], calculated_threshold: float) -> List[int]:
-    split_indices = []
-    for idx, score in enumerate(similarities):
-        logger.debug(f"Similarity score at index {idx}: {score}")
-        if score < calculated_threshold:
-            logger.debug(
-                f"Adding to split_indices due to score < threshold: "
-                f"{score} < {calculated_threshold}"
-            )
-            # Chunk after the document at idx
-            split_indices.append(idx + 1)
-    return split_indices
-
 
 def _split_documents(docs: List[str], split_indices: List[int], similarities: List[float],
-                     max_split_tokens: int = 300, min_split_tokens: int = 100, 
+                     max_split_tokens: int = 300, min_split_tokens: int = 100,
+                     token_counts: Optional[List[int]] = None,
                      ) -> List[Chunk]:
     """
     This method iterates through each document, appending it to the current split
@@ -147,8 +169,14 @@ def _split_documents(docs: List[str], split_indices: List[int], similarities: Li
     When a document causes the current token count to exceed this limit,
     or when a split point is reached and the minimum token requirement is met,
     the current split is finalized and added to the List of chunks.
+    Token counts of docs can be passed if they are already calculated.
     """
-    token_counts = [tiktoken_length(doc) for doc in docs]
+    token_counts = _token_counts(docs, token_counts).tolist()
+    # split_points[i] is True if the document at i is followed by a split
+    split_points = np.zeros(len(docs) + 1, dtype=bool)
+    split_indices = np.asarray(split_indices, dtype=np.int64)
+    split_points[split_indices[(split_indices >= 1) & (split_indices <= len(docs))] - 1] = True
+    split_points = split_points.tolist()
     chunks, current_split = [], []
     current_tokens_count = 0
 
@@ -159,10 +187,8 @@ def _split_documents(docs: List[str], split_indices: List[int], similarities: Li
 
     for doc_idx, doc in enumerate(docs):
         doc_token_count = token_counts[doc_idx]
-        logger.debug(f"Accumulative token count: {current_tokens_count} tokens")
-        logger.debug(f"Document token count: {doc_token_count} tokens")
         # Check if current index is a split point based on similarity
-        if doc_idx + 1 in split_indices:
+        if split_points[doc_idx]:
             if (
                 min_split_tokens
                 <= current_tokens_count + doc_token_count
@@ -178,16 +204,12 @@ def _split_documents(docs: List[str], split_indices: List[int], similarities: Li
                 )
                 chunks.append(
                     Chunk(
-                        splits=current_split.copy(),
+                        splits=current_split,
                         is_triggered=True,
                         triggered_score=triggered_score,
                         token_count=current_tokens_count,
                     )
                 )
-                logger.debug(
-                    f"Chunk finalized with {current_tokens_count} tokens due to "
-                    f"threshold {triggered_score}."
-                )
                 current_split, current_tokens_count = [], 0
                 chunks_by_threshold += 1
                 continue  # Move to the next document after splitting
@@ -197,17 +219,13 @@ def _split_documents(docs: List[str], split_indices: List[int], similarities: Li
             if current_tokens_count >= min_split_tokens:
                 chunks.append(
                     Chunk(
-                        splits=current_split.copy(),
+                        splits=current_split,
                         is_triggered=False,
                         triggered_score=None,
                         token_count=current_tokens_count,
                     )
                 )
                 chunks_by_max_chunk_size += 1
-                logger.debug(
-                    f"Chink finalized with {current_tokens_count} tokens due to "
-                    f"exceeding token limit of {max_split_tokens}."
-                )
                 current_split, current_tokens_count = [], 0
 
         current_split.append(doc)
@@ -217,23 +235,21 @@ def _split_documents(docs: List[str], split_indices: List[int], similarities: Li
     if current_split:
         chunks.append(
             Chunk(
-                splits=current_split.copy(),
+                splits=current_split,
                 is_triggered=False,
                 triggered_score=None,
                 token_count=current_tokens_count,
             )
         )
         chunks_by_last_split += 1
-        logger.debug(
-            f"Final split added with {current_tokens_count} "
-            "tokens due to remaining documents."
-        )
+    logger.debug(
+        f"{len(chunks)} chunks created: {chunks_by_threshold} by threshold, "
+        f"{chunks_by_max_chunk_size} by max chunk size, {chunks_by_last_split} by last split."
+    )
 
     # Validation to ensure no tokens are lost during the split
     original_token_count = sum(token_counts)
-    split_token_count = sum(
-        [tiktoken_length(doc) for split in chunks for doc in split.splits]
-    )
+    split_token_count = sum(chunk.token_count for chunk in chunks)
     if original_token_count != split_token_count:
         logger.error(
             f"Token count mismatch: {original_token_count} != {split_token_count}"
@@ -278,6 +294,8 @@ def statistical_chunker(file_content_generator: Generator[Document, None, None],
                     batch_splits = last_chunk.splits + batch_splits
                 
                 encoded_splits = _encode_documents(embedding, batch_splits)
+                # token counts are calculated once and shared by threshold search and splitting
+                token_counts = [tiktoken_length(split) for split in batch_splits]
                 
                 similarities = _calculate_similarity_scores(encoded_splits, window_size)
 
@@ -285,7 +303,7 @@ def statistical_chunker(file_content_generator: Generator[Document, None, None],
                     calculated_threshold = _find_optimal_threshold(
                         batch_splits, similarities, min_split_tokens, 
                         max_split_tokens, split_tokens_tolerance, 
-                        threshold_adjustment
+                        threshold_adjustment, token_counts=token_counts
                     )
                 else:
                     calculated_threshold = score_threshold
@@ -299,6 +317,7 @@ def statistical_chunker(file_content_generator: Generator[Document, None, None],
                     docs=batch_splits,
                     split_indices=split_indices,
                     similarities=similarities,
+                    token_counts=token_counts,
                 )
                 for chunk in doc_chunks:
                     chunk_id += 1
@@ -9,6 +9,9 @@ the appropriate chunking strategy based on the file extension:
 - .json → JSON chunker  
 - other → Default text chunker
 
+Documents are buffered by type and buffers are chunked by UniversalChunker, optionally
+concurrently in threads or worker processes (see `workers` and `pool`).
+
 Usage:
     from alita_sdk.tools.chunkers.universal_chunker import universal_chunker
     
@@ -19,7 +22,11 @@ Usage:
 
 import logging
 import os
-from typing import Generator, Dict, Any, Optional
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generator, Dict, Any, Iterable, List, Optional, Tuple, Union
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
@@ -27,6 +34,9 @@ from .code.codeparser import parse_code_files_for_db
 from .sematic.markdown_chunker import markdown_chunker
 from .sematic.json_chunker import json_chunker
 
+if TYPE_CHECKING:
+    from ..utils.parsing_pool import ParsingPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,9 +123,237 @@ def _code_chunker_from_documents(
         yield chunk
 
 
+_CHUNKERS = {
+    'markdown': markdown_chunker,
+    'json': json_chunker,
+    'code': _code_chunker_from_documents,
+    'text': _default_text_chunker,
+}
+
+# Default configs for each chunker type
+DEFAULT_CONFIGS = {
+    'markdown': {
+        'strip_header': False,
+        'return_each_line': False,
+        'headers_to_split_on': [
+            ('#', 'Header 1'),
+            ('##', 'Header 2'),
+            ('###', 'Header 3'),
+            ('####', 'Header 4'),
+        ],
+        'max_tokens': 1024,
+        'token_overlap': 50,
+        'min_chunk_chars': 100,  # Merge chunks smaller than this
+    },
+    'json': {
+        'max_tokens': 512,
+    },
+    'code': {},
+    'text': {
+        'chunk_size': 1000,
+        'chunk_overlap': 100,
+    },
+}
+
+FILE_TYPES = tuple(_CHUNKERS)
+
+# Documents of a single type chunked by one job
+DEFAULT_BUFFER_SIZE = 10
+
+
+def chunk_buffer(
+    file_type: str,
+    documents: List[Document],
+    config: Dict[str, Any]
+) -> Tuple[float, List[List[Document]]]:
+    """
+    Chunk a buffer of documents of a single file type.
+
+    Each document is chunked separately so that chunks can be put back into the input order.
+    Defined at module level to be runnable in worker processes.
+
+    Returns:
+        Seconds spent and list of chunks per document
+    """
+    chunker = _CHUNKERS[file_type]
+    start = time.perf_counter()
+    chunks = [list(chunker(iter([doc]), config)) for doc in documents]
+    return time.perf_counter() - start, chunks
+
+
+@dataclass
+class ChunkingStats:
+    """Documents, chunks and chunking time per file type."""
+    documents: dict = field(default_factory=dict)
+    chunks: dict = field(default_factory=dict)
+    seconds: dict = field(default_factory=dict)
+
+    def add(self, file_type: str, seconds: float, documents: int, chunks: int):
+        self.documents[file_type] = self.documents.get(file_type, 0) + documents
+        self.chunks[file_type] = self.chunks.get(file_type, 0) + chunks
+        self.seconds[file_type] = self.seconds.get(file_type, 0.0) + seconds
+
+    def throughput(self, file_type: str) -> float:
+        """Documents per second of chunking time (summed over concurrent jobs)."""
+        seconds = self.seconds.get(file_type, 0.0)
+        return self.documents.get(file_type, 0) / seconds if seconds else 0.0
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{file_type}: {self.documents[file_type]} docs -> {self.chunks[file_type]} chunks "
+            f"in {self.seconds[file_type]:.2f}s ({self.throughput(file_type):.1f} docs/sec)"
+            for file_type in self.documents
+        )
+
+
+class UniversalChunker:
+    """
+    Chunking engine behind universal_chunker.
+
+    Documents are collected into per-type buffers and every full buffer is chunked as one job:
+    in the calling thread, in a thread pool (`workers`) or in worker processes of a ParsingPool.
+    Jobs of different types run concurrently, so a mix of markdown, JSON, code and text documents
+    keeps all workers busy.
+
+    Args:
+        config: Chunkers configuration (markdown_config, json_config, code_config, text_config)
+        buffer_sizes: Documents per job, single size or dict by file type
+        workers: Number of threads chunking buffers, 0 chunks in the calling thread
+        pool: ParsingPool chunking buffers in worker processes, takes precedence over workers
+        preserve_order: Yield chunks in the order of input documents; otherwise chunks of every
+            job are yielded as soon as it completes
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        buffer_sizes: Optional[Union[int, Dict[str, int]]] = None,
+        workers: int = 0,
+        pool: Optional["ParsingPool"] = None,
+        preserve_order: bool = False,
+    ):
+        config = config or {}
+        self.configs = {
+            file_type: config.get(f'{file_type}_config', DEFAULT_CONFIGS[file_type])
+            for file_type in FILE_TYPES
+        }
+        if buffer_sizes is None or isinstance(buffer_sizes, int):
+            buffer_sizes = dict.fromkeys(FILE_TYPES, buffer_sizes or DEFAULT_BUFFER_SIZE)
+        self.buffer_sizes = {
+            file_type: max(1, buffer_sizes.get(file_type, DEFAULT_BUFFER_SIZE))
+            for file_type in FILE_TYPES
+        }
+        self.workers = workers
+        self.pool = pool
+        self.preserve_order = preserve_order
+        self.stats = ChunkingStats()
+
+    @property
+    def max_jobs(self) -> int:
+        """Number of jobs submitted ahead of yielding their chunks."""
+        if self.pool is not None:
+            return self.pool.lookahead
+        return max(1, self.workers * 2)
+
+    def chunk(self, documents: Iterable[Document]) -> Generator[Document, None, None]:
+        """Yields chunks of the documents."""
+        executor = None
+        if self.pool is None and self.workers > 0:
+            executor = ThreadPoolExecutor(self.workers, thread_name_prefix="chunker")
+        try:
+            yield from _ChunkingRun(self, executor).run(documents)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug(f"Chunking stats: {self.stats.summary()}")
+
+    def submit(self, executor: Optional[Executor], file_type: str, documents: List[Document]) -> Future:
+        config = self.configs[file_type]
+        if self.pool is not None:
+            return self.pool.submit(chunk_buffer, file_type, documents, config)
+        if executor is not None:
+            return executor.submit(chunk_buffer, file_type, documents, config)
+        future = Future()
+        future.set_result(chunk_buffer(file_type, documents, config))
+        return future
+
+
+class _ChunkingRun:
+    """State of a single UniversalChunker.chunk call."""
+
+    def __init__(self, engine: UniversalChunker, executor: Optional[Executor]):
+        self.engine = engine
+        self.executor = executor
+        self.buffers: Dict[str, List[Tuple[int, Document]]] = {file_type: [] for file_type in FILE_TYPES}
+        # (file_type, sequence numbers of documents, future) in the order of submission
+        self.jobs = deque()
+        # chunks per sequence number waiting for earlier documents (preserve_order only)
+        self.ready: Dict[int, List[Document]] = {}
+        self.next_seq = 0
+        # documents held in `ready` before the buffer blocking them is flushed early
+        self.max_ready = sum(engine.buffer_sizes.values())
+
+    def run(self, documents: Iterable[Document]) -> Generator[Document, None, None]:
+        for seq, doc in enumerate(documents):
+            # Get file path from metadata
+            file_path = (doc.metadata.get('file_path') or
+                         doc.metadata.get('file_name') or
+                         doc.metadata.get('source') or
+                         'unknown')
+            # Ensure file_path is in metadata for downstream use
+            doc.metadata['file_path'] = file_path
+
+            file_type = get_file_type(file_path)
+            self.buffers[file_type].append((seq, doc))
+            if len(self.buffers[file_type]) >= self.engine.buffer_sizes[file_type]:
+                self.flush(file_type)
+            yield from self.collect(block=len(self.jobs) >= self.engine.max_jobs)
+
+        # Flush remaining documents
+        for file_type in FILE_TYPES:
+            if self.buffers[file_type]:
+                self.flush(file_type)
+        while self.jobs:
+            yield from self.collect(block=True)
+
+    def flush(self, file_type: str):
+        buffer, self.buffers[file_type] = self.buffers[file_type], []
+        future = self.engine.submit(self.executor, file_type, [doc for _, doc in buffer])
+        self.jobs.append((file_type, [seq for seq, _ in buffer], future))
+
+    def collect(self, block: bool) -> Generator[Document, None, None]:
+        """Yields chunks of completed jobs, waiting for at least one if `block`."""
+        if block and self.jobs:
+            wait([future for _, _, future in self.jobs], return_when=FIRST_COMPLETED)
+        pending = deque()
+        while self.jobs:
+            file_type, seqs, future = self.jobs.popleft()
+            if not future.done():
+                pending.append((file_type, seqs, future))
+                continue
+            seconds, chunks = future.result()
+            self.engine.stats.add(file_type, seconds, len(seqs), sum(len(doc_chunks) for doc_chunks in chunks))
+            if not self.engine.preserve_order:
+                for doc_chunks in chunks:
+                    yield from doc_chunks
+                continue
+            self.ready.update(zip(seqs, chunks))
+            while self.next_seq in self.ready:
+                yield from self.ready.pop(self.next_seq)
+                self.next_seq += 1
+        self.jobs = pending
+        if len(self.ready) > self.max_ready:
+            # the earliest document not yielded yet waits in a buffer which is not full
+            for file_type, buffer in self.buffers.items():
+                if buffer and buffer[0][0] == self.next_seq:
+                    self.flush(file_type)
+                    break
+
+
 def universal_chunker(
     documents: Generator[Document, None, None],
-    config: Optional[Dict[str, Any]] = None
+    config: Optional[Dict[str, Any]] = None,
+    pool: Optional["ParsingPool"] = None,
 ) -> Generator[Document, None, None]:
     """
     Universal chunker that routes documents to appropriate chunkers based on file type.
@@ -135,119 +373,26 @@ def universal_chunker(
             - json_config: Config for JSON chunker
             - code_config: Config for code chunker
             - text_config: Config for default text chunker
+            - buffer_sizes: Documents chunked per job, single size or dict by file type
+              ('markdown', 'json', 'code', 'text'), 10 by default
+            - workers: Number of threads chunking buffers concurrently (0 - in the calling thread)
+            - preserve_order: Yield chunks in the order of input documents (False by default,
+              chunks of each buffer are yielded as soon as it is chunked)
+        pool: Optional ParsingPool; when provided, buffers are chunked in its worker processes
             
     Yields:
         Document objects with chunked content and preserved metadata
     """
     if config is None:
         config = {}
-    
-    # Default configs for each chunker type
-    markdown_config = config.get('markdown_config', {
-        'strip_header': False,
-        'return_each_line': False,
-        'headers_to_split_on': [
-            ('#', 'Header 1'),
-            ('##', 'Header 2'),
-            ('###', 'Header 3'),
-            ('####', 'Header 4'),
-        ],
-        'max_tokens': 1024,
-        'token_overlap': 50,
-        'min_chunk_chars': 100,  # Merge chunks smaller than this
-    })
-    
-    json_config = config.get('json_config', {
-        'max_tokens': 512,
-    })
-    
-    code_config = config.get('code_config', {})
-    
-    text_config = config.get('text_config', {
-        'chunk_size': 1000,
-        'chunk_overlap': 100,
-    })
-    
-    # Buffer documents by type for batch processing
-    # This is more efficient than processing one at a time
-    markdown_docs = []
-    json_docs = []
-    code_docs = []
-    text_docs = []
-    
-    # Buffer size before flushing
-    BUFFER_SIZE = 10
-    
-    def flush_markdown():
-        if markdown_docs:
-            def gen():
-                for d in markdown_docs:
-                    yield d
-            for chunk in markdown_chunker(gen(), markdown_config):
-                yield chunk
-            markdown_docs.clear()
-    
-    def flush_json():
-        if json_docs:
-            def gen():
-                for d in json_docs:
-                    yield d
-            for chunk in json_chunker(gen(), json_config):
-                yield chunk
-            json_docs.clear()
-    
-    def flush_code():
-        if code_docs:
-            def gen():
-                for d in code_docs:
-                    yield d
-            for chunk in _code_chunker_from_documents(gen(), code_config):
-                yield chunk
-            code_docs.clear()
-    
-    def flush_text():
-        if text_docs:
-            def gen():
-                for d in text_docs:
-                    yield d
-            for chunk in _default_text_chunker(gen(), text_config):
-                yield chunk
-            text_docs.clear()
-    
-    for doc in documents:
-        # Get file path from metadata
-        file_path = (doc.metadata.get('file_path') or 
-                    doc.metadata.get('file_name') or 
-                    doc.metadata.get('source') or 
-                    'unknown')
-        
-        # Ensure file_path is in metadata for downstream use
-        doc.metadata['file_path'] = file_path
-        
-        file_type = get_file_type(file_path)
-        
-        if file_type == 'markdown':
-            markdown_docs.append(doc)
-            if len(markdown_docs) >= BUFFER_SIZE:
-                yield from flush_markdown()
-        elif file_type == 'json':
-            json_docs.append(doc)
-            if len(json_docs) >= BUFFER_SIZE:
-                yield from flush_json()
-        elif file_type == 'code':
-            code_docs.append(doc)
-            if len(code_docs) >= BUFFER_SIZE:
-                yield from flush_code()
-        else:
-            text_docs.append(doc)
-            if len(text_docs) >= BUFFER_SIZE:
-                yield from flush_text()
-    
-    # Flush remaining documents
-    yield from flush_markdown()
-    yield from flush_json()
-    yield from flush_code()
-    yield from flush_text()
+    chunker = UniversalChunker(
+        config,
+        buffer_sizes=config.get('buffer_sizes'),
+        workers=config.get('workers', 0),
+        pool=pool,
+        preserve_order=config.get('preserve_order', False),
+    )
+    return chunker.chunk(documents)
 
 
 def chunk_single_document(
@@ -2,24 +2,33 @@ import ast
 import fnmatch
 import json
 import logging
-from typing import Optional, List, Generator
+from typing import Optional, List, Generator, Dict, Callable, Set
 
 from langchain_core.documents import Document
 from langchain_core.tools import ToolException
 from pydantic import Field
 
 from alita_sdk.tools.base_indexer_toolkit import BaseIndexerToolkit
+from alita_sdk.tools.utils.repository_archive import RepositoryArchive, git_blob_sha
 
 logger = logging.getLogger(__name__)
 
+# Metadata flag of whole file documents yielded by incremental and bulk loaders: they are chunked in `_extend_data`,
+# so chunking (and reading content, if it is empty) happens only for files which have to be indexed
+RAW_FILE_KEY = 'raw_file'
+# Default minimal number of changed files to download repository archive instead of reading them one by one
+ARCHIVE_MIN_CHANGED_FILES = 50
+# Length of sha256 hex digests of file content used as commit_hash before git blob SHAs
+LEGACY_CONTENT_HASH_LENGTH = 64
+
 
 class CodeIndexerToolkit(BaseIndexerToolkit):
-    def _get_indexed_data(self, index_name: str):
+    def _get_indexed_data(self, index_name: str, keys: Optional[List[str]] = None):
         self._ensure_vectorstore_initialized()
         if not self.vector_adapter:
             raise ToolException("Vector adapter is not initialized. "
                              "Check your configuration: embedding_model and vectorstore_type.")
-        return self.vector_adapter.get_code_indexed_data(self, index_name)
+        return self.vector_adapter.get_code_indexed_data(self, index_name, keys=keys)
 
     def key_fn(self, document: Document):
         return document.metadata.get("filename")
@@ -39,17 +48,166 @@ class CodeIndexerToolkit(BaseIndexerToolkit):
             whitelist: Optional[List[str]] = None,
             blacklist: Optional[List[str]] = None,
             chunking_config: Optional[dict] = None,
+            incremental: Optional[bool] = True,
+            bulk_download: Optional[bool] = True,
+            bulk_download_min_files: Optional[int] = ARCHIVE_MIN_CHANGED_FILES,
+            index_name: Optional[str] = None,
             **kwargs) -> Generator[Document, None, None]:
-        """Index repository files in the vector store using code parsing."""
+        """Index repository files in the vector store using code parsing.
+
+        In incremental mode files are listed with their git blob SHAs, which are used as `commit_hash`:
+        unchanged files are skipped by duplicates reduction before their content is downloaded,
+        and `_extend_data` reads and chunks only new or changed files.
+        With bulk_download, files are taken from a single snapshot archive of the branch instead of per-file reads,
+        unless less than bulk_download_min_files files are changed since the last indexing.
+        Falls back to reading all files one by one if neither blob SHAs nor archives are available.
+
+        `commit_hash` of files is their git blob SHA in all modes. Indexes built when it was a sha256 of file content
+        are fully re-indexed once, after that only new and changed files are.
+        """
+        branch = self.__get_branch(branch)
+        whitelist = self._include_chunking_extensions(whitelist, chunking_config)
+        is_included = self._file_filter(whitelist, blacklist)
+        blob_shas = self._get_files_blob_shas("", branch) if incremental else None
+        if blob_shas is not None:
+            if not isinstance(blob_shas, dict):
+                raise ValueError(f"Expected blob SHAs by file paths, but got: {blob_shas}")
+            blob_shas = {file: blob_sha for file, blob_sha in blob_shas.items() if is_included(file)}
+            if bulk_download:
+                changed = self._changed_files(blob_shas, index_name)
+                if len(changed) >= (bulk_download_min_files or 0):
+                    documents = self._archive_documents(branch, lambda file: file in changed)
+                    if documents is not None:
+                        for document in documents:
+                            document.metadata[RAW_FILE_KEY] = True
+                            yield document
+                        return
+            yield from self._blob_documents(blob_shas, branch)
+            return
+        if incremental:
+            logger.info("Blob SHAs are not available for the repository, all files are read to index them")
         yield from self.loader(
             branch=branch,
             whitelist=whitelist,
             blacklist=blacklist,
-            chunking_config=chunking_config
+            chunking_config=chunking_config,
+            bulk_download=bulk_download,
         )
 
+    def _changed_files(self, blob_shas: Dict[str, str], index_name: Optional[str]) -> Set[str]:
+        """Files which blob SHAs are not indexed yet."""
+        try:
+            indexed_data = self._get_indexed_data(index_name, keys=list(blob_shas)) if blob_shas else {}
+        except Exception as e:
+            logger.warning(f"Failed to get indexed data, all files are considered changed: {e}")
+            return set(blob_shas)
+        if any(len(commit_hash) == LEGACY_CONTENT_HASH_LENGTH
+               for data in indexed_data.values() for commit_hash in data.get('commit_hashes') or []):
+            self._log_tool_event(message="Index contains files hashed by content, they are re-indexed once "
+                                         "to be tracked by git blob SHAs", tool_name="loader")
+        return {file for file, blob_sha in blob_shas.items()
+                if file not in indexed_data or blob_sha not in (indexed_data[file].get('commit_hashes') or [])}
+
+    def _blob_documents(self, blob_shas: Dict[str, str], branch: Optional[str]) -> Generator[Document, None, None]:
+        """Yields documents without content for the files."""
+        for file, blob_sha in blob_shas.items():
+            yield Document(
+                page_content="",
+                metadata={
+                    'file_path': file,
+                    'filename': file,
+                    'source': file,
+                    'commit_hash': blob_sha,
+                    'branch': branch,
+                    RAW_FILE_KEY: True,
+                }
+            )
+        self._log_tool_event(message=f"{len(blob_shas)} files listed with blob SHAs, only new and changed files are read",
+                             tool_name="loader")
+
+    def _archive_documents(self, branch: Optional[str],
+                           is_included: Callable[[str], bool]) -> Optional[Generator[Document, None, None]]:
+        """Returns generator of documents for files from snapshot archive of the branch,
+        or None if archive is not available."""
+        try:
+            archive = self._open_repository_archive(branch)
+        except Exception as e:
+            logger.warning(f"Failed to download repository archive, files are read one by one: {e}")
+            return None
+        if archive is None:
+            return None
+
+        def documents() -> Generator[Document, None, None]:
+            loaded = 0
+            for file, content in archive.files(is_included):
+                file_content = self._archive_file_content(file, content) if content else None
+                if not file_content:
+                    continue
+                loaded += 1
+                yield Document(
+                    page_content=file_content,
+                    metadata={
+                        'file_path': file,
+                        'filename': file,
+                        'source': file,
+                        'commit_hash': git_blob_sha(content),
+                    }
+                )
+                if loaded % 100 == 0:
+                    self._log_tool_event(message=f"{loaded} files extracted from repository archive",
+                                         tool_name="loader")
+            self._log_tool_event(message=f"{loaded} files loaded from repository archive", tool_name="loader")
+
+        return documents()
+
     def _extend_data(self, documents: Generator[Document, None, None]):
-        yield from documents
+        raw_files = []
+
+        def read_raw_files() -> Generator[Document, None, None]:
+            for document in raw_files:
+                branch = document.metadata.pop('branch', None)
+                if document.page_content:
+                    yield document
+                    continue
+                file = document.metadata['file_path']
+                try:
+                    file_content = self._read_file(file, branch)
+                except Exception as e:
+                    logger.error(f"Failed to read file {file}: {e}")
+                    continue
+                if file_content:
+                    document.page_content = self._file_content_to_str(file, file_content)
+                    yield document
+
+        for document in documents:
+            if document.metadata.pop(RAW_FILE_KEY, False):
+                raw_files.append(document)
+            else:
+                yield document
+        if raw_files:
+            from .chunkers.universal_chunker import universal_chunker
+            yield from universal_chunker(read_raw_files(), pool=self._parsing_pool())
+
+    def _get_files_blob_shas(self, path: str, branch: str) -> Optional[Dict[str, str]]:
+        """Returns git blob SHAs of files by their paths, listed with a single tree request,
+        or None if blob SHAs are not available for the toolkit.
+        NOTE: override this method in subclasses which can list blob SHAs to enable incremental indexing."""
+        return None
+
+    def _open_repository_archive(self, branch: str) -> Optional[RepositoryArchive]:
+        """Returns snapshot archive of the branch or None if archives are not available for the toolkit.
+        NOTE: override this method in subclasses which can download repository archives to enable bulk loading."""
+        return None
+
+    def _archive_file_content(self, file: str, content: bytes) -> Optional[str]:
+        """Returns text of a file extracted from repository archive, or None to skip the file.
+        Binary files are skipped, the same way as reading them with `_read_file` fails.
+        NOTE: override this method in subclasses which parse files in `_read_file`, e.g. with `parse_file_content`."""
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError:
+            logger.debug(f"Skipping binary file {file} from repository archive")
+            return None
 
     def _index_tool_params(self):
         """Return the parameters for indexing data."""
@@ -63,6 +221,18 @@ class CodeIndexerToolkit(BaseIndexerToolkit):
             "blacklist": (Optional[List[str]], Field(
                 description='File extensions or paths to exclude. Defaults to no exclusions if None. Example: ["*.md", "*.java"]',
                 default=None)),
+            "incremental": (Optional[bool], Field(
+                description="Compare git blob SHAs of files with indexed ones and read only new or changed files. "
+                            "Used if the repository provides blob SHAs in file listing, otherwise all files are read.",
+                default=True)),
+            "bulk_download": (Optional[bool], Field(
+                description="Download a snapshot archive of the branch with a single request instead of reading "
+                            "files one by one, if the repository provides archives and many files have to be indexed.",
+                default=True)),
+            "bulk_download_min_files": (Optional[int], Field(
+                description="In incremental mode, minimal number of new or changed files to download the snapshot "
+                            "archive for, fewer files are read one by one.",
+                default=ARCHIVE_MIN_CHANGED_FILES)),
         }
 
     def loader(self,
@@ -70,7 +240,8 @@ class CodeIndexerToolkit(BaseIndexerToolkit):
                whitelist: Optional[List[str]] = None,
                blacklist: Optional[List[str]] = None,
                chunked: bool = True,
-               chunking_config: Optional[dict] = None) -> Generator[Document, None, None]:
+               chunking_config: Optional[dict] = None,
+               bulk_download: bool = True) -> Generator[Document, None, None]:
         """
         Generates Documents from files in a branch, respecting whitelist and blacklist patterns.
     
@@ -81,6 +252,8 @@ class CodeIndexerToolkit(BaseIndexerToolkit):
         - chunked (bool): If True (default), applies universal chunker based on file type.
                          If False, returns raw Documents without chunking.
         - chunking_config (Optional[dict]): Chunking configuration by file extension
+        - bulk_download (bool): If True (default), files are extracted from a snapshot archive of the branch
+                         when the toolkit provides it, instead of reading files one by one.
     
         Returns:
         - generator: Yields Documents from files matching the whitelist but not the blacklist.
@@ -103,42 +276,21 @@ class CodeIndexerToolkit(BaseIndexerToolkit):
           - .json files → JSON chunker
           - other files → default text chunker
         """
-        import hashlib
-    
-        # Auto-include extensions from chunking_config if whitelist is specified
-        # This allows chunking config to work without manually adding extensions to whitelist
-        if chunking_config and whitelist:
-            for ext_pattern in chunking_config.keys():
-                # Normalize extension pattern (both ".cbl" and "*.cbl" should work)
-                normalized = ext_pattern if ext_pattern.startswith('*') else f'*{ext_pattern}'
-                if normalized not in whitelist:
-                    whitelist.append(normalized)
-                    self._log_tool_event(
-                        message=f"Auto-included extension '{normalized}' from chunking_config",
-                        tool_name="loader"
-                    )
-    
-        _files = self.__handle_get_files("", self.__get_branch(branch))
-
-        def is_whitelisted(file_path: str) -> bool:
-            if whitelist:
-                return (any(fnmatch.fnmatch(file_path, pattern) for pattern in whitelist)
-                        or any(file_path.endswith(f'.{pattern}') for pattern in whitelist))
-            return True
-
-        def is_blacklisted(file_path: str) -> bool:
-            if blacklist:
-                return (any(fnmatch.fnmatch(file_path, pattern) for pattern in blacklist)
-                        or any(file_path.endswith(f'.{pattern}') for pattern in blacklist))
-            return False
+        whitelist = self._include_chunking_extensions(whitelist, chunking_config)
+        is_included = self._file_filter(whitelist, blacklist)
+        archive_documents = self._archive_documents(self.__get_branch(branch), is_included) if bulk_download else None
+        _files = self.__handle_get_files("", self.__get_branch(branch)) if archive_documents is None else []
 
         def raw_document_generator() -> Generator[Document, None, None]:
             """Yields raw Documents without chunking - pure generator, no pre-filtering."""
+            if archive_documents is not None:
+                yield from archive_documents
+                return
             processed = 0
 
             for file in _files:
                 # Skip non-matching files
-                if not is_whitelisted(file) or is_blacklisted(file):
+                if not is_included(file):
                     continue
 
                 try:
@@ -150,16 +302,11 @@ class CodeIndexerToolkit(BaseIndexerToolkit):
                 if not file_content:
                     continue
 
-                # Ensure file content is a string
-                if isinstance(file_content, bytes):
-                    file_content = file_content.decode("utf-8", errors="ignore")
-                elif isinstance(file_content, dict) and file.endswith('.json'):
-                    file_content = json.dumps(file_content)
-                elif not isinstance(file_content, str):
-                    file_content = str(file_content)
+                file_content = self._file_content_to_str(file, file_content)
 
-                # Hash the file content for uniqueness tracking
-                file_hash = hashlib.sha256(file_content.encode("utf-8")).hexdigest()
+                # Hash the file content for uniqueness tracking, the same way as git does for blobs,
+                # so it matches hashes of incremental and bulk loading
+                file_hash = git_blob_sha(file_content.encode("utf-8"))
                 processed += 1
 
                 yield Document(
@@ -183,7 +330,48 @@ class CodeIndexerToolkit(BaseIndexerToolkit):
         
         # Apply universal chunker based on file type
         from .chunkers.universal_chunker import universal_chunker
-        return universal_chunker(raw_document_generator())
+        return universal_chunker(raw_document_generator(), pool=self._parsing_pool())
+
+    def _include_chunking_extensions(self, whitelist: Optional[List[str]],
+                                     chunking_config: Optional[dict]) -> Optional[List[str]]:
+        # Auto-include extensions from chunking_config if whitelist is specified
+        # This allows chunking config to work without manually adding extensions to whitelist
+        if chunking_config and whitelist:
+            for ext_pattern in chunking_config.keys():
+                # Normalize extension pattern (both ".cbl" and "*.cbl" should work)
+                normalized = ext_pattern if ext_pattern.startswith('*') else f'*{ext_pattern}'
+                if normalized not in whitelist:
+                    whitelist.append(normalized)
+                    self._log_tool_event(
+                        message=f"Auto-included extension '{normalized}' from chunking_config",
+                        tool_name="loader"
+                    )
+        return whitelist
+
+    @staticmethod
+    def _file_filter(whitelist: Optional[List[str]], blacklist: Optional[List[str]]) -> Callable[[str], bool]:
+        """Returns predicate for files matching the whitelist but not the blacklist."""
+        def matches(file_path: str, patterns: List[str]) -> bool:
+            return (any(fnmatch.fnmatch(file_path, pattern) for pattern in patterns)
+                    or any(file_path.endswith(f'.{pattern}') for pattern in patterns))
+
+        def is_included(file_path: str) -> bool:
+            if whitelist and not matches(file_path, whitelist):
+                return False
+            return not (blacklist and matches(file_path, blacklist))
+
+        return is_included
+
+    @staticmethod
+    def _file_content_to_str(file: str, file_content) -> str:
+        # Ensure file content is a string
+        if isinstance(file_content, bytes):
+            return file_content.decode("utf-8", errors="ignore")
+        if isinstance(file_content, dict) and file.endswith('.json'):
+            return json.dumps(file_content)
+        if not isinstance(file_content, str):
+            return str(file_content)
+        return file_content
 
     def __handle_get_files(self, path: str, branch: str):
         """
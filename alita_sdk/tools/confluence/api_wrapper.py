@@ -998,6 +998,30 @@ class ConfluenceAPIWrapper(NonCodeIndexerToolkit):
                 document.metadata['updated_on'] = document.metadata['when']
             yield document
 
+    def _base_loader_total(self, **kwargs) -> Optional[int]:
+        """
+        Estimated number of pages from the total sizes of CQL searches matching the pages of each source
+        the loader reads (space, label, cql, page_ids), each of them capped by max_pages.
+        """
+        max_pages = kwargs.get('max_pages', 1000)
+        page_ids = kwargs.get('page_ids') or []
+        queries = []
+        if kwargs.get('label'):
+            queries.append(f'type = page and label = "{kwargs["label"]}"')
+        if kwargs.get('cql'):
+            queries.append(kwargs['cql'])
+        if not queries and not page_ids and self.space:
+            queries.append(f'type = page and space = "{self.space}"')
+        total = len(page_ids)
+        try:
+            for query in queries:
+                size = int(self.client.cql(query, limit=1).get('totalSize', 0))
+                total += min(size, max_pages) if max_pages else size
+        except Exception as e:
+            logger.debug(f"Failed to get total number of Confluence pages: {e}")
+            return None
+        return total
+
     def _process_document(self, document: Document) -> Generator[Document, None, None]:
         try:
             if self._index_include_attachments:
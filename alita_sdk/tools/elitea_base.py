@@ -583,6 +583,24 @@ class BaseCodeToolApiWrapper(BaseVectorStoreToolApiWrapper):
     def _get_files(self):
         raise NotImplementedError("Subclasses should implement this method")
 
+    def _open_repository_archive(self, branch: str):
+        """
+        Returns snapshot archive (alita_sdk.tools.utils.repository_archive.RepositoryArchive) of the branch,
+        used by loader to get all files with a single download, or None if archives are not supported.
+        """
+        return None
+
+    def _archive_file_content(self, file: str, content: bytes) -> Optional[str]:
+        """
+        Returns text of a file extracted from repository archive, or None to skip the file.
+        Binary files are skipped, override this method in subclasses which parse files in `_read_file`.
+        """
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError:
+            logger.debug(f"Skipping binary file {file} from repository archive")
+            return None
+
     def _read_file(
         self, 
         file_path: str, 
@@ -918,6 +936,7 @@ class BaseCodeToolApiWrapper(BaseVectorStoreToolApiWrapper):
         Notes:
         - Whitelist and blacklist use Unix shell-style wildcards.
         - Files must match the whitelist and not the blacklist to be included.
+        - If `_open_repository_archive` returns an archive, files are extracted from it instead of per-file reads.
         - When chunked=True:
           - .md files → markdown chunker (header-based splitting)
           - .py/.js/.ts/etc → code parser (TreeSitter-based)
@@ -927,10 +946,6 @@ class BaseCodeToolApiWrapper(BaseVectorStoreToolApiWrapper):
         from langchain_core.documents import Document
         import hashlib
 
-        _files = self.__handle_get_files("", self.__get_branch(branch))
-        self._log_tool_event(message="Listing files in branch", tool_name="loader")
-        logger.info(f"Files in branch: {_files}")
-
         def is_whitelisted(file_path: str) -> bool:
             if whitelist:
                 return (any(fnmatch.fnmatch(file_path, pattern) for pattern in whitelist)
@@ -943,8 +958,42 @@ class BaseCodeToolApiWrapper(BaseVectorStoreToolApiWrapper):
                         or any(file_path.endswith(f'.{pattern}') for pattern in blacklist))
             return False
 
+        try:
+            archive = self._open_repository_archive(self.__get_branch(branch))
+        except Exception as e:
+            logger.warning(f"Failed to download repository archive, files are read one by one: {e}")
+            archive = None
+
+        def archive_document_generator() -> Generator[Document, None, None]:
+            """Yields raw Documents for files extracted from repository archive."""
+            self._log_tool_event(message="Extracting the files from repository archive", tool_name="loader")
+            processed = 0
+            for file, content in archive.files(lambda path: is_whitelisted(path) and not is_blacklisted(path)):
+                file_content = self._archive_file_content(file, content) if content else None
+                if not file_content:
+                    continue
+                processed += 1
+                yield Document(
+                    page_content=file_content,
+                    metadata={
+                        'file_path': file,
+                        'file_name': file,
+                        'source': file,
+                        'commit_hash': hashlib.sha256(file_content.encode("utf-8")).hexdigest(),
+                    }
+                )
+            self._log_tool_event(message=f"{processed} files loaded", tool_name="loader")
+
+        if archive is None:
+            _files = self.__handle_get_files("", self.__get_branch(branch))
+            self._log_tool_event(message="Listing files in branch", tool_name="loader")
+            logger.info(f"Files in branch: {_files}")
+
         def raw_document_generator() -> Generator[Document, None, None]:
             """Yields raw Documents without chunking."""
+            if archive is not None:
+                yield from archive_document_generator()
+                return
             self._log_tool_event(message="Reading the files", tool_name="loader")
             total_files = len(_files)
             processed = 0
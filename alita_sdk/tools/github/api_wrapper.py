@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, Optional
 
+from langchain_core.tools import ToolException
 from pydantic import model_validator, Field, SecretStr
 
 from .github_client import GitHubClient
@@ -10,6 +11,7 @@ from .schemas import (
     GitHubRepoConfig
 )
 from ..code_indexer_toolkit import CodeIndexerToolkit
+from ..utils.repository_archive import open_url_archive
 from ..utils.available_tools_decorator import extend_with_parent_available_tools
 
 logger = logging.getLogger(__name__)
@@ -140,6 +142,25 @@ class AlitaGitHubAPIWrapper(CodeIndexerToolkit):
         # Use the GitHub client's method to get files
         return self.github_client_instance._get_files(path, branch or self.active_branch)
 
+    def _get_files_blob_shas(self, path: str = "", branch: str = None):
+        """Get blob SHAs of files from GitHub repository tree."""
+        if not self.github_client_instance:
+            raise ValueError("GitHub client not initialized")
+
+        blobs = self.github_client_instance._get_files_blob_shas(path, branch or self.active_branch)
+        if isinstance(blobs, str):
+            raise ToolException(blobs)
+        return blobs
+
+    def _open_repository_archive(self, branch: str = None):
+        """Open tarball snapshot of the GitHub repository branch."""
+        if not self.github_client_instance:
+            raise ValueError("GitHub client not initialized")
+
+        link = self.github_client_instance._get_archive_link(branch or self.active_branch)
+        # files are placed under `<owner>-<repo>-<sha>/` directory in GitHub archives
+        return open_url_archive(link, strip_components=1)
+
     def _file_commit_hash(self, file_path: str, branch: str):
         """Get the commit hash of a file in the GitHub repository."""
         if not self.github_client_instance:
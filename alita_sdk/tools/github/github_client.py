@@ -243,6 +243,21 @@ class GitHubClient(BaseModel):
         Returns:
             List of file paths
         """
+        blobs = self._get_files_blob_shas(directory_path, ref, repo_name)
+        return blobs if isinstance(blobs, str) else list(blobs)
+
+    def _get_files_blob_shas(self, directory_path: str, ref: str, repo_name: Optional[str] = None) -> Dict[str, str]:
+        """
+        Get blob SHAs of all files in a directory recursively using Git Trees API (single API call).
+
+        Args:
+            directory_path: Path to the directory (empty string for root)
+            ref: Branch or commit reference
+            repo_name: Optional repository name to override default
+
+        Returns:
+            Blob SHAs by file paths
+        """
         from github import GithubException
 
         try:
@@ -269,15 +284,15 @@ class GitHubClient(BaseModel):
             dir_prefix = directory_path.strip("/") + "/" if directory_path.strip("/") else ""
 
             # Filter to files only (blob = file, tree = directory)
-            files = []
+            files = {}
             for item in tree.tree:
                 if item.type == "blob":
                     # If directory_path specified, filter by prefix
                     if dir_prefix:
                         if item.path.startswith(dir_prefix):
-                            files.append(item.path)
+                            files[item.path] = item.sha
                     else:
-                        files.append(item.path)
+                        files[item.path] = item.sha
 
             # Check if tree was truncated (>100k files)
             # Use getattr for compatibility with different PyGithub versions
@@ -1562,6 +1577,20 @@ class GitHubClient(BaseModel):
         except Exception as e:
             return f"An error occurred while updating the issue: {str(e)}"
 
+    def _get_archive_link(self, ref: str, repo_name: Optional[str] = None) -> str:
+        """
+        Get download link of the tarball snapshot of the repository at the ref.
+
+        Args:
+            ref: Branch or commit reference
+            repo_name: Optional repository name to override default
+
+        Returns:
+            Archive URL (pre-authorized for private repositories)
+        """
+        repo = self.github_api.get_repo(repo_name) if repo_name else self.github_repo_instance
+        return repo.get_archive_link("tarball", ref)
+
     def _file_commit_hash(self, file_path: str, branch: str, repo_name: Optional[str] = None) -> str:
         """
         Get the commit hash of a file in a specific branch.
@@ -10,6 +10,7 @@ from ..code_indexer_toolkit import CodeIndexerToolkit
 from ..utils.available_tools_decorator import extend_with_parent_available_tools
 from ..elitea_base import extend_with_file_operations, BaseCodeToolApiWrapper
 from ..utils.content_parser import parse_file_content
+from ..utils.repository_archive import ARCHIVE_TAR, RepositoryArchive
 from .utils import get_position
 from ..utils.tool_prompts import EDIT_FILE_DESCRIPTION, UPDATE_FILE_PROMPT_WITH_PATH
 
@@ -226,6 +227,25 @@ class GitLabAPIWrapper(CodeIndexerToolkit):
         gitlab_files = self._get_all_files(path, recursive, branch)
         return [file['path'] for file in gitlab_files if file['type'] == 'blob']
 
+    # overridden for incremental indexing
+    def _get_files_blob_shas(self, path: str = None, branch: str = None):
+        gitlab_files = self._get_all_files(path, True, branch)
+        return {file['path']: file['id'] for file in gitlab_files if file['type'] == 'blob'}
+
+    # overridden for bulk loading in indexer
+    def _open_repository_archive(self, branch: str = None):
+        branch = branch if branch else self._active_branch
+        chunks = self.repo_instance.repository_archive(sha=branch, format="tar.gz", streamed=True, iterator=True)
+        # files are placed under `<repo>-<ref>-<sha>/` directory in GitLab archives
+        return RepositoryArchive(chunks, archive_format=ARCHIVE_TAR, strip_components=1)
+
+    # overridden to parse files from repository archive the same way as read_file
+    def _archive_file_content(self, file_path: str, content: bytes):
+        file_content = parse_file_content(file_name=file_path, file_content=content, llm=self.llm)
+        if isinstance(file_content, ToolException):
+            return None
+        return self._file_content_to_str(file_path, file_content)
+
     def _file_commit_hash(self, file_path: str, branch: str):
         """
         Get the commit hash of a file in a specific branch.
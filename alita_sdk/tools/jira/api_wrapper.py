@@ -23,6 +23,9 @@ from ...runtime.utils.utils import IndexerKeywords
 
 logger = logging.getLogger(__name__)
 
+# Default to get all issues ordered by update time
+DEFAULT_INDEX_JQL = "created >= \"1970-01-01\" ORDER BY updated DESC"
+
 NoInput = create_model(
     "NoInput"
 )
@@ -1731,10 +1734,7 @@ class JiraApiWrapper(NonCodeIndexerToolkit):
                 fields.append('attachment')
 
             # Use provided JQL query or default to all issues
-            if not jql:
-                jql_query = "created >= \"1970-01-01\" ORDER BY updated DESC"  # Default to get all issues ordered by update time
-            else:
-                jql_query = jql
+            jql_query = jql or DEFAULT_INDEX_JQL
 
             # Remove duplicates and prepare fields
             final_fields = ','.join({field.lower() for field in fields})
@@ -1826,6 +1826,27 @@ class JiraApiWrapper(NonCodeIndexerToolkit):
                                        'type': 'comment',
                                    })
 
+    def _base_loader_total(self, **kwargs) -> Optional[int]:
+        """
+        Estimated number of issues of the JQL query, capped by max_total_issues.
+        The total is requested without issues: from the search response (API v2) or the approximate count (API v3).
+        """
+        jql_query = kwargs.get('jql') or DEFAULT_INDEX_JQL
+        try:
+            if self.api_version == '3':
+                response = self._client.post(self._client.resource_url("search/approximate-count"),
+                                             data={"jql": jql_query})
+                total = response["count"]
+            else:
+                response = self._client.get(self._client.resource_url("search"),
+                                            params={"jql": jql_query, "maxResults": 0, "fields": "id"})
+                total = response["total"]
+        except Exception as e:
+            logger.debug(f"Failed to get total number of Jira issues: {e}")
+            return None
+        max_total_issues = kwargs.get('max_total_issues', 1000)
+        return min(int(total), max_total_issues) if max_total_issues else int(total)
+
     def _jql_get_tickets(self, jql, fields="*all", start=0, limit=None, expand=None, validate_query=None):
         """
         Generator that yields batches of Jira issues based on JQL query.
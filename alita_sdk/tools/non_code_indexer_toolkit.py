@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from langchain_core.documents import Document
 from langchain_core.tools import ToolException
 
@@ -6,12 +8,12 @@ from alita_sdk.tools.base_indexer_toolkit import BaseIndexerToolkit
 
 
 class NonCodeIndexerToolkit(BaseIndexerToolkit):
-    def _get_indexed_data(self, index_name: str):
+    def _get_indexed_data(self, index_name: str, keys: Optional[List[str]] = None):
         self._ensure_vectorstore_initialized()
         if not self.vector_adapter:
             raise ToolException("Vector adapter is not initialized. "
                              "Check your configuration: embedding_model and vectorstore_type.")
-        return self.vector_adapter.get_indexed_data(self, index_name)
+        return self.vector_adapter.get_indexed_data(self, index_name, keys=keys)
 
     def key_fn(self, document: Document):
         return document.metadata.get('id')
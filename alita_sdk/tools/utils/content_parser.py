@@ -4,11 +4,12 @@ import re
 import tempfile
 from logging import getLogger
 from pathlib import Path
-from typing import Generator, List
+from typing import Generator, Iterable, List
 
 from langchain_core.documents import Document
 from langchain_core.tools import ToolException
 
+from alita_sdk.runtime.langchain.document_loaders.bytes_loader import memory_temp_file
 from alita_sdk.runtime.langchain.document_loaders.constants import loaders_map, LoaderProperties
 from ...runtime.langchain.document_loaders.AlitaTextLoader import AlitaTextLoader
 from ...runtime.utils.utils import IndexerKeywords
@@ -290,8 +291,15 @@ def _load_content_from_bytes_with_prompt(file_content: bytes, extension: str = N
 def process_document_by_type(content, extension_source: str, document: Document = None, llm = None, chunking_config=None) \
         -> Generator[Document, None, None]:
     """Process the content of a file based on its type using a configured loader cosidering the origin document."""
+    yield from document_chunks(process_content_by_type(content, extension_source, llm, chunking_config),
+                               extension_source, document)
+
+
+def document_chunks(chunks: Iterable[Document], extension_source: str, document: Document = None) \
+        -> Generator[Document, None, None]:
+    """Turns chunks parsed from the content of the origin document into documents to be indexed.
+    Parsing errors raised while iterating the chunks are reported as a single document."""
     try:
-        chunks = process_content_by_type(content, extension_source, llm, chunking_config)
         chunks_counter = 0
         for chunk in chunks:
             chunks_counter += 1
@@ -313,10 +321,38 @@ def process_document_by_type(content, extension_source: str, document: Document
         )
 
 
+def _loader_kwargs(loader_config: dict, extension: str, chunking_config=None) -> dict:
+    """Loader kwargs of the extension with user overrides from chunking_config applied."""
+    # Copy kwargs — the dict in loaders_map is shared across all calls;
+    # mutating it directly (e.g. via pop) permanently corrupts the config.
+    loader_kwargs = dict(loader_config['kwargs'])
+    # Determine which loader configuration keys are allowed to be overridden by user input.
+    # If 'allowed_to_override' is specified in the loader configuration, use it; otherwise, allow all keys in loader_kwargs.
+    allowed_to_override = loader_config.get('allowed_to_override', loader_kwargs)
+    # If a chunking_config is provided and contains custom configuration for the current file extension,
+    # update loader_kwargs with user-supplied values, but only for keys explicitly permitted in allowed_to_override and if value differs from default.
+    # This ensures that only safe and intended parameters can be customized, preventing accidental or unauthorized changes
+    # to critical loader settings.
+    if chunking_config and (users_config_for_extension := chunking_config.get(extension, {})):
+        for key in set(users_config_for_extension.keys()) & set(allowed_to_override.keys()):
+            if users_config_for_extension[key] != allowed_to_override[key]:
+                loader_kwargs[key] = users_config_for_extension[key]
+    return loader_kwargs
+
+
+def loader_uses_llm(filename: str, chunking_config=None) -> bool:
+    """Whether the loader selected for the file name is configured to use LLM (e.g. for images)."""
+    match = re.search(r'\.([^.]+)$', filename or '')
+    extension = f".{match.group(1).lower()}" if match else ".txt"
+    loader_config = loaders_map.get(extension)
+    return bool(loader_config and _loader_kwargs(loader_config, extension, chunking_config).get(LoaderProperties.LLM.value))
+
+
 def process_content_by_type(content, filename: str, llm=None, chunking_config=None, fallback_extensions=None) -> \
         Generator[Document, None, None]:
-    """Process the content of a file based on its type using a configured loader."""
-    temp_file_path = None
+    """Process the content of a file based on its type using a configured loader.
+
+    Loaders supporting `from_bytes` parse the content in memory; the others get a temporary file on tmpfs."""
     extensions = fallback_extensions if fallback_extensions else []
     match = re.search(r'\.([^.]+)$', filename)
 
@@ -325,55 +361,39 @@ def process_content_by_type(content, filename: str, llm=None, chunking_config=No
     elif not extensions:
         extensions = [".txt"]
 
+    if content is None:
+        logger.warning(
+            f"'{IndexerKeywords.CONTENT_IN_BYTES.value}' ie expected but not found in document metadata.")
+        return
+
     for extension in extensions:
         try:
-            with tempfile.NamedTemporaryFile(mode='w+b', suffix=extension, delete=False) as temp_file:
-                temp_file_path = temp_file.name
-                if content is None:
-                    logger.warning(
-                        f"'{IndexerKeywords.CONTENT_IN_BYTES.value}' ie expected but not found in document metadata.")
-                    return []
-    
-                temp_file.write(content)
-                temp_file.flush()
-    
-                loader_config = loaders_map.get(extension)
-                if not loader_config:
-                    logger.warning(f"No loader found for file extension: {extension}. File: {temp_file_path}")
-                    return []
-    
-                loader_cls = loader_config['class']
-                # Copy kwargs — the dict in loaders_map is shared across all calls;
-                # mutating it directly (e.g. via pop) permanently corrupts the config.
-                loader_kwargs = dict(loader_config['kwargs'])
-                # Determine which loader configuration keys are allowed to be overridden by user input.
-                # If 'allowed_to_override' is specified in the loader configuration, use it; otherwise, allow all keys in loader_kwargs.
-                allowed_to_override = loader_config.get('allowed_to_override', loader_kwargs)
-                # If a chunking_config is provided and contains custom configuration for the current file extension,
-                # update loader_kwargs with user-supplied values, but only for keys explicitly permitted in allowed_to_override and if value differs from default.
-                # This ensures that only safe and intended parameters can be customized, preventing accidental or unauthorized changes
-                # to critical loader settings.
-                if chunking_config and (users_config_for_extension := chunking_config.get(extension, {})):
-                    for key in set(users_config_for_extension.keys()) & set(allowed_to_override.keys()):
-                        if users_config_for_extension[key] != allowed_to_override[key]:
-                            loader_kwargs[key] = users_config_for_extension[key]
-                if LoaderProperties.LLM.value in loader_kwargs and loader_kwargs.pop(LoaderProperties.LLM.value):
-                    loader_kwargs['llm'] = llm
-                if LoaderProperties.PROMPT_DEFAULT.value in loader_kwargs and loader_kwargs.pop(LoaderProperties.PROMPT_DEFAULT.value):
-                    loader_kwargs[LoaderProperties.PROMPT.value] = image_processing_prompt
-                loader = loader_cls(file_path=temp_file_path, **loader_kwargs)
-                yield from loader.load()
-                break
+            loader_config = loaders_map.get(extension)
+            if not loader_config:
+                logger.warning(f"No loader found for file extension: {extension}. File: {filename}")
+                return
+
+            loader_cls = loader_config['class']
+            loader_kwargs = _loader_kwargs(loader_config, extension, chunking_config)
+            if LoaderProperties.LLM.value in loader_kwargs and loader_kwargs.pop(LoaderProperties.LLM.value):
+                loader_kwargs['llm'] = llm
+            if LoaderProperties.PROMPT_DEFAULT.value in loader_kwargs and loader_kwargs.pop(LoaderProperties.PROMPT_DEFAULT.value):
+                loader_kwargs[LoaderProperties.PROMPT.value] = image_processing_prompt
+            if hasattr(loader_cls, 'from_bytes'):
+                # loaders pick the format by the file name extension, which must match the one being tried
+                file_name = filename if filename.lower().endswith(extension) else f"{filename}{extension}"
+                yield from loader_cls.from_bytes(content, file_name=file_name, **loader_kwargs).load()
+            else:
+                with memory_temp_file(content, suffix=extension) as temp_file_path:
+                    yield from loader_cls(file_path=temp_file_path, **loader_kwargs).load()
+            break
         except Exception as e:
             if fallback_extensions:
-                logger.warning(f"Error loading attachment: {str(e)} for file {temp_file_path} (extension: {extension})")
+                logger.warning(f"Error loading attachment: {str(e)} for file {filename} (extension: {extension})")
                 logger.warning(f"Continuing with fallback extensions: {fallback_extensions}.")
                 continue
             else:
                 raise e
-        finally:
-            if temp_file_path and os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
 
 # FIXME copied from langchain_core/utils/strings.py of 0.3.74 version
 # https://github.com/langchain-ai/langchain/pull/32157
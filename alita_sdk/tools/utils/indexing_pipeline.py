@@ -0,0 +1,293 @@
+"""
+Bounded producer/consumer pipeline for indexing.
+
+Stages:
+    1. load & chunk - base documents are turned into lists of ready-to-index documents in a worker pool
+    2. embed        - batches of documents are embedded concurrently (optionally limited by requests per minute)
+    3. write        - embedded batches are bulk-inserted into the vectorstore by the calling thread
+
+Stages are connected with bounded queues, so a slow stage applies backpressure to the previous one
+and memory usage stays bounded by queue sizes and batch size.
+"""
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import getLogger
+from queue import Queue, Empty, Full
+from typing import Any, Callable, Iterable, List, Optional
+
+from langchain_core.documents import Document
+
+logger = getLogger(__name__)
+
+_SENTINEL = object()
+_QUEUE_POLL_INTERVAL = 0.5
+
+
+class RpmLimiter:
+    """Thread-safe sliding window limiter of calls per minute."""
+
+    def __init__(self, rpm: Optional[int] = None, window: float = 60.0):
+        self.rpm = rpm if rpm and rpm > 0 else None
+        self.window = window
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed by the limit."""
+        if not self.rpm:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.rpm:
+                    self._calls.append(now)
+                    return
+                wait = self.window - (now - self._calls[0])
+            time.sleep(max(wait, 0.01))
+
+
+@dataclass
+class StageTimings:
+    """Accumulated wall time and processed items per pipeline stage."""
+    seconds: dict = field(default_factory=dict)
+    items: dict = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, stage: str, seconds: float, items: int = 1):
+        with self._lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            self.items[stage] = self.items.get(stage, 0) + items
+
+    def summary(self) -> str:
+        with self._lock:
+            return ", ".join(
+                f"{stage}: {self.seconds[stage]:.2f}s for {self.items.get(stage, 0)} items"
+                for stage in self.seconds
+            )
+
+
+@dataclass
+class IndexingBatch:
+    """Documents to be written together with bookkeeping for base documents completed in this batch."""
+    documents: List[Document] = field(default_factory=list)
+    completed_base_docs: List[tuple] = field(default_factory=list)  # (base_doc_number, dependent_docs_count)
+    embeddings: Optional[List[List[float]]] = None
+    error: Optional[Exception] = None
+
+
+class _LoaderExecutor:
+    """ThreadPoolExecutor for several loader workers, runs calls in the current thread for a single one."""
+
+    def __init__(self, workers: int):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="indexing-loader") \
+            if workers > 1 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def submit(self, fn, *args) -> Future:
+        if self._pool is not None:
+            return self._pool.submit(fn, *args)
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:  # pylint: disable=W0718
+            future.set_exception(exc)
+        return future
+
+
+class IndexingPipeline:
+    """Runs load & chunk, embed and write stages of indexing concurrently.
+
+    Args:
+        prepare_fn: Turns single base document into a list of documents to index (stage 1).
+        embed_fn: Embeds list of texts (stage 2). If None, documents are passed to write_fn without embeddings.
+        write_fn: Writes a batch into the vectorstore (stage 3), receives documents and embeddings (or None).
+        batch_size: Max number of documents in a single embed/write batch.
+        loader_workers: Number of threads preparing base documents. With 1, base documents are read and prepared
+            one by one in a single thread, so the source is never accessed concurrently.
+        embedding_workers: Number of concurrent embedding requests.
+        embedding_rpm: Optional limit of embedding requests per minute.
+        queue_size: Max number of batches waiting between stages.
+    """
+
+    def __init__(self,
+                 prepare_fn: Callable[[Document], List[Document]],
+                 embed_fn: Optional[Callable[[List[str]], List[List[float]]]],
+                 write_fn: Callable[[List[Document], Optional[List[List[float]]]], Any],
+                 batch_size: int = 20,
+                 loader_workers: int = 1,
+                 embedding_workers: int = 1,
+                 embedding_rpm: Optional[int] = None,
+                 queue_size: Optional[int] = None):
+        self.prepare_fn = prepare_fn
+        self.embed_fn = embed_fn
+        self.write_fn = write_fn
+        self.batch_size = max(batch_size or 1, 1)
+        self.loader_workers = max(loader_workers or 1, 1)
+        self.embedding_workers = max(embedding_workers or 1, 1)
+        self.rpm_limiter = RpmLimiter(embedding_rpm)
+        self.queue_size = queue_size or self.embedding_workers * 2
+        self.timings = StageTimings()
+        self._stop = threading.Event()
+
+    def run(self,
+            base_documents: Iterable[Document],
+            on_written: Optional[Callable[[IndexingBatch], None]] = None,
+            on_failed: Optional[Callable[[IndexingBatch, Exception], None]] = None):
+        """Run the pipeline until all base documents are indexed.
+
+        Callbacks are invoked from the calling thread once a batch is written (or failed to be embedded/written).
+        Exceptions raised by base_documents generator or prepare_fn are re-raised in the calling thread.
+        """
+        embed_queue: Queue = Queue(maxsize=self.queue_size)
+        write_queue: Queue = Queue(maxsize=self.queue_size)
+        producer_errors: List[BaseException] = []
+
+        producer = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._produce, base_documents, embed_queue, producer_errors),
+            name="indexing-load-chunk",
+            daemon=True,
+        )
+        embedders = [
+            threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(self._embed, embed_queue, write_queue),
+                name=f"indexing-embed-{i}",
+                daemon=True,
+            )
+            for i in range(self.embedding_workers)
+        ]
+        producer.start()
+        for embedder in embedders:
+            embedder.start()
+        try:
+            finished_embedders = 0
+            while finished_embedders < self.embedding_workers:
+                batch = write_queue.get()
+                if batch is _SENTINEL:
+                    finished_embedders += 1
+                    continue
+                if batch.error is None and batch.documents:
+                    start = time.perf_counter()
+                    try:
+                        self.write_fn(batch.documents, batch.embeddings)
+                    except Exception as exc:
+                        batch.error = exc
+                    self.timings.add("write", time.perf_counter() - start, len(batch.documents))
+                if batch.error is not None:
+                    if on_failed:
+                        on_failed(batch, batch.error)
+                elif on_written:
+                    on_written(batch)
+        finally:
+            self._stop.set()
+            producer.join()
+            for embedder in embedders:
+                embedder.join()
+        if producer_errors:
+            raise producer_errors[0]
+
+    def _put(self, target: Queue, item) -> bool:
+        """Blocking put which gives up if pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _prepare(self, base_doc: Document) -> tuple[List[Document], float]:
+        start = time.perf_counter()
+        documents = self.prepare_fn(base_doc)
+        return documents, time.perf_counter() - start
+
+    def _produce(self, base_documents: Iterable[Document], embed_queue: Queue, errors: List[BaseException]):
+        batch = IndexingBatch()
+        try:
+            with _LoaderExecutor(self.loader_workers) as executor:
+                pending = deque()
+                base_doc_number = 0
+
+                def _collect_oldest():
+                    # results are collected in submission order to keep base documents numbering stable
+                    nonlocal batch
+                    number, future = pending.popleft()
+                    documents, elapsed = future.result()
+                    self.timings.add("load_and_chunk", elapsed)
+                    for doc in documents:
+                        if len(batch.documents) >= self.batch_size:
+                            if not self._put(embed_queue, batch):
+                                return
+                            batch = IndexingBatch()
+                        batch.documents.append(doc)
+                    # base document is completed with the batch containing its last document
+                    batch.completed_base_docs.append((number, len(documents)))
+                    if len(batch.documents) >= self.batch_size:
+                        if not self._put(embed_queue, batch):
+                            return
+                        batch = IndexingBatch()
+
+                for base_doc in base_documents:
+                    if self._stop.is_set():
+                        break
+                    base_doc_number += 1
+                    pending.append((base_doc_number,
+                                    executor.submit(contextvars.copy_context().run, self._prepare, base_doc)))
+                    # bounded number of base documents in flight
+                    while len(pending) >= self.loader_workers * 2:
+                        _collect_oldest()
+                while pending and not self._stop.is_set():
+                    _collect_oldest()
+            if batch.documents or batch.completed_base_docs:
+                self._put(embed_queue, batch)
+        except BaseException as exc:  # pylint: disable=W0718
+            errors.append(exc)
+        finally:
+            for _ in range(self.embedding_workers):
+                self._put(embed_queue, _SENTINEL)
+
+    def _embed(self, embed_queue: Queue, write_queue: Queue):
+        try:
+            while True:
+                try:
+                    batch = embed_queue.get(timeout=_QUEUE_POLL_INTERVAL)
+                except Empty:
+                    if self._stop.is_set():
+                        return
+                    continue
+                if batch is _SENTINEL:
+                    return
+                try:
+                    self._embed_batch(batch)
+                except Exception as exc:
+                    logger.error(f"Failed to embed batch of {len(batch.documents)} documents: {exc}")
+                    batch.error = exc
+                if not self._put(write_queue, batch):
+                    return
+        finally:
+            # run() waits for a sentinel of every embedder, even if it failed
+            self._put(write_queue, _SENTINEL)
+
+    def _embed_batch(self, batch: IndexingBatch):
+        texts = [doc.page_content for doc in batch.documents if doc.page_content]
+        if self.embed_fn is None or not texts:
+            return
+        self.rpm_limiter.acquire()
+        start = time.perf_counter()
+        try:
+            batch.embeddings = self.embed_fn(texts)
+        finally:
+            self.timings.add("embed", time.perf_counter() - start, len(texts))
@@ -0,0 +1,125 @@
+"""
+Process pool for the CPU-bound parsing and chunking stage of indexing.
+
+Parsing of PDF/DOCX/PPTX/XLSX content and TreeSitter parsing of code hold the GIL, so indexing threads cannot
+use more than a single core for them. ParsingPool ships picklable jobs (content bytes and file name, or
+buffers of documents to chunk, with configuration stripped of LLM/embedding objects) to worker processes and streams
+results back in the order of submission. Content requiring LLM is never shipped and is parsed in-process.
+"""
+import atexit
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from logging import getLogger
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from langchain_core.documents import Document
+
+logger = getLogger(__name__)
+
+# chunking_config entries holding live clients, which are neither picklable nor usable in worker processes
+UNPICKLABLE_CONFIG_KEYS = ('llm', 'embedding')
+
+
+def _parse_content(content: bytes, filename: str, chunking_config: Optional[dict]) -> List[Document]:
+    from .content_parser import process_content_by_type
+    return list(process_content_by_type(content, filename, None, chunking_config))
+
+
+def picklable_config(chunking_config: Optional[dict]) -> dict:
+    """chunking_config without LLM/embedding entries."""
+    return {key: value for key, value in (chunking_config or {}).items() if key not in UNPICKLABLE_CONFIG_KEYS}
+
+
+def future_results(future: Future) -> Iterator[Document]:
+    """Lazily yields documents returned by the job, waiting for it on the first iteration."""
+    yield from future.result()
+
+
+class ParsingPool:
+    """Worker processes parsing and chunking documents.
+
+    Args:
+        processes: number of worker processes (started on the first job).
+        lookahead: number of jobs submitted ahead of the consumer by `ordered`, defaults to 2 per process.
+    """
+
+    def __init__(self, processes: int, lookahead: Optional[int] = None):
+        self.processes = processes
+        self.lookahead = lookahead or processes * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args) -> Future:
+        """Submits a call of the module-level function to a worker process, restarting a broken pool."""
+        with self._lock:
+            for attempt in range(2):
+                if self._executor is None:
+                    # spawn: forking a process with running indexing threads may copy held locks
+                    self._executor = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context("spawn"))
+                try:
+                    return self._executor.submit(fn, *args)
+                except BrokenProcessPool:
+                    if attempt:
+                        raise
+                    logger.warning("Parsing worker process terminated abruptly, restarting the pool")
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = None
+
+    def parse_content(self, content: bytes, filename: str, chunking_config: Optional[dict] = None) -> Future:
+        """Submits parsing of the content with the loader selected by the file name (see process_content_by_type)."""
+        return self.submit(_parse_content, content, filename, picklable_config(chunking_config))
+
+    def ordered(self, items: Iterable[Union[Future, Iterable[Document]]]) -> Iterator[Document]:
+        """Yields documents of the items (futures of jobs or iterables) in order.
+
+        Up to `lookahead` items are taken from `items` before the earliest one is consumed, so that jobs submitted
+        while producing the items run in worker processes concurrently with consumption of the earlier ones."""
+        pending = deque()
+        for item in items:
+            pending.append(item)
+            if len(pending) > self.lookahead:
+                yield from self._results(pending.popleft())
+        while pending:
+            yield from self._results(pending.popleft())
+
+    @staticmethod
+    def _results(item: Union[Future, Iterable[Document]]) -> Iterable[Document]:
+        return item.result() if isinstance(item, Future) else item
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+
+_pools: Dict[int, ParsingPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_parsing_pool(processes: Optional[int]) -> Optional[ParsingPool]:
+    """Pool with the given number of worker processes shared within the process, None if processes < 1."""
+    if not processes or processes < 1:
+        return None
+    with _pools_lock:
+        if processes not in _pools:
+            _pools[processes] = ParsingPool(processes)
+        return _pools[processes]
+
+
+def shutdown_parsing_pools():
+    """Stops worker processes of all shared pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        try:
+            pool.shutdown()
+        except Exception as e:
+            logger.debug(f"Failed to stop parsing worker processes: {e}")
+
+
+atexit.register(shutdown_parsing_pools)
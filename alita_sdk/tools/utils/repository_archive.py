@@ -0,0 +1,164 @@
+"""
+Bulk loading of repository files from a snapshot archive (tarball / zipball).
+
+Reading a repository file by file costs one API call per file. A snapshot archive of the branch is downloaded
+with a single request and its members are extracted on the fly: tar archives are read as a stream,
+zip archives (which need random access) are spooled to a temporary file, the tree is never extracted to disk.
+"""
+import hashlib
+import io
+import logging
+import subprocess
+import tarfile
+import tempfile
+import zipfile
+from typing import BinaryIO, Callable, Generator, Iterable, Optional, Tuple, Union
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_TAR = "tar"
+ARCHIVE_ZIP = "zip"
+# Zip archives smaller than this are kept in memory while being read
+ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def git_blob_sha(content: bytes) -> str:
+    """SHA of the content as a git blob object, the same as listed in git trees."""
+    sha = hashlib.sha1()
+    sha.update(b"blob %d\0" % len(content))
+    sha.update(content)
+    return sha.hexdigest()
+
+
+class _IterStream(io.RawIOBase):
+    """Readable file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class RepositoryArchive:
+    """Snapshot archive of a repository read as a stream.
+
+    Args:
+        stream: file object or iterator of byte chunks with archive content (gzip/bz2/xz compression of tar
+            archives is detected automatically).
+        archive_format: ARCHIVE_TAR or ARCHIVE_ZIP.
+        strip_components: number of leading path components removed from member names, e.g. 1 for
+            GitHub/GitLab archives having all files under a `<repo>-<sha>/` directory.
+        path_prefix: prefix added to member names to match file paths of the toolkit listing.
+        on_close: callable releasing the underlying resource (HTTP response, subprocess).
+    """
+
+    def __init__(self, stream: Union[BinaryIO, Iterable[bytes]], archive_format: str = ARCHIVE_TAR,
+                 strip_components: int = 0, path_prefix: str = "", on_close: Optional[Callable[[], None]] = None):
+        if archive_format not in (ARCHIVE_TAR, ARCHIVE_ZIP):
+            raise ValueError(f"Unsupported archive format: {archive_format}")
+        self.stream = stream if hasattr(stream, "read") else io.BufferedReader(_IterStream(stream))
+        self.archive_format = archive_format
+        self.strip_components = strip_components
+        self.path_prefix = path_prefix
+        self._on_close = on_close
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._on_close:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    def _path(self, name: str) -> Optional[str]:
+        parts = [part for part in name.split("/") if part and part != "."]
+        if len(parts) <= self.strip_components:
+            return None
+        return self.path_prefix + "/".join(parts[self.strip_components:])
+
+    def files(self, is_included: Optional[Callable[[str], bool]] = None) -> Generator[Tuple[str, bytes], None, None]:
+        """Yields (path, content) of regular files in the archive, filtered by path with is_included.
+        Content of excluded members is never read."""
+        try:
+            if self.archive_format == ARCHIVE_TAR:
+                yield from self._tar_files(is_included)
+            else:
+                yield from self._zip_files(is_included)
+        finally:
+            self.close()
+
+    def _tar_files(self, is_included) -> Generator[Tuple[str, bytes], None, None]:
+        with tarfile.open(fileobj=self.stream, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                path = self._path(member.name)
+                if path is None or (is_included and not is_included(path)):
+                    continue
+                file = archive.extractfile(member)
+                if file is not None:
+                    yield path, file.read()
+
+    def _zip_files(self, is_included) -> Generator[Tuple[str, bytes], None, None]:
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as spooled:
+            while chunk := self.stream.read(DOWNLOAD_CHUNK_SIZE):
+                spooled.write(chunk)
+            spooled.seek(0)
+            with zipfile.ZipFile(spooled) as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    path = self._path(info.filename)
+                    if path is None or (is_included and not is_included(path)):
+                        continue
+                    yield path, archive.read(info)
+
+
+def open_url_archive(url: str, headers: Optional[dict] = None, archive_format: str = ARCHIVE_TAR,
+                     strip_components: int = 1, path_prefix: str = "", timeout: float = 300,
+                     session: Optional[requests.Session] = None) -> RepositoryArchive:
+    """Streams archive downloaded from the URL (redirects are followed)."""
+    response = (session or requests).get(url, headers=headers, stream=True, timeout=timeout)
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    response.raw.decode_content = True
+    return RepositoryArchive(response.raw, archive_format=archive_format, strip_components=strip_components,
+                             path_prefix=path_prefix, on_close=response.close)
+
+
+def open_git_archive(repo_path: str, ref: str, path_prefix: str = "") -> RepositoryArchive:
+    """Streams `git archive` of the ref from a local (bare or working) repository."""
+    process = subprocess.Popen(
+        ["git", "archive", "--format=tar", ref],
+        cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+    def _close():
+        process.stdout.close()
+        _, stderr = process.communicate()
+        if process.returncode not in (0, None) and stderr:
+            logger.warning(f"git archive of {ref} in {repo_path} failed: {stderr.decode(errors='ignore').strip()}")
+
+    return RepositoryArchive(process.stdout, archive_format=ARCHIVE_TAR, path_prefix=path_prefix, on_close=_close)
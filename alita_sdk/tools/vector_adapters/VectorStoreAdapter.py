@@ -1,11 +1,97 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from logging import getLogger
 
+from ...runtime.tools.pgvector_schema import metadata_field
 from ...runtime.utils.utils import IndexerKeywords
 
 logger = getLogger(__name__)
 
+# Number of rows fetched per round-trip by server-side cursors
+INDEXED_DATA_FETCH_SIZE = 5000
+INCOMING_KEYS_TEMP_TABLE = "alita_incoming_keys"
+
+
+class CompactIndexedData(Mapping):
+    """Array-backed view of already indexed documents keyed by document id.
+
+    Keeps only the fields required for duplicates reduction in parallel lists instead of a dict
+    with full metadata per document. Item access builds the same structure as returned by
+    `get_indexed_data` historically: metadata, id, all_chunks, dependent docs and parent id.
+    Rows must be added grouped by document id (e.g. ordered by it).
+    """
+
+    def __init__(self, index_name: str):
+        self.index_name = index_name
+        self._positions: Dict[str, int] = {}
+        self._ids: List[Any] = []
+        self._updated_on: List[Any] = []
+        self._chunk_ids: List[Any] = []
+        self._parents: List[Any] = []
+        self._dependent_docs: List[Optional[str]] = []
+        self._chunks_start: List[int] = []
+        self._chunks: List[Any] = []
+
+    def add_row(self, doc_id: str, db_id, updated_on=None, chunk_id=None, parent_id=None,
+                dependent_docs: Optional[str] = None):
+        """Add a single vectorstore row of the document."""
+        position = self._positions.get(doc_id)
+        if position is not None and chunk_id:
+            if position != len(self._ids) - 1:
+                raise ValueError(f"Rows of document '{doc_id}' are not grouped together")
+            # If document with the same id already saved, add db_id for current one as chunk
+            self._chunks.append(db_id)
+            return
+        if position is None:
+            position = len(self._ids)
+            self._positions[doc_id] = position
+            self._ids.append(db_id)
+            self._updated_on.append(updated_on)
+            self._chunk_ids.append(chunk_id)
+            self._parents.append(parent_id)
+            self._dependent_docs.append(dependent_docs)
+            self._chunks_start.append(len(self._chunks))
+        else:
+            # row without chunk_id replaces previously saved one
+            del self._chunks[self._chunks_start[position]:]
+            self._ids[position] = db_id
+            self._updated_on[position] = updated_on
+            self._chunk_ids[position] = chunk_id
+            self._parents[position] = parent_id
+            self._dependent_docs[position] = dependent_docs
+        self._chunks.append(db_id)
+
+    def __getitem__(self, doc_id: str) -> Dict[str, Any]:
+        position = self._positions[doc_id]
+        end = self._chunks_start[position + 1] if position + 1 < len(self._chunks_start) else len(self._chunks)
+        dependent_docs = self._dependent_docs[position]
+        dependent_docs = [d.strip() for d in dependent_docs.split(';') if d.strip()] if dependent_docs else []
+        parent_id = self._parents[position] if self._parents[position] is not None else -1
+        return {
+            'metadata': {
+                'id': doc_id,
+                'collection': self.index_name,
+                'updated_on': self._updated_on[position],
+                'chunk_id': self._chunk_ids[position],
+                IndexerKeywords.PARENT.value: parent_id,
+                IndexerKeywords.DEPENDENT_DOCS.value: self._dependent_docs[position],
+            },
+            'id': self._ids[position],
+            'all_chunks': self._chunks[self._chunks_start[position]:end],
+            IndexerKeywords.DEPENDENT_DOCS.value: dependent_docs,
+            IndexerKeywords.PARENT.value: parent_id,
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, doc_id) -> bool:
+        return doc_id in self._positions
+
 
 class VectorStoreAdapter(ABC):
     """Abstract base class for vector store adapters."""
@@ -36,13 +122,15 @@ class VectorStoreAdapter(ABC):
         pass
 
     @abstractmethod
-    def get_indexed_data(self, vectorstore_wrapper):
-        """Get all indexed data from vectorstore for non-code content"""
+    def get_indexed_data(self, vectorstore_wrapper, index_name: str, keys: Optional[List[str]] = None):
+        """Get all indexed data from vectorstore for non-code content.
+        If keys are provided, only documents with these ids (and their dependent documents) are returned."""
         pass
 
     @abstractmethod
-    def get_code_indexed_data(self, vectorstore_wrapper, index_name) -> Dict[str, Dict[str, Any]]:
-        """Get all indexed data from vectorstore for code content"""
+    def get_code_indexed_data(self, vectorstore_wrapper, index_name, keys: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get all indexed data from vectorstore for code content.
+        If keys are provided, only files with these names are returned."""
         pass
 
     @abstractmethod
@@ -55,6 +143,101 @@ class VectorStoreAdapter(ABC):
         """Get all index_meta entries from the vector store."""
         pass
 
+    def similarity_search_by_vector(self, vectorstore_wrapper, embedding: List[float], filter: Optional[dict] = None,
+                                    k: int = 10) -> List[Tuple[Any, float]]:
+        """Similarity search with already embedded query. Returns (document, score) tuples."""
+        store = vectorstore_wrapper.vectorstore
+        if hasattr(store, 'similarity_search_with_score_by_vector'):
+            return store.similarity_search_with_score_by_vector(embedding, k=k, filter=filter)
+        return store.similarity_search_by_vector_with_relevance_scores(embedding, k=k, filter=filter)
+
+    def similarity_search_by_chunk_types(self, vectorstore_wrapper, embedding: List[float], chunk_types: List[str],
+                                         filter: Optional[dict] = None, k: int = 10) -> Dict[str, List[Tuple[Any, float]]]:
+        """Top k (document, score) tuples per chunk type for already embedded query."""
+        result = {}
+        for chunk_type in chunk_types:
+            try:
+                result[chunk_type] = self.similarity_search_by_vector(
+                    vectorstore_wrapper, embedding, filter=_and_filter(filter, {"chunk_type": {"$in": [chunk_type]}}), k=k
+                )
+            except Exception as e:
+                logger.warning(f"Error searching for chunk type {chunk_type}: {str(e)}")
+                result[chunk_type] = []
+        return result
+
+    def get_document_chunks(self, vectorstore_wrapper, embedding: List[float], keys: List[Tuple[str, Any]],
+                            filter: Optional[dict] = None) -> Dict[Tuple[str, str], Tuple[Any, float]]:
+        """Get 'document' chunks by (source, chunk_id) keys with one query, scored against already embedded query.
+
+        Returns:
+            Best scored (document, score) tuple per (source, str(chunk_id)) key.
+        """
+        if not keys:
+            return {}
+        key_filters = [{"$and": [{"source": {"$eq": source}}, {"chunk_id": {"$eq": chunk_id}}]} for source, chunk_id in keys]
+        items = self.similarity_search_by_vector(
+            vectorstore_wrapper, embedding,
+            filter=_and_filter(filter, {"chunk_type": {"$in": ["document"]}},
+                               key_filters[0] if len(key_filters) == 1 else {"$or": key_filters}),
+            k=len(keys),
+        )
+        result = {}
+        for doc, score in items:
+            result.setdefault((doc.metadata.get('source'), str(doc.metadata.get('chunk_id'))), (doc, score))
+        return result
+
+    def extended_search(self, vectorstore_wrapper, embedding: List[float], chunk_types: List[str],
+                        filter: Optional[dict] = None, k: int = 10) -> List[Tuple[Any, float]]:
+        """Search 'document' chunks together with chunks of additional types (title, summary, ...).
+
+        Parent 'document' chunks of documents found only by additional chunk types are added to the results.
+        The query is embedded once by the caller, additional chunk types are searched with a single call
+        and missing parent chunks are fetched in one batch.
+        """
+        unique_docs = set()
+        try:
+            vector_items = self.similarity_search_by_vector(
+                vectorstore_wrapper, embedding, filter=_and_filter(filter, {"chunk_type": {"$in": ["document"]}}), k=k
+            )
+        except Exception as e:
+            logger.warning(f"Error searching for document chunks: {str(e)}")
+            vector_items = []
+        for doc, _ in vector_items:
+            unique_docs.add(_search_doc_key(doc))
+
+        missing_parents = []
+        for chunk_items in self.similarity_search_by_chunk_types(vectorstore_wrapper, embedding, chunk_types,
+                                                                 filter=filter, k=k).values():
+            for doc, _ in chunk_items:
+                doc_key = _search_doc_key(doc)
+                if doc_key in unique_docs:
+                    continue
+                unique_docs.add(doc_key)
+                source, chunk_id = doc.metadata.get('source'), doc.metadata.get('chunk_id')
+                if source and chunk_id:
+                    missing_parents.append((source, chunk_id))
+        if missing_parents:
+            try:
+                parents = self.get_document_chunks(vectorstore_wrapper, embedding, missing_parents, filter=filter)
+                vector_items.extend(parents[(source, str(chunk_id))] for source, chunk_id in missing_parents
+                                    if (source, str(chunk_id)) in parents)
+            except Exception as e:
+                logger.warning(f"Error retrieving document chunks for {len(missing_parents)} documents: {str(e)}")
+        return vector_items
+
+
+def _and_filter(filter: Optional[dict], *conditions: dict) -> dict:
+    """Combine optional metadata filter with additional conditions."""
+    conditions = ([filter] if filter else []) + list(conditions)
+    return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+
+def _search_doc_key(doc) -> str:
+    """Identifier of the document a search hit belongs to."""
+    source = doc.metadata.get('source')
+    chunk_id = doc.metadata.get('chunk_id')
+    return f"{source}_{chunk_id}" if source and chunk_id else str(doc.metadata.get('id', id(doc)))
+
 
 class PGVectorAdapter(VectorStoreAdapter):
     """Adapter for PGVector database operations."""
@@ -72,10 +255,24 @@ class PGVectorAdapter(VectorStoreAdapter):
             "create_extension": worker_config.get("pgvector_create_extension", True),
             "alita_sdk_options": {
                 "target_schema": collection_name,
+                "metadata_indexes": worker_config.get("pgvector_metadata_indexes", True),
+                "metadata_generated_columns": worker_config.get("pgvector_metadata_generated_columns", False),
+                # e.g. {"fields": ["content", "title"], "language": "english", "stored": false}
+                "full_text_index": worker_config.get("pgvector_full_text_index"),
             },
             "connection_string": connection_string
         }
 
+    def ensure_metadata_indexes(self, vectorstore_wrapper, generated_columns: bool = False):
+        """Create indexes (and optionally generated columns) for metadata keys used in filters."""
+        from ...runtime.tools.pgvector_schema import METADATA_COLUMNS_ATTR, ensure_metadata_indexes
+
+        store = vectorstore_wrapper.vectorstore
+        promoted = ensure_metadata_indexes(store.session_maker.bind, store.collection_name,
+                                           generated_columns=generated_columns)
+        setattr(store, METADATA_COLUMNS_ATTR, promoted)
+        return promoted
+
     def list_collections(self, vectorstore_wrapper) -> str:
         from sqlalchemy import func
         from sqlalchemy.orm import Session
@@ -85,7 +282,7 @@ class PGVectorAdapter(VectorStoreAdapter):
             with Session(store.session_maker.bind) as session:
                 collections = (
                     session.query(
-                        func.distinct(func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection'))
+                        func.distinct(metadata_field(store, 'collection'))
                     )
                     .filter(store.EmbeddingStore.cmetadata.isnot(None))
                     .all()
@@ -109,7 +306,7 @@ class PGVectorAdapter(VectorStoreAdapter):
     def get_indexed_ids(self, vectorstore_wrapper, index_name: Optional[str] = '') -> List[str]:
         """Get all indexed document IDs from PGVector"""
         from sqlalchemy.orm import Session
-        from sqlalchemy import func, or_
+        from sqlalchemy import or_
 
         store = vectorstore_wrapper.vectorstore
         try:
@@ -119,11 +316,10 @@ class PGVectorAdapter(VectorStoreAdapter):
                 # Apply filter only if index_name is provided
                 if index_name:
                     query = query.filter(
-                        func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection') == index_name,
+                        metadata_field(store, 'collection') == index_name,
                         or_(
-                            func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'type').is_(None),
-                            func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata,
-                                                         'type') != IndexerKeywords.INDEX_META_TYPE.value
+                            metadata_field(store, 'type').is_(None),
+                            metadata_field(store, 'type') != IndexerKeywords.INDEX_META_TYPE.value
                         )
                     )
                 ids = query.all()
@@ -135,18 +331,18 @@ class PGVectorAdapter(VectorStoreAdapter):
     def clean_collection(self, vectorstore_wrapper, index_name: str = '', including_index_meta: bool = False):
         """Clean the vectorstore collection by deleting all indexed data. If including_index_meta is True, skip the index_meta records."""
         from sqlalchemy.orm import Session
-        from sqlalchemy import func, or_
+        from sqlalchemy import or_
         store = vectorstore_wrapper.vectorstore
         with Session(store.session_maker.bind) as session:
             if including_index_meta:
                 session.query(store.EmbeddingStore).filter(
-                    func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection') == index_name
+                    metadata_field(store, 'collection') == index_name
                 ).delete(synchronize_session=False)
             else:
                 session.query(store.EmbeddingStore).filter(
-                    func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection') == index_name,
-                    or_(func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'type').is_(None),
-                        func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'type') != IndexerKeywords.INDEX_META_TYPE.value)
+                    metadata_field(store, 'collection') == index_name,
+                    or_(metadata_field(store, 'type').is_(None),
+                        metadata_field(store, 'type') != IndexerKeywords.INDEX_META_TYPE.value)
                 ).delete(synchronize_session=False)
             session.commit()
 
@@ -154,58 +350,62 @@ class PGVectorAdapter(VectorStoreAdapter):
         """Check if the vectorstore is a PGVector store."""
         return hasattr(vectorstore, 'session_maker') and hasattr(vectorstore, 'EmbeddingStore')
 
-    def get_indexed_data(self, vectorstore_wrapper, index_name: str)-> Dict[str, Dict[str, Any]]:
-        """Get all indexed data from PGVector for non-code content per index_name."""
+    def get_indexed_data(self, vectorstore_wrapper, index_name: str, keys: Optional[List[str]] = None) -> CompactIndexedData:
+        """Get indexed data from PGVector for non-code content per index_name.
+
+        Only ids and a few metadata fields required for duplicates reduction are selected (no content or
+        full metadata) and streamed with a server-side cursor. If keys are provided, only documents with
+        these ids and their dependent documents are selected, using a temp table of incoming keys.
+        """
         from sqlalchemy.orm import Session
-        from sqlalchemy import func
-        from ...runtime.utils.utils import IndexerKeywords
+        from sqlalchemy import func, or_
 
-        result = {}
+        result = CompactIndexedData(index_name)
         try:
             vectorstore_wrapper._log_tool_event("Retrieving already indexed data from PGVector vectorstore",
                            tool_name="get_indexed_data")
             store = vectorstore_wrapper.vectorstore
+            meta = store.EmbeddingStore.cmetadata
+            doc_id = metadata_field(store, 'id')
+            parent_id = func.jsonb_extract_path_text(meta, IndexerKeywords.PARENT.value)
             with Session(store.session_maker.bind) as session:
-                docs = session.query(
+                query = session.query(
                     store.EmbeddingStore.id,
-                    store.EmbeddingStore.document,
-                    store.EmbeddingStore.cmetadata
+                    doc_id.label('doc_id'),
+                    # keep original json types of values compared with incoming documents
+                    meta['updated_on'].label('updated_on'),
+                    meta['chunk_id'].label('chunk_id'),
+                    meta[IndexerKeywords.PARENT.value].label('parent_id'),
+                    func.jsonb_extract_path_text(meta, IndexerKeywords.DEPENDENT_DOCS.value).label('dependent_docs'),
                 ).filter(
-                    func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection') == index_name
-                ).all()
-
-            # Process the retrieved data
-            for doc in docs:
-                db_id = doc.id
-                meta = doc.cmetadata or {}
-
-                # Get document id from metadata
-                doc_id = str(meta.get('id', db_id))
-                dependent_docs = meta.get(IndexerKeywords.DEPENDENT_DOCS.value, [])
-                if dependent_docs:
-                    dependent_docs = [d.strip() for d in dependent_docs.split(';') if d.strip()]
-                parent_id = meta.get(IndexerKeywords.PARENT.value, -1)
-
-                chunk_id = meta.get('chunk_id')
-                if doc_id in result and chunk_id:
-                    # If document with the same id already saved, add db_id for current one as chunk
-                    result[doc_id]['all_chunks'].append(db_id)
-                else:
-                    result[doc_id] = {
-                        'metadata': meta,
-                        'id': db_id,
-                        'all_chunks': [db_id],
-                        IndexerKeywords.DEPENDENT_DOCS.value: dependent_docs,
-                        IndexerKeywords.PARENT.value: parent_id
-                    }
-
+                    metadata_field(store, 'collection') == index_name
+                )
+                if keys is not None:
+                    incoming_keys = self._incoming_keys_select(session, keys)
+                    query = query.filter(or_(doc_id.in_(incoming_keys), parent_id.in_(incoming_keys)))
+                # rows of the same document go one after another
+                query = query.order_by(doc_id)
+                for row in query.yield_per(INDEXED_DATA_FETCH_SIZE):
+                    result.add_row(
+                        doc_id=row.doc_id if row.doc_id is not None else str(row.id),
+                        db_id=row.id,
+                        updated_on=row.updated_on,
+                        chunk_id=row.chunk_id,
+                        parent_id=row.parent_id,
+                        dependent_docs=row.dependent_docs,
+                    )
         except Exception as e:
             logger.error(f"Failed to get indexed data from PGVector: {str(e)}. Continuing with empty index.")
+            result = CompactIndexedData(index_name)
 
         return result
 
-    def get_code_indexed_data(self, vectorstore_wrapper, index_name: str) -> Dict[str, Dict[str, Any]]:
-        """Get all indexed code data from PGVector per collection suffix."""
+    def get_code_indexed_data(self, vectorstore_wrapper, index_name: str, keys: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get indexed code data from PGVector per collection suffix.
+
+        Only ids, filenames and commit hashes are selected and streamed with a server-side cursor.
+        If keys are provided, only files with these names are selected, using a temp table of incoming keys.
+        """
         from sqlalchemy.orm import Session
         from sqlalchemy import func
 
@@ -214,32 +414,54 @@ class PGVectorAdapter(VectorStoreAdapter):
             vectorstore_wrapper._log_tool_event(message="Retrieving already indexed code data from PGVector vectorstore",
                            tool_name="index_code_data")
             store = vectorstore_wrapper.vectorstore
-            with (Session(store.session_maker.bind) as session):
-                docs = session.query(
+            meta = store.EmbeddingStore.cmetadata
+            filename_expr = metadata_field(store, 'filename')
+            with Session(store.session_maker.bind) as session:
+                query = session.query(
                     store.EmbeddingStore.id,
-                    store.EmbeddingStore.cmetadata
+                    filename_expr.label('filename'),
+                    func.jsonb_extract_path_text(meta, 'commit_hash').label('commit_hash'),
                 ).filter(
-                    func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection') == index_name
-                ).all()
-
-            for db_id, meta in docs:
-                filename = meta.get('filename')
-                commit_hash = meta.get('commit_hash')
-                if not filename:
-                    continue
-                if filename not in result:
-                    result[filename] = {
-                        'metadata': meta,
-                        'commit_hashes': [],
-                        'ids': []
-                    }
-                if commit_hash is not None:
-                    result[filename]['commit_hashes'].append(commit_hash)
-                result[filename]['ids'].append(db_id)
+                    metadata_field(store, 'collection') == index_name,
+                    filename_expr.isnot(None),
+                )
+                if keys is not None:
+                    query = query.filter(filename_expr.in_(self._incoming_keys_select(session, keys)))
+                for db_id, filename, commit_hash in query.yield_per(INDEXED_DATA_FETCH_SIZE):
+                    if not filename:
+                        continue
+                    if filename not in result:
+                        result[filename] = {
+                            'metadata': {'filename': filename, 'collection': index_name},
+                            'commit_hashes': [],
+                            'ids': []
+                        }
+                    if commit_hash is not None:
+                        result[filename]['commit_hashes'].append(commit_hash)
+                    result[filename]['ids'].append(db_id)
         except Exception as e:
             logger.error(f"Failed to get indexed code data from PGVector: {str(e)}. Continuing with empty index.")
+            result = {}
         return result
 
+    @staticmethod
+    def _incoming_keys_select(session, keys: List[str]):
+        """Fill session-scoped temp table with incoming keys and return a select of them."""
+        from sqlalchemy import text, column, Text
+
+        session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {INCOMING_KEYS_TEMP_TABLE} (key text PRIMARY KEY) ON COMMIT DROP"
+        ))
+        session.execute(text(f"TRUNCATE {INCOMING_KEYS_TEMP_TABLE}"))
+        unique_keys = list(dict.fromkeys(str(key) for key in keys))
+        if unique_keys:
+            session.execute(
+                text(f"INSERT INTO {INCOMING_KEYS_TEMP_TABLE} (key) VALUES (:key)"),
+                [{"key": key} for key in unique_keys],
+            )
+        # temp tables live in pg_temp schema, which is not affected by schema_translate_map
+        return text(f"SELECT key FROM pg_temp.{INCOMING_KEYS_TEMP_TABLE}").columns(column("key", Text))
+
     def add_to_collection(self, vectorstore_wrapper, entry_id, new_collection_value):
         """Add a new collection name to the `collection` key in the `metadata` column."""
         from sqlalchemy import func
@@ -250,7 +472,7 @@ class PGVectorAdapter(VectorStoreAdapter):
             with Session(store.session_maker.bind) as session:
                 # Query the current value of the `collection` key
                 current_collection_query = session.query(
-                    func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection')
+                    metadata_field(store, 'collection')
                 ).filter(store.EmbeddingStore.id == entry_id).scalar()
 
                 # If the `collection` key is NULL or doesn't contain the new value, update it
@@ -291,7 +513,6 @@ class PGVectorAdapter(VectorStoreAdapter):
 
     def get_index_meta(self, vectorstore_wrapper, index_name: str) -> List[Dict[str, Any]]:
         from sqlalchemy.orm import Session
-        from sqlalchemy import func
 
         store = vectorstore_wrapper.vectorstore
         try:
@@ -301,8 +522,8 @@ class PGVectorAdapter(VectorStoreAdapter):
                     store.EmbeddingStore.document,
                     store.EmbeddingStore.cmetadata
                 ).filter(
-                    store.EmbeddingStore.cmetadata['type'].astext == IndexerKeywords.INDEX_META_TYPE.value,
-                    func.jsonb_extract_path_text(store.EmbeddingStore.cmetadata, 'collection') == index_name
+                    metadata_field(store, 'type') == IndexerKeywords.INDEX_META_TYPE.value,
+                    metadata_field(store, 'collection') == index_name
                 ).all()
                 result = []
                 for id, document, cmetadata in meta:
@@ -312,6 +533,78 @@ class PGVectorAdapter(VectorStoreAdapter):
             logger.error(f"Failed to get index_meta from PGVector: {str(e)}")
             raise e
 
+    def similarity_search_by_chunk_types(self, vectorstore_wrapper, embedding: List[float], chunk_types: List[str],
+                                         filter: Optional[dict] = None, k: int = 10) -> Dict[str, List[Tuple[Any, float]]]:
+        """Top k (document, score) tuples per chunk type, selected with a single UNION ALL query."""
+        from sqlalchemy import asc, literal, select, union_all
+        from sqlalchemy.orm import Session
+
+        if not chunk_types:
+            return {}
+        store = vectorstore_wrapper.vectorstore
+        result = {chunk_type: [] for chunk_type in chunk_types}
+        try:
+            with Session(store.session_maker.bind) as session:
+                collection = store.get_collection(session)
+                if not collection:
+                    raise ValueError("Collection not found")
+                distance = store.distance_strategy(embedding)
+                per_type = [
+                    select(
+                        store.EmbeddingStore.id.label('id'),
+                        distance.label('distance'),
+                        literal(chunk_type).label('search_chunk_type'),
+                    ).where(
+                        store.EmbeddingStore.collection_id == collection.uuid,
+                        store._create_filter_clause(_and_filter(filter, {"chunk_type": {"$in": [chunk_type]}})),
+                    ).order_by(asc('distance')).limit(k).subquery()
+                    for chunk_type in chunk_types
+                ]
+                hits = union_all(*(select(subquery) for subquery in per_type)).subquery()
+                rows = (
+                    session.query(store.EmbeddingStore, hits.c.distance, hits.c.search_chunk_type)
+                    .join(hits, store.EmbeddingStore.id == hits.c.id)
+                    .order_by(hits.c.search_chunk_type, asc(hits.c.distance))
+                    .all()
+                )
+            for row in rows:
+                result[row.search_chunk_type].extend(store._results_to_docs_and_scores([row]))
+        except Exception as e:
+            logger.warning(f"Error searching for chunk types {chunk_types}: {str(e)}")
+        return result
+
+    def get_document_chunks(self, vectorstore_wrapper, embedding: List[float], keys: List[Tuple[str, Any]],
+                            filter: Optional[dict] = None) -> Dict[Tuple[str, str], Tuple[Any, float]]:
+        """Get best scored 'document' chunk per (source, chunk_id) key with a single `IN (...)` query."""
+        from sqlalchemy import asc, tuple_
+        from sqlalchemy.orm import Session
+
+        if not keys:
+            return {}
+        store = vectorstore_wrapper.vectorstore
+        source = metadata_field(store, 'source')
+        chunk_id = store.EmbeddingStore.cmetadata['chunk_id'].astext
+        with Session(store.session_maker.bind) as session:
+            collection = store.get_collection(session)
+            if not collection:
+                raise ValueError("Collection not found")
+            distance = store.distance_strategy(embedding).label('distance')
+            rows = (
+                session.query(store.EmbeddingStore, distance)
+                .filter(
+                    store.EmbeddingStore.collection_id == collection.uuid,
+                    store._create_filter_clause(_and_filter(filter, {"chunk_type": {"$in": ["document"]}})),
+                    tuple_(source, chunk_id).in_([(key_source, str(key_chunk_id)) for key_source, key_chunk_id in keys]),
+                )
+                .distinct(source, chunk_id)
+                .order_by(source, chunk_id, asc('distance'))
+                .all()
+            )
+        return {
+            (doc.metadata.get('source'), str(doc.metadata.get('chunk_id'))): (doc, score)
+            for doc, score in store._results_to_docs_and_scores(rows)
+        }
+
 
 class ChromaAdapter(VectorStoreAdapter):
     """Adapter for Chroma database operations."""
@@ -342,8 +635,8 @@ class ChromaAdapter(VectorStoreAdapter):
         """Clean the vectorstore collection by deleting all indexed data. including_index_meta is ignored."""
         vectorstore_wrapper.vectorstore.delete(ids=self.get_indexed_ids(vectorstore_wrapper, index_name))
 
-    def get_indexed_data(self, vectorstore_wrapper):
-        """Get all indexed data from Chroma for non-code content"""
+    def get_indexed_data(self, vectorstore_wrapper, index_name: str = '', keys: Optional[List[str]] = None):
+        """Get all indexed data from Chroma for non-code content. Keys filtering is not supported and ignored."""
         from ...runtime.utils.utils import IndexerKeywords
 
         result = {}
@@ -378,8 +671,8 @@ class ChromaAdapter(VectorStoreAdapter):
 
         return result
 
-    def get_code_indexed_data(self, vectorstore_wrapper, index_name) -> Dict[str, Dict[str, Any]]:
-        """Get all indexed code data from Chroma."""
+    def get_code_indexed_data(self, vectorstore_wrapper, index_name, keys: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get all indexed code data from Chroma. Keys filtering is not supported and ignored."""
         result = {}
         try:
             vectorstore_wrapper._log_data("Retrieving already indexed code data from Chroma vectorstore",
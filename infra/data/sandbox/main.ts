@@ -17,6 +17,18 @@
  * which triggers a RequestsDependencyWarning in the `requests` package.
  * Pyodide 0.29.0 ships compatible versions (requests 2.32.4, urllib3 2.5.0,
  * charset-normalizer 3.4.3, chardet 5.2.0).
+ *
+ * ADDITION: `--worker` mode. Pyodide is loaded once and requests are read
+ * from stdin as frames (two uint32 big-endian lengths, JSON header, binary
+ * payload), results are written to stdout the same way. The payload carries
+ * dill session bytes, so sessions are not passed on the command line.
+ * Interpreter state is restored before every execution, see workerIsolationCode.
+ * See alita_sdk/runtime/langchain/pyodide_worker_pool.py.
+ *
+ * ADDITION: `--session-file <path>` option. Session bytes are read from the
+ * file and the updated session is written back to it (the output has
+ * `sessionFile` instead of `sessionBytes`), so sessions of executions in a
+ * new process are not passed on the command line either.
  */
 
 import { loadPyodide } from "npm:pyodide@0.29.0";
@@ -189,6 +201,114 @@ def dumps(result: Any) -> str:
     return json.dumps(result)
 `;
 
+// State of a worker interpreter, restored before every execution of a worker.
+// Restored: __main__ and builtins, modules loaded at snapshot time (entries of
+// sys.modules and their attributes), sys.path, os.environ, working directory and
+// files under the snapshot directories. Not restored: modules first imported by
+// an execution stay loaded (C extensions can't be loaded twice) and packages
+// installed with micropip stay installed, so workers are opt-in and recycled.
+// Keep the code free of backslashes, it is a template literal.
+const workerIsolationCode = `
+import os
+import shutil
+import sys
+
+_MISSING = object()
+_state = None
+
+
+def _restore_mapping(current, saved) -> None:
+    # Keys are replaced one by one, so the mapping is never empty (sys, builtins)
+    for key in [key for key in current if key not in saved]:
+        del current[key]
+    for key, value in saved.items():
+        if current.get(key, _MISSING) is not value:
+            current[key] = value
+
+
+def _files(dirs) -> tuple:
+    # Contents of files (None for directories) and paths of symlinks
+    files, links = {}, set()
+    for root_dir in dirs:
+        for root, dirnames, filenames in os.walk(root_dir):
+            files[root] = None
+            for name in dirnames + filenames:
+                path = os.path.join(root, name)
+                if os.path.islink(path):
+                    links.add(path)
+                elif name in filenames:
+                    with open(path, "rb") as file:
+                        files[path] = file.read()
+    return files, links
+
+
+def snapshot(dirs) -> None:
+    """Remember the state of a fresh worker, dirs are directories executions may write to."""
+    global _state
+    modules = dict(sys.modules)
+    module_dicts = {}
+    for name, module in modules.items():
+        if name != __name__ and module is not None and hasattr(module, "__dict__"):
+            module_dicts[name] = dict(vars(module))
+    dirs = [str(path) for path in dirs]
+    files, links = _files(dirs)
+    _state = {
+        "modules": modules,
+        "module_dicts": module_dicts,
+        "path": list(sys.path),
+        "environ": dict(os.environ),
+        "cwd": os.getcwd(),
+        "dirs": dirs,
+        "files": files,
+        "links": links,
+    }
+
+
+def restore() -> None:
+    """Restore the state remembered by snapshot."""
+    if _state is None:
+        return
+    modules = _state["modules"]
+    for name in [name for name in sys.modules if name in modules and sys.modules[name] is not modules[name]]:
+        sys.modules[name] = modules[name]
+    for name in [name for name in modules if name not in sys.modules]:
+        sys.modules[name] = modules[name]
+    # Includes __main__, builtins and sys
+    for name, saved in _state["module_dicts"].items():
+        _restore_mapping(vars(modules[name]), saved)
+    sys.path[:] = _state["path"]
+    _restore_mapping(os.environ, _state["environ"])
+    os.chdir(_state["cwd"])
+
+    files, links = _state["files"], _state["links"]
+    for root_dir in _state["dirs"]:
+        for root, dirnames, filenames in os.walk(root_dir):
+            for dirname in list(dirnames):
+                path = os.path.join(root, dirname)
+                if path not in files and path not in links:
+                    dirnames.remove(dirname)
+                    if os.path.islink(path):
+                        os.remove(path)
+                    else:
+                        shutil.rmtree(path, ignore_errors=True)
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                if files.get(path) is None and path not in links:
+                    os.remove(path)
+    for path, content in files.items():
+        if content is None:
+            os.makedirs(path, exist_ok=True)
+            continue
+        try:
+            with open(path, "rb") as file:
+                if file.read() == content:
+                    continue
+        except OSError:
+            pass
+        with open(path, "wb") as file:
+            file.write(content)
+`;
+
 interface SessionMetadata {
   created: string;
   lastModified: string;
@@ -214,14 +334,32 @@ async function initPyodide(pyodide: any): Promise<void> {
   sys.path.append(dirPath);
   pathlib.Path(dirPath).mkdir();
   pathlib.Path(dirPath + "prepare_env.py").write_text(prepareEnvCode);
+  pathlib.Path(dirPath + "worker_isolation.py").write_text(workerIsolationCode);
+}
+
+async function createPyodide(output: string[], err_output: string[]): Promise<any> {
+  const pyodide = await loadPyodide({
+    stdout: (msg) => output.push(msg),
+    stderr: (msg) => err_output.push(msg),
+  })
+  await pyodide.loadPackage(["micropip"], {
+    messageCallback: () => {},
+    errorCallback: (msg: string) => {
+      output.push(`install error: ${msg}`)
+    },
+  });
+  await initPyodide(pyodide);
+  return pyodide;
 }
 
 async function runPython(
   pythonCode: string,
   options: {
     stateful?: boolean;
-    sessionBytes?: string;
+    sessionBytes?: Uint8Array;
     sessionMetadata?: string;
+    // Warm Pyodide of a worker, a new one is loaded when not provided
+    pyodide?: any;
   }
 ): Promise<PyodideResult> {
   const output: string[] = [];
@@ -230,17 +368,14 @@ async function runPython(
   console.log = (...args: any[]) => {}
 
   try {
-    const pyodide = await loadPyodide({
-      stdout: (msg) => output.push(msg),
-      stderr: (msg) => err_output.push(msg),
-    })
-    await pyodide.loadPackage(["micropip"], {
-      messageCallback: () => {},
-      errorCallback: (msg: string) => {
-        output.push(`install error: ${msg}`)
-      },
-    });
-    await initPyodide(pyodide);
+    let pyodide = options.pyodide;
+    if (pyodide) {
+      pyodide.setStdout({ batched: (msg: string) => output.push(msg) });
+      pyodide.setStderr({ batched: (msg: string) => err_output.push(msg) });
+      pyodide.pyimport("worker_isolation").restore();
+    } else {
+      pyodide = await createPyodide(output, err_output);
+    }
 
     // Determine session directory
     let sessionMetadata: SessionMetadata;
@@ -294,7 +429,7 @@ async function runPython(
     }
 
     if (options.sessionBytes) {
-      sessionData = Uint8Array.from(JSON.parse(options.sessionBytes));
+      sessionData = options.sessionBytes;
       // Run session preamble
       await prepare_env.load_session_bytes(sessionData);
     }
@@ -307,6 +442,10 @@ async function runPython(
     const rawValue = await pyodide.runPythonAsync(pythonCode);
     // Dump result to string
     const jsonValue = await prepare_env.dumps(rawValue);
+    if (options.pyodide && rawValue?.destroy) {
+      // Workers run many executions, release the proxy (only jsonResult is reported)
+      rawValue.destroy();
+    }
 
     // Update session metadata with installed packages
     sessionMetadata.packages = [
@@ -332,6 +471,7 @@ async function runPython(
     }
     return result;
   } catch (error: any) {
+    console.log = originalLog;
     return {
       success: false,
       error: error.message,
@@ -341,9 +481,116 @@ async function runPython(
   }
 }
 
+function formatResult(result: PyodideResult) {
+  return {
+    stdout: result.stdout?.join('') || null,
+    stderr: result.success ? (result.stderr?.join('') || null) : result.error || null,
+    result: result.success ? JSON.parse(result.jsonResult || 'null') : null,
+    success: result.success,
+    sessionBytes: result.sessionBytes,
+    sessionMetadata: result.sessionMetadata,
+  };
+}
+
+async function writeFrame(header: object, payload: Uint8Array): Promise<void> {
+  const headerBytes = new TextEncoder().encode(JSON.stringify(header));
+  const frame = new Uint8Array(8 + headerBytes.length + payload.length);
+  const view = new DataView(frame.buffer);
+  view.setUint32(0, headerBytes.length);
+  view.setUint32(4, payload.length);
+  frame.set(headerBytes, 8);
+  frame.set(payload, 8 + headerBytes.length);
+  let written = 0;
+  while (written < frame.length) {
+    written += await Deno.stdout.write(frame.subarray(written));
+  }
+}
+
+class FrameReader {
+  private reader = Deno.stdin.readable.getReader();
+  private chunks: Uint8Array[] = [];
+  private length = 0;
+
+  // Buffer at least `size` bytes as one chunk, false at end of input
+  private async fill(size: number): Promise<boolean> {
+    while (this.length < size) {
+      const { value, done } = await this.reader.read();
+      if (done) return false;
+      this.chunks.push(value);
+      this.length += value.length;
+    }
+    if (this.chunks.length > 1) {
+      const merged = new Uint8Array(this.length);
+      let offset = 0;
+      for (const chunk of this.chunks) {
+        merged.set(chunk, offset);
+        offset += chunk.length;
+      }
+      this.chunks = [merged];
+    }
+    return true;
+  }
+
+  private take(size: number): Uint8Array {
+    const data = this.chunks[0];
+    const taken = data.slice(0, size);
+    this.chunks = size < data.length ? [data.subarray(size)] : [];
+    this.length -= size;
+    return taken;
+  }
+
+  async read(): Promise<{ header: any; payload: Uint8Array } | null> {
+    if (!(await this.fill(8))) return null;
+    const view = new DataView(this.chunks[0].buffer, this.chunks[0].byteOffset, 8);
+    const headerLength = view.getUint32(0);
+    const payloadLength = view.getUint32(4);
+    if (!(await this.fill(8 + headerLength + payloadLength))) return null;
+    this.take(8);
+    const header = JSON.parse(new TextDecoder().decode(this.take(headerLength)));
+    return { header, payload: this.take(payloadLength) };
+  }
+}
+
+function toBytes(data: any): Uint8Array {
+  if (!data) return new Uint8Array();
+  // Python bytes returned by dump_session_bytes are proxies
+  if (typeof data.toJs === "function") {
+    const bytes = data.toJs();
+    data.destroy?.();
+    return bytes;
+  }
+  return data;
+}
+
+async function worker(): Promise<void> {
+  // stdout carries frames only
+  console.log = (...args: any[]) => console.error(...args);
+  const pyodide = await createPyodide([], []);
+  pyodide.pyimport("prepare_env");
+  const os = pyodide.pyimport("os");
+  pyodide.pyimport("worker_isolation").snapshot(pyodide.toPy([os.getcwd(), "/tmp"]));
+  await writeFrame({ ready: true, version: pkgVersion }, new Uint8Array());
+
+  const reader = new FrameReader();
+  while (true) {
+    const request = await reader.read();
+    if (request === null) return;
+    const result = await runPython(request.header.code ?? "", {
+      stateful: request.header.stateful,
+      sessionBytes: request.payload.length ? request.payload : undefined,
+      sessionMetadata: request.header.sessionMetadata
+        ? JSON.stringify(request.header.sessionMetadata)
+        : undefined,
+      pyodide,
+    });
+    const { sessionBytes, ...output } = formatResult(result);
+    await writeFrame(output, toBytes(sessionBytes));
+  }
+}
+
 async function main(): Promise<void> {
   const flags = parseArgs(Deno.args, {
-    string: ["code", "file", "session-bytes", "session-metadata"],
+    string: ["code", "file", "session-bytes", "session-file", "session-metadata"],
     alias: {
       c: "code",
       f: "file",
@@ -353,8 +600,8 @@ async function main(): Promise<void> {
       b: "session-bytes",
       m: "session-metadata",
     },
-    boolean: ["help", "version", "stateful"],
-    default: { help: false, version: false, stateful: false },
+    boolean: ["help", "version", "stateful", "worker"],
+    default: { help: false, version: false, stateful: false, worker: false },
   });
 
   if (flags.help) {
@@ -367,7 +614,9 @@ OPTIONS:
   -f, --file <path>            Path to Python file to execute
   -s, --stateful <bool>        Use a stateful session
   -b, --session-bytes <bytes>  Session bytes
+      --session-file <path>    File with session bytes, the updated session is written to it
   -m, --session-metadata       Session metadata
+      --worker                 Execute framed requests from stdin with one Pyodide
   -h, --help                   Display help
   -V, --version                Display version
 `);
@@ -379,11 +628,25 @@ OPTIONS:
     return
   }
 
+  if (flags.worker) {
+    await worker();
+    return;
+  }
+
+  const sessionFile = flags["session-file"];
+  let sessionBytes: Uint8Array | undefined;
+  if (sessionFile) {
+    sessionBytes = await Deno.readFile(sessionFile);
+    if (!sessionBytes.length) sessionBytes = undefined;
+  } else if (flags["session-bytes"]) {
+    sessionBytes = Uint8Array.from(JSON.parse(flags["session-bytes"]));
+  }
+
   const options = {
     code: flags.code,
     file: flags.file,
     stateful: flags.stateful,
-    sessionBytes: flags["session-bytes"],
+    sessionBytes,
     sessionMetadata: flags["session-metadata"],
   };
 
@@ -424,14 +687,12 @@ OPTIONS:
 
   // Exit with error code if Python execution failed
   // Create output JSON with stdout, stderr, and result
-  const outputJson = {
-    stdout: result.stdout?.join('') || null,
-    stderr: result.success ? (result.stderr?.join('') || null) : result.error || null,
-    result: result.success ? JSON.parse(result.jsonResult || 'null') : null,
-    success: result.success,
-    sessionBytes: result.sessionBytes,
-    sessionMetadata: result.sessionMetadata,
-  };
+  const outputJson: Record<string, any> = formatResult(result);
+  if (sessionFile && outputJson.sessionBytes) {
+    await Deno.writeFile(sessionFile, toBytes(outputJson.sessionBytes));
+    delete outputJson.sessionBytes;
+    outputJson.sessionFile = sessionFile;
+  }
 
   // Output as JSON to stdout
   console.log(JSON.stringify(outputJson));
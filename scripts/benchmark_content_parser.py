@@ -0,0 +1,107 @@
+"""
+Benchmark of process_content_by_type on many small attachments.
+
+Generates N small documents per format and parses them with the in-memory loaders (`from_bytes`) used by
+process_content_by_type, and with the previous flow writing each document to a temporary file on disk and
+loading it by path. Reports docs/sec of both and checks they produce the same content.
+
+Usage:
+    python scripts/benchmark_content_parser.py --docs 500 --formats txt json csv xlsx docx pdf
+"""
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+
+import pymupdf
+from docx import Document as DocxDocument
+from openpyxl import Workbook
+
+from alita_sdk.runtime.langchain.document_loaders.constants import loaders_map
+from alita_sdk.tools.utils.content_parser import process_content_by_type
+
+
+def _txt(idx: int) -> bytes:
+    return f"Attachment {idx}\n\nSome text of the attachment number {idx}.\n".encode()
+
+
+def _json(idx: int) -> bytes:
+    return json.dumps({"id": idx, "title": f"Attachment {idx}", "tags": ["a", "b"]}).encode()
+
+
+def _csv(idx: int) -> bytes:
+    return "".join(f"{row},name {idx}-{row},{row * idx}\n" for row in range(20)).encode()
+
+
+def _xlsx(idx: int) -> bytes:
+    workbook = Workbook()
+    for row in range(20):
+        workbook.active.append([row, f"name {idx}-{row}", row * idx])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _docx(idx: int) -> bytes:
+    document = DocxDocument()
+    document.add_heading(f"Attachment {idx}", level=1)
+    document.add_paragraph(f"Some text of the attachment number {idx}.")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf(idx: int) -> bytes:
+    with pymupdf.open() as document:
+        document.new_page().insert_text((72, 72), f"Attachment {idx}")
+        return document.tobytes()
+
+
+GENERATORS = {"txt": _txt, "json": _json, "csv": _csv, "xlsx": _xlsx, "docx": _docx, "pdf": _pdf}
+
+
+def load_with_temp_file(content: bytes, extension: str):
+    """Previous flow: a temporary file on disk per document, loaded by path."""
+    loader_config = loaders_map[extension]
+    with tempfile.NamedTemporaryFile(mode='w+b', suffix=extension, delete=False) as temp_file:
+        temp_file.write(content)
+        temp_file.flush()
+    try:
+        return list(loader_config['class'](file_path=temp_file.name, **loader_config['kwargs']).load())
+    finally:
+        os.remove(temp_file.name)
+
+
+def measure(label: str, func, documents):
+    start = time.perf_counter()
+    results = [func(content, name) for name, content in documents]
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {len(documents) / elapsed:10.1f} docs/sec ({elapsed:.2f}s)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=500, help="Number of documents per format")
+    parser.add_argument("--formats", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    args = parser.parse_args()
+
+    for fmt in args.formats:
+        extension = f".{fmt}"
+        documents = [(f"attachment_{idx}{extension}", GENERATORS[fmt](idx)) for idx in range(args.docs)]
+        print(f"{fmt}: {args.docs} documents")
+        # warm up lazily initialized parsers and tokenizers
+        load_with_temp_file(documents[0][1], extension)
+        list(process_content_by_type(documents[0][1], documents[0][0]))
+        temp_file_docs = measure("temp file", lambda content, name: load_with_temp_file(content, extension),
+                                 documents)
+        memory_docs = measure("in memory", lambda content, name: list(process_content_by_type(content, name)),
+                              documents)
+        assert [[doc.page_content for doc in docs] for docs in temp_file_docs] == \
+            [[doc.page_content for doc in docs] for docs in memory_docs]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark of KnowledgeGraph.search and search_advanced on a synthetic graph.
+
+Builds a graph of N entities with camelCase names composed from a vocabulary, short descriptions and
+cited file paths, then runs a set of queries (exact names, name parts, substrings, multi-word and
+file path queries) and reports milliseconds per query and the time of building and loading the graph.
+
+Usage:
+    python scripts/benchmark_knowledge_graph_search.py --nodes 500000 --repeat 3
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from alita_sdk.community.inventory.knowledge_graph import Citation, KnowledgeGraph
+
+TYPES = ["class", "function", "method", "service", "api_endpoint", "model", "concept", "document"]
+QUERIES = [
+    "UserSessionManager",  # exact name
+    "session",  # name token
+    "essionMan",  # substring inside words
+    "payment refund",  # multi-word
+    "billing/api",  # file path
+    "xyzzy",  # no matches
+]
+
+
+def vocabulary(rng: random.Random, size: int) -> list:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = {"user", "session", "manager", "payment", "refund", "billing", "api", "handler"}
+    while len(words) < size:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 9))))
+    return sorted(words)
+
+
+def build_graph(nodes: int, seed: int = 42) -> KnowledgeGraph:
+    rng = random.Random(seed)
+    words = vocabulary(rng, 5000)
+    graph = KnowledgeGraph()
+    graph.add_entity("target", "UserSessionManager", "class", Citation(file_path="billing/api/session.py"))
+    for idx in range(nodes - 1):
+        name = "".join(word.capitalize() for word in rng.sample(words, rng.randint(1, 3)))
+        path = "/".join(rng.sample(words, 2)) + f"/{name.lower()}.py"
+        graph.add_entity(
+            f"entity_{idx}", name, rng.choice(TYPES),
+            Citation(file_path=path, line_start=idx % 500, doc_id=f"doc_{idx % 1000}"),
+            {"description": " ".join(rng.sample(words, 6))},
+        )
+    return graph
+
+
+def measure(label: str, func, repeat: int):
+    func()  # warm up
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<40} {best * 1000:10.1f} ms ({len(results)} results)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=500000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = build_graph(args.nodes)
+    print(f"Built graph of {args.nodes} entities in {time.perf_counter() - start:.1f}s")
+
+    for query in QUERIES:
+        measure(f"search({query!r})", lambda: graph.search(query, top_k=20), args.repeat)
+    measure("search('session', entity_type='class')", lambda: graph.search("session", entity_type="class"),
+            args.repeat)
+    measure("search_advanced('handler', layers=['code'])",
+            lambda: graph.search_advanced("handler", layers=["code"]), args.repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.json")
+        graph.dump_to_json(path)
+        start = time.perf_counter()
+        KnowledgeGraph().load_from_json(path)
+        print(f"Loaded graph ({os.path.getsize(path) / 1024 / 1024:.0f} MiB) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
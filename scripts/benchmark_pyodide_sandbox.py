@@ -0,0 +1,70 @@
+"""
+Benchmark of cold and warm PyodideSandbox executions.
+
+Cold executions start a Deno process per execution (worker_pool_size=0), warm ones run on the pool of
+Deno/Pyodide workers. Reports seconds per execution of a stateless snippet and of a stateful session
+growing by SESSION_KB kilobytes per execution, and the time the pool spent starting workers.
+
+Requires Deno and the sandbox entrypoint with worker mode (infra/data/sandbox/main.ts).
+
+Usage:
+    PYODIDE_SANDBOX_PKG=infra/data/sandbox/main.ts python scripts/benchmark_pyodide_sandbox.py --repeat 10
+"""
+import argparse
+import statistics
+import time
+
+from alita_sdk.runtime.langchain.pyodide_sandbox import SyncPyodideSandbox
+
+STATELESS_CODE = "sum(i * i for i in range(10_000))"
+STATEFUL_CODE = "data = globals().get('data', []) + ['x' * {size}]\nlen(data)"
+
+
+def run(sandbox: SyncPyodideSandbox, code: str, repeat: int, stateful: bool) -> list:
+    session_bytes, session_metadata = None, None
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = sandbox.execute(code, session_bytes=session_bytes, session_metadata=session_metadata,
+                                 timeout_seconds=300)
+        timings.append(time.perf_counter() - start)
+        if result.status != "success":
+            raise RuntimeError(f"Execution failed: {result.stderr}")
+        if stateful:
+            session_bytes, session_metadata = result.session_bytes, result.session_metadata
+    return timings
+
+
+def report(label: str, func):
+    try:
+        timings = func()
+    except Exception as e:
+        # Cold stateful executions pass the session on the command line, large sessions exceed ARG_MAX
+        print(f"{label:<28} failed: {e}")
+        return
+    print(f"{label:<28} first {timings[0]:7.3f}s  median {statistics.median(timings):7.3f}s  "
+          f"min {min(timings):7.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=2, help="size of the warm worker pool")
+    parser.add_argument("--session-kb", type=int, default=256)
+    args = parser.parse_args()
+
+    stateful_code = STATEFUL_CODE.format(size=args.session_kb * 1024)
+    for mode, pool_size in (("cold", 0), ("warm", args.workers)):
+        stateless = SyncPyodideSandbox(worker_pool_size=pool_size)
+        stateful = SyncPyodideSandbox(stateful=True, worker_pool_size=pool_size)
+        report(f"{mode} stateless", lambda: run(stateless, STATELESS_CODE, args.repeat, stateful=False))
+        report(f"{mode} stateful", lambda: run(stateful, stateful_code, args.repeat, stateful=True))
+        pool = stateless._get_worker_pool()
+        if pool is not None:
+            stats = pool.stats()
+            print(f"{mode} pool: {stats['workers_started']} workers started in "
+                  f"{stats['startup_time']:.1f}s, {stats['workers_recycled']} recycled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark of the statistical chunker core on large documents.
+
+Generates a synthetic document of N sentences (50k by default) with topic drift and random embeddings,
+then measures similarity scores, threshold search and splitting of the vectorized implementation
+against a sequential reference implementation of the same algorithm.
+
+Usage:
+    python scripts/benchmark_statistical_chunker.py --sentences 50000 --dim 1536
+"""
+import argparse
+import time
+
+import numpy as np
+
+from alita_sdk.tools.chunkers.sematic.statistical_chunker import (
+    _calculate_similarity_scores,
+    _find_optimal_threshold,
+    _find_split_indices,
+    _split_documents,
+)
+from alita_sdk.tools.chunkers.utils import tiktoken_length
+
+
+def reference_similarity_scores(encoded_docs: np.ndarray, window_size: int):
+    scores = []
+    for idx in range(1, len(encoded_docs)):
+        context = np.mean(encoded_docs[max(0, idx - window_size):idx], axis=0)
+        scores.append(np.dot(context, encoded_docs[idx]) / (
+            np.linalg.norm(context) * np.linalg.norm(encoded_docs[idx]) + 1e-10))
+    return scores
+
+
+def reference_optimal_threshold(token_counts, scores, min_tokens=100, max_tokens=300, tolerance=10, step=0.01):
+    cumulative = np.cumsum([0] + list(token_counts))
+    median_score, std_dev = np.median(scores), np.std(scores)
+    low, high = max(0.0, float(median_score - std_dev)), min(1.0, float(median_score + std_dev))
+    threshold = 0.0
+    while low <= high:
+        threshold = (low + high) / 2
+        splits = [idx + 1 for idx, score in enumerate(scores) if score < threshold]
+        median_tokens = np.median([cumulative[end] - cumulative[start]
+                                   for start, end in zip([0] + splits, splits + [len(token_counts)])])
+        if min_tokens - tolerance <= median_tokens <= max_tokens + tolerance:
+            break
+        if median_tokens < min_tokens:
+            high = threshold - step
+        else:
+            low = threshold + step
+    return threshold
+
+
+def reference_split(token_counts, split_indices, max_tokens=300, min_tokens=100):
+    chunks, current = 0, 0
+    for idx, count in enumerate(token_counts):
+        if idx + 1 in split_indices and min_tokens <= current + count < max_tokens:
+            chunks, current = chunks + 1, 0
+            continue
+        if current + count > max_tokens and current >= min_tokens:
+            chunks, current = chunks + 1, 0
+        current += count
+    return chunks + (1 if current else 0)
+
+
+def timed(label: str, fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    print(f"  {label:<32} {time.perf_counter() - start:10.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sentences", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--window-size", type=int, default=5)
+    parser.add_argument("--skip-reference", action="store_true", help="Measure vectorized implementation only")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    topics = rng.normal(size=(args.sentences // 20 + 1, args.dim))
+    encoded = np.repeat(topics, 20, axis=0)[:args.sentences] + rng.normal(scale=0.8, size=(args.sentences, args.dim))
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+    docs = [" ".join(rng.choice(words, size=int(size))) for size in rng.integers(8, 40, args.sentences)]
+    print(f"{args.sentences} sentences, {args.dim}-dimensional embeddings")
+
+    token_counts = timed("token counts (once)", lambda: [tiktoken_length(doc) for doc in docs])
+
+    print("Vectorized")
+    scores = timed("similarity scores", _calculate_similarity_scores, encoded, args.window_size)
+    threshold = timed("optimal threshold", _find_optimal_threshold, docs, scores, token_counts=token_counts)
+    split_indices = timed("split indices", _find_split_indices, scores, threshold)
+    chunks = timed("split documents", _split_documents, docs, split_indices, scores, token_counts=token_counts)
+    print(f"  {len(chunks)} chunks")
+
+    if not args.skip_reference:
+        print("Sequential reference")
+        reference_scores = timed("similarity scores", reference_similarity_scores, encoded, args.window_size)
+        reference_threshold = timed("optimal threshold", reference_optimal_threshold, token_counts, reference_scores)
+        reference_indices = [idx + 1 for idx, score in enumerate(reference_scores) if score < reference_threshold]
+        reference_chunks = timed("split documents", reference_split, token_counts, reference_indices)
+        print(f"  {reference_chunks} chunks")
+        assert np.allclose(scores, reference_scores, atol=1e-9)
+        assert reference_chunks == len(chunks)
+
+
+if __name__ == "__main__":
+    main()
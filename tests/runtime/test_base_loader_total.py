@@ -0,0 +1,79 @@
+import pytest
+
+pytest.importorskip("atlassian")
+
+from alita_sdk.tools.confluence.api_wrapper import ConfluenceAPIWrapper
+from alita_sdk.tools.jira.api_wrapper import DEFAULT_INDEX_JQL, JiraApiWrapper
+
+
+class _JiraClient:
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def resource_url(self, resource):
+        return f"rest/api/{resource}"
+
+    def get(self, url, params=None):
+        self.requests.append(("get", url, params))
+        return self.response
+
+    def post(self, url, data=None):
+        self.requests.append(("post", url, data))
+        return self.response
+
+
+class _ConfluenceClient:
+    def __init__(self, sizes):
+        self.sizes = sizes
+        self.queries = []
+
+    def cql(self, cql, start=0, limit=None):
+        self.queries.append(cql)
+        if cql not in self.sizes:
+            raise ValueError("The query cannot be parsed")
+        return {"results": [], "totalSize": self.sizes[cql]}
+
+
+def _jira(api_version, response):
+    wrapper = JiraApiWrapper.model_construct(api_version=api_version)
+    wrapper._client = _JiraClient(response)
+    return wrapper
+
+
+def test_jira_total_is_taken_from_search_response():
+    wrapper = _jira("2", {"issues": [], "total": 42})
+
+    assert wrapper._base_loader_total(jql="project = TEST") == 42
+    assert wrapper._base_loader_total(max_total_issues=10) == 10
+    assert wrapper._client.requests == [
+        ("get", "rest/api/search", {"jql": "project = TEST", "maxResults": 0, "fields": "id"}),
+        ("get", "rest/api/search", {"jql": DEFAULT_INDEX_JQL, "maxResults": 0, "fields": "id"}),
+    ]
+
+
+def test_jira_cloud_total_is_approximate_count():
+    wrapper = _jira("3", {"count": 5000})
+
+    assert wrapper._base_loader_total(jql="project = TEST") == 1000
+    assert wrapper._client.requests == [("post", "rest/api/search/approximate-count", {"jql": "project = TEST"})]
+
+
+def test_jira_total_is_unknown_on_errors():
+    assert _jira("2", {"issues": []})._base_loader_total() is None
+
+
+def test_confluence_total_sums_sources_of_loader():
+    client = _ConfluenceClient({
+        'type = page and space = "SPACE"': 30,
+        'type = page and label = "docs"': 1500,
+        "type = page and title ~ x": 7,
+    })
+    wrapper = ConfluenceAPIWrapper.model_construct(space="SPACE", client=client)
+
+    assert wrapper._base_loader_total() == 30
+    assert wrapper._base_loader_total(label="docs", cql="type = page and title ~ x", page_ids=["1", "2"]) == 1009
+    assert wrapper._base_loader_total(label="docs", max_pages=100) == 100
+    # space is not loaded when pages are selected
+    assert wrapper._base_loader_total(page_ids=["1", "2"]) == 2
+    assert wrapper._base_loader_total(cql="invalid") is None
@@ -0,0 +1,136 @@
+import operator
+import sqlite3
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from alita_sdk.runtime.langchain.checkpointer import BoundedMemorySaver, create_checkpointer
+
+TURNS = 10_000
+
+
+class State(TypedDict):
+    counter: int
+    log: Annotated[list, operator.add]
+
+
+def _graph(checkpointer):
+    def step(state: State):
+        return {"counter": state.get("counter", 0) + 1, "log": ["x"]}
+
+    def check(state: State):
+        return {"log": ["y"]}
+
+    builder = StateGraph(State)
+    builder.add_node("step", step)
+    builder.add_node("check", check)
+    builder.add_edge(START, "step")
+    builder.add_edge("step", "check")
+    builder.add_edge("check", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _checkpoint_count(saver, thread_id):
+    return sum(len(checkpoints) for checkpoints in saver.storage[thread_id].values())
+
+
+def test_memory_stays_bounded_over_10k_turns():
+    saver = BoundedMemorySaver(max_threads=50, max_checkpoints_per_thread=5)
+    graph = _graph(saver)
+
+    # 36 conversations used over and over, every tenth turn is a one-off conversation
+    for turn in range(TURNS):
+        graph.invoke({"log": []}, _config(f"once{turn}" if turn % 10 == 9 else f"t{turn % 40}"))
+
+    assert len(saver.storage) == 50
+    assert max(_checkpoint_count(saver, thread) for thread in saver.storage) <= 5
+    assert len(saver.writes) <= 50 * 5
+    # Only channel values of kept checkpoints are stored
+    referenced = set()
+    for thread_id, namespaces in saver.storage.items():
+        for checkpoint_ns, checkpoints in namespaces.items():
+            for checkpoint, _, _ in checkpoints.values():
+                versions = saver.serde.loads_typed(checkpoint)["channel_versions"]
+                referenced.update((thread_id, checkpoint_ns, *item) for item in versions.items())
+    assert set(saver.blobs) <= referenced
+    # Latest state of kept threads is complete, least recently used one-off threads are gone
+    state = graph.get_state(_config("t0"))
+    assert state.values["counter"] == TURNS // 40
+    assert len(state.values["log"]) == 2 * TURNS // 40
+    assert graph.get_state(_config("once9")).values == {}
+
+
+def test_unbounded_saver_grows_with_turns():
+    # Reference for the test above: the plain saver keeps every checkpoint
+    saver = InMemorySaver()
+    graph = _graph(saver)
+    for turn in range(200):
+        graph.invoke({"counter": 0, "log": []}, _config("t"))
+    assert _checkpoint_count(saver, "t") == 200 * 4
+
+
+def test_compaction_drops_superseded_writes():
+    compacted = BoundedMemorySaver(max_checkpoints_per_thread=None)
+    kept = BoundedMemorySaver(max_checkpoints_per_thread=None, compact_writes=False)
+    for saver in (compacted, kept):
+        graph = _graph(saver)
+        for _ in range(10):
+            graph.invoke({"counter": 0, "log": []}, _config("t"))
+
+    assert len(compacted.writes) < len(kept.writes)
+    assert _checkpoint_count(compacted, "t") == _checkpoint_count(kept, "t") == 40
+    assert _graph(compacted).get_state(_config("t")).values == _graph(kept).get_state(_config("t")).values
+
+
+def test_recently_read_threads_are_kept():
+    saver = BoundedMemorySaver(max_threads=2)
+    graph = _graph(saver)
+    graph.invoke({"counter": 0, "log": []}, _config("a"))
+    graph.invoke({"counter": 0, "log": []}, _config("b"))
+    graph.get_state(_config("a"))
+    graph.invoke({"counter": 0, "log": []}, _config("c"))
+
+    assert set(saver.storage) == {"a", "c"}
+    saver.delete_thread("a")
+    assert set(saver.storage) == {"c"}
+    assert not any(key[0] == "a" for key in saver.blobs)
+
+
+def test_sqlite_checkpointer_retains_last_checkpoints(tmp_path):
+    path = tmp_path / "checkpoints.sqlite"
+    saver = create_checkpointer({"backend": "sqlite", "path": str(path), "max_checkpoints_per_thread": 3})
+    assert create_checkpointer({"backend": "sqlite", "path": str(path), "max_checkpoints_per_thread": 3}) is saver
+    graph = _graph(saver)
+    for _ in range(50):
+        graph.invoke({"counter": 0, "log": []}, _config("t"))
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0] == 3
+        write_checkpoints = {row[0] for row in conn.execute("SELECT checkpoint_id FROM writes")}
+        kept = {row[0] for row in conn.execute("SELECT checkpoint_id FROM checkpoints")}
+    assert write_checkpoints <= kept
+    state = graph.get_state(_config("t"))
+    assert state.values["counter"] == 1
+    assert len(state.values["log"]) == 100
+
+
+def test_checkpointer_configuration(monkeypatch, tmp_path):
+    monkeypatch.delenv("ALITA_CHECKPOINTER", raising=False)
+    saver = create_checkpointer()
+    assert isinstance(saver, BoundedMemorySaver)
+    assert saver.max_threads == 1000 and saver.max_checkpoints_per_thread == 20
+
+    monkeypatch.setenv("ALITA_CHECKPOINTER", '{"max_threads": 7}')
+    assert create_checkpointer().max_threads == 7
+
+    monkeypatch.setenv("ALITA_CHECKPOINTER", str(tmp_path / "env.sqlite"))
+    assert type(create_checkpointer()).__name__ == "BoundedSqliteSaver"
+
+    with pytest.raises(ValueError):
+        create_checkpointer({"backend": "redis"})
@@ -0,0 +1,47 @@
+from alita_sdk.tools.code_indexer_toolkit import CodeIndexerToolkit
+
+
+class _Repo(CodeIndexerToolkit):
+    def _get_files_blob_shas(self, path, branch):
+        return {"a.py": "sha-a", "b.py": "sha-b2", "c.md": "sha-c", "d.py": "sha-d"}
+
+    def _read_file(self, file_path, branch):
+        self.__dict__.setdefault("reads", []).append(file_path)
+        return f"def {file_path[0]}():\n    return 1\n"
+
+    def _get_files(self, path="", branch=None):
+        raise AssertionError("files are listed with blob SHAs")
+
+
+def _indexed(commit_hash, ids):
+    return {"metadata": {"collection": "idx"}, "commit_hashes": [commit_hash], "ids": ids}
+
+
+def test_incremental_loader_reads_only_changed_files():
+    repo = _Repo.model_construct()
+    indexed_data = {"a.py": _indexed("sha-a", ["a-1"]), "b.py": _indexed("sha-b1", ["b-1", "b-2"])}
+    docs_to_remove = set()
+
+    base_docs = list(repo._skip_indexed(repo._base_loader(whitelist=["*.py"]), "idx", docs_to_remove, indexed_data))
+    assert [doc.metadata["filename"] for doc in base_docs] == ["b.py", "d.py"]
+    assert docs_to_remove == {"b-1", "b-2"}
+    assert "reads" not in repo.__dict__
+
+    chunks = list(repo._extend_data(iter(base_docs)))
+    assert repo.reads == ["b.py", "d.py"]
+    assert {chunk.metadata["commit_hash"] for chunk in chunks} == {"sha-b2", "sha-d"}
+    assert all("raw_file" not in chunk.metadata for chunk in chunks)
+
+
+def test_loader_without_blob_shas_falls_back_to_reading_files():
+    class _PlainRepo(_Repo):
+        def _get_files_blob_shas(self, path, branch):
+            return None
+
+        def _get_files(self, path="", branch=None):
+            return ["a.py"]
+
+    repo = _PlainRepo.model_construct()
+    docs = list(repo._base_loader())
+    assert repo.reads == ["a.py"]
+    assert docs and all(doc.page_content for doc in docs)
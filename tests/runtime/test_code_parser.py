@@ -0,0 +1,57 @@
+import threading
+
+from alita_sdk.tools.chunkers.code.codeparser import parse_code_files_for_db
+from alita_sdk.tools.chunkers.code.constants import Language
+from alita_sdk.tools.chunkers.code.treesitter import Treesitter, TreesitterMethodNode
+
+RUST_SOURCE = b"""
+/// Adds numbers.
+/// Returns the sum.
+fn add(a: i32, b: i32) -> i32 {
+    fn inner() {}
+    a + b
+}
+
+mod nested {
+    fn sub(a: i32) -> i32 { a - 1 }
+}
+"""
+
+
+def test_methods_are_walked_in_order_without_nested_ones():
+    nodes = Treesitter.get_treesitter(Language.RUST).parse(RUST_SOURCE)
+
+    assert [node.name for node in nodes] == ["add", "sub"]
+    assert nodes[0].doc_comment == "/// Adds numbers.\n/// Returns the sum."
+    assert nodes[1].doc_comment is None
+
+
+def test_method_node_decodes_source_from_byte_offsets():
+    source = "// привіт\nfunction hello() { return 'світ'; }\n".encode()
+    node = Treesitter.get_treesitter(Language.JAVASCRIPT).parse(source)[0]
+
+    assert isinstance(node, TreesitterMethodNode) and not hasattr(node, "__dict__")
+    assert node._method_source_code is None
+    assert node.method_source_code == "function hello() { return 'світ'; }"
+    assert source[node.start_byte:node.end_byte].decode() == node.method_source_code
+
+
+def test_parsers_are_reused_per_thread():
+    parser = Treesitter.get_treesitter(Language.PYTHON)
+    other_thread = []
+    thread = threading.Thread(target=lambda: other_thread.append(Treesitter.get_treesitter(Language.PYTHON)))
+    thread.start()
+    thread.join()
+
+    assert Treesitter.get_treesitter(Language.PYTHON) is parser
+    assert other_thread[0] is not parser
+
+
+def test_python_methods_keep_docstrings_and_names():
+    source = 'class A:\n    def f(self):\n        """Doc."""\n        return 1\n\ndef g():\n    pass\n'
+
+    docs = list(parse_code_files_for_db(iter([{"file_name": "a.py", "file_content": source, "commit_hash": "c1"}])))
+
+    assert [doc.metadata["method_name"] for doc in docs] == ["f", "g"]
+    assert docs[0].page_content.startswith("def f(self):")
+    assert all(doc.metadata["commit_hash"] == "c1" for doc in docs)
@@ -0,0 +1,60 @@
+import pytest
+
+from alita_sdk.runtime.utils.utils import IndexerKeywords
+from alita_sdk.tools.vector_adapters.VectorStoreAdapter import CompactIndexedData
+
+DEPENDENT_DOCS = IndexerKeywords.DEPENDENT_DOCS.value
+PARENT = IndexerKeywords.PARENT.value
+
+
+def make_data():
+    data = CompactIndexedData("idx")
+    data.add_row("1", "db-1", updated_on=100.5, chunk_id=1, dependent_docs="1_a; 1_b")
+    data.add_row("1", "db-2", updated_on=100.5, chunk_id=2)
+    data.add_row("1_a", "db-3", updated_on="2024-01-01", parent_id=1)
+    data.add_row("2", "db-4", updated_on=200, chunk_id=1)
+    return data
+
+
+def test_item_has_legacy_structure():
+    item = make_data()["1"]
+    assert item["id"] == "db-1"
+    assert item["all_chunks"] == ["db-1", "db-2"]
+    assert item[DEPENDENT_DOCS] == ["1_a", "1_b"]
+    assert item[PARENT] == -1
+    assert item["metadata"]["collection"] == "idx"
+    assert item["metadata"]["updated_on"] == 100.5
+
+
+def test_dependent_document_keeps_parent():
+    item = make_data()["1_a"]
+    assert item[PARENT] == 1
+    assert item[DEPENDENT_DOCS] == []
+    assert item["all_chunks"] == ["db-3"]
+
+
+def test_mapping_interface():
+    data = make_data()
+    assert len(data) == 3
+    assert set(data) == {"1", "1_a", "2"}
+    assert "2" in data and "3" not in data
+    with pytest.raises(KeyError):
+        data["3"]
+
+
+def test_row_without_chunk_id_replaces_document():
+    data = CompactIndexedData("idx")
+    data.add_row("1", "db-1", updated_on=1, chunk_id=1)
+    data.add_row("1", "db-2", updated_on=1, chunk_id=2)
+    data.add_row("1", "db-3", updated_on=2)
+    assert data["1"]["id"] == "db-3"
+    assert data["1"]["all_chunks"] == ["db-3"]
+    assert data["1"]["metadata"]["updated_on"] == 2
+
+
+def test_ungrouped_rows_are_rejected():
+    data = CompactIndexedData("idx")
+    data.add_row("1", "db-1", chunk_id=1)
+    data.add_row("2", "db-2", chunk_id=1)
+    with pytest.raises(ValueError):
+        data.add_row("1", "db-3", chunk_id=2)
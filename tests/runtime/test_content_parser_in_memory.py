@@ -0,0 +1,92 @@
+import io
+import json
+import tempfile
+
+import pymupdf
+import pytest
+from docx import Document as DocxDocument
+from langchain_core.documents import Document
+from openpyxl import Workbook
+
+from alita_sdk.runtime.langchain.document_loaders import bytes_loader
+from alita_sdk.tools.utils import content_parser
+from alita_sdk.tools.utils.content_parser import process_content_by_type
+
+
+def _xlsx() -> bytes:
+    workbook = Workbook()
+    workbook.active.append(["name", "value"])
+    workbook.active.append(["a", 1])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _docx() -> bytes:
+    document = DocxDocument()
+    document.add_heading("Title", level=1)
+    document.add_paragraph("Paragraph text")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf() -> bytes:
+    with pymupdf.open() as document:
+        document.new_page().insert_text((72, 72), "Hello PDF")
+        return document.tobytes()
+
+
+@pytest.fixture
+def no_temp_files(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("temporary file created")
+
+    monkeypatch.setattr(tempfile, "mkstemp", _fail)
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", _fail)
+
+
+@pytest.mark.parametrize("filename,content,expected", [
+    ("notes.txt", b"plain text", "plain text"),
+    ("data.json", json.dumps({"key": "value"}).encode(), '"key": "value"'),
+    ("table.csv", b"name,value\na,1\n", "a,1"),
+    ("book.xlsx", _xlsx(), "a | 1"),
+    ("doc.docx", _docx(), "Paragraph text"),
+    ("report.pdf", _pdf(), "Hello PDF"),
+])
+def test_content_is_parsed_in_memory(no_temp_files, filename, content, expected):
+    docs = list(process_content_by_type(content, filename))
+
+    assert docs and expected in "\n".join(doc.page_content for doc in docs)
+    assert all(filename in str(doc.metadata.get("source", filename)) for doc in docs)
+
+
+def test_fallback_extension_is_used_for_file_name(no_temp_files):
+    docs = list(process_content_by_type(b"plain text", "attachment", fallback_extensions=[".txt"]))
+
+    assert [doc.metadata["source"] for doc in docs] == ["attachment.txt"]
+
+
+def test_path_only_loader_gets_temp_file_in_memory_dir(monkeypatch, tmp_path):
+    paths = []
+
+    class _PathLoader:
+        def __init__(self, file_path, **kwargs):
+            self.file_path = file_path
+
+        def load(self):
+            paths.append(self.file_path)
+            with open(self.file_path, "rb") as file:
+                return [Document(page_content=file.read().decode())]
+
+    monkeypatch.setitem(content_parser.loaders_map, ".path", {"class": _PathLoader, "kwargs": {}})
+    monkeypatch.setattr(bytes_loader, "MEMORY_TEMP_DIRS", (str(tmp_path),))
+    bytes_loader.memory_temp_dir.cache_clear()
+    try:
+        docs = list(process_content_by_type(b"content", "file.path"))
+    finally:
+        bytes_loader.memory_temp_dir.cache_clear()
+
+    assert [doc.page_content for doc in docs] == ["content"]
+    assert paths[0].startswith(str(tmp_path)) and paths[0].endswith(".path")
+    assert list(tmp_path.iterdir()) == []
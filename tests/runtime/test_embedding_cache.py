@@ -0,0 +1,53 @@
+from langchain_core.embeddings import Embeddings
+
+from alita_sdk.runtime.llms import embedding_cache
+from alita_sdk.runtime.llms.embedding_cache import CachedEmbeddings, SQLiteEmbeddingCache, text_hash
+
+
+class _CountingEmbeddings(Embeddings):
+    model = "test-model"
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def test_cached_embeddings_embed_only_new_texts(tmp_path):
+    store = SQLiteEmbeddingCache(str(tmp_path / "cache.sqlite"))
+    model = _CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, store)
+
+    first = embeddings.embed_documents(["a", "bb", "a"])
+    second = CachedEmbeddings(model, SQLiteEmbeddingCache(str(tmp_path / "cache.sqlite"))).embed_documents(
+        ["bb", "ccc", "a"])
+
+    assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert second == [[2.0, 0.5], [3.0, 0.5], [1.0, 0.5]]
+    assert model.calls == [["a", "bb"], ["ccc"]]
+    assert embeddings.stats == {"model": "test-model", "hits": 1, "misses": 2, "hit_rate": 1 / 3}
+
+
+def test_sqlite_cache_evicts_expired_and_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_cache, "EVICTION_INTERVAL", 1)
+    store = SQLiteEmbeddingCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    store.put_many("m", {"h1": [1.0]})
+    store.put_many("m", {"h2": [2.0]})
+    store.get_many("m", ["h1"])
+    store.put_many("m", {"h3": [3.0]})
+
+    assert set(store.get_many("m", ["h1", "h2", "h3"])) == {"h1", "h3"}
+
+    store.ttl = 60
+    monkeypatch.setattr(embedding_cache.time, "time", lambda: 10 ** 12)
+    assert store.get_many("m", ["h1", "h3"]) == {}
+    assert store.evict() == 2
+
+
+def test_text_hash_is_stable():
+    assert text_hash("text") == "982d9e3eb996f559e633f4d194def3761d909f5a3b647d1a851fead67c32c9d1"
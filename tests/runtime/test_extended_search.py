@@ -0,0 +1,59 @@
+from langchain_core.documents import Document
+
+from alita_sdk.tools.vector_adapters.VectorStoreAdapter import ChromaAdapter
+
+
+def _doc(source, chunk_id, chunk_type):
+    return Document(page_content=f"{chunk_type} {source} {chunk_id}",
+                    metadata={"source": source, "chunk_id": chunk_id, "chunk_type": chunk_type})
+
+
+class _Store:
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+
+    def similarity_search_with_score_by_vector(self, embedding, k=4, filter=None):
+        self.calls.append(filter)
+        return [(doc, 0.1) for doc in self.docs if _matches(doc, filter)][:k]
+
+
+def _matches(doc, filter):
+    if not filter:
+        return True
+    if "$and" in filter:
+        return all(_matches(doc, condition) for condition in filter["$and"])
+    if "$or" in filter:
+        return any(_matches(doc, condition) for condition in filter["$or"])
+    (field, condition), = filter.items()
+    value = doc.metadata.get(field)
+    return value in condition["$in"] if "$in" in condition else value == condition["$eq"]
+
+
+class _Wrapper:
+    def __init__(self, store):
+        self.vectorstore = store
+
+
+def test_extended_search_fetches_missing_parents_in_one_call():
+    store = _Store([
+        _doc("a", 1, "document"),
+        _doc("b", 1, "document"),
+        _doc("c", 2, "document"),
+        _doc("a", 1, "title"),
+        _doc("b", 1, "summary"),
+        _doc("c", 2, "summary"),
+    ])
+    items = ChromaAdapter().extended_search(_Wrapper(store), [0.0], ["title", "summary"], k=1)
+
+    assert [(doc.metadata["source"], doc.metadata["chunk_type"]) for doc, _ in items] == \
+        [("a", "document"), ("b", "document")]
+    # documents, two chunk types and a single batch of missing parent chunks
+    assert len(store.calls) == 4
+
+
+def test_extended_search_without_missing_parents_skips_fetch():
+    store = _Store([_doc("a", 1, "document"), _doc("a", 1, "title")])
+    items = ChromaAdapter().extended_search(_Wrapper(store), [0.0], ["title"], k=5)
+    assert len(items) == 1
+    assert len(store.calls) == 2
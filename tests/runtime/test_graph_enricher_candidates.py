@@ -0,0 +1,85 @@
+import json
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from alita_sdk.community.inventory.enrichment import GraphEnricher, SimilarNameIndex
+
+
+def _names(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    words = ["toolkit", "create", "creation", "user", "users", "service", "config", "agent", "api", "ab"]
+    names = []
+    for _ in range(count):
+        name = " ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        if rng.random() < 0.3:
+            position = rng.randrange(len(name))
+            name = name[:position] + rng.choice("aeiosx ") + name[position + 1:]
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85, 0.9, 0.95, 1.0])
+def test_similar_names_match_all_pairs_comparison(threshold):
+    names = _names(150)
+    index = SimilarNameIndex(names, threshold)
+
+    for i, name in enumerate(names):
+        expected = {
+            j for j, other in enumerate(names)
+            if j != i and SequenceMatcher(None, name, other).ratio() >= threshold
+        }
+        assert set(index.similar(i)) == expected, name
+        assert set(index.similar(i, min_index=i + 1)) == {j for j in expected if j > i}
+
+
+def _enricher(tmp_path, names):
+    nodes = [
+        {"id": f"n{i}", "name": name, "type": "concept" if i % 2 else "feature"}
+        for i, name in enumerate(names)
+    ]
+    links = [{"source": "n0", "target": "n1", "relation_type": "uses"}]
+    path = tmp_path / "graph.json"
+    path.write_text(json.dumps({"nodes": nodes, "links": links}))
+    return GraphEnricher(str(path))
+
+
+def test_similarity_links_match_all_pairs_comparison(tmp_path):
+    names = _names(200)
+    enricher = _enricher(tmp_path, names)
+
+    enricher.enrich_similarity_links(min_similarity=0.9)
+
+    normalized = [enricher._normalize_name(name) for name in names]
+    linked = {frozenset(("n0", "n1"))}
+    expected = []
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            if min(len(normalized[i]), len(normalized[j])) < 3:
+                continue
+            if SequenceMatcher(None, normalized[i], normalized[j]).ratio() >= 0.9:
+                pair = frozenset((f"n{i}", f"n{j}"))
+                if pair not in linked:
+                    linked.add(pair)
+                    expected.append((f"n{i}", f"n{j}"))
+    assert [(link["source"], link["target"]) for link in enricher.new_links] == expected
+    assert enricher.stats["similarity_links"] == len(expected) > 0
+
+
+def test_fuzzy_dedupe_merges_near_identical_names(tmp_path):
+    enricher = _enricher(tmp_path, ["Artifact Toolkit", "artifact_toolkits", "Artifact Toolkit Guide", "Agent"])
+
+    enricher.deduplicate_entities(name_similarity_threshold=0.95, require_exact_match=False)
+
+    assert enricher.stats["merge_groups"] == 1
+    assert sorted(node["name"] for node in enricher.graph_data["nodes"]) == ["Agent", "Artifact Toolkit", "Artifact Toolkit Guide"]
+
+
+def test_name_tokens_are_cached(tmp_path):
+    enricher = _enricher(tmp_path, ["The Create Toolkit"])
+
+    tokens = enricher._tokenize_name("The Create Toolkit")
+
+    assert tokens == {"create", "toolkit"}
+    assert enricher._tokenize_name("The Create Toolkit") is tokens
@@ -0,0 +1,157 @@
+import asyncio
+import copy
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from alita_sdk.runtime.clients.client import AlitaClient
+from alita_sdk.runtime.clients.http_session import AsyncHttpSessions, create_http_session, session_stats
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = {}  # path -> number of 503 responses before success
+    calls = []
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        self.calls.append((self.command, self.path, body))
+        if self.failures.get(self.path):
+            self.failures[self.path] -= 1
+            status, payload = 503, {"error": "unavailable"}
+        elif "predict" in self.path:
+            status, payload = 200, {"messages": [{"role": "assistant", "content": "hi"}, {"role": "user", "content": "q"}]}
+        else:
+            status, payload = 200, {"path": self.path, "body": body}
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.failures = {}
+    _Handler.calls = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_session_reuses_connections(server):
+    session = create_http_session()
+
+    for _ in range(5):
+        assert session.get(f"{server}/items").ok
+
+    assert session_stats(session) == {
+        "requests": 5, "connections_opened": 1, "connections_reused": 4, "reuse_ratio": 0.8,
+    }
+
+
+def test_only_idempotent_requests_are_retried(server):
+    session = create_http_session({"backoff_factor": 0})
+    _Handler.failures = {"/get": 2, "/post": 2}
+
+    assert session.get(f"{server}/get").status_code == 200
+    assert session.post(f"{server}/post", json={}).status_code == 503
+    assert [call[1] for call in _Handler.calls] == ["/get"] * 3 + ["/post"]
+
+
+def test_session_stats_survive_copy(server):
+    session = create_http_session()
+    session.get(f"{server}/items")
+
+    copied = copy.deepcopy(session)
+    copied.get(f"{server}/items")
+
+    assert session_stats(copied)["requests"] == 2
+
+
+def test_async_sessions_are_per_loop_and_reuse_connections(server):
+    sessions = AsyncHttpSessions()
+
+    async def fetch():
+        for _ in range(3):
+            async with sessions.session().get(f"{server}/items") as response:
+                assert (await response.json())["path"] == "/items"
+        session = sessions.session()
+        await sessions.close()
+        return session
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+
+    assert first is not second and first.closed
+    assert sessions.stats.as_dict()["requests"] == 6
+    assert sessions.stats.as_dict()["connections_opened"] == 2
+
+
+def test_client_async_twins_use_pooled_session(server):
+    client = AlitaClient(base_url=server, project_id=1, auth_token="token")
+
+    async def call():
+        messages = await client.apredict([HumanMessage(content="q")], {"model": "m"})
+        result = await client.amcp_tool_call({"server": "s", "params": {"name": "tool", "arguments": {"a": 1}}})
+        await client.aclose()
+        return messages, result
+
+    messages, result = asyncio.run(call())
+
+    assert messages == [AIMessage(content="hi"), HumanMessage(content="q")]
+    assert result["body"]["params"]["arguments"] == {"a": 1}
+    assert client.predict([HumanMessage(content="q")], {"model": "m"}) == messages
+    stats = client.connection_stats()
+    assert stats["async"]["requests"] == 2 and stats["async"]["connections_opened"] == 1
+    assert stats["sync"]["requests"] == 1
+
+
+def test_async_requests_are_not_limited_by_default():
+    async def timeouts():
+        default = AsyncHttpSessions().session()
+        configured = AsyncHttpSessions({"request_timeout": 5}).session()
+        try:
+            return default.timeout.total, configured.timeout.total
+        finally:
+            await default.close()
+            await configured.close()
+
+    assert asyncio.run(timeouts()) == (None, 5)
+
+
+def test_async_sessions_are_closed_with_their_loop(server):
+    sessions = AsyncHttpSessions()
+
+    async def fetch():
+        async with sessions.session().get(f"{server}/items") as response:
+            await response.read()
+        return sessions.session()
+
+    opened = [asyncio.run(fetch()) for _ in range(3)]
+
+    assert all(session.closed for session in opened)
+
+    # Loops closed without finalizing async generators don't keep their sessions
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(fetch())
+    loop.close()
+
+    async def cached_loops():
+        sessions.session()
+        return list(sessions._sessions) == [asyncio.get_running_loop()]
+
+    assert asyncio.run(cached_loops())
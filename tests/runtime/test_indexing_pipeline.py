@@ -0,0 +1,315 @@
+import threading
+import time
+
+import pytest
+from langchain_core.documents import Document
+
+from alita_sdk.tools.base_indexer_toolkit import BaseIndexerToolkit
+from alita_sdk.tools.utils.indexing_pipeline import IndexingPipeline, RpmLimiter
+
+
+def make_base_docs(count: int):
+    for i in range(count):
+        yield Document(page_content=f"base {i}", metadata={"id": i})
+
+
+def prepare_with_deps(deps: int):
+    def _prepare(base_doc):
+        return [base_doc] + [
+            Document(page_content=f"{base_doc.page_content} dep {j}", metadata={"parent": base_doc.metadata["id"]})
+            for j in range(deps)
+        ]
+    return _prepare
+
+
+def test_pipeline_writes_all_documents_in_batches():
+    written = []
+    completed = []
+
+    pipeline = IndexingPipeline(
+        prepare_fn=prepare_with_deps(2),
+        embed_fn=lambda texts: [[float(len(t))] for t in texts],
+        write_fn=lambda docs, embeddings: written.append((list(docs), embeddings)),
+        batch_size=4,
+        loader_workers=3,
+        embedding_workers=2,
+    )
+    pipeline.run(make_base_docs(10), on_written=lambda batch: completed.extend(batch.completed_base_docs))
+
+    all_docs = [doc for docs, _ in written for doc in docs]
+    assert len(all_docs) == 30
+    assert all(len(docs) <= 4 for docs, _ in written)
+    assert all(len(docs) == len(embeddings) for docs, embeddings in written)
+    assert sorted(number for number, _ in completed) == list(range(1, 11))
+    assert all(count == 3 for _, count in completed)
+    assert "embed" in pipeline.timings.summary()
+    assert "write" in pipeline.timings.summary()
+
+
+def test_pipeline_without_embed_fn_passes_no_embeddings():
+    written = []
+    pipeline = IndexingPipeline(
+        prepare_fn=prepare_with_deps(0),
+        embed_fn=None,
+        write_fn=lambda docs, embeddings: written.append(embeddings),
+        batch_size=5,
+        embedding_workers=2,
+    )
+    pipeline.run(make_base_docs(7))
+    assert written and all(embeddings is None for embeddings in written)
+
+
+def test_pipeline_reports_failed_batches_and_continues():
+    failed = []
+    written = []
+
+    def embed(texts):
+        if any("base 3" in t for t in texts):
+            raise RuntimeError("embedding failed")
+        return [[0.0] for _ in texts]
+
+    pipeline = IndexingPipeline(
+        prepare_fn=prepare_with_deps(0),
+        embed_fn=embed,
+        write_fn=lambda docs, embeddings: written.extend(docs),
+        batch_size=1,
+        embedding_workers=3,
+    )
+    pipeline.run(make_base_docs(6), on_failed=lambda batch, exc: failed.append((batch, exc)))
+
+    assert len(written) == 5
+    assert len(failed) == 1
+    assert failed[0][0].completed_base_docs == [(4, 1)]
+    assert str(failed[0][1]) == "embedding failed"
+
+
+def test_pipeline_reports_embedder_errors_outside_embed_fn():
+    failed = []
+    written = []
+    calls = []
+
+    def acquire():
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("limiter failed")
+
+    pipeline = IndexingPipeline(
+        prepare_fn=prepare_with_deps(0),
+        embed_fn=lambda texts: [[0.0] for _ in texts],
+        write_fn=lambda docs, embeddings: written.extend(docs),
+        batch_size=1,
+        embedding_workers=1,
+    )
+    pipeline.rpm_limiter.acquire = acquire
+    runner = threading.Thread(
+        target=pipeline.run, args=(make_base_docs(3),),
+        kwargs={"on_failed": lambda batch, exc: failed.append(exc)}, daemon=True,
+    )
+    runner.start()
+    runner.join(timeout=10)
+
+    assert not runner.is_alive()
+    assert len(written) == 2
+    assert [str(exc) for exc in failed] == ["limiter failed"]
+
+
+def test_pipeline_reraises_loader_errors():
+    def broken_loader():
+        yield Document(page_content="ok", metadata={"id": 1})
+        raise ValueError("source is not available")
+
+    pipeline = IndexingPipeline(
+        prepare_fn=prepare_with_deps(0),
+        embed_fn=None,
+        write_fn=lambda docs, embeddings: None,
+    )
+    with pytest.raises(ValueError, match="source is not available"):
+        pipeline.run(broken_loader())
+
+
+def test_pipeline_embeds_concurrently():
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def slow_embed(texts):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return [[0.0] for _ in texts]
+
+    pipeline = IndexingPipeline(
+        prepare_fn=prepare_with_deps(0),
+        embed_fn=slow_embed,
+        write_fn=lambda docs, embeddings: None,
+        batch_size=1,
+        embedding_workers=4,
+    )
+    pipeline.run(make_base_docs(12))
+    assert max_active > 1
+
+
+def test_rpm_limiter_blocks_when_limit_reached():
+    limiter = RpmLimiter(rpm=2, window=0.2)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_rpm_limiter_without_limit_does_not_block():
+    limiter = RpmLimiter(rpm=None)
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.1
+
+
+class _VectorStore:
+    """ PGVector-like store keeping documents by id and the order of operations """
+
+    def __init__(self, documents=None):
+        self.documents = dict(documents or {})
+        self.operations = []
+        self.delete_threads = set()
+
+    def add_embeddings(self, texts, embeddings, metadatas=None, ids=None):
+        ids = ids or [f"{metadata['id']}-{len(self.documents) + i}" for i, metadata in enumerate(metadatas)]
+        self.documents.update({id_: (text, metadata) for id_, text, metadata in zip(ids, texts, metadatas)})
+        self.operations.append(("add", [metadata["id"] for metadata in metadatas]))
+        return ids
+
+    def add_texts(self, texts, metadatas=None, ids=None):
+        return self.add_embeddings(texts, [None] * len(texts), metadatas=metadatas, ids=ids)
+
+    def delete(self, ids):
+        for id_ in ids:
+            self.documents.pop(id_, None)
+        self.operations.append(("delete", len(ids)))
+        self.delete_threads.add(threading.current_thread().name)
+
+
+class _Embeddings:
+    def __init__(self):
+        self.threads = set()
+
+    def embed_documents(self, texts):
+        self.threads.add(threading.current_thread().name)
+        return [[float(len(text))] for text in texts]
+
+
+class _Toolkit(BaseIndexerToolkit):
+    loader_threads: set = set()
+    requested_keys: list = []
+
+    def _base_loader(self, **kwargs):
+        self.loader_threads.add(threading.current_thread().name)
+        for i in range(kwargs.get("count", 10)):
+            yield Document(page_content=f"doc {i} v{kwargs.get('version', 1)}",
+                           metadata={"id": i, "updated_on": kwargs.get("version", 1)})
+
+    def _get_indexed_data(self, index_name, keys=None):
+        self.requested_keys.append(keys)
+        indexed = {}
+        for id_, (_, metadata) in self.vectorstore.documents.items():
+            if keys is not None and str(metadata["id"]) not in keys:
+                continue
+            item = indexed.setdefault(str(metadata["id"]), {"metadata": metadata, "ids": []})
+            item["ids"].append(id_)
+        return indexed
+
+    def key_fn(self, document):
+        return document.metadata["id"]
+
+    def compare_fn(self, document, idx):
+        return idx["metadata"]["updated_on"] == document.metadata["updated_on"]
+
+    def remove_ids_fn(self, idx_data, key):
+        return idx_data[key]["ids"]
+
+    def _extend_data(self, documents):
+        for document in documents:
+            self.loader_threads.add(threading.current_thread().name)
+            yield document
+
+    def _ensure_vectorstore_initialized(self):
+        pass
+
+    def index_meta_init(self, index_name, index_configuration):
+        pass
+
+    def index_meta_update(self, *args, **kwargs):
+        pass
+
+    def _emit_index_event(self, *args, **kwargs):
+        pass
+
+    def _log_tool_event(self, *args, **kwargs):
+        pass
+
+
+def _toolkit(vectorstore=None, cls=_Toolkit, **settings):
+    return cls.model_construct(vectorstore=vectorstore or _VectorStore(), embeddings=_Embeddings(), llm=None,
+                               max_docs_per_add=3, loader_threads=set(), requested_keys=[], **settings)
+
+
+def test_index_data_parameters_override_toolkit_settings():
+    sequential = _toolkit()
+    sequential.index_data(index_name="idx", count=7)
+    assert sequential.embeddings.threads == set()  # embedded by the vectorstore on write
+
+    toolkit = _toolkit()
+    result = toolkit.index_data(index_name="idx", count=7, indexing_loader_workers=2, embedding_workers=2,
+                                embedding_rpm_limit=1000)
+
+    assert result["status"] == "ok"
+    assert len(toolkit.vectorstore.documents) == 7
+    assert toolkit.embeddings.threads and all(name.startswith("indexing-embed") for name in toolkit.embeddings.threads)
+    # Toolkit settings are used by runs without the parameters
+    assert toolkit._indexing_setting("embedding_workers") == 2
+    toolkit.index_data(index_name="idx", count=7)
+    assert toolkit._indexing_setting("embedding_workers") == 1
+
+
+@pytest.mark.parametrize("settings", [{}, {"indexing_loader_workers": 3, "embedding_workers": 2}])
+def test_outdated_chunks_are_removed_after_new_versions_are_written(settings):
+    toolkit = _toolkit()
+    toolkit.index_data(index_name="idx", count=10)
+    toolkit.vectorstore.operations.clear()
+
+    toolkit.index_data(index_name="idx", count=10, version=2, **settings)
+
+    operations = toolkit.vectorstore.operations
+    assert operations[-1] == ("delete", 10)
+    assert all(operation == "add" for operation, _ in operations[:-1])
+    assert toolkit.vectorstore.delete_threads == {threading.current_thread().name}
+    assert sorted(text for text, _ in toolkit.vectorstore.documents.values()) == \
+        sorted(f"doc {i} v2" for i in range(10))
+
+
+def test_loaders_run_in_single_thread_unless_thread_safe():
+    toolkit = _toolkit()
+    toolkit.index_data(index_name="idx", count=10, indexing_loader_workers=4)
+    assert toolkit.loader_threads == {"indexing-load-chunk"}
+
+    class _ThreadSafeToolkit(_Toolkit):
+        thread_safe_loaders = True
+
+    toolkit = _toolkit(cls=_ThreadSafeToolkit)
+    toolkit.index_data(index_name="idx", count=10, indexing_loader_workers=4)
+    assert any(name.startswith("indexing-loader") for name in toolkit.loader_threads)
+
+
+def test_dedupe_batch_size_parameter_requests_indexed_data_of_batches():
+    toolkit = _toolkit()
+    toolkit.index_data(index_name="idx", count=10)
+    toolkit.requested_keys.clear()
+
+    toolkit.index_data(index_name="idx", count=11, dedupe_batch_size=4)
+
+    assert toolkit.requested_keys == [["0", "1", "2", "3"], ["4", "5", "6", "7"], ["8", "9", "10"]]
+    assert len(toolkit.vectorstore.documents) == 11
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from alita_sdk.community.inventory.knowledge_graph import Citation, KnowledgeGraph
+
+WORDS = ["chat", "message", "handler", "user", "session", "token", "index", "graph", "api", "v2", "db"]
+QUERIES = ["ChatMessageHandler", "handler", "sage", "user_session", "api/v2", "ind", "s", "graph token",
+           "function", "class", "docs/", ".py", "--", "  "]
+
+
+def _random_graph(seed: int = 7, count: int = 300) -> KnowledgeGraph:
+    rng = random.Random(seed)
+    graph = KnowledgeGraph()
+    for idx in range(count):
+        name = "".join(word.capitalize() for word in rng.sample(WORDS, rng.randint(1, 3)))
+        properties = {"description": " ".join(rng.sample(WORDS, 4))} if idx % 3 else {}
+        if idx % 5 == 0:
+            properties["file_path"] = f"legacy/{rng.choice(WORDS)}.md"
+        citation = Citation(file_path=f"src/{rng.choice(WORDS)}/{name.lower()}.py", doc_id=f"doc{idx % 10}") \
+            if idx % 4 else None
+        graph.add_entity(f"e{idx}", name, rng.choice(["class", "function", "Service"]), citation, properties)
+    return graph
+
+
+def _ranking(results):
+    return [(result["entity"]["name"], result["score"], result["match_field"]) for result in results]
+
+
+def _full_scan(graph: KnowledgeGraph, monkeypatch, search, *args, **kwargs):
+    with monkeypatch.context() as patch:
+        patch.setattr(graph, "_search_candidates", lambda *_: None)
+        return search(*args, **kwargs)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_search_matches_full_scan(query, monkeypatch):
+    graph = _random_graph()
+
+    assert graph.search(query, top_k=50) == _full_scan(graph, monkeypatch, graph.search, query, top_k=50)
+    assert graph.search_advanced(query, entity_types=["code"], top_k=50) == \
+        _full_scan(graph, monkeypatch, graph.search_advanced, query, entity_types=["code"], top_k=50)
+
+
+def test_token_index_follows_updates_and_removals():
+    graph = _random_graph(count=50)
+    graph.add_entity("x", "PaymentGatewayClient", "class")
+    assert graph.search("gatewayclient")[0]["entity"]["id"] == "x"
+
+    graph.update_entity("x", {"name": "RefundProcessor", "type": "service"})
+    assert not graph.search("gateway")
+    assert graph.search("refund")[0]["entity"]["id"] == "x"
+    assert "x" in {entity["id"] for entity in graph.get_entities_by_type("service")}
+    assert not graph.find_entity_by_name("PaymentGatewayClient")
+
+    graph.remove_entity("x")
+    assert not graph.search("refund")
+    assert "refundprocessor" not in graph._token_index
+    assert not any("refundprocessor" in tokens for tokens in graph._trigram_index.values())
+
+
+def test_token_index_follows_merged_citations_of_loaded_graph(tmp_path):
+    graph = _random_graph(count=50)
+    graph.add_entity("x", "PaymentGatewayClient", "class", Citation(file_path="src/payments/gateway.py"))
+    graph._graph.nodes["x"]["citation"] = graph._graph.nodes["x"].pop("citations")[0]
+    graph._rebuild_search_index()
+    path = str(tmp_path / "graph.db")
+    graph.save(path)
+
+    loaded = KnowledgeGraph()
+    loaded.load(path)
+    loaded.add_entity("x", "PaymentGatewayClient", "class", Citation(file_path="lib/refunds.py"))
+    indexed = {token: set(node_ids) for token, node_ids in loaded._token_index.items()}
+    loaded._rebuild_search_index()
+
+    assert indexed == {token: set(node_ids) for token, node_ids in loaded._token_index.items()}
+    assert loaded.search("gateway")[0]["entity"]["id"] == "x"
+
+
+def test_token_index_is_persisted(tmp_path, monkeypatch):
+    graph = _random_graph()
+    path = str(tmp_path / "graph.json")
+    graph.dump_to_json(path)
+
+    loaded = KnowledgeGraph()
+    monkeypatch.setattr(KnowledgeGraph, "_rebuild_search_index", lambda self: pytest.fail("index rebuilt"))
+    loaded.load_from_json(path)
+
+    assert loaded._token_index == graph._token_index
+    assert loaded._trigram_index == graph._trigram_index
+    for query in QUERIES:
+        assert _ranking(loaded.search(query, top_k=50)) == _ranking(graph.search(query, top_k=50))
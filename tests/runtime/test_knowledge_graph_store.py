@@ -0,0 +1,126 @@
+import os
+import sqlite3
+
+import pytest
+
+from alita_sdk.community.inventory.graph_store import LazyNodeAttributes, SQLiteGraphStore
+from alita_sdk.community.inventory.knowledge_graph import (
+    Citation,
+    KnowledgeGraph,
+    load_graph_data,
+    save_graph_data,
+)
+
+
+def _graph(count: int = 20) -> KnowledgeGraph:
+    graph = KnowledgeGraph()
+    for idx in range(count):
+        graph.add_entity(
+            f"e{idx}", f"ChatHandler{idx}", "class" if idx % 2 else "function",
+            Citation(file_path=f"src/chat_{idx % 3}.py", line_start=idx, doc_id=f"doc{idx % 4}"),
+            {"description": f"Handles chat message {idx}"},
+        )
+    for idx in range(count - 1):
+        graph.add_relation(f"e{idx}", f"e{idx + 1}", "calls", {"weight": idx})
+    return graph
+
+
+def _snapshot(graph: KnowledgeGraph, all_indices: bool = True):
+    nodes = {node_id: dict(data) for node_id, data in graph._graph.nodes(data=True)}
+    edges = {(source, target): dict(data) for source, target, data in graph._graph.edges(data=True)}
+    indices = [graph._entity_index, graph._type_index, graph._token_index]
+    if all_indices:
+        indices += [graph._file_index, graph._source_doc_index]
+    return nodes, edges, [{key: set(value) for key, value in index.items() if value} for index in indices]
+
+
+def test_store_round_trip_keeps_entities_relations_and_indices(tmp_path):
+    graph = _graph()
+    path = str(tmp_path / "graph.db")
+    graph.save(path)
+
+    loaded = KnowledgeGraph()
+    loaded.load(path)
+
+    assert _snapshot(loaded) == _snapshot(graph)
+    assert loaded._metadata["version"] == "2.2"
+    assert loaded.search("handler7")[0]["entity"]["id"] == "e7"
+
+
+def test_attributes_are_decoded_lazily(tmp_path):
+    path = str(tmp_path / "graph.db")
+    _graph().save(path)
+
+    loaded = KnowledgeGraph()
+    loaded.load(path)
+    nodes = loaded._graph._node
+
+    assert all(isinstance(data, LazyNodeAttributes) and data.encoded_attributes() for data in nodes.values())
+    assert loaded.search("ChatHandler4", entity_type="function")[0]["entity"]["name"] == "ChatHandler4"
+    assert nodes["e4"].encoded_attributes() is None
+    assert nodes["e5"].encoded_attributes() is not None
+    assert "citation" not in nodes["e5"] and nodes["e5"].encoded_attributes() is not None
+    assert loaded.get_entity("e5")["citations"][0]["line_start"] == 5
+    assert loaded.get_stats()["entity_types"] == {"function": 10, "class": 10}
+
+
+def test_saves_to_the_loaded_store_are_incremental(tmp_path, monkeypatch):
+    path = str(tmp_path / "graph.db")
+    _graph().save(path)
+    graph = KnowledgeGraph()
+    graph.load(path)
+
+    graph.update_entity("e1", {"description": "renamed"})
+    graph.remove_entity("e2")
+    graph.add_entity("new", "NewService", "service", Citation(file_path="svc.py", doc_id="doc9"))
+    graph.add_relation("new", "e1", "uses")
+    graph.remove_relation("e5", "e6")
+
+    written = []
+    write_nodes = SQLiteGraphStore.write_nodes
+    monkeypatch.setattr(SQLiteGraphStore, "write_nodes",
+                        staticmethod(lambda connection, nodes: write_nodes(connection, written.extend(nodes) or written)))
+    graph.save(path)
+
+    assert sorted(row[0] for row in written) == ["e1", "new"]
+    reloaded = KnowledgeGraph()
+    reloaded.load(path)
+    # file and source indices of the reloaded graph are rebuilt from citations of the remaining entities
+    assert _snapshot(reloaded, all_indices=False) == _snapshot(graph, all_indices=False)
+    assert "e2" not in reloaded._file_index["src/chat_2.py"]
+    assert not reloaded._graph.has_edge("e1", "e2") and not reloaded._graph.has_edge("e5", "e6")
+    assert reloaded.get_entities_by_source("doc9")[0]["name"] == "NewService"
+
+
+def test_json_graph_is_migrated_to_missing_store(tmp_path):
+    graph = _graph()
+    graph.dump_to_json(str(tmp_path / "graph.json"))
+
+    migrated = KnowledgeGraph()
+    migrated.load(str(tmp_path / "graph.db"))
+
+    assert os.path.isfile(tmp_path / "graph.db")
+    with sqlite3.connect(tmp_path / "graph.db") as connection:
+        assert connection.execute("SELECT COUNT(*) FROM nodes").fetchone() == (20,)
+    # node_link JSON keeps entity ids as node keys only
+    assert _snapshot(migrated)[0] == {
+        node_id: {key: value for key, value in data.items() if key != "id"}
+        for node_id, data in _snapshot(graph)[0].items()
+    }
+    assert _snapshot(migrated)[1:] == _snapshot(graph)[1:]
+    with pytest.raises(FileNotFoundError):
+        KnowledgeGraph().load(str(tmp_path / "missing.db"))
+
+
+def test_node_link_data_round_trips_through_store(tmp_path):
+    path = str(tmp_path / "graph.db")
+    _graph().save(path)
+
+    data = load_graph_data(path)
+    data["links"].append({"source": "e0", "target": "e9", "relation_type": "similar"})
+    save_graph_data(data, path)
+
+    graph = KnowledgeGraph()
+    graph.load(path)
+    assert graph._graph.edges["e0", "e9"]["relation_type"] == "similar"
+    assert graph.find_entity_by_name("chathandler9")["citations"][0]["line_start"] == 9
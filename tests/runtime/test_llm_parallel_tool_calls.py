@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import StructuredTool
+
+from alita_sdk.runtime.toolkits.security import configure_sensitive_tools, reset_sensitive_tools
+from alita_sdk.runtime.tools.llm import LLMNode
+
+
+@pytest.fixture(autouse=True)
+def reset_sensitive_tools_config():
+    reset_sensitive_tools()
+    yield
+    reset_sensitive_tools()
+
+
+class FinalAnswerClient:
+    def invoke(self, messages, config=None):
+        return AIMessage(content="done")
+
+
+def _sync_tool(name, delay, running, toolkit="jira"):
+    def lookup(key: str) -> str:
+        with running["lock"]:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(delay)
+        with running["lock"]:
+            running["now"] -= 1
+        if key == "boom":
+            raise ValueError("lookup failed")
+        return f"{name}:{key}"
+
+    return StructuredTool.from_function(func=lookup, name=name, description=name,
+                                        metadata={"toolkit_type": toolkit, "toolkit_name": toolkit,
+                                                  "tool_name": name})
+
+
+def _async_tool(name, delay):
+    async def fetch(key: str) -> str:
+        await asyncio.sleep(delay)
+        return f"{name}:{key}"
+
+    return StructuredTool.from_function(coroutine=fetch, name=name, description=name)
+
+
+def _completion(*calls):
+    return AIMessage(content="", tool_calls=[
+        {"name": name, "args": {"key": key}, "id": f"call_{idx}"} for idx, (name, key) in enumerate(calls)
+    ])
+
+
+def _run(node, completion):
+    return asyncio.run(node._LLMNode__perform_tool_calling(
+        completion, [HumanMessage(content="go")], FinalAnswerClient(), {},
+    ))
+
+
+def _node(tools, **kwargs):
+    return LLMNode(available_tools=tools, tool_names=[tool.name for tool in tools], lazy_tools_mode=False, **kwargs)
+
+
+def test_parallel_calls_keep_call_order():
+    running = {"lock": threading.Lock(), "now": 0, "max": 0}
+    tools = [_sync_tool("get_issue", 0.3, running), _async_tool("get_pr", 0.3)]
+    node = _node(tools, parallel_tool_calls=True, max_parallel_tool_calls=3)
+    completion = _completion(("get_issue", "A"), ("get_pr", "1"), ("get_issue", "B"), ("get_issue", "boom"),
+                             ("missing_tool", "x"))
+
+    started = time.monotonic()
+    messages, final = _run(node, completion)
+    elapsed = time.monotonic() - started
+
+    tool_messages = [message for message in messages if isinstance(message, ToolMessage)]
+    assert [message.tool_call_id for message in tool_messages] == [f"call_{idx}" for idx in range(5)]
+    assert [message.content for message in tool_messages] == [
+        "get_issue:A", "get_pr:1", "get_issue:B",
+        "Error executing get_issue: lookup failed", "Tool 'missing_tool' not available",
+    ]
+    # the limit of 3 is shared by sync and async calls
+    assert 2 <= running["max"] <= 3
+    assert elapsed < 0.9
+    assert final.content == "done"
+
+
+def test_sequential_mode_resolves_tools_once_per_iteration(monkeypatch):
+    running = {"lock": threading.Lock(), "now": 0, "max": 0}
+    node = _node([_sync_tool("get_issue", 0, running)])
+    lookups = []
+    get_filtered_tools = LLMNode.get_filtered_tools
+    monkeypatch.setattr(LLMNode, "get_filtered_tools",
+                        lambda self, config=None: lookups.append(config) or get_filtered_tools(self, config))
+
+    messages, _ = _run(node, _completion(("get_issue", "A"), ("get_issue", "B"), ("get_issue", "C")))
+
+    assert [message.content for message in messages if isinstance(message, ToolMessage)] == [
+        "get_issue:A", "get_issue:B", "get_issue:C",
+    ]
+    assert len(lookups) == 1
+    assert running["max"] == 1
+
+
+def test_sensitive_tools_run_alone():
+    configure_sensitive_tools({"github": ["delete_repo"]})
+    running = {"lock": threading.Lock(), "now": 0, "max": 0}
+    lookup = _sync_tool("get_issue", 0, running)
+    delete_repo = _sync_tool("delete_repo", 0, running, toolkit="github")
+    node = _node([lookup, delete_repo], parallel_tool_calls=True)
+    calls = [(getattr(tool, "name", "missing"), {}, f"call_{idx}", tool)
+             for idx, tool in enumerate([lookup, lookup, delete_repo, lookup, None])]
+
+    batches = node._batch_tool_calls(calls)
+
+    assert [[call[2] for call in batch] for batch in batches] == [
+        ["call_0", "call_1"], ["call_2"], ["call_3", "call_4"],
+    ]
+    assert len(_node([lookup])._batch_tool_calls(calls)) == 5
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import StructuredTool
+
+from alita_sdk.runtime.tools import loop, loop_output
+from alita_sdk.runtime.tools.loop import LoopNode, invoke_loop_items
+from alita_sdk.runtime.tools.loop_output import LoopToolNode
+
+
+def _lookup_tool(delay=0.2, running=None):
+    running = running if running is not None else {"lock": threading.Lock(), "now": 0, "max": 0}
+
+    def get_ticket(key: str) -> str:
+        with running["lock"]:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        try:
+            if key == "hang":
+                time.sleep(1)
+            time.sleep(delay)
+            if key == "boom":
+                raise ValueError("ticket not found")
+            return f"ticket {key}"
+        finally:
+            with running["lock"]:
+                running["now"] -= 1
+
+    return StructuredTool.from_function(func=get_ticket, name="get_ticket", description="Get ticket")
+
+
+class _Client:
+    def __init__(self, content):
+        self.content = content
+
+    def invoke(self, messages, config=None):
+        return AIMessage(content=self.content)
+
+
+@pytest.fixture(autouse=True)
+def no_events(monkeypatch):
+    events = []
+    monkeypatch.setattr(loop, "dispatch_custom_event", lambda name, data, config=None: events.append((name, data)))
+    monkeypatch.setattr(loop_output, "dispatch_custom_event", lambda name, data, config=None: events.append((name, data)))
+    return events
+
+
+def test_items_run_in_parallel_and_keep_order():
+    running = {"lock": threading.Lock(), "now": 0, "max": 0}
+    items = [{"key": str(idx)} for idx in range(8)] + [{"key": "boom"}]
+
+    started = time.monotonic()
+    outcomes = invoke_loop_items(_lookup_tool(0.2, running), items, parallelism=4)
+    elapsed = time.monotonic() - started
+
+    assert [outcome.result for outcome in outcomes[:-1]] == [f"ticket {idx}" for idx in range(8)]
+    assert isinstance(outcomes[-1].error, ValueError) and "ticket not found" in outcomes[-1].details
+    assert running["max"] == 4
+    assert elapsed < 1.0
+
+
+def test_timed_out_items_do_not_hold_workers():
+    items = [{"key": "hang"}, {"key": "a"}, {"key": "b"}]
+
+    started = time.monotonic()
+    outcomes = invoke_loop_items(_lookup_tool(0.05), items, parallelism=1, item_timeout=0.3)
+
+    assert isinstance(outcomes[0].error, TimeoutError)
+    assert [outcome.result for outcome in outcomes[1:]] == ["ticket a", "ticket b"]
+    assert time.monotonic() - started < 0.9
+
+
+def test_loop_node_aggregates_in_order_and_reports_failures(no_events):
+    node = LoopNode(client=_Client('[{"key": "a"}, {"key": "boom"}, {"key": "c"}]'), tool=_lookup_tool(0.05),
+                    return_type="dict", output_variables=["tickets"], input_variables=["messages"],
+                    parallelism=3)
+
+    response = node.invoke({"messages": [HumanMessage(content="tickets a, boom, c")]})
+
+    content = response["messages"][-1]["content"]
+    assert content.index("ticket a") < content.index("ticket not found") < content.index("ticket c")
+    assert content.rstrip().endswith("1 of 3 iterations failed (items 2)")
+    assert response["tickets"].startswith("ticket a\n\n")
+    assert no_events[-1][1]["failures"] == "1 of 3 iterations failed (items 2)"
+
+
+def test_loop_tool_node_returns_accumulated_response():
+    def list_tickets(project: str) -> list:
+        return [{"key": f"{project}-{idx}"} for idx in range(3)]
+
+    source = StructuredTool.from_function(func=list_tickets, name="list_tickets", description="List tickets")
+    node = LoopToolNode(client=_Client('{"project": "AT"}'), tool=source, loop_tool=_lookup_tool(0.05),
+                        return_type="dict", variables_mapping={"key": {"type": "variable", "value": "key", "source": "tool"}}, input_variables=["project"],
+                        output_variables=["tickets"], parallelism=3)
+
+    response = node.invoke({"project": "AT"})
+
+    assert response["tickets"] == "ticket AT-0\n\nticket AT-1\n\nticket AT-2\n\n"
@@ -0,0 +1,68 @@
+import random
+import re
+
+import pytest
+
+from langchain_core.documents import Document
+
+from alita_sdk.community.inventory.ingestion import IngestionPipeline
+from alita_sdk.community.inventory.patterns import MentionMatcher
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("the user service calls users", {"user service", "user"}),
+    ("userservice and user_service", set()),
+    ("see api/v1 (user)", {"api/v1", "user"}),
+    ("", set()),
+])
+def test_finds_names_at_word_boundaries(text, expected):
+    matcher = MentionMatcher(["user service", "user", "api/v1", "service user"])
+
+    assert matcher.find(text) == expected
+
+
+def test_matches_regex_word_boundary_search():
+    rng = random.Random(7)
+    alphabet = "ab _.-é1"
+    for _ in range(500):
+        names = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 8))]
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+
+        expected = {name for name in names if re.search(r"\b" + re.escape(name) + r"\b", text)}
+
+        assert MentionMatcher(names).find(text) == expected, (names, text)
+
+
+def test_empty_matcher_finds_nothing():
+    matcher = MentionMatcher(["", ""])
+
+    assert len(matcher) == 0
+    assert matcher.find("anything") == set()
+
+
+def _entity(entity_id, name, entity_type, file_path, content=None):
+    entity = {"id": entity_id, "name": name, "type": entity_type, "citation": {"file_path": file_path}}
+    if content is not None:
+        entity["source_doc"] = Document(page_content=content)
+    return entity
+
+
+def test_cross_file_mentions_keep_order_of_significant_entities():
+    entities = [
+        _entity("doc", "Overview", "document", "docs/overview.txt",
+                "The payment service stores orders in the Order Table via the Billing API."),
+        _entity("api", "Billing API", "api", "src/billing.py"),
+        _entity("svc1", "Payment Service", "service", "src/payments.py"),
+        _entity("svc2", "payment service", "class", "lib/payments.py"),
+        _entity("table", "Order Table", "table", "db/orders.sql"),
+        _entity("unused", "Refund Service", "service", "src/refunds.py"),
+    ]
+    by_file = {}
+    for entity in entities:
+        by_file.setdefault(entity["citation"]["file_path"], []).append(entity)
+
+    relations = IngestionPipeline.model_construct()._extract_cross_file_relations(entities, entities, by_file)
+    mentions = [(r["source_id"], r["target_id"]) for r in relations if r["type"] == "MENTIONS"]
+
+    # longest names first, entities with the same name in their original order
+    assert mentions == [("doc", "svc1"), ("doc", "svc2"), ("doc", "api"), ("doc", "table")]
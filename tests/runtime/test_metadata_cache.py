@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from alita_sdk.runtime.clients.client import AlitaClient, ApiDetailsRequestError
+from alita_sdk.runtime.clients.metadata_cache import NOT_MODIFIED, MetadataCache, MetadataResponse
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls = []
+    delay = 0.0
+    version = "v1"
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        self.calls.append((self.command, self.path.split("?")[0], self.headers.get("If-None-Match")))
+        time.sleep(self.delay)
+        etag = f'"{self.version}"'
+        if "/missing" in self.path:
+            status, payload = 404, {"error": "not found"}
+        elif self.headers.get("If-None-Match") == etag:
+            status, payload = 304, None
+        elif "/configurations/models/" in self.path:
+            status, payload = 200, {"items": [{"name": "gpt", "version": self.version}]}
+        else:
+            status, payload = 200, {"path": self.path, "body": body, "version": self.version}
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_PATCH = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.calls = []
+    _Handler.delay = 0.0
+    _Handler.version = "v1"
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(server, **kwargs):
+    return AlitaClient(base_url=server, project_id=1, auth_token="token", **kwargs)
+
+
+def test_lookups_are_cached_and_copied(server):
+    client = _client(server)
+
+    models = client.get_available_models()
+    models[0]["name"] = "changed"
+    assert client.get_available_models() == [{"name": "gpt", "version": "v1"}]
+    client.get_app_details(7)
+    client.get_app_details(7)
+    client.get_app_details(7, "latest")
+    client.get_integration_details("abc")
+    client.get_integration_details("abc")
+
+    assert len(_Handler.calls) == 4
+    assert client.metadata_cache_stats()["hits"] == 3
+    assert client.metadata_cache_stats()["misses"] == 4
+
+
+def test_app_version_details_are_keyed_by_configurations(server):
+    client = _client(server)
+
+    first = client.get_app_version_details(7, 3)
+    assert client.get_app_version_details(7, 3) == first
+    # configurations used for the version are fetched once as well
+    assert [call[0] for call in _Handler.calls] == ["GET", "PATCH"]
+
+    client.configurations = [{"name": "jira"}]
+    assert client.get_app_version_details(7, 3)["body"] == {"configurations": [{"name": "jira"}]}
+    assert len(_Handler.calls) == 3
+
+
+def test_failures_are_not_cached(server):
+    client = _client(server)
+    client.app = f"{server}/missing"
+
+    assert client.get_app_details(1) == {"error": "not found"}
+    assert client.get_app_details(1) == {"error": "not found"}
+    client.base_url = f"{server}/missing"
+    with pytest.raises(ApiDetailsRequestError):
+        client.get_app_version_details(1, 2)
+
+    assert len(_Handler.calls) == 4
+    assert client.metadata_cache_stats()["entries"] == 1  # configurations
+
+
+def test_expired_entries_are_revalidated_with_etag(server):
+    client = _client(server, metadata_cache={"ttl": 0.05})
+
+    client.get_integration_details("abc")
+    time.sleep(0.1)
+    assert client.get_integration_details("abc")["version"] == "v1"
+    _Handler.version = "v2"
+    time.sleep(0.1)
+    assert client.get_integration_details("abc")["version"] == "v2"
+
+    assert [call[2] for call in _Handler.calls] == [None, '"v1"', '"v1"']
+    assert client.metadata_cache_stats()["revalidated"] == 1
+
+
+def test_concurrent_lookups_share_one_request(server):
+    client = _client(server)
+    _Handler.delay = 0.2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get_app_details(5), range(8)))
+
+    assert len(_Handler.calls) == 1
+    assert all(result == results[0] for result in results)
+    assert client.metadata_cache_stats()["coalesced"] == 7
+
+
+def test_invalidation_and_disabled_cache(server):
+    client = _client(server)
+    client.get_app_details(1)
+    client.get_app_details(2)
+    client.get_available_models()
+
+    assert client.invalidate_metadata_cache("app_details", 1) == 1
+    client.get_app_details(1)
+    client.get_app_details(2)
+    assert client.invalidate_metadata_cache() == 3
+    assert len(_Handler.calls) == 4
+
+    uncached = _client(server, metadata_cache=False)
+    uncached.get_available_models()
+    uncached.get_available_models()
+    assert len(_Handler.calls) == 6
+    assert uncached.metadata_cache_stats() == {}
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = MetadataCache(max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get(("kind", key), lambda etag, key=key: MetadataResponse(key))
+
+    assert cache.get(("kind", "a"), lambda etag: NOT_MODIFIED) == "a"
+    assert cache.stats()["evictions"] == 1
+    assert cache.invalidate("kind", "b") == 0
@@ -0,0 +1,81 @@
+from concurrent.futures import Future
+
+import pytest
+from langchain_core.documents import Document
+
+from alita_sdk.runtime.utils.utils import IndexerKeywords
+from alita_sdk.tools.base_indexer_toolkit import BaseIndexerToolkit
+from alita_sdk.tools.chunkers.universal_chunker import universal_chunker
+from alita_sdk.tools.utils.content_parser import loader_uses_llm
+from alita_sdk.tools.utils.parsing_pool import ParsingPool, get_parsing_pool, shutdown_parsing_pools
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ParsingPool(2)
+    yield pool
+    pool.shutdown()
+
+
+def _attachment(idx: int) -> Document:
+    return Document(page_content=f"page {idx}", metadata={
+        "id": idx,
+        IndexerKeywords.CONTENT_FILE_NAME.value: f"file_{idx}.txt" if idx % 2 else f"file_{idx}.csv",
+        IndexerKeywords.CONTENT_IN_BYTES.value: f"name,value\nrow,{idx}\n".encode(),
+    })
+
+
+def _dump(documents):
+    return [(doc.page_content, doc.metadata) for doc in documents]
+
+
+def test_loaders_chunkers_in_worker_processes_match_in_process(pool, monkeypatch):
+    toolkit = BaseIndexerToolkit.model_construct(llm=None, embeddings=None)
+    expected = _dump(toolkit._apply_loaders_chunkers(_attachment(idx) for idx in range(8)))
+
+    monkeypatch.setattr(BaseIndexerToolkit, "_parsing_pool", lambda self: pool)
+    actual = _dump(toolkit._apply_loaders_chunkers(_attachment(idx) for idx in range(8)))
+
+    assert actual == expected
+    assert [metadata["id"] for _, metadata in actual] == list(range(8))
+
+
+def test_universal_chunker_in_worker_processes_keeps_document_order(pool):
+    documents = [Document(page_content=f"def f{idx}():\n    return {idx}\n", metadata={"file_path": f"m{idx}.py"})
+                 for idx in range(25)]
+
+    chunks = list(universal_chunker(iter(documents), {"preserve_order": True}, pool=pool))
+
+    assert [chunk.metadata["file_path"] for chunk in chunks] == [doc.metadata["file_path"] for doc in documents]
+    assert _dump(chunks) == _dump(universal_chunker(iter(documents)))
+
+
+def test_ordered_mixes_jobs_and_in_process_results():
+    pool = ParsingPool(1, lookahead=1)
+    done = Future()
+    done.set_result([Document(page_content="job")])
+
+    assert [doc.page_content for doc in pool.ordered([[Document(page_content="a")], done, iter([])])] == ["a", "job"]
+
+
+def test_llm_dependent_loaders_are_detected():
+    assert not loader_uses_llm("image.png")
+    assert loader_uses_llm("image.png", {".png": {"use_llm": True}})
+    assert not loader_uses_llm("table.csv", {".csv": {"use_llm": True}})
+
+
+def test_shared_pool_of_index_data_setting_is_shut_down():
+    toolkit = BaseIndexerToolkit.model_construct(llm=None, embeddings=None)
+    assert toolkit._parsing_pool() is None
+
+    # index_data(parsing_processes=2) overrides the toolkit setting for the run
+    toolkit._index_settings = {"parsing_processes": 2}
+    shared = toolkit._parsing_pool()
+    assert shared.processes == 2 and get_parsing_pool(2) is shared
+    assert [doc.page_content for doc in shared.parse_content(b"name,value\nrow,1\n", "f.csv").result(timeout=60)]
+
+    shutdown_parsing_pools()
+
+    assert shared._executor is None
+    assert get_parsing_pool(2) is not shared
+    shutdown_parsing_pools()
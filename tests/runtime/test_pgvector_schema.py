@@ -0,0 +1,34 @@
+from sqlalchemy.dialects import postgresql
+
+from alita_sdk.runtime.tools.pgvector_schema import METADATA_COLUMNS_ATTR, metadata_field
+from alita_sdk.runtime.tools.pgvector_search import PGVectorSearch
+
+
+class _Store:
+    def __init__(self, promoted=()):
+        from langchain_postgres.vectorstores import _get_embedding_collection_store
+        self.EmbeddingStore, _ = _get_embedding_collection_store()
+        setattr(self, METADATA_COLUMNS_ATTR, frozenset(promoted))
+
+
+def _sql(expression) -> str:
+    return str(expression.compile(dialect=postgresql.dialect()))
+
+
+def test_metadata_field_uses_json_text_expression():
+    assert _sql(metadata_field(_Store(), "collection") == "idx") == \
+        "(langchain_pg_embedding.cmetadata ->> %(cmetadata_1)s) = %(param_1)s"
+
+
+def test_metadata_field_uses_generated_column_when_promoted():
+    store = _Store(promoted=["collection"])
+    assert _sql(metadata_field(store, "collection") == "idx") == \
+        "langchain_pg_embedding.meta_collection = %(meta_collection_1)s"
+    assert "->>" in _sql(metadata_field(store, "type"))
+
+
+def test_search_scalar_equality_uses_containment():
+    helper = PGVectorSearch("postgresql://localhost/db", "langchain_pg_embedding")
+    condition, params = helper._process_filter({"collection": "idx", "chunk_id": {"$gt": 1}})
+    assert condition.startswith("cmetadata @> %(p1)s::jsonb")
+    assert params["p1"] == '{"collection": "idx"}'
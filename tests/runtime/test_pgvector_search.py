@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+import pytest
+from langchain_core.documents import Document
+
+from alita_sdk.runtime.tools.pgvector_search import PGVectorSearch
+from alita_sdk.runtime.tools.vectorstore_base import search_result_key
+
+
+@pytest.fixture
+def helper(monkeypatch):
+    helper = PGVectorSearch("postgresql://localhost/db", "idx", schema="idx")
+    text_rows = [
+        {"id": "row-2", "cmetadata": {"id": 2, "chunk_id": 1}, "text_score": 0.5},
+        {"id": "row-3", "cmetadata": {"id": 3, "chunk_id": 1}, "text_score": 0.25},
+    ]
+    fetched = []
+
+    def _get_documents_by_ids(ids):
+        fetched.append(list(ids))
+        return {row_id: {"id": row_id, "document": f"text of {row_id}", "cmetadata": {"id": 3, "chunk_id": 1}}
+                for row_id in ids}
+
+    monkeypatch.setattr(helper, "full_text_search_fields", lambda *args, **kwargs: text_rows)
+    monkeypatch.setattr(helper, "get_documents_by_ids", _get_documents_by_ids)
+    helper.fetched = fetched
+    return helper
+
+
+def _vector_items():
+    return OrderedDict([
+        ("1_1", (Document(page_content="one", metadata={"id": 1, "chunk_id": 1}), 0.9)),
+        ("2_1", (Document(page_content="two", metadata={"id": 2, "chunk_id": 1}), 0.8)),
+    ])
+
+
+def test_weighted_fusion_fetches_text_only_documents_in_one_batch(helper):
+    result = helper.hybrid_search("query", ["title"], _vector_items(), key_fn=search_result_key, text_weight=0.4)
+
+    assert list(result) == ["2_1", "1_1", "3_1"]
+    assert result["2_1"][1] == pytest.approx(0.8 + 0.5 * 0.4)
+    assert result["3_1"][0].page_content == "text of row-3"
+    assert helper.fetched == [["row-3"]]
+
+
+def test_rrf_fusion_is_normalized(helper):
+    result = helper.hybrid_search("query", ["title"], _vector_items(), key_fn=search_result_key,
+                                  fusion="rrf", text_weight=1.0, rrf_k=0)
+
+    assert list(result) == ["2_1", "1_1", "3_1"]
+    assert all(0 < score <= 1 for _, score in result.values())
+
+
+def test_invalid_field_name_is_rejected():
+    helper = PGVectorSearch("postgresql://localhost/db", "idx", schema="idx")
+    with pytest.raises(ValueError):
+        helper._fts_document_sql(["title'; DROP TABLE x; --"])
+
+
+def test_full_text_index_is_created_by_vectorstore_bootstrap_only(monkeypatch):
+    import langchain_postgres
+
+    from alita_sdk.runtime.langchain.interfaces.llm_processor import get_vectorstore
+    from alita_sdk.runtime.tools.vectorstore_base import SearchDocumentsModel
+
+    created = []
+    monkeypatch.setattr(langchain_postgres, "PGVector", lambda **kwargs: object())
+    monkeypatch.setattr(PGVectorSearch, "from_vectorstore",
+                        classmethod(lambda cls, store, language: cls("postgresql://localhost/db", "idx",
+                                                                     language=language, schema="idx")))
+    monkeypatch.setattr(PGVectorSearch, "ensure_full_text_index",
+                        lambda self, fields, stored=False: created.append((self.language, fields, stored)))
+
+    get_vectorstore("PGVector", {
+        "connection_string": "postgresql+psycopg://localhost/db",
+        "collection_name": "idx",
+        "alita_sdk_options": {"full_text_index": {"fields": ["content"], "language": "simple", "stored": True}},
+    })
+
+    assert created == [("simple", ["content"], True)]
+    # Search arguments can't trigger schema changes
+    description = SearchDocumentsModel.model_fields["full_text_search"].description
+    assert '"index"' not in description and '"stored"' not in description
@@ -0,0 +1,317 @@
+import asyncio
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from alita_sdk.runtime.langchain import pyodide_worker_pool
+from alita_sdk.runtime.langchain.pyodide_sandbox import PyodideSandbox, SyncPyodideSandbox
+from alita_sdk.runtime.langchain.pyodide_worker_pool import (
+    PyodideWorkerError,
+    PyodideWorkerPool,
+    PyodideWorkerStartError,
+    encode_frame,
+)
+
+# Speaks the worker protocol of infra/data/sandbox/main.ts, code is a command
+FAKE_WORKER = textwrap.dedent('''
+    import json, os, struct, sys, time
+
+    if "--worker" not in sys.argv:
+        code = sys.argv[sys.argv.index("-c") + 1]
+        output = {"stdout": f"cold {code}", "stderr": None, "result": None, "success": True}
+        if "--session-file" in sys.argv:
+            path = sys.argv[sys.argv.index("--session-file") + 1]
+            with open(path, "rb") as f:
+                session = f.read()
+            with open(path, "wb") as f:
+                f.write(session[::-1])
+            output.update(result=len(session), sessionFile=path)
+        print(json.dumps(output))
+        sys.exit(0)
+    if "unsupported" in sys.argv:
+        print("Error: You must provide Python code", file=sys.stderr)
+        sys.exit(1)
+
+    def write(header, payload=b""):
+        data = json.dumps(header).encode()
+        sys.stdout.buffer.write(struct.pack(">II", len(data), len(payload)) + data + payload)
+        sys.stdout.buffer.flush()
+
+    def read_exactly(size):
+        data = b""
+        while len(data) < size:
+            chunk = sys.stdin.buffer.read(size - len(data))
+            if not chunk:
+                sys.exit(0)
+            data += chunk
+        return data
+
+    write({"ready": True})
+    executions = 0
+    while True:
+        header_length, payload_length = struct.unpack(">II", read_exactly(8))
+        request = json.loads(read_exactly(header_length))
+        payload = read_exactly(payload_length) if payload_length else b""
+        executions += 1
+        code = request["code"]
+        if code.startswith("sleep"):
+            time.sleep(float(code.split()[1]))
+        if code == "crash":
+            print("worker crashed", file=sys.stderr, flush=True)
+            os._exit(3)
+        write({
+            "stdout": f"{os.getpid()} {executions}",
+            "stderr": None,
+            "result": len(payload),
+            "success": True,
+            "sessionMetadata": request.get("sessionMetadata"),
+        }, payload[::-1])
+''')
+
+
+@pytest.fixture(autouse=True)
+def _stop_pools():
+    yield
+    pyodide_worker_pool.shutdown_worker_pools()
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(command, **kwargs):
+        pools.append(PyodideWorkerPool(command, **kwargs))
+        return pools[-1]
+
+    yield make
+    for pool in pools:
+        asyncio.run_coroutine_threadsafe(pool.aclose(), pyodide_worker_pool._pool_loop()).result(timeout=5)
+
+
+@pytest.fixture
+def worker_command(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER)
+    return [sys.executable, str(script), "main.ts", "--worker"]
+
+
+def _run(pool, code, payload=b"", timeout=10):
+    return pool.submit({"code": code}, payload, timeout).result(timeout=30)
+
+
+def _pid_and_count(header):
+    pid, count = header["stdout"].split()
+    return pid, int(count)
+
+
+def test_pool_reuses_warm_workers_and_recycles_them(worker_command, make_pool):
+    pool = make_pool(worker_command, size=1, max_executions=3)
+
+    pids = [_pid_and_count(_run(pool, "print()")[0]) for _ in range(7)]
+
+    assert [count for _, count in pids] == [1, 2, 3, 1, 2, 3, 1]
+    assert len({pid for pid, _ in pids}) == 3
+    stats = pool.stats()
+    assert stats["executions"] == 7
+    assert stats["workers_recycled"] == 2
+    assert stats["workers_started"] == 3
+
+
+def test_session_bytes_are_sent_as_binary_payload(worker_command, make_pool):
+    pool = make_pool(worker_command, size=1)
+    # Larger than the command line limit of most systems
+    session = bytes(range(256)) * 40_000
+
+    header, payload = _run(pool, "session", session)
+
+    assert header["result"] == len(session)
+    assert payload == session[::-1]
+
+
+def test_timed_out_and_crashed_workers_are_replaced(worker_command, make_pool):
+    pool = make_pool(worker_command, size=1)
+    first_pid, _ = _pid_and_count(_run(pool, "print()")[0])
+
+    with pytest.raises(TimeoutError, match="timed out after 0.2 seconds"):
+        _run(pool, "sleep 5", timeout=0.2)
+    with pytest.raises(PyodideWorkerError, match="exited with code 3: worker crashed"):
+        _run(pool, "crash")
+
+    pid, count = _pid_and_count(_run(pool, "print()")[0])
+    assert pid != first_pid and count == 1
+    assert pool.stats()["workers_recycled"] == 2
+
+
+def test_workers_run_executions_concurrently(worker_command, make_pool):
+    pool = make_pool(worker_command, size=3)
+    pool.warm()
+    _run(pool, "print()")
+
+    futures = [pool.submit({"code": "sleep 0.5"}, b"", 10) for _ in range(3)]
+    pids = {_pid_and_count(future.result(timeout=30)[0])[0] for future in futures}
+
+    assert len(pids) == 3
+
+
+def test_start_error_of_entrypoint_without_worker_mode(worker_command, make_pool):
+    pool = make_pool([*worker_command[:-2], "unsupported", "--worker"], size=1)
+
+    with pytest.raises(PyodideWorkerStartError, match="You must provide Python code"):
+        _run(pool, "print()")
+    assert pool.start_error is not None
+
+
+def test_encode_frame():
+    frame = encode_frame({"code": "x"}, b"\x00\x01")
+    assert frame == b"\x00\x00\x00\x0d\x00\x00\x00\x02" + b'{"code": "x"}' + b"\x00\x01"
+
+
+ENTRYPOINT = Path(__file__).parents[2] / "infra" / "data" / "sandbox" / "main.ts"
+
+# Executions of a worker run in one interpreter, the state of the first one must not leak to the second one
+ISOLATION_CHECK = textwrap.dedent('''
+    import __main__, builtins, json, os, sys
+    sys.path.insert(0, sys.argv[1])
+    os.chdir(sys.argv[2])
+    import worker_isolation
+    print_ = builtins.print
+    worker_isolation.snapshot([sys.argv[2]])
+
+    # first execution
+    sys.modules["json"] = None
+    json.dumps = None
+    builtins.print = None
+    os.environ["SECRET"] = "leaked"
+    sys.path.append("/leaked")
+    with open("secret.txt", "w") as file:
+        file.write("leaked")
+    with open("existing.txt", "w") as file:
+        file.write("leaked")
+    os.makedirs("leaked/nested")
+    os.chdir("leaked")
+    leaked = True
+
+    worker_isolation.restore()
+
+    # second execution
+    import json as second_json
+    print_(second_json.dumps({
+        "json": second_json is json and second_json.dumps is not None,
+        "print": builtins.print is print_,
+        "environ": "SECRET" in os.environ,
+        "path": "/leaked" in sys.path,
+        "files": sorted(os.listdir(".")),
+        "existing": open("existing.txt").read(),
+        "cwd": os.getcwd() == sys.argv[2],
+        "main": hasattr(__main__, "leaked"),
+    }))
+''')
+
+
+def test_worker_restores_interpreter_state_between_executions(tmp_path):
+    source = re.search(r"const workerIsolationCode = `(.*?)`;", ENTRYPOINT.read_text(), re.S).group(1)
+    (tmp_path / "worker_isolation.py").write_text(source)
+    workdir = tmp_path / "home"
+    workdir.mkdir()
+    (workdir / "existing.txt").write_text("original")
+    check = tmp_path / "check.py"
+    check.write_text(ISOLATION_CHECK)
+
+    process = subprocess.run([sys.executable, str(check), str(tmp_path), str(workdir)],
+                             capture_output=True, text=True, timeout=60)
+
+    assert process.returncode == 0, process.stderr
+    assert json.loads(process.stdout) == {
+        "json": True, "print": True, "environ": False, "path": False,
+        "files": ["existing.txt"], "existing": "original", "cwd": True, "main": False,
+    }
+
+
+def test_sandbox_starts_process_per_execution_by_default(monkeypatch):
+    monkeypatch.delenv("PYODIDE_SANDBOX_WORKERS", raising=False)
+    sandbox = SyncPyodideSandbox(skip_deno_check=True, pkg_name="main.ts")
+
+    assert sandbox.worker_pool_size == 0
+    assert sandbox._get_worker_pool() is None
+
+
+def _sandbox(cls, worker_command, monkeypatch, pkg_name="main.ts", **kwargs):
+    sandbox = cls(stateful=True, skip_deno_check=True, pkg_name=pkg_name, **kwargs)
+    monkeypatch.setattr(sandbox, "_deno_command", lambda memory_limit_mb=None, session_file=None: worker_command[:2])
+    return sandbox
+
+
+def test_sync_sandbox_executes_on_workers(worker_command, monkeypatch):
+    sandbox = _sandbox(SyncPyodideSandbox, worker_command, monkeypatch, worker_pool_size=1)
+
+    first = sandbox.execute("x = 1", session_bytes=b"abc", session_metadata={"packages": []})
+    second = sandbox.execute("x", session_bytes=first.session_bytes, session_metadata=first.session_metadata)
+
+    assert first.status == "success"
+    assert first.session_bytes == b"cba" and second.session_bytes == b"abc"
+    assert first.session_metadata == {"packages": []}
+    assert _pid_and_count({"stdout": second.stdout}) == (first.stdout.split()[0], 2)
+
+    timed_out = sandbox.execute("sleep 5", timeout_seconds=0.2)
+    assert timed_out.status == "error"
+    assert timed_out.stderr == "Execution timed out after 0.2 seconds"
+
+
+def test_async_sandbox_executes_on_workers_from_any_loop(worker_command, monkeypatch):
+    sandbox = _sandbox(PyodideSandbox, worker_command, monkeypatch, worker_pool_size=1)
+
+    results = [asyncio.run(sandbox.execute("print()")) for _ in range(2)]
+
+    assert [_pid_and_count({"stdout": result.stdout})[1] for result in results] == [1, 2]
+
+
+def test_sandbox_falls_back_to_process_per_execution(worker_command, monkeypatch):
+    monkeypatch.setenv("PYODIDE_SANDBOX_WORKERS", "1")
+    sandbox = _sandbox(SyncPyodideSandbox, worker_command, monkeypatch, pkg_name="unsupported")
+
+    assert sandbox.execute("print(1)").stdout == "cold print(1)"
+    assert sandbox._get_worker_pool() is None
+    assert sandbox.execute("print(2)").stdout == "cold print(2)"
+
+    cold = _sandbox(SyncPyodideSandbox, worker_command, monkeypatch, worker_pool_size=0)
+    assert cold.execute("print(3)").stdout == "cold print(3)"
+
+
+def test_process_per_execution_passes_session_in_file(worker_command, tmp_path, monkeypatch):
+    entrypoint = tmp_path / "main.ts"
+    entrypoint.write_text(ENTRYPOINT.read_text())
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "sessions"))
+    os.mkdir(tempfile.tempdir)
+    # Would exceed the command line limit as the JSON list passed with -b
+    session = bytes(range(256)) * (os.sysconf("SC_ARG_MAX") // 256 + 1)
+
+    sync_result = _sandbox(SyncPyodideSandbox, worker_command, monkeypatch, pkg_name=str(entrypoint),
+                           worker_pool_size=0).execute("x", session_bytes=session, session_metadata={"packages": []})
+    async_result = asyncio.run(_sandbox(PyodideSandbox, worker_command, monkeypatch, pkg_name=str(entrypoint),
+                                        worker_pool_size=0).execute("x", session_bytes=session,
+                                                                    session_metadata={"packages": []}))
+
+    for result in (sync_result, async_result):
+        assert result.status == "success"
+        assert result.result == len(session)
+        assert result.session_bytes == session[::-1]
+    assert not os.listdir(tempfile.tempdir)
+
+
+def test_session_file_is_readable_and_writable_by_deno():
+    sandbox = SyncPyodideSandbox(skip_deno_check=True, pkg_name="main.ts", allow_read=["/data"])
+
+    command = sandbox._deno_command(session_file="/tmp/session.bin")
+
+    assert "--allow-read=/data,/tmp/session.bin" in command
+    assert "--allow-write=/tmp/session.bin" in command
+    # Upstream entrypoints without --session-file get the session on the command line
+    assert sandbox._create_session_file(b"abc") is None
+    assert "-b" in sandbox._build_command("x", session_bytes=b"abc")
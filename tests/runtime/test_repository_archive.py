@@ -0,0 +1,205 @@
+import io
+import shutil
+import subprocess
+import tarfile
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from alita_sdk.tools.code_indexer_toolkit import CodeIndexerToolkit
+from alita_sdk.tools.utils.repository_archive import (
+    ARCHIVE_ZIP, RepositoryArchive, git_blob_sha, open_git_archive, open_url_archive,
+)
+
+FILES = {
+    "a.py": b"def a():\n    return 1\n",
+    "pkg/b.py": b"def b():\n    return 2\n",
+    "docs/readme.md": b"# Readme\n",
+}
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(cwd, *args) -> str:
+    return subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                          cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def bare_repo(tmp_path):
+    work = tmp_path / "work"
+    work.mkdir()
+    _git(work, "init", "-q", "-b", "main")
+    for path, content in FILES.items():
+        (work / path).parent.mkdir(parents=True, exist_ok=True)
+        (work / path).write_bytes(content)
+    _git(work, "add", ".")
+    _git(work, "commit", "-q", "-m", "init")
+    _git(tmp_path, "clone", "-q", "--bare", str(work), "repo.git")
+    return str(tmp_path / "repo.git")
+
+
+@pytest.fixture
+def archive_server():
+    archives = {}
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = archives[self.path]
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", archives
+    server.shutdown()
+
+
+def _tarball(root: str) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, content in FILES.items():
+            info = tarfile.TarInfo(f"{root}/{path}")
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def _zipball(root: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for path, content in FILES.items():
+            archive.writestr(f"{root}/{path}", content)
+    return buffer.getvalue()
+
+
+@requires_git
+def test_git_archive_files_match_blob_shas(bare_repo):
+    files = dict(open_git_archive(bare_repo, "main").files(lambda path: path.endswith(".py")))
+
+    assert files == {"a.py": FILES["a.py"], "pkg/b.py": FILES["pkg/b.py"]}
+    assert git_blob_sha(files["a.py"]) == _git(bare_repo, "rev-parse", "main:a.py")
+
+
+@pytest.mark.parametrize("archive_format,build", [("tar", _tarball), (ARCHIVE_ZIP, _zipball)])
+def test_url_archive_is_streamed_with_root_stripped(archive_server, archive_format, build):
+    url, archives = archive_server
+    archives["/archive"] = build("owner-repo-0123abc")
+
+    files = dict(open_url_archive(f"{url}/archive", archive_format=archive_format).files())
+
+    assert files == FILES
+
+
+class _Repo(CodeIndexerToolkit):
+    def _read_file(self, file_path, branch):
+        raise AssertionError("files are extracted from archive")
+
+    def _get_files(self, path="", branch=None):
+        raise AssertionError("files are extracted from archive")
+
+
+@requires_git
+def test_loader_uses_repository_archive(bare_repo):
+    class _ArchiveRepo(_Repo):
+        def _open_repository_archive(self, branch):
+            return open_git_archive(bare_repo, branch)
+
+    repo = _ArchiveRepo.model_construct()
+    chunks = list(repo._base_loader(branch="main", whitelist=["*.py"], incremental=False))
+
+    assert {chunk.metadata["filename"] for chunk in chunks} == {"a.py", "pkg/b.py"}
+    assert {chunk.metadata["commit_hash"] for chunk in chunks if chunk.metadata["filename"] == "a.py"} == \
+        {_git(bare_repo, "rev-parse", "main:a.py")}
+
+
+@requires_git
+def test_incremental_loader_extracts_only_changed_files(bare_repo):
+    blob_shas = {path: _git(bare_repo, "rev-parse", f"main:{path}") for path in FILES}
+
+    class _IncrementalRepo(_Repo):
+        def _get_files_blob_shas(self, path, branch):
+            return blob_shas
+
+        def _open_repository_archive(self, branch):
+            return open_git_archive(bare_repo, branch)
+
+        def _get_indexed_data(self, index_name, keys=None):
+            return {"a.py": {"metadata": {"collection": index_name}, "commit_hashes": [blob_shas["a.py"]],
+                             "ids": ["a-1"]}}
+
+    repo = _IncrementalRepo.model_construct()
+    base_docs = list(repo._base_loader(branch="main", whitelist=["*.py"], index_name="idx",
+                                       bulk_download_min_files=1))
+    assert [doc.metadata["filename"] for doc in base_docs] == ["pkg/b.py"]
+
+    chunks = list(repo._extend_data(iter(base_docs)))
+    assert chunks and {chunk.metadata["commit_hash"] for chunk in chunks} == {blob_shas["pkg/b.py"]}
+
+
+def test_incremental_loader_reads_few_changed_files_one_by_one():
+    blob_shas = {"a.py": "1" * 40, "pkg/b.py": "2" * 40}
+
+    class _FewChangesRepo(_Repo):
+        def _get_files_blob_shas(self, path, branch):
+            return blob_shas
+
+        def _open_repository_archive(self, branch):
+            raise AssertionError("archive is not downloaded for a few changed files")
+
+        def _get_indexed_data(self, index_name, keys=None):
+            return {"a.py": {"commit_hashes": ["0" * 64]}}
+
+    docs = list(_FewChangesRepo.model_construct()._base_loader(branch="main", index_name="idx",
+                                                               bulk_download_min_files=3))
+
+    assert [(doc.metadata["filename"], doc.page_content) for doc in docs] == [("a.py", ""), ("pkg/b.py", "")]
+
+
+def _tar_archive(files) -> RepositoryArchive:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, content in files.items():
+            info = tarfile.TarInfo(path)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    buffer.seek(0)
+    return RepositoryArchive(buffer)
+
+
+BINARY_FILES = {**FILES, "docs/logo.png": b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\xff\xfe"}
+
+
+def test_loader_skips_binary_archive_members():
+    class _ArchiveRepo(_Repo):
+        def _open_repository_archive(self, branch):
+            return _tar_archive(BINARY_FILES)
+
+    docs = list(_ArchiveRepo.model_construct().loader(branch="main", chunked=False))
+
+    assert {doc.metadata["filename"]: doc.page_content.encode() for doc in docs} == FILES
+
+
+def test_loader_parses_archive_members_with_toolkit_parser():
+    parsed = []
+
+    class _ParsingRepo(_Repo):
+        def _open_repository_archive(self, branch):
+            return _tar_archive(BINARY_FILES)
+
+        def _archive_file_content(self, file, content):
+            parsed.append(file)
+            return f"image of {len(content)} bytes" if file.endswith(".png") else content.decode()
+
+    docs = list(_ParsingRepo.model_construct().loader(branch="main", whitelist=["*.png"], chunked=False))
+
+    assert parsed == ["docs/logo.png"]
+    assert [doc.page_content for doc in docs] == [f"image of {len(BINARY_FILES['docs/logo.png'])} bytes"]
+    assert docs[0].metadata["commit_hash"] == git_blob_sha(BINARY_FILES["docs/logo.png"])
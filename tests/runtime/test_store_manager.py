@@ -0,0 +1,114 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import langgraph.store.postgres as postgres_store
+import langgraph.store.postgres.aio as postgres_store_aio
+import psycopg_pool
+import pytest
+
+from alita_sdk.runtime.langchain.store_manager import DEFAULT_POOL_CONFIG, get_manager
+
+CONN_STR = "postgresql+psycopg://user:p%40ss@db:5432/memory"
+
+
+class FakePool:
+    instances = []
+
+    def __init__(self, open=None, **kwargs):
+        self.kwargs = kwargs
+        self.name = kwargs["name"]
+        self.closed = False
+        self.instances.append(self)
+
+    @staticmethod
+    def check_connection(conn):
+        pass
+
+    def get_stats(self):
+        return {"pool_min": 1, "pool_max": 10, "pool_size": 3, "pool_available": 1,
+                "requests_waiting": 2, "requests_num": 4, "requests_wait_ms": 10}
+
+    def close(self):
+        self.closed = True
+
+
+class FakeAsyncPool(FakePool):
+    async def open(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeStore:
+    def __init__(self, conn):
+        self.conn = conn
+        time.sleep(0.05)
+
+    def setup(self):
+        pass
+
+
+class FakeAsyncStore(FakeStore):
+    async def setup(self):
+        pass
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    FakePool.instances = []
+    monkeypatch.setattr(psycopg_pool, "ConnectionPool", FakePool)
+    monkeypatch.setattr(psycopg_pool, "AsyncConnectionPool", FakeAsyncPool)
+    monkeypatch.setattr(postgres_store, "PostgresStore", FakeStore)
+    monkeypatch.setattr(postgres_store_aio, "AsyncPostgresStore", FakeAsyncStore)
+    manager = get_manager()
+    manager.shutdown()
+    yield manager
+    manager.shutdown()
+    manager.configure(**DEFAULT_POOL_CONFIG)
+
+
+def test_store_is_backed_by_one_pool_per_connection_string(manager):
+    manager.configure(max_size=20, check=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        stores = list(executor.map(lambda _: manager.get_store(CONN_STR), range(8)))
+
+    assert all(store is stores[0] for store in stores)
+    assert len(FakePool.instances) == 1
+    pool = stores[0].conn
+    assert pool.kwargs["kwargs"] == {"user": "user", "password": "p@ss", "host": "db", "port": 5432,
+                                     "dbname": "memory", "autocommit": True, "prepare_threshold": 0}
+    assert pool.kwargs["max_size"] == 20
+    assert pool.kwargs["check"] is FakePool.check_connection
+    # pools are named without the password
+    assert pool.name == "user@db:5432/memory"
+
+    manager.shutdown()
+    assert pool.closed
+
+
+def test_pool_stats_and_settings_validation(manager):
+    manager.get_store(CONN_STR)
+
+    stats = manager.pool_stats()["user@db:5432/memory"]
+
+    assert stats["in_use"] == 2 and stats["waiting"] == 2 and stats["checkout_latency_ms"] == 2.5
+    with pytest.raises(ValueError):
+        manager.configure(pool_size=3)
+
+
+def test_async_stores_are_per_event_loop(manager):
+    async def get_twice():
+        first, second = await asyncio.gather(manager.aget_store(CONN_STR), manager.aget_store(CONN_STR))
+        assert first is second
+        assert "user@db:5432/memory (async)" in manager.pool_stats()
+        await manager.aclose()
+        return first
+
+    first = asyncio.run(get_twice())
+    second = asyncio.run(get_twice())
+
+    assert first is not second
+    assert first.conn.closed and second.conn.closed
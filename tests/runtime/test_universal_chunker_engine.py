@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from langchain_core.documents import Document
+
+from alita_sdk.tools.chunkers.universal_chunker import UniversalChunker, universal_chunker
+
+MARKDOWN = "# Title\n\nSome text long enough to be kept as a separate markdown chunk of the document.\n"
+
+
+def _mixed_documents(count: int = 30):
+    documents = []
+    for idx in range(count):
+        kind = idx % 4
+        if kind == 0:
+            documents.append(Document(page_content=f"def f{idx}():\n    return {idx}\n", metadata={"file_path": f"m{idx}.py"}))
+        elif kind == 1:
+            documents.append(Document(page_content=MARKDOWN, metadata={"file_path": f"d{idx}.md"}))
+        elif kind == 2:
+            documents.append(Document(page_content=json.dumps({"id": idx}), metadata={"file_path": f"f{idx}.json"}))
+        else:
+            documents.append(Document(page_content=f"text {idx}", metadata={"file_path": f"t{idx}.txt"}))
+    return documents
+
+
+def _paths(chunks):
+    return [chunk.metadata["file_path"] for chunk in chunks]
+
+
+@pytest.mark.parametrize("workers", [0, 3])
+def test_preserve_order_yields_chunks_in_input_order(workers):
+    documents = _mixed_documents()
+    config = {"preserve_order": True, "workers": workers, "buffer_sizes": {"code": 2, "json": 5}}
+
+    chunks = list(universal_chunker(iter(documents), config))
+
+    assert _paths(chunks) == [doc.metadata["file_path"] for doc in documents]
+
+
+def test_default_mode_yields_same_chunks_grouped_by_buffers():
+    ordered = list(universal_chunker(iter(_mixed_documents()), {"preserve_order": True}))
+    grouped = list(universal_chunker(iter(_mixed_documents()), {"workers": 2, "buffer_sizes": 3}))
+
+    assert sorted(_paths(grouped)) == sorted(_paths(ordered))
+    assert _paths(grouped) != _paths(ordered)
+
+
+def test_stats_count_documents_and_chunks_per_type():
+    chunker = UniversalChunker(buffer_sizes=4, workers=2)
+
+    chunks = list(chunker.chunk(iter(_mixed_documents(8))))
+
+    assert chunker.stats.documents == {"code": 2, "markdown": 2, "json": 2, "text": 2}
+    assert sum(chunker.stats.chunks.values()) == len(chunks)
+    assert "code: 2 docs" in chunker.stats.summary()
+
+
+def test_document_waiting_in_partial_buffer_is_flushed_early():
+    documents = [Document(page_content=json.dumps({"id": 0}), metadata={"file_path": "first.json"})] + [
+        Document(page_content=f"text {idx}", metadata={"file_path": f"t{idx}.txt"}) for idx in range(50)
+    ]
+    chunker = UniversalChunker(buffer_sizes=5, preserve_order=True)
+    stream = chunker.chunk(iter(documents))
+
+    first = next(stream)
+
+    assert first.metadata["file_path"] == "first.json"
+    assert chunker.stats.documents["json"] == 1
+    assert _paths(stream) == [doc.metadata["file_path"] for doc in documents[1:]]